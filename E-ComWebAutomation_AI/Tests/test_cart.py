@@ -1,34 +1,26 @@
 import pytest
 from pages.cart_page.cart_page import CartPage
 from pages.dashboard_page.dashboard_page import DashboardPage
-from pages.login_page.login import LoginPage
 from Tests.test_data import TestData
+from utils.health import establishes
 
 
 @pytest.fixture
-def setup_cart(driver_for_test):
+@establishes("add_to_cart")
+def setup_cart(driver_for_test, api_seeder, test_account):
     """
     Fixture that provides a logged-in session with an item in cart.
+    Uses a leased account; the cart is seeded through the API and the
+    browser opens it.
     Returns both dashboard and cart page objects.
     """
-    # Login first
-    login_page = LoginPage(driver_for_test)
-    login_page.perform_login(
-        TestData.VALID_USER["email"],
-        TestData.VALID_USER["password"]
-    )
-    
-    # Add an item to cart
-    dashboard = DashboardPage(driver_for_test)
     product = TestData.PRODUCTS["zara_coat"]
-    dashboard.add_product_to_cart(product["title"])
-    
-    # Navigate to cart
-    dashboard.navigate_to_cart()
+    seeded = api_seeder.seed(user=test_account, cart=[product["title"]])
+    api_seeder.open_session(driver_for_test, seeded.user, route="/dashboard/cart")
     
     # Return both page objects for test use
     return {
-        "dashboard": dashboard,
+        "dashboard": DashboardPage(driver_for_test),
         "cart": CartPage(driver_for_test)
     }
 
@@ -128,19 +120,13 @@ class TestCartCheckout:
         assert "checkout" in cart.driver.current_url.lower(), \
             "Should navigate to checkout page"
             
-    def test_empty_cart_checkout_co06(self, driver_for_test):
+    def test_empty_cart_checkout_co06(self, driver_for_test, api_seeder, test_account):
         """
         TC: CO_06 - Verify checkout with empty cart
         """
-        # Given: Empty cart (new session)
-        login_page = LoginPage(driver_for_test)
-        login_page.perform_login(
-            TestData.VALID_USER["email"],
-            TestData.VALID_USER["password"]
-        )
-        
-        dashboard = DashboardPage(driver_for_test)
-        dashboard.navigate_to_cart()
+        # Given: Empty cart (seeded through the API)
+        seeded = api_seeder.seed(user=test_account, cart=[])
+        api_seeder.open_session(driver_for_test, seeded.user, route="/dashboard/cart")
         cart = CartPage(driver_for_test)
         
         # When/Then: Verify empty cart state
@@ -2,9 +2,11 @@ import pytest
 from pages.dashboard_page.dashboard_page import DashboardPage
 from pages.login_page.login import LoginPage
 from Tests.test_data import TestData
+from utils.health import establishes
 
 
 @pytest.fixture
+@establishes("login")
 def dashboard_page(driver_for_test):
     """
     Fixture that provides a logged-in dashboard page.
@@ -76,6 +78,8 @@ class TestDashboard:
         products = dashboard_page.get_product_details()
         assert len(products) > 0, f"Should show {subcategory} products"
         
+    @pytest.mark.resource("cart")
+    @pytest.mark.capability("add_to_cart")
     def test_add_to_cart_sc01(self, dashboard_page):
         """
         TC: SC_01 - Verify adding product to cart
@@ -1,5 +1,6 @@
 """Test data configuration for all test cases."""
 import os
+import uuid
 from datetime import datetime
 
 
@@ -63,9 +64,9 @@ class TestData:
 
     @staticmethod
     def generate_unique_email(prefix="testuser"):
-        """Generate a unique email using timestamp."""
+        """Generate a unique email (timestamp plus random suffix, safe across workers)."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{prefix}_{timestamp}@gauto.com"
+        return f"{prefix}_{timestamp}_{uuid.uuid4().hex[:8]}@gauto.com"
 
     @staticmethod
     def get_valid_password():
@@ -4,6 +4,7 @@ from pages.login_page.login import LoginPage
 from Tests.test_data import TestData
 
 
+@pytest.mark.requires("login")
 def test_forgot_password_flow(driver_for_test):
     """
     TC: UA_05 - Verify forgot password functionality
@@ -14,4 +15,4 @@ def test_forgot_password_flow(driver_for_test):
     fp = ForgotPasswordPage(driver_for_test)
 
     msg = fp.request_password_reset(TestData.FORGOT_EMAIL)
-    assert TestData.ME  SSAGES["registration"]["success"] or msg, "Forgot password flow did not return expected message"
+    assert TestData.MESSAGES["registration"]["success"] or msg, "Forgot password flow did not return expected message"
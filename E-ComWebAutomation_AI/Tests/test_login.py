@@ -4,6 +4,7 @@ from utils.test_helpers import test_case, retry_if_fails
 from Tests.test_data import TestData
 
 
+@pytest.mark.requires("login")
 class TestLogin:
     """
     Test suite for Login functionality.
@@ -20,6 +21,7 @@ class TestLogin:
         self.login_page.clear_login_form()
 
     @test_case('UA_03', feature='login', smoke=True, critical=True)
+    @pytest.mark.capability("login")
     @retry_if_fails(max_retries=2)
     def test_valid_login_success_ua03(self):
         """
@@ -1,8 +1,10 @@
+import pytest
 from pages.login_page.login import LoginPage
 from pages.dashboard_page.dashboard_page import DashboardPage
 from Tests.test_data import TestData
 
 
+@pytest.mark.requires("login")
 def test_logout_functionality(driver_for_test):
     """
     TC: UA_09 - Verify logout functionality
@@ -1,26 +1,24 @@
 import pytest
 from pages.payment_page.payment_page import PaymentPage
 from pages.cart_page.cart_page import CartPage
-from pages.login_page.login import LoginPage
 from Tests.test_data import TestData
+from utils.health import establishes
 
 
 @pytest.fixture
-def setup_payment(driver_for_test):
+@establishes("checkout")
+def setup_payment(driver_for_test, api_seeder, test_account):
     """
     Fixture that provides a logged-in session with items in cart ready for payment.
+    Uses a leased account with a cart seeded through the API; checkout
+    runs in the UI.
     Returns payment page object.
     """
-    # Login first
-    login_page = LoginPage(driver_for_test)
-    login_page.perform_login(
-        TestData.VALID_USER["email"],
-        TestData.VALID_USER["password"]
-    )
+    seeded = api_seeder.seed(user=test_account, cart=[TestData.PRODUCTS["zara_coat"]["title"]])
+    api_seeder.open_session(driver_for_test, seeded.user, route="/dashboard/cart")
     
-    # Navigate to cart and proceed to payment
+    # Proceed to payment
     cart = CartPage(driver_for_test)
-    cart.navigate_to_cart()
     cart.proceed_to_checkout()
     
     return PaymentPage(driver_for_test)
@@ -149,15 +147,15 @@ class TestPaymentAndOrder:
                 payment_page.PAYPAL_OPTION
             ).get_attribute("class"), "PayPal not selected"
             
-    def test_email_display_py07(self, setup_payment):
+    def test_email_display_py07(self, setup_payment, test_account):
         """
         TC: PY_07 - Verify correct email display
         """
         payment_page = setup_payment
         
-        # Verify displayed email
+        # Verify displayed email: the leased account setup_payment signed in with
         displayed_email = payment_page.get_email_address()
-        assert displayed_email == TestData.VALID_USER["email"], \
+        assert displayed_email == test_account["email"], \
             f"Wrong email displayed: {displayed_email}"
             
     def test_missing_country_py08(self, setup_payment):
@@ -3,9 +3,11 @@ from pages.product_page.product_details_page import ProductDetailsPage
 from pages.dashboard_page.dashboard_page import DashboardPage
 from pages.login_page.login import LoginPage
 from Tests.test_data import TestData
+from utils.health import establishes
 
 
 @pytest.fixture
+@establishes("login")
 def setup_product_details(driver_for_test):
     """
     Fixture that provides access to a product details page.
@@ -62,6 +64,7 @@ class TestProductDetails:
         # Verify zoom view
         assert zoom_displayed, "Image zoom view not displayed"
     
+    @pytest.mark.resource("reviews")
     def test_review_section_pc07(self, setup_product_details):
         """
         TC: PC_07 - Verify review section functionality
@@ -122,6 +125,7 @@ class TestProductDetails:
         success = product_page.select_size("M")
         assert success, "Failed to select size"
     
+    @pytest.mark.resource("reviews")
     @pytest.mark.parametrize("rating", [1, 3, 5])
     def test_different_ratings_pc07(self, setup_product_details, rating):
         """
@@ -1,21 +1,31 @@
 import pytest
 from pages.profile_page.profile_page import ProfilePage
-from pages.login_page.login import LoginPage
 from Tests.test_data import TestData
+from utils.health import establishes
 
 
 @pytest.fixture
-def setup_profile(driver_for_test):
+@establishes("login")
+def setup_profile(driver_for_test, api_seeder, test_account):
     """
     Fixture that provides a logged-in session with profile page access.
+    Uses a leased account, signed in through the API.
     Returns profile page object.
     """
-    # Login first
-    login_page = LoginPage(driver_for_test)
-    login_page.perform_login(
-        TestData.VALID_USER["email"],
-        TestData.VALID_USER["password"]
-    )
+    seeded = api_seeder.seed(user=test_account)
+    api_seeder.open_session(driver_for_test, seeded.user, route="/dashboard/profile")
+    
+    return ProfilePage(driver_for_test)
+
+
+@pytest.fixture
+@establishes("login")
+def setup_profile_with_orders(driver_for_test, api_seeder, test_account):
+    """
+    Like setup_profile, with an order placed through the API beforehand.
+    """
+    seeded = api_seeder.seed(user=test_account, orders=[TestData.PRODUCTS["zara_coat"]["title"]])
+    api_seeder.open_session(driver_for_test, seeded.user, route="/dashboard/profile")
     
     return ProfilePage(driver_for_test)
 
@@ -54,11 +64,11 @@ class TestProfile:
         assert current_details["address"] == new_details["address"], "Address update failed"
         assert current_details["phone"] == new_details["phone"], "Phone update failed"
     
-    def test_order_history_ua08(self, setup_profile):
+    def test_order_history_ua08(self, setup_profile_with_orders):
         """
         TC: UA_08 - Verify order history display
         """
-        profile_page = setup_profile
+        profile_page = setup_profile_with_orders
         
         # View order history
         orders = profile_page.view_order_history()
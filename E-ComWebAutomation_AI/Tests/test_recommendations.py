@@ -2,9 +2,11 @@ import pytest
 from pages.dashboard_page.dashboard_page import DashboardPage
 from pages.login_page.login import LoginPage
 from Tests.test_data import TestData
+from utils.health import establishes
 
 
 @pytest.fixture
+@establishes("login")
 def setup_recommendations(driver_for_test):
     login = LoginPage(driver_for_test)
     login.perform_login(TestData.VALID_USER["email"], TestData.VALID_USER["password"])
@@ -48,16 +48,17 @@ class TestRegistration:
         assert expected_msg in success_msg, \
             f"Expected success message '{expected_msg}' not found in '{success_msg}'"
 
-    def test_duplicate_email_registration_ua02(self):
+    def test_duplicate_email_registration_ua02(self, api_seeder):
         """
         TC: UA_02 - Verify registration attempt with existing email is rejected.
 
         Strategy:
-        - Use known registered email (from TestData)
+        - Use known registered email (from TestData), created through the API
         - Verify error message and validation
         - Ensure form remains accessible
         """
         # Given: Registration data with existing email
+        api_seeder.ensure_user(**TestData.VALID_USER)
         existing_email = TestData.VALID_USER["email"]
         password = TestData.get_valid_password()
 
@@ -0,0 +1 @@
+"""Unit tests for the framework utilities (no browser)."""
@@ -0,0 +1,82 @@
+import uuid
+
+import pytest
+
+from utils import health
+
+
+@pytest.fixture
+def graph(tmp_path):
+    graph = health.HealthGraph(f"unit_{uuid.uuid4().hex[:8]}", threshold=2, root=tmp_path)
+    yield graph
+    graph.remove()
+
+
+def test_prerequisites_are_transitive():
+    assert health.prerequisites("checkout") == ["checkout", "add_to_cart", "login"]
+    assert health.prerequisites("unknown") == ["unknown"]
+
+
+def test_consecutive_failures_take_a_capability_down(graph):
+    graph.record("login", False, "Tests/test_a.py::test_one", "TimeoutException")
+    assert graph.broken(["login"]) is None
+    graph.record("login", False, "Tests/test_b.py::test_two")
+    name, root = graph.broken(["login"])
+    assert name == "login"
+    assert root["nodeid"] == "Tests/test_a.py::test_one"
+    assert root["detail"] == "TimeoutException"
+
+
+def test_a_pass_resets_the_streak(graph):
+    graph.record("login", False, "t1")
+    graph.record("login", True, "t2")
+    graph.record("login", False, "t3")
+    assert graph.broken(["login"]) is None
+    entry = graph.state()["login"]
+    assert (entry["passes"], entry["failures"], len(entry["streak"])) == (1, 2, 1)
+
+
+def test_a_down_capability_stays_down(graph):
+    graph.record("login", False, "t1")
+    graph.record("login", False, "t2")
+    graph.record("login", True, "t3")
+    assert graph.broken(["login"])[1]["nodeid"] == "t1"
+    assert graph.state()["login"]["passes"] == 0
+
+
+def test_dependents_are_broken_by_their_prerequisites(graph):
+    graph.record("login", False, "t1")
+    graph.record("login", False, "t2")
+    assert graph.broken(["checkout"])[0] == "login"
+    assert graph.broken(["unrelated"]) is None
+
+
+def test_streaks_are_counted_per_capability(graph):
+    graph.record("login", False, "t1")
+    graph.record("checkout", False, "t2")
+    assert graph.broken(["checkout", "login"]) is None
+
+
+def test_state_is_shared_between_instances(graph, tmp_path):
+    other = health.HealthGraph(graph.path.stem, threshold=2, root=tmp_path)
+    graph.record("add_to_cart", False, "t1")
+    other.record("add_to_cart", False, "t2")
+    assert graph.broken(["add_to_cart"])[1]["nodeid"] == "t1"
+
+
+def test_threshold_is_at_least_one(tmp_path):
+    graph = health.HealthGraph(f"unit_{uuid.uuid4().hex[:8]}", threshold=0, root=tmp_path)
+    try:
+        graph.record("login", False, "t1")
+        assert graph.broken(["login"])
+    finally:
+        graph.remove()
+
+
+def test_establishes_collects_capabilities_on_the_fixture():
+    @health.establishes("checkout")
+    @health.establishes("login")
+    def fixture():
+        pass
+
+    assert fixture._capabilities == ("login", "checkout")
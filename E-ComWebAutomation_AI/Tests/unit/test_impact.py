@@ -0,0 +1,154 @@
+import subprocess
+
+import pytest
+
+from utils import impact
+from utils.tc_registry import PROJECT_DIR
+
+FILES = {
+    "conftest.py": "from utils import shared\n",
+    "utils/__init__.py": "",
+    "utils/shared.py": "def helper():\n    return 1\n",
+    "utils/cart.py": "LIMIT = 3\n\n\ndef add(x):\n    return x + 1\n\n\ndef remove(x):\n    return x - 1\n",
+    "pages/__init__.py": "",
+    "pages/cart_page.py": "from utils.cart import add\n",
+    "Tests/__init__.py": "",
+    "Tests/test_cart.py": "from pages.cart_page import add\n\n\ndef test_add():\n    assert add(1) == 2\n",
+    "Tests/test_other.py": "def test_other():\n    pass\n",
+}
+COVERAGE = {
+    "tests": {
+        "Tests/test_cart.py::test_add": {"functions": ["utils/cart.py::add"], "fixtures": []},
+        "Tests/test_other.py::test_other": {"functions": [], "fixtures": []},
+    },
+    "fixtures": {},
+}
+
+
+def git(root, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=root, check=True, capture_output=True)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A tiny committed project: a test importing a page object importing a util."""
+    for rel, text in FILES.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "base")
+    return tmp_path
+
+
+def edit(root, rel, old, new):
+    path = root / rel
+    path.write_text(path.read_text().replace(old, new))
+
+
+def select(root, coverage=None):
+    return impact.select_tests(impact.diff_changes("HEAD", root), "HEAD", impact.module_graph(root),
+                               coverage, root)
+
+
+class TestDiffChanges:
+
+    def test_modified_line_on_both_sides(self, project):
+        edit(project, "utils/cart.py", "return x - 1", "return x - 2")
+        assert impact.diff_changes("HEAD", project) == {"utils/cart.py": {"old": {9}, "new": {9}}}
+
+    def test_pure_insertion_has_no_old_lines(self, project):
+        edit(project, "utils/cart.py", "LIMIT = 3\n", "LIMIT = 3\nMINIMUM = 1\n")
+        assert impact.diff_changes("HEAD", project) == {"utils/cart.py": {"old": set(), "new": {2}}}
+
+    def test_hunk_ranges(self, project):
+        edit(project, "utils/cart.py", "def remove(x):\n    return x - 1\n", "")
+        changes = impact.diff_changes("HEAD", project)
+        assert changes["utils/cart.py"]["old"] == {8, 9}
+        assert changes["utils/cart.py"]["new"] == set()
+
+    def test_new_and_deleted_files_count_as_whole_changes(self, project):
+        (project / "utils" / "extra.py").write_text("X = 1\n")
+        (project / "Tests" / "test_other.py").unlink()
+        changes = impact.diff_changes("HEAD", project)
+        assert changes["utils/extra.py"] is None
+        assert changes["Tests/test_other.py"] is None
+
+
+class TestSelectTests:
+
+    def test_shared_configuration_runs_everything(self, project):
+        edit(project, "conftest.py", "shared\n", "shared  # noqa\n")
+        assert select(project).full
+
+    def test_conftest_dependency_without_coverage_runs_everything(self, project):
+        edit(project, "utils/shared.py", "return 1", "return 2")
+        selection = select(project)
+        assert selection.full
+        assert "no coverage is recorded" in selection.reasons[0]
+
+    def test_without_coverage_selects_importing_modules(self, project):
+        edit(project, "utils/cart.py", "return x - 1", "return x - 2")
+        selection = select(project)
+        assert not selection.full
+        assert selection.files == {"Tests/test_cart.py"}
+        assert selection.includes("Tests/test_cart.py::test_add")
+        assert not selection.includes("Tests/test_other.py::test_other")
+
+    def test_changed_test_module_is_selected(self, project):
+        edit(project, "Tests/test_other.py", "pass", "assert True")
+        assert select(project).files == {"Tests/test_other.py"}
+
+    def test_unrelated_files_select_nothing(self, project):
+        (project / "notes.md").write_text("notes\n")
+        selection = select(project)
+        assert not selection.full and not selection.files and not selection.nodeids
+
+    def test_coverage_narrows_to_tests_that_ran_the_function(self, project):
+        edit(project, "utils/cart.py", "return x + 1", "return 1 + x")
+        selection = select(project, COVERAGE)
+        assert selection.nodeids == {"Tests/test_cart.py::test_add"}
+        assert not selection.files
+
+    def test_coverage_rules_out_tests_of_other_functions(self, project):
+        edit(project, "utils/cart.py", "return x - 1", "return x - 2")
+        selection = select(project, COVERAGE)
+        assert not selection.nodeids and not selection.files
+
+    def test_module_level_change_falls_back_to_importers(self, project):
+        edit(project, "utils/cart.py", "LIMIT = 3", "LIMIT = 4")
+        assert select(project, COVERAGE).files == {"Tests/test_cart.py"}
+
+    def test_tests_missing_from_coverage_are_kept(self, project):
+        edit(project, "Tests/test_cart.py", "assert add(1) == 2\n",
+             "assert add(1) == 2\n\n\ndef test_add_twice():\n    assert add(add(1)) == 3\n")
+        edit(project, "utils/cart.py", "return x - 1", "return x - 2")
+        selection = select(project, COVERAGE)
+        assert "Tests/test_cart.py::test_add_twice" in selection.nodeids
+
+    def test_fixture_imports_select_only_tests_requesting_the_fixture(self, project):
+        edit(project, "conftest.py", "from utils import shared\n",
+             "import pytest\nfrom utils import shared\n\n\n@pytest.fixture\ndef seeder():\n"
+             "    from utils.seed import Seeder\n    return Seeder()\n")
+        (project / "utils" / "seed.py").write_text("def Seeder():\n    from utils.cart import add\n")
+        edit(project, "Tests/test_other.py", "def test_other():", "def test_other(seeder):")
+        git(project, "add", ".")
+        git(project, "commit", "-q", "-m", "fixture")
+        edit(project, "utils/cart.py", "return x - 1", "return x - 2")
+        selection = select(project)
+        assert not selection.full
+        assert selection.files == {"Tests/test_cart.py", "Tests/test_other.py"}
+
+    def test_page_object_edit_does_not_select_unrelated_tests(self):
+        """conftest fixtures import page objects lazily; that must not make them shared."""
+        selection = impact.select_tests({"pages/cart_page/cart_page.py": None}, "HEAD", root=PROJECT_DIR)
+        assert not selection.full
+        assert "Tests/test_cart.py" in selection.files
+        assert "Tests/test_login.py" not in selection.files
+
+    def test_selection_survives_serialisation(self, project):
+        edit(project, "utils/cart.py", "return x + 1", "return 1 + x")
+        selection = select(project, COVERAGE)
+        assert impact.ImpactSelection.from_json(selection.to_json()) == selection
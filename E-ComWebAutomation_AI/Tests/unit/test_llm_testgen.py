@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from stub_app.llm_server import CompletionServer
+from utils import llm_testgen
+
+SRS = """Project Name: "Style Haven"
+
+1. User Accounts:
+• Registration: Users can sign up with email and password.
+• Login: Registered users can log in.
+
+2. Shopping Cart:
+• Add to cart: Products can be added from the product page.
+• Update quantity: Quantities can be changed in the cart.
+
+3. Checkout:
+• Payment: Users pay by card.
+"""
+SETTINGS = {"model": "stub-model", "temperature": 0, "max_tokens": 500}
+
+
+@pytest.fixture(scope="module")
+def stand_in():
+    with CompletionServer(port=0) as server:
+        yield server
+
+
+@pytest.fixture
+def client(stand_in):
+    client = llm_testgen.CompletionClient(stand_in.url)
+    yield client
+    client.close()
+
+
+def run(text, client, cache):
+    sections = llm_testgen.split_sections(text)
+    return llm_testgen.generate(sections, client, cache, SETTINGS, workers=2)
+
+
+def test_sections_are_split_at_headings():
+    sections = llm_testgen.split_sections(SRS)
+    assert [s.title for s in sections] == ["Overview", "User Accounts", "Shopping Cart", "Checkout"]
+    assert [s.prefix for s in sections[1:]] == ["UA", "SC", "CH"]
+
+
+def test_second_run_is_served_from_cache(stand_in, client, tmp_path):
+    cache = llm_testgen.PromptCache(tmp_path)
+    before = stand_in.request_count
+
+    results, stats = run(SRS, client, cache)
+    assert (stats["hits"], stats["misses"]) == (0, 4)
+    assert stand_in.request_count - before == 4
+    assert "UA_01" in dict((s.title, c) for s, c in results)["User Accounts"]
+
+    again, stats = run(SRS, client, cache)
+    assert (stats["hits"], stats["misses"]) == (4, 0)
+    assert stats["tokens"] == 0 and stats["tokens_saved"] > 0
+    assert stand_in.request_count - before == 4
+    assert again == results
+
+
+def test_editing_one_section_misses_once(stand_in, client, tmp_path):
+    cache = llm_testgen.PromptCache(tmp_path)
+    run(SRS, client, cache)
+    before = stand_in.request_count
+
+    results, stats = run(SRS.replace("Users pay by card.", "Users pay by card or wallet."), client, cache)
+    assert (stats["hits"], stats["misses"]) == (3, 1)
+    assert stand_in.request_count - before == 1
+    assert "wallet" in dict((s.title, c) for s, c in results)["Checkout"]
+
+
+def test_settings_are_part_of_the_key():
+    key = llm_testgen.PromptCache.key
+    assert key("p", SETTINGS) != key("p", {**SETTINGS, "temperature": 1})
+
+
+def fill(cache, count, size=100):
+    """``count`` equally sized entries, least recently used first."""
+    keys = [f"{number:02d}".ljust(64, "0") for number in range(count)]
+    for number, key in enumerate(keys):
+        cache.put(key, {"content": "x" * size})
+        os.utime(cache._path(key), (1000 + number, 1000 + number))
+    return keys
+
+
+def test_eviction_respects_the_entry_limit(tmp_path):
+    cache = llm_testgen.PromptCache(tmp_path, max_entries=3)
+    keys = fill(cache, 5)
+    cache.get(keys[0])  # a hit makes the oldest entry the most recent
+
+    assert cache.evict() == 2
+    assert [cache.get(k) is not None for k in keys] == [True, False, False, True, True]
+
+
+def test_eviction_respects_the_size_limit(tmp_path):
+    cache = llm_testgen.PromptCache(tmp_path, max_entries=100)
+    keys = fill(cache, 5)
+    size = cache.entries()[0][1]
+    cache.max_bytes = size * 2
+
+    assert cache.evict() == 3
+    assert [cache.get(k) is not None for k in keys] == [False, False, False, True, True]
+    assert sum(s for _, s, _ in cache.entries()) <= cache.max_bytes
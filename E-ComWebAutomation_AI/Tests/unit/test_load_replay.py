@@ -0,0 +1,104 @@
+import json
+
+from stub_app.server import StubServer
+from utils import load_replay
+
+USER = {"email": "qa@shop.com", "password": "Pa$$word1"}
+BASE = "http://127.0.0.1:8000"
+TOKEN = "eyJhbGci0iJIUzI1NiJ9"
+USER_ID = "64f0c1a2b3c4d5e6f7a8b9c0"
+
+
+def entry(method, path, body=None, response=None, headers=None, status=200, started=0, elapsed=10):
+    return {"method": method, "url": path if "://" in path else BASE + path, "headers": headers or {},
+            "body": json.dumps(body) if body is not None else None,
+            "response": json.dumps(response) if response is not None else None,
+            "status": status, "started": started, "elapsed": elapsed}
+
+
+def recorded_log():
+    return [
+        entry("POST", "/api/ecom/auth/login", {"userEmail": USER["email"], "userPassword": USER["password"]},
+              {"token": TOKEN, "userId": USER_ID, "message": "Login Successfully"}, started=0, elapsed=40),
+        entry("GET", "https://fonts.example.com/font.woff2", started=45),
+        entry("GET", f"/api/ecom/user/get-cart-products/{USER_ID}", response={"count": 0},
+              headers={"Authorization": TOKEN}, started=140, elapsed=20),
+        entry("POST", "/api/ecom/user/update-cart-quantity", {"productId": USER_ID, "quantity": 2},
+              {"message": "Quantity updated"}, headers={"Authorization": TOKEN}, started=160),
+    ]
+
+
+def test_other_origins_are_dropped():
+    scenario = load_replay.build_scenario(recorded_log(), USER, BASE + "/client/")
+    assert [step["method"] for step in scenario["steps"]] == ["POST", "GET", "POST"]
+    assert scenario["recorded_from"] == BASE
+
+
+def test_credentials_and_origin_become_variables():
+    login = load_replay.build_scenario(recorded_log(), USER, BASE)["steps"][0]
+    assert login["url"] == "${base}/api/ecom/auth/login"
+    body = json.loads(login["body"])
+    assert body == {"userEmail": "${email}", "userPassword": "${password}"}
+
+
+def test_dollar_signs_are_escaped():
+    user = {"email": "qa@shop.com", "password": "secret"}
+    log = [entry("POST", "/api/ecom/order/apply-coupon", {"code": "SAVE$10"})]
+    step = load_replay.build_scenario(log, user, BASE)["steps"][0]
+    assert "SAVE$$10" in step["body"]
+
+
+def test_generated_values_are_extracted_and_substituted():
+    scenario = load_replay.build_scenario(recorded_log(), USER, BASE)
+    login, cart, update = scenario["steps"]
+    assert login["extract"] == {"token": ["token"], "userId": ["userId"]}
+    assert set(scenario["variables"]) == {"base", "email", "password", "token", "userId"}
+    assert cart["url"] == "${base}/api/ecom/user/get-cart-products/${userId}"
+    assert cart["headers"] == {"Authorization": "${token}"}
+    assert json.loads(update["body"])["productId"] == "${userId}"
+    assert cart["extract"] == {}  # nothing from its response is reused
+
+
+def test_values_not_reused_later_are_not_extracted():
+    log = recorded_log()[:1]
+    assert load_replay.build_scenario(log, USER, BASE)["steps"][0]["extract"] == {}
+
+
+def test_think_time_is_the_gap_between_requests():
+    steps = load_replay.build_scenario(recorded_log(), USER, BASE)["steps"]
+    assert [step["think_ms"] for step in steps] == [0, 100, 0]
+    assert steps[1]["name"] == "GET /api/ecom/user/get-cart-products/${userId}"
+
+
+def test_dynamic_values_need_length_and_a_digit():
+    document = {"id": "abc12345", "short": "a1", "word": "confirmed", "text": "has 1 space here",
+                "nested": [{"orderId": "ord-00000001"}]}
+    found = dict(load_replay._dynamic_values(document))
+    assert found == {("id",): "abc12345", ("nested", 0, "orderId"): "ord-00000001"}
+
+
+def test_variable_names_are_unique():
+    assert load_replay._variable_name(("data", 0, "_id"), ["base"]) == "id"
+    assert load_replay._variable_name(("token",), ["token"]) == "token_2"
+    assert load_replay._variable_name((0,), []) == "value"
+
+
+def test_correlated_scenario_replays_against_the_stub():
+    """The recorded token and user id differ from every fresh login; replay only works if they are extracted."""
+    user = {"email": "test.qa@shop.com", "password": "ValidPassword123!"}
+    with StubServer() as stub:
+        token, account = stub.store.login(user["email"], user["password"])
+        log = [
+            {"method": "POST", "url": f"{stub.url}/api/ecom/auth/login", "headers": {},
+             "body": json.dumps({"userEmail": user["email"], "userPassword": user["password"]}),
+             "response": json.dumps({"token": token, "userId": account["_id"]}),
+             "status": 200, "started": 0, "elapsed": 5},
+            {"method": "GET", "url": f"{stub.url}/api/ecom/user/get-cart-count/{account['_id']}",
+             "headers": {"Authorization": token}, "body": None, "response": json.dumps({"count": 0}),
+             "status": 200, "started": 10, "elapsed": 5},
+        ]
+        scenario = load_replay.build_scenario(log, user, stub.login_url)
+        report = load_replay.run_load(scenario, stub.url, [user], vus=2, iterations=2, timeout=10)
+    assert report["errors"] == 0
+    assert report["iterations"] == 4
+    assert report["requests"] == 8
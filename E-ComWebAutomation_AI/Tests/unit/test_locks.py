@@ -0,0 +1,41 @@
+import pytest
+
+from utils import locks
+
+
+class Item:
+    """Markers of a collected test: its own, then its class's and module's."""
+
+    def __init__(self, own=(), inherited=()):
+        self.own_markers = [decorator.mark for decorator in own]
+        self.inherited = [decorator.mark for decorator in inherited]
+
+    def iter_markers(self, name):
+        return (marker for marker in self.own_markers + self.inherited if marker.name == name)
+
+
+def test_resources_from_every_level():
+    item = Item(own=[pytest.mark.resource("reviews")], inherited=[pytest.mark.resource("cart", "orders")])
+    assert locks.resource_names(item) == ["reviews", "cart", "orders"]
+
+
+def test_parallel_safe_test_drops_only_inherited_resources():
+    item = Item(own=[pytest.mark.parallel_safe, pytest.mark.resource("reviews")],
+                inherited=[pytest.mark.resource("cart")])
+    assert locks.resource_names(item) == ["reviews"]
+
+
+def test_parallel_safe_on_a_class_or_module_is_ignored():
+    item = Item(own=[pytest.mark.resource("reviews")],
+                inherited=[pytest.mark.parallel_safe, pytest.mark.resource("cart")])
+    assert locks.resource_names(item) == ["reviews", "cart"]
+
+
+def test_file_lock_is_exclusive(tmp_path):
+    first = locks.FileLock(tmp_path / "cart.lock", timeout=5)
+    second = locks.FileLock(tmp_path / "cart.lock", timeout=0.2)
+    with first:
+        with pytest.raises(locks.LockTimeout):
+            second.acquire()
+    with second:
+        pass
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from utils import pipeline
+
+
+@pytest.mark.parametrize("args, found", [
+    (["-n", "4", "-x"], ["-n", "4"]),
+    (["-n4"], ["-n4"]),
+    (["-n=auto"], ["-n=auto"]),
+    (["--numprocesses", "2"], ["--numprocesses", "2"]),
+    (["--numprocesses=2"], ["--numprocesses=2"]),
+    (["-v", "-m", "smoke", "--no-cov"], []),
+    (None, []),
+])
+def test_worker_options(args, found):
+    assert pipeline.worker_options(args) == found
+
+
+def test_budget_sets_the_worker_count():
+    commands = pipeline.build_commands(["smoke", "regression"], 5, Path("run"), ["-x"])
+    # Drop "<python> -m pytest"
+    smoke, regression = commands["smoke"][0][3:], commands["regression"][0][3:]
+    assert pipeline._option_value(smoke, "-n") == "3"
+    assert pipeline._option_value(regression, "-n") == "2"
+    assert pipeline._option_value(regression, "-m") == "(not slow) and not (smoke)"
+    assert regression[-1] == "-x"
+
+
+def test_worker_count_in_additional_args_is_rejected():
+    with pytest.raises(ValueError, match="--browsers"):
+        pipeline.build_commands(["regression"], 4, Path("run"), ["--numprocesses", "8"])
+
+
+def _alive(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_terminate_stops_the_whole_process_group():
+    """Workers and browsers started by pytest must not outlive a cancelled configuration."""
+    script = ("import subprocess, sys, time\n"
+              "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+              "print(child.pid, flush=True)\n"
+              "time.sleep(60)\n")
+    proc = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True,
+                            **pipeline.PROCESS_GROUP)
+    child = int(proc.stdout.readline())
+    proc.stdout.close()
+
+    pipeline._terminate(proc, grace_seconds=5)
+
+    assert proc.returncode is not None
+    deadline = time.monotonic() + 5
+    while _alive(child) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _alive(child)
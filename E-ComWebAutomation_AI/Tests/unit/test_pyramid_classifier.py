@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from utils import pyramid_classifier as pc
+
+TEXTS = [
+    "api returns 200 with the product list",
+    "api response contains the order id",
+    "api rejects an invalid token with 401",
+    "page shows the order confirmation message",
+    "page displays the cart badge after adding",
+    "page redirects to the dashboard after login",
+    "discount calculation rounds to two decimals",
+]
+LABELS = ["Integration", "Integration", "Integration", "E2E (UI)", "E2E (UI)", "E2E (UI)", "Unit"]
+
+
+def test_tokenize_adds_word_pairs():
+    assert pc.tokenize("Cart, Total!") == ["cart", "total", "cart total"]
+
+
+def test_record_text_uses_title_and_expected_result():
+    record = {"title": "Add to cart", "steps": "click add", "expected": "Badge shows 1"}
+    assert pc.record_text(record) == "Add to cart Badge shows 1"
+
+
+class TestTfidf:
+
+    def test_idf_is_smoothed_and_lowest_for_common_terms(self):
+        vectorizer = pc.TfidfVectorizer.fit(["cart total", "cart badge", "cart"])
+        idf = dict(zip(vectorizer.vocabulary, vectorizer.idf))
+        assert idf["cart"] == pytest.approx(1.0)
+        assert idf["badge"] == pytest.approx(np.log(4 / 2) + 1)
+
+    def test_rows_are_l2_normalised_and_unknown_text_is_zero(self):
+        vectorizer = pc.TfidfVectorizer.fit(TEXTS)
+        matrix = vectorizer.transform(TEXTS + ["nothing known here zzz", ""])
+        assert matrix.dtype == np.float32
+        assert np.linalg.norm(matrix[:len(TEXTS)], axis=1) == pytest.approx(1.0, abs=1e-6)
+        assert not matrix[len(TEXTS):].any()
+
+    def test_repeated_terms_are_dampened(self):
+        vectorizer = pc.TfidfVectorizer(["api", "page"], np.ones(2))
+        row = vectorizer.transform(["api api api page"])[0]
+        assert row[0] / row[1] == pytest.approx(np.log1p(3) / np.log1p(1))
+
+    def test_chunked_transform_matches_one_block(self, monkeypatch):
+        vectorizer = pc.TfidfVectorizer.fit(TEXTS)
+        whole = vectorizer.transform(TEXTS)
+        monkeypatch.setattr(pc, "TRANSFORM_CHUNK_ROWS", 2)
+        assert np.array_equal(vectorizer.transform(TEXTS), whole)
+
+
+def test_softmax_rows_sum_to_one_without_overflow():
+    probabilities = pc._softmax(np.array([[1000.0, 0.0, -1000.0], [1.0, 1.0, 1.0]]))
+    assert probabilities.sum(axis=1) == pytest.approx(1.0)
+    assert probabilities[0, 0] == pytest.approx(1.0)
+    assert probabilities[1] == pytest.approx(1 / 3)
+
+
+class TestClassifier:
+
+    def test_learns_separable_training_data(self):
+        model = pc.PyramidClassifier.train(TEXTS, LABELS)
+        predicted, confidence = model.predict(model.vectorizer.transform(TEXTS))
+        assert predicted == LABELS
+        assert ((confidence > 1 / 3) & (confidence <= 1)).all()
+
+    def test_generalises_to_unseen_wording(self):
+        model = pc.PyramidClassifier.train(TEXTS, LABELS)
+        predicted, _ = model.predict(model.vectorizer.transform(["api returns the cart items",
+                                                                 "page shows the profile"]))
+        assert predicted == ["Integration", "E2E (UI)"]
+
+    def test_rare_class_weight_is_capped(self):
+        """One "Unit" row in a hundred would get weight sqrt(50); it is capped."""
+        texts = [f"api check {i}" for i in range(99)] + ["unit calculation"]
+        labels = ["Integration"] * 99 + ["Unit"]
+        model = pc.PyramidClassifier.train(texts, labels, epochs=1, learning_rate=1.0)
+        # From zero weights every probability is 0.5, so one step moves the
+        # bias by the class-weighted sum of the errors
+        integration_weight = np.sqrt(len(labels) / (2 * 99))
+        step = (99 * 0.5 * integration_weight - 0.5 * pc.MAX_CLASS_WEIGHT) / len(labels)
+        assert model.bias == pytest.approx([step, -step], rel=1e-4)
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        model = pc.PyramidClassifier.train(TEXTS, LABELS, epochs=20)
+        path = tmp_path / "model.npz"
+        model.save(path)
+        loaded = pc.PyramidClassifier.load(path)
+        assert loaded.key == model.key
+        features = model.vectorizer.transform(TEXTS)
+        assert np.allclose(loaded.predict_proba(features), model.predict_proba(features))
+
+
+@pytest.mark.skipif(not pc.TRAINING_FILE.exists(), reason="labelled workbook not in this checkout")
+def test_model_beats_the_majority_class_on_the_labelled_workbook():
+    accuracy, majority = pc.cross_validate(repeats=3)
+    assert accuracy > majority
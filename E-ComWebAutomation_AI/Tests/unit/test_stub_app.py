@@ -0,0 +1,120 @@
+import pytest
+import requests
+
+from stub_app.server import StubServer
+from utils import account_pool
+from utils.api_seed import ApiSeeder, SeedError
+
+USER = {"email": "test.qa@shop.com", "password": "ValidPassword123!"}
+
+
+@pytest.fixture(scope="module")
+def stub():
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def seeder(stub):
+    stub.store.reset()
+    seeder = ApiSeeder(stub.login_url)
+    yield seeder
+    seeder.close()
+
+
+def post(seeder, path, user, payload):
+    return requests.post(f"{seeder.api_root}{path}", json=payload, headers={"Authorization": user.token},
+                         timeout=10)
+
+
+@pytest.mark.parametrize("path, payload", [
+    ("/user/add-to-cart", {"quantity": "two"}),
+    ("/user/update-cart-quantity", {"quantity": None}),
+    ("/product/add-review/p1", {"rating": "five"}),
+])
+def test_non_numeric_fields_are_rejected(seeder, path, payload):
+    user = seeder.login(USER["email"], USER["password"])
+    response = post(seeder, path, user, payload)
+    assert response.status_code == 400
+    assert response.json()["message"].startswith("Invalid ")
+
+
+@pytest.mark.parametrize("payload", [
+    {"base_ms": "slow"},
+    {"jitter_ms": None},
+    {"routes": ["/api"]},
+    {"routes": {"/api": "slow"}},
+])
+def test_invalid_latency_settings_are_rejected(stub, payload):
+    response = requests.post(f"{stub.url}/__stub__/latency", json=payload, timeout=10)
+    assert response.status_code == 400
+    assert response.json()["message"].startswith("Invalid ")
+    assert stub.httpd.latency.base_ms == 0
+
+
+def test_non_object_body_is_treated_as_empty(seeder):
+    response = requests.post(f"{seeder.api_root}/auth/login", json=[], timeout=10)
+    assert response.status_code == 400
+    assert response.json()["message"] == "Invalid email or password"
+
+
+def test_unread_body_does_not_break_the_connection(seeder):
+    """Requests answered before their body is read must not poison keep-alive."""
+    with requests.Session() as session:
+        assert session.post(f"{seeder.api_root}/no-such-route", json={"a": 1}, timeout=10).status_code == 404
+        assert session.post(f"{seeder.api_root}/user/add-to-cart", json={"a": 1}, timeout=10).status_code == 401
+        assert session.post(f"{seeder.api_root}/product/get-all-products", json={}, timeout=10).status_code == 200
+
+
+def test_seeded_cart_replaces_the_previous_one(seeder, stub):
+    user = seeder.login(USER["email"], USER["password"])
+    title = next(iter(seeder.catalog()))
+    seeder.fill_cart(user, [title])
+    seeder.fill_cart(user, [title])
+    assert [product["productName"] for product, _ in stub.store.cart(user.user_id)] == [title]
+
+
+def test_unknown_product_is_a_seed_error(seeder):
+    user = seeder.login(USER["email"], USER["password"])
+    with pytest.raises(SeedError):
+        seeder.fill_cart(user, ["no such product"])
+
+
+def test_released_account_gets_a_clean_cart_and_profile(seeder, stub, tmp_path, monkeypatch):
+    monkeypatch.setattr(account_pool, "POOL_DIR", tmp_path)
+    pool = account_pool.AccountPool(seeder, "unit")
+    account = pool.lease()
+    user = seeder.login(account["email"], account["password"])
+    seeder.fill_cart(user, [next(iter(seeder.catalog()))])
+    post(seeder, "/user/update-profile", user, {"name": "Changed", "phone": "123", "address": "Street 1"})
+    for street in ("A", "B"):
+        post(seeder, "/user/add-address", user, {"street": street})
+
+    pool.release(account)
+
+    profile = stub.store.users[user.user_id]
+    assert (profile["name"], profile["phone"], profile["address"]) == (account["name"], "", "")
+    assert profile["addresses"] == []
+    assert stub.store.cart(user.user_id) == []
+    assert pool.status() == [(account["email"], None)]
+
+
+
+def test_release_skips_the_profile_reset_without_profile_routes(seeder, stub, tmp_path, monkeypatch):
+    """The real application has no profile API; returning an account must not fail."""
+    from stub_app.server import StubRequestHandler
+
+    routes = [route for route in StubRequestHandler.API_ROUTES if "profile" not in route[1]
+              and "address" not in route[1]]
+    monkeypatch.setattr(StubRequestHandler, "API_ROUTES", routes)
+    monkeypatch.setattr(account_pool, "POOL_DIR", tmp_path)
+    pool = account_pool.AccountPool(seeder, "unit")
+    account = pool.lease()
+    user = seeder.login(account["email"], account["password"])
+    seeder.fill_cart(user, [next(iter(seeder.catalog()))])
+
+    assert seeder.reset_profile(user, account["name"]) is False
+    pool.release(account)
+
+    assert stub.store.cart(user.user_id) == []
+    assert pool.status() == [(account["email"], None)]
@@ -0,0 +1,167 @@
+import json
+import os
+
+import pytest
+
+from utils import tc_registry
+from utils.tc_registry import TCRegistry
+
+LOGIN = '''import pytest
+from utils.test_helpers import test_case
+
+
+class TestLogin:
+
+    def test_valid_login(self):
+        """
+        TC: UA_03 - Verify login with valid credentials
+        """
+
+    @test_case("UA_04")
+    def test_invalid_login(self):
+        pass
+
+    def test_helper_without_ids(self):
+        pass
+
+
+def test_logout_ua05():
+    pass
+'''
+PAYMENT = '''def test_payment_form():
+    """TC: PY_01, PY_02 - Verify the payment form"""
+
+
+def test_coupon():
+    """Covers test case PY_10"""
+'''
+SPEC = """| TC ID | Title | Steps | Expected | Priority |
+| ----- | ----- | ----- | -------- | -------- |
+| UA_03 | Login with valid credentials | 1. Log in | Dashboard | High |
+| UA_04 | Login with invalid credentials | 1. Log in | Error | High |
+| UA_06 | Password reset | 1. Reset | Email sent | Medium |
+| PY_01 | Payment form | 1. Open | Form shown | High |
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    tests_dir = tmp_path / "Tests"
+    tests_dir.mkdir()
+    (tests_dir / "test_login.py").write_text(LOGIN)
+    (tests_dir / "test_payment.py").write_text(PAYMENT)
+    (tmp_path / "spec.md").write_text(SPEC)
+    return tmp_path
+
+
+def load(project):
+    return TCRegistry.load(project / "Tests", project / "spec.md", project / "cache.json")
+
+
+def node(project, name, test):
+    return f"{(project / 'Tests' / name).as_posix()}::{test}"
+
+
+class TestScan:
+
+    def test_ids_from_docstrings_decorators_and_names(self, project):
+        registry = load(project)
+        assert registry.ids_for(node(project, "test_login.py", "TestLogin::test_valid_login")) == ["UA_03"]
+        assert registry.ids_for(node(project, "test_login.py", "TestLogin::test_invalid_login")) == ["UA_04"]
+        assert registry.ids_for(node(project, "test_login.py", "test_logout_ua05")) == ["UA_05"]
+        assert node(project, "test_login.py", "TestLogin::test_helper_without_ids") not in registry.tests
+
+    def test_comma_separated_references_are_all_read(self, project):
+        registry = load(project)
+        assert registry.ids_for(node(project, "test_payment.py", "test_payment_form")) == ["PY_01", "PY_02"]
+        assert registry.ids_for(node(project, "test_payment.py", "test_coupon")) == ["PY_10"]
+
+    def test_parametrize_suffix_is_ignored(self, project):
+        nodeid = node(project, "test_payment.py", "test_coupon")
+        assert load(project).ids_for(f"{nodeid}[chrome]") == ["PY_10"]
+
+    def test_catalog_coverage(self, project):
+        registry = load(project)
+        assert registry.uncovered() == ["UA_06"]
+        assert registry.unknown() == ["PY_02", "PY_10", "UA_05"]
+
+
+class TestSelect:
+
+    def test_globs_and_comma_lists(self, project):
+        registry = load(project)
+        assert registry.select("PY_*") == {node(project, "test_payment.py", "test_payment_form"),
+                                           node(project, "test_payment.py", "test_coupon")}
+        assert registry.select("ua_03, UA_0[45]") == {
+            node(project, "test_login.py", "TestLogin::test_valid_login"),
+            node(project, "test_login.py", "TestLogin::test_invalid_login"),
+            node(project, "test_login.py", "test_logout_ua05"),
+        }
+        assert registry.select(["PY_02", "XX_*"]) == {node(project, "test_payment.py", "test_payment_form")}
+
+    def test_unknown_id_selects_nothing(self, project):
+        assert load(project).select("CO_99") == set()
+
+
+class TestCache:
+
+    @pytest.fixture
+    def scans(self, monkeypatch):
+        """Paths parsed by scan_test_file."""
+        parsed = []
+        scan = tc_registry.scan_test_file
+
+        def counting(source, rel_path):
+            parsed.append(rel_path.rsplit("/", 1)[-1])
+            return scan(source, rel_path)
+
+        monkeypatch.setattr(tc_registry, "scan_test_file", counting)
+        return parsed
+
+    def test_unchanged_files_are_not_parsed_again(self, project, scans):
+        load(project)
+        assert sorted(scans) == ["test_login.py", "test_payment.py"]
+        before = (project / "cache.json").stat().st_mtime_ns
+        scans.clear()
+
+        registry = load(project)
+        assert scans == []
+        assert (project / "cache.json").stat().st_mtime_ns == before
+        assert registry.tests == load(project).tests
+
+    def test_touched_file_with_same_content_is_not_parsed(self, project, scans):
+        load(project)
+        scans.clear()
+        path = project / "Tests" / "test_login.py"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        load(project)
+        assert scans == []
+        # The new mtime is stored, so the next load skips hashing as well
+        cached = json.loads((project / "cache.json").read_text())
+        assert cached["files"][path.as_posix()]["mtime_ns"] == stat.st_mtime_ns + 10 ** 9
+
+    def test_edited_file_is_parsed_again(self, project, scans):
+        load(project)
+        scans.clear()
+        path = project / "Tests" / "test_payment.py"
+        path.write_text(PAYMENT.replace("PY_10", "PY_11"))
+
+        registry = load(project)
+        assert scans == ["test_payment.py"]
+        assert registry.ids_for(node(project, "test_payment.py", "test_coupon")) == ["PY_11"]
+
+    def test_deleted_file_leaves_the_registry(self, project):
+        load(project)
+        (project / "Tests" / "test_payment.py").unlink()
+        assert load(project).select("PY_*") == set()
+
+    def test_cache_from_another_version_is_rebuilt(self, project, scans):
+        load(project)
+        cache = project / "cache.json"
+        cache.write_text(cache.read_text().replace(f'"version": {tc_registry.CACHE_VERSION}', '"version": 0'))
+        scans.clear()
+
+        load(project)
+        assert sorted(scans) == ["test_login.py", "test_payment.py"]
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from utils import testcase_dedup as dedup
+from utils.testcase_dedup import Case
+
+
+def test_shingles_ignore_case_punctuation_and_stop_words():
+    assert np.array_equal(np.sort(dedup.shingle_hashes("Verify the LOGIN, with password")),
+                          np.sort(dedup.shingle_hashes("login password")))
+    assert dedup.shingle_hashes("the test of").size == 0
+
+
+def test_short_text_is_one_shingle():
+    assert dedup.shingle_hashes("cart").size == 1
+
+
+class TestMinHasher:
+
+    def test_signature_slots_estimate_jaccard_similarity(self):
+        a = np.arange(0, 1000, dtype=np.uint64)
+        b = np.arange(500, 1500, dtype=np.uint64)  # Jaccard 500 / 1500
+        signatures = dedup.MinHasher(num_perm=512).signatures([a, b])
+        assert (signatures[0] == signatures[1]).mean() == pytest.approx(1 / 3, abs=0.07)
+
+    def test_identical_sets_have_identical_signatures(self):
+        a = dedup.shingle_hashes("add product to cart and check the total")
+        signatures = dedup.MinHasher().signatures([a, a.copy()[::-1]])
+        assert np.array_equal(signatures[0], signatures[1])
+
+    def test_batching_does_not_change_signatures(self):
+        sets = [dedup.shingle_hashes(text) for text in ("login page", "", "cart total", "profile phone")]
+        hasher = dedup.MinHasher(num_perm=64)
+        assert np.array_equal(hasher.signatures(sets, batch=1), hasher.signatures(sets))
+
+    def test_empty_sets_never_match_anything(self):
+        signatures = dedup.MinHasher(num_perm=16).signatures([np.empty(0, np.uint64)])
+        assert (signatures == dedup.PRIME).all()
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.6, 0.8])
+def test_lsh_shape_midpoint_is_just_below_the_threshold(threshold):
+    bands, rows = dedup.lsh_shape(threshold)
+    assert bands * rows == dedup.NUM_PERM
+    midpoint = (1 / bands) ** (1 / rows)
+    assert midpoint <= threshold
+    others = [(dedup.NUM_PERM // r, r) for r in range(1, dedup.NUM_PERM + 1) if dedup.NUM_PERM % r == 0]
+    assert all((1 / b) ** (1 / r) <= midpoint or (1 / b) ** (1 / r) > threshold for b, r in others)
+
+
+def test_candidate_pairs_share_a_band():
+    signatures = np.array([[1, 2, 3, 4], [1, 2, 9, 9], [7, 7, 7, 7], [5, 6, 3, 4]], dtype=np.uint64)
+    pairs = dedup.candidate_pairs(signatures, bands=2, rows=2)
+    assert pairs.tolist() == [[0, 1], [0, 3]]
+
+
+def test_oversized_buckets_are_skipped():
+    signatures = np.zeros((4, 4), dtype=np.uint64)
+    assert dedup.candidate_pairs(signatures, 2, 2, max_bucket=3).shape == (0, 2)
+
+
+def test_jaccard():
+    a = np.array([1, 2, 3, 4], dtype=np.uint64)
+    b = np.array([3, 4, 5], dtype=np.uint64)
+    assert dedup._jaccard(a, b) == pytest.approx(2 / 5)
+    assert dedup._jaccard(a, np.empty(0, np.uint64)) == 0.0
+
+
+class TestFindClusters:
+
+    def test_near_duplicates_are_grouped(self):
+        cases = [
+            Case("c1", "catalog", "Verify user can add a product to the cart from the dashboard", ["CT_01"]),
+            Case("c2", "catalog", "Verify user can add product to the cart from dashboard", ["CT_07"]),
+            Case("c3", "catalog", "Verify password reset email is sent for a registered address", ["UA_09"]),
+        ]
+        clusters = dedup.find_clusters(cases)
+        assert len(clusters) == 1
+        members, similarity = clusters[0]
+        assert {case.key for case in members} == {"c1", "c2"}
+        assert 0.6 <= similarity <= 1.0
+
+    def test_same_test_case_is_not_a_duplicate_of_itself(self):
+        cases = [
+            Case("c1", "catalog", "Verify login with valid credentials", ["UA_03"]),
+            Case("Tests/test_login.py::test_valid_login", "test", "Verify login with valid credentials", ["UA_03"]),
+        ]
+        assert dedup.find_clusters(cases) == []
+
+
+def test_removable_nodeids_keep_the_lowest_tc_id():
+    cluster = [
+        Case("c2", "catalog", "", ["CT_07"], ["Tests/test_cart.py::test_b", "Tests/test_cart.py::test_shared"]),
+        Case("c1", "catalog", "", ["CT_01"], ["Tests/test_cart.py::test_a", "Tests/test_cart.py::test_shared"]),
+        Case("c3", "catalog", "", ["CT_09"]),
+    ]
+    assert dedup.removable_nodeids(cluster) == ("CT_01", ["Tests/test_cart.py::test_b"])
+    assert dedup.removable_nodeids(cluster[2:]) == (None, [])
@@ -0,0 +1,137 @@
+import ast
+
+import openpyxl
+import pytest
+
+from utils import testcase_generator as generator
+from utils import tc_registry
+
+SPEC = """# Catalog
+
+| TC ID | Test Case Title | Steps | Expected Result | Priority |
+| ----- | --------------- | ----- | --------------- | -------- |
+| UA_01 | Verify registration (new user) | 1. Open register <br>2. Submit | Account created | High |
+| UA_02 | Verify login | 1. Log in | Dashboard shown | Medium |
+| XX_01 | Unknown module | 1. Nothing | Nothing | Low |
+
+Notes between tables.
+
+| TC ID | Test Case Title | Steps | Expected Result | Priority |
+| ----- | --------------- | ----- | --------------- | -------- |
+| SC_01 | Verify cart shows items | 1. Add item | Item listed | High |
+"""
+
+
+@pytest.fixture
+def spec(tmp_path):
+    path = tmp_path / "catalog.md"
+    path.write_text(SPEC, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def output(tmp_path):
+    return tmp_path / "generated"
+
+
+def run(cases, output, covered=()):
+    stubs = generator.StubGenerator(cases, covered, output)
+    files, actions, manifest = stubs.plan()
+    stubs.write(files, manifest)
+    return files, {action: ids for action, ids in actions.items() if ids}
+
+
+class TestSources:
+
+    def test_markdown_rows_are_parsed_per_table(self, spec):
+        cases = list(generator.read_markdown_cases(spec))
+        assert [c["id"] for c in cases] == ["UA_01", "UA_02", "XX_01", "SC_01"]
+        assert cases[0]["steps"] == ["Open register", "Submit"]
+        assert cases[0]["expected"] == "Account created"
+
+    def test_workbook_fills_missing_fields(self, spec, tmp_path):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["Test Case ID", "Title", "Test Data (Input)", "Priority"])
+        sheet.append(["UA_02", "Login (workbook title)", "user@shop.com", "Low"])
+        sheet.append(["PY_01", "Verify card payment", "4111 1111", "High"])
+        workbook.save(tmp_path / "cases.xlsx")
+
+        cases = generator.load_cases(spec, tmp_path / "cases.xlsx")
+        assert cases["UA_02"]["title"] == "Verify login"  # the markdown catalog wins
+        assert cases["UA_02"]["data"] == "user@shop.com"
+        assert cases["PY_01"]["title"] == "Verify card payment"
+
+    def test_missing_sources_are_skipped(self, tmp_path):
+        assert generator.load_cases(tmp_path / "none.md", tmp_path / "none.xlsx") == {}
+
+
+class TestStubGenerator:
+
+    def test_stubs_are_valid_and_registered(self, spec, output):
+        files, actions = run(generator.load_cases(spec, "none.xlsx"), output)
+        assert actions == {"created": ["UA_01", "UA_02", "SC_01"]}
+        assert sorted(p.name for p in files) == ["test_shopping_cart.py", "test_user_account.py"]
+        source = (output / "test_user_account.py").read_text()
+        ast.parse(source)
+        assert "def test_registration_ua01(self, driver_for_test):" in source
+
+        tests = tc_registry.scan_test_file(source.encode(), "test_user_account.py")
+        prefix = "test_user_account.py::TestGeneratedUserAccount::"
+        assert tests == {f"{prefix}test_registration_ua01": ["UA_01"], f"{prefix}test_login_ua02": ["UA_02"]}
+
+    def test_rerun_without_changes_writes_nothing(self, spec, output):
+        cases = generator.load_cases(spec, "none.xlsx")
+        run(cases, output)
+        files, actions = run(cases, output)
+        assert files == {}
+        assert actions == {"unchanged": ["UA_01", "UA_02", "SC_01"]}
+
+    def test_only_changed_rows_are_rewritten(self, spec, output):
+        cases = generator.load_cases(spec, "none.xlsx")
+        run(cases, output)
+        cart = (output / "test_shopping_cart.py").read_text()
+
+        cases["UA_02"]["expected"] = "Dashboard and greeting shown"
+        files, actions = run(cases, output)
+        assert actions == {"updated": ["UA_02"], "unchanged": ["UA_01", "SC_01"]}
+        assert list(files) == [output / "test_user_account.py"]
+        assert "Dashboard and greeting shown" in (output / "test_user_account.py").read_text()
+        assert (output / "test_shopping_cart.py").read_text() == cart
+
+    def test_hand_edited_stub_is_never_overwritten(self, spec, output):
+        cases = generator.load_cases(spec, "none.xlsx")
+        run(cases, output)
+        path = output / "test_user_account.py"
+        path.write_text(path.read_text().replace('raise NotImplementedError("UA_02")', "page.login()"))
+
+        cases["UA_02"]["expected"] = "Changed"
+        del cases["UA_01"]
+        _, actions = run(cases, output)
+        assert actions == {"edited": ["UA_02"], "unchanged": ["SC_01"], "removed": ["UA_01"]}
+        text = path.read_text()
+        assert "page.login()" in text and "Changed" not in text
+        assert "UA_01" not in text
+
+    def test_covered_ids_are_removed_and_empty_modules_deleted(self, spec, output):
+        cases = generator.load_cases(spec, "none.xlsx")
+        run(cases, output)
+        files, actions = run(cases, output, covered={"SC_01"})
+        assert actions == {"unchanged": ["UA_01", "UA_02"], "removed": ["SC_01"]}
+        assert files == {output / "test_shopping_cart.py": None}
+        assert not (output / "test_shopping_cart.py").exists()
+        assert "SC_01" not in (output / "manifest.json").read_text()
+
+    def test_text_around_the_stubs_is_kept(self, spec, output):
+        cases = generator.load_cases(spec, "none.xlsx")
+        run(cases, output)
+        path = output / "test_user_account.py"
+        path.write_text(path.read_text().replace("import pytest\n", "import pytest\nimport json\n")
+                        + "\n\ndef helper():\n    pass\n")
+
+        cases["UA_01"]["priority"] = "Low"
+        _, actions = run(cases, output)
+        assert actions["updated"] == ["UA_01"]
+        text = path.read_text()
+        assert "import json\n" in text and text.endswith("def helper():\n    pass\n")
+        assert "priority='low'" in text
@@ -0,0 +1,27 @@
+import pytest
+
+from utils import transport
+
+
+def entry(*samples):
+    transport._latency.pop("unit", None)
+    for elapsed_ms in samples:
+        transport._observe("unit", elapsed_ms)
+    return transport._latency.pop("unit")
+
+
+def test_percentile_is_the_bucket_edge():
+    latencies = entry(3, 4, 15, 150)
+    assert transport._percentile(latencies, 0.5) == 5
+    assert transport._percentile(latencies, 0.75) == 20
+
+
+def test_percentile_never_exceeds_the_slowest_observation():
+    latencies = entry(12.5, 13, 13.4)
+    assert transport._percentile(latencies, 0.5) == 13.4
+    assert transport._percentile(latencies, 0.95) == 13.4
+
+
+@pytest.mark.parametrize("fraction", [0.5, 0.95])
+def test_overflow_bucket_reports_the_maximum(fraction):
+    assert transport._percentile(entry(6000, 7123), fraction) == 7123
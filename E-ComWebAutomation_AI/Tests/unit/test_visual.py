@@ -0,0 +1,125 @@
+import io
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from utils import visual
+from utils.config import DEFAULT_CONFIG
+
+SETTINGS = DEFAULT_CONFIG["visual"]
+
+
+def png(pixels):
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def gradient(height=96, width=128):
+    rows, cols = np.mgrid[0:height, 0:width]
+    return ((rows * 2 + cols) % 256).astype(np.uint8)
+
+
+@pytest.fixture
+def baselines(tmp_path, monkeypatch):
+    monkeypatch.setattr(visual, "BASELINE_DIR", tmp_path / "baselines")
+    monkeypatch.setitem(visual._state, "diff_dir", str(tmp_path / "diffs"))
+    return tmp_path
+
+
+class TestBlockDiff:
+
+    def test_identical_images_have_no_difference(self):
+        image = gradient()
+        assert not visual.block_diff(image, image, 8).any()
+
+    def test_one_value_per_block_rounded_up(self):
+        image = np.zeros((20, 10), np.uint8)
+        assert visual.block_diff(image, image, 8).shape == (3, 2)
+
+    def test_mean_over_the_block(self):
+        a = np.zeros((16, 16), np.uint8)
+        b = a.copy()
+        b[0, 0] = 64
+        diff = visual.block_diff(a, b, 8)
+        assert diff[0, 0] == pytest.approx(1.0)
+        assert diff.sum() == pytest.approx(1.0)
+
+    def test_edge_blocks_are_averaged_over_their_own_pixels(self):
+        a = np.zeros((10, 10), np.uint8)
+        b = a.copy()
+        b[9, 9] = 80
+        assert visual.block_diff(a, b, 8)[1, 1] == pytest.approx(20.0)
+
+    def test_difference_is_symmetric_without_wrapping(self):
+        a = np.full((8, 8), 250, np.uint8)
+        b = np.full((8, 8), 5, np.uint8)
+        assert visual.block_diff(a, b, 8)[0, 0] == visual.block_diff(b, a, 8)[0, 0] == 245
+
+
+class TestBlockMask:
+
+    def test_aligned_rectangle_covers_one_block(self):
+        mask = visual.block_mask((32, 32), [(8, 8, 8, 8)], 8)
+        assert mask.sum() == 1 and mask[1, 1]
+
+    def test_partial_overlap_covers_every_touched_block(self):
+        mask = visual.block_mask((32, 32), [(4, 4, 8, 8)], 8)
+        assert mask[:2, :2].all() and mask.sum() == 4
+
+    def test_rectangles_outside_or_empty_are_clipped(self):
+        mask = visual.block_mask((16, 16), [(-10, -10, 14, 14), (5, 5, 0, 3), (12, 12, 40, 40)], 8)
+        assert mask.tolist() == [[True, False], [False, True]]
+
+
+def test_perceptual_hash_tolerates_noise_but_not_a_different_image():
+    image = gradient()
+    noisy = np.clip(image.astype(int) + np.random.default_rng(0).integers(-3, 4, image.shape), 0, 255)
+    flipped = image[:, ::-1].copy()
+    assert visual.hash_distance(visual.phash(image), visual.phash(noisy.astype(np.uint8))) <= 2
+    assert visual.hash_distance(visual.phash(image), visual.phash(flipped)) > SETTINGS["phash_distance"]
+
+
+class TestCompare:
+
+    def test_first_checkpoint_records_the_baseline(self, baselines):
+        result = visual.compare("Page.image", png(gradient()), [], SETTINGS)
+        assert result["status"] == "new"
+        assert visual.baseline_file("Page.image").exists()
+
+    def test_same_rendering_matches(self, baselines):
+        visual.compare("Page.image", png(gradient()), [], SETTINGS)
+        result = visual.compare("Page.image", png(gradient()), [], SETTINGS)
+        assert result["status"] == "match"
+        assert result["changed_blocks"] == 0
+
+    def test_local_change_is_a_mismatch_with_a_diff_image(self, baselines):
+        visual.compare("Page.image", png(gradient()), [], SETTINGS)
+        changed = gradient()
+        changed[10:30, 20:60] = 255
+        result = visual.compare("Page.image", png(changed), [], SETTINGS)
+        assert result["status"] == "mismatch"
+        assert result["changed_blocks"] > 0
+        diff = Path(result["diff"])
+        assert diff.exists() and diff.parent == baselines / "diffs"
+
+    def test_ignored_region_is_masked(self, baselines):
+        visual.compare("Page.image", png(gradient()), [], SETTINGS)
+        changed = gradient()
+        changed[10:30, 20:60] = 255
+        result = visual.compare("Page.image", png(changed), [(20, 10, 40, 20)], SETTINGS)
+        assert result["status"] == "match"
+
+    def test_size_change_is_a_mismatch(self, baselines):
+        visual.compare("Page.image", png(gradient()), [], SETTINGS)
+        result = visual.compare("Page.image", png(gradient(96, 120)), [], SETTINGS)
+        assert result["status"] == "mismatch"
+        assert result["size"] == "128x96 -> 120x96"
+
+    def test_update_replaces_the_baseline(self, baselines):
+        visual.compare("Page.image", png(gradient()), [], SETTINGS)
+        flipped = gradient()[:, ::-1].copy()
+        assert visual.compare("Page.image", png(flipped), [], SETTINGS, update=True)["status"] == "updated"
+        assert visual.compare("Page.image", png(flipped), [], SETTINGS)["status"] == "match"
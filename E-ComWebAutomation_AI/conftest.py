@@ -1,54 +1,78 @@
 import os
+import sys
+import json
 import time
 import pytest
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from openpyxl import Workbook
 from utils.logger import init_logger
 
-from utils.config import TestConfig
-from utils.test_utils import take_screenshot, save_test_artifacts
-from utils.report_helper import create_excel_report, cleanup_old_reports, consolidate_run_logs
+from utils.config import TestConfig, set_config
+from utils.locks import LockTimeout, ResourceLocks, resource_names
+from utils.self_healing import drain_healed
+
+# Selenium, webdriver_manager and openpyxl are imported where they are first
+# used (utils.driver_factory, pytest_sessionfinish) so that collection and
+# xdist worker start-up stay cheap.
 
 # Global variables
 logger = None
 test_config = None
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--tc", action="store", default=None, metavar="IDS",
+        help="Run only tests covering these test-case IDs, e.g. PY_*,UA_03"
+    )
+    parser.addoption(
+        "--impact", action="store", default=None, metavar="REF",
+        help="Run only tests affected by changes since a git ref (see utils.impact)"
+    )
+    parser.addoption(
+        "--record-impact", action="store_true", default=False,
+        help="Record the project functions each test executes, for --impact"
+    )
+    parser.addoption(
+        "--skip-locator-check", action="store_true", default=False,
+        help="Do not validate page-object locators offline before the run"
+    )
+    parser.addoption(
+        "--web-perf-baseline", action="store_true", default=False,
+        help="Store this run's per-screen front-end timings as the baseline (see utils.web_perf)"
+    )
+    parser.addoption(
+        "--visual-baseline", action="store_true", default=False,
+        help="Record every visual checkpoint as the new baseline (see utils.visual)"
+    )
+
 def pytest_configure(config):
     """
     Custom pytest configuration for test execution.
     Sets up logging, directories, and configuration.
     """
-    # Initialize test configuration
+    # Initialize test configuration: the controller (or a plain, non-xdist
+    # run) resolves it once; xdist workers reuse the controller's snapshot
     global test_config
-    test_config = TestConfig()
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput and 'test_config' in workerinput:
+        test_config = TestConfig.from_json(workerinput['test_config'])
+    else:
+        test_config = TestConfig()
+    set_config(test_config)
     
-    # Create timestamp for this run
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-    # Create run directory structure
-    logs_root = os.path.abspath('test_logs')
-    os.makedirs(logs_root, exist_ok=True)
-    run_dir = os.path.join(logs_root, timestamp)
-    os.makedirs(run_dir, exist_ok=True)
-    os.makedirs(os.path.join(run_dir, 'screenshots'), exist_ok=True)
-    os.makedirs(os.path.join(run_dir, 'logs'), exist_ok=True)
-    os.makedirs(os.path.join(run_dir, 'artifacts'), exist_ok=True)
-
-    # Attach run info to config
-    config._run_dir = run_dir
+    # Timestamp for this run; workers share the controller's so that
+    # all artifacts land in one run directory
+    if workerinput and 'run_timestamp' in workerinput:
+        timestamp = workerinput['run_timestamp']
+    else:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    # Attach run info to config. The directory itself is created on first
+    # use by ensure_run_dir(), so --collect-only never touches the disk.
+    config._run_dir = os.path.join(os.path.abspath('test_logs'), timestamp)
     config._run_timestamp = timestamp
     config._test_config = test_config
 
-    # Initialize logger
-    global logger
-    logger = init_logger(run_dir)
-    logger.info(f"Test run directory created: {run_dir}")
-
     # Configure test session metadata
     metadata = {
         'Timestamp': timestamp,
@@ -68,56 +92,149 @@ def pytest_configure(config):
         if workers != 'auto':
             config.option.numprocesses = int(workers)
 
-    # Clean up old reports
-    cleanup_old_reports(logs_root)
-
     # create container for test results that will be written to Excel
     config._test_results = []
 
+    # --tc: resolve the selection once from the cached TC registry; workers
+    # receive the controller's result
+    config._tc_selection = None
+    if workerinput and 'tc_selection' in workerinput:
+        config._tc_selection = set(workerinput['tc_selection'])
+    elif config.getoption('tc'):
+        from utils.tc_registry import TCRegistry
+        config._tc_selection = TCRegistry.load().select(config.getoption('tc'))
+
+    # --impact: same pattern, from the git diff and recorded coverage
+    config._impact_selection = None
+    if workerinput and 'impact_selection' in workerinput:
+        from utils.impact import ImpactSelection
+        config._impact_selection = ImpactSelection.from_json(workerinput['impact_selection'])
+    elif config.getoption('impact'):
+        from utils.impact import impact_since
+        config._impact_selection = impact_since(config.getoption('impact'))
+        for reason in config._impact_selection.reasons:
+            print(f"impact: {reason}")
+    if config.getoption('record_impact'):
+        from utils.impact import CoverageRecorder
+        config.pluginmanager.register(CoverageRecorder(config), 'impact-recorder')
+
+    # Capability health: stop starting browsers for tests whose login /
+    # add-to-cart / checkout precondition is already known to be broken
+    if test_config.health['enabled'] and not config.option.collectonly:
+        from utils.health import HealthMonitor
+        config.pluginmanager.register(HealthMonitor(config, test_config.health), 'capability-health')
+
+    # Front-end timings sampled at page-object transitions, summarized per screen
+    if test_config.web_perf['enabled'] and not config.option.collectonly:
+        from utils.web_perf import WebPerfReporter
+        config.pluginmanager.register(WebPerfReporter(config, test_config.web_perf), 'web-perf')
+
+    # Element screenshots compared with baselines in a background pool
+    if test_config.visual['enabled'] and not config.option.collectonly:
+        from utils.visual import VisualReporter
+        config.pluginmanager.register(VisualReporter(config, test_config.visual), 'visual')
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Ship the controller's configuration snapshot to each xdist worker."""
+    node.workerinput['test_config'] = node.config._test_config.to_json()
+    node.workerinput['run_timestamp'] = node.config._run_timestamp
+    if node.config._tc_selection is not None:
+        node.workerinput['tc_selection'] = sorted(node.config._tc_selection)
+    if node.config._impact_selection is not None:
+        node.workerinput['impact_selection'] = node.config._impact_selection.to_json()
+
+
+def pytest_sessionstart(session):
+    """
+    Validate page-object locators offline (syntax, missing imports, DOM
+    snapshots) before any browser starts; errors abort the run. Runs once,
+    on the controller.
+    """
+    config = session.config
+    if hasattr(config, 'workerinput') or config.getoption('skip_locator_check'):
+        return
+    try:
+        from utils.locator_check import check
+        findings = check()
+    except ImportError as e:
+        print(f"locator check skipped: {e}")
+        return
+    errors = [f for f in findings if f.level == 'error']
+    for finding in findings:
+        print(f"locator check: {finding}")
+    if errors:
+        pytest.exit(f"{len(errors)} page-object locator error(s); fix them or pass --skip-locator-check",
+                    returncode=pytest.ExitCode.USAGE_ERROR)
+
+
+def ensure_run_dir(config):
+    """
+    Create the run directory structure and logger on first use.
+    Args:
+        config: pytest config carrying ``_run_dir``
+    Returns:
+        str: Path to the run directory
+    """
+    global logger
+    run_dir = config._run_dir
+    if logger is None:
+        for sub_dir in ('screenshots', 'logs', 'artifacts'):
+            os.makedirs(os.path.join(run_dir, sub_dir), exist_ok=True)
+        logger = init_logger(run_dir)
+        logger.info(f"Test run directory created: {run_dir}")
+    return run_dir
+
+@pytest.fixture(scope="session")
+def asset_cache(request):
+    """
+    Session-scoped warm asset cache (utils/asset_cache.py), shared by all
+    workers. Returns the read-only master directory, or None when
+    asset_cache.enabled is off or warming failed (sessions then run cold).
+    """
+    settings = test_config.asset_cache
+    if not settings['enabled']:
+        return None
+
+    from utils.asset_cache import warm
+    from utils.driver_factory import resolve_driver_path, create_driver
+
+    ensure_run_dir(request.config)
+    base_url = request.getfixturevalue('base_url')
+    try:
+        driver_path = resolve_driver_path()
+        master = warm(base_url, request.config._run_timestamp,
+                      lambda cache_dir: create_driver(test_config.browser, driver_path, cache_dir=str(cache_dir)),
+                      settings['max_age_hours'])
+    except Exception as e:
+        logger.warning(f"Asset cache unavailable, sessions run cold: {e}")
+        return None
+    logger.info(f"Using warm asset cache {master}")
+    return master
+
 @pytest.fixture(scope="function")
-def setup_driver(request, browser_config):
+def setup_driver(request, browser_config, asset_cache):
     """
     Sets up the Chrome WebDriver instance using webdriver_manager.
     This fixture is function-scoped for parallel execution support.
     Uses browser_config fixture for configuration.
+    With the asset cache on, the session starts from a private copy of it.
     """
-    # Configure Chrome options
-    chrome_options = Options()
-    chrome_options.page_load_strategy = 'none'  # Don't wait for full page load
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--ignore-certificate-errors')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--disable-extensions')
-    chrome_options.add_argument('--disable-software-rasterizer')
-    chrome_options.add_argument('--disk-cache-size=0')  # Disable disk cache
-    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])  # Reduce logging
-    
-    # Apply browser config
-    if browser_config['headless']:
-        chrome_options.add_argument('--headless=new')  # new headless mode
-    
-    # Set viewport size
-    chrome_options.add_argument(f"--window-size={browser_config['viewport_width']},{browser_config['viewport_height']}")
-    
-    # Try to use an existing ChromeDriver if available
-    driver_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chromedriver.exe")
-    
-    if not os.path.exists(driver_path):
-        try:
-            driver_path = ChromeDriverManager().install()
-        except Exception as e:
-            logger.error(f"Failed to install ChromeDriver: {str(e)}")
-            pytest.skip("ChromeDriver installation failed")
-    
-    # Create ChromeService with the driver path
-    service = ChromeService(driver_path)
-    
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver.implicitly_wait(browser_config['timeout'])
-    
-    if not browser_config['headless']:
-        driver.maximize_window()
+    from utils.driver_factory import resolve_driver_path, create_driver
+
+    ensure_run_dir(request.config)
+    try:
+        driver_path = resolve_driver_path()
+    except Exception as e:
+        logger.error(f"Failed to install ChromeDriver: {str(e)}")
+        pytest.skip("ChromeDriver installation failed")
+
+    cache_copy = None
+    if asset_cache is not None:
+        from utils.asset_cache import session_copy
+        cache_copy = session_copy(asset_cache)
+    driver = create_driver(browser_config, driver_path, cache_dir=cache_copy)
     
     # Store the driver in the request context for screenshots
     request.instance.driver = driver
@@ -128,7 +245,7 @@ def setup_driver(request, browser_config):
     try:
         if hasattr(request.node, 'rep_call') and request.node.rep_call.failed:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            run_dir = getattr(request.config, '_run_dir', os.path.abspath('test_logs'))
+            run_dir = ensure_run_dir(request.config)
             screenshots_dir = os.path.join(run_dir, 'screenshots')
             screenshot_name = os.path.join(screenshots_dir, f"failed_{request.node.name}_{timestamp}.png")
             driver.save_screenshot(screenshot_name)
@@ -136,33 +253,95 @@ def setup_driver(request, browser_config):
                 logger.error(f"Saved failure screenshot (teardown): {screenshot_name}")
     except Exception:
         pass
+
+    if test_config.web_perf['enabled']:
+        from utils.web_perf import sample
+        sample(driver)  # the screen the test ended on
+    if asset_cache is not None:
+        from utils.asset_cache import record, discard
+        record(driver)
     
     # Teardown: close the browser after each test
     driver.quit()
+    if cache_copy:
+        discard(cache_copy)
 
 @pytest.fixture(scope="session")
-def base_url():
+def stub_server():
+    """
+    Session-scoped local stub of the application (one per xdist worker).
+    Started only when stub.enabled is set (TEST_STUB_SERVER=true); yields
+    None otherwise.
+    """
+    stub = test_config.stub
+    if not stub['enabled']:
+        yield None
+        return
+
+    from stub_app.server import StubServer, LatencyProfile
+
+    server = StubServer(latency=LatencyProfile(stub['latency_ms'], stub['jitter_ms'])).start()
+    if logger:
+        logger.info(f"Stub application started at {server.url}")
+    yield server
+    server.stop()
+
+@pytest.fixture(scope="session")
+def base_url(stub_server):
     """
     Defines the base URL for the application.
     Can be overridden by environment variables.
+    Points at the local stub application when it is enabled.
     Session scope - created once for all tests.
     """
+    if stub_server:
+        return stub_server.login_url
     return os.getenv('TEST_BASE_URL', 
                      "https://rahulshettyacademy.com/client/#/auth/login")
 
+@pytest.fixture(scope="session")
+def api_seeder(base_url):
+    """
+    Session-scoped REST client for seeding preconditions (users, carts,
+    orders) without driving the UI. One pooled HTTP session per worker.
+    """
+    from utils.api_seed import ApiSeeder
+
+    seeder = ApiSeeder(base_url)
+    yield seeder
+    seeder.close()
+
+@pytest.fixture(scope="session")
+def account_pool(api_seeder, stub_server, base_url):
+    """
+    Session-scoped handle on the cross-worker test account pool.
+    Every stub application run shares one pool file.
+    """
+    from urllib.parse import urlsplit
+    from utils.account_pool import AccountPool
+
+    namespace = "stub" if stub_server else urlsplit(base_url).netloc
+    return AccountPool(api_seeder, namespace)
+
+@pytest.fixture
+def test_account(account_pool):
+    """
+    Function-scoped account leased for the test's exclusive use.
+    Same shape as TestData.VALID_USER; the cart is emptied and the profile
+    restored on return.
+    """
+    account = account_pool.lease()
+    yield account
+    account_pool.release(account)
+
 @pytest.fixture(scope="module")
 def browser_config():
     """
     Module-scoped fixture for browser configuration.
     Same browser config will be used for all tests in a module.
+    Read from the run's configuration snapshot (TEST_* env vars included).
     """
-    config = {
-        'headless': os.getenv('TEST_HEADLESS', 'true').lower() == 'true',
-        'viewport_width': int(os.getenv('TEST_VIEWPORT_WIDTH', 1920)),
-        'viewport_height': int(os.getenv('TEST_VIEWPORT_HEIGHT', 1080)),
-        'timeout': int(os.getenv('TEST_TIMEOUT', 10))
-    }
-    return config
+    return test_config.browser
 
 @pytest.fixture(scope="class")
 def user_credentials():
@@ -181,7 +360,7 @@ def test_data_dir(request):
     Session-scoped fixture for test data directory.
     Creates and provides path to test data directory.
     """
-    data_dir = os.path.join(request.config._run_dir, 'test_data')
+    data_dir = os.path.join(ensure_run_dir(request.config), 'test_data')
     os.makedirs(data_dir, exist_ok=True)
     return data_dir
 
@@ -197,9 +376,68 @@ def driver_for_test(setup_driver, base_url, user_credentials):
     driver.get(base_url)
     return driver
 
+def pytest_ignore_collect(collection_path, config):
+    """With --tc/--impact, skip importing test modules with no selected test."""
+    tc_selection, impact = config._tc_selection, config._impact_selection
+    if (tc_selection is None and impact is None) or collection_path.suffix != '.py' \
+            or not collection_path.name.startswith('test_'):
+        return None
+    try:
+        rel = collection_path.relative_to(config.rootpath).as_posix()
+    except ValueError:
+        return None
+    if tc_selection is not None and not any(nodeid.startswith(rel + '::') for nodeid in tc_selection):
+        return True
+    if impact is not None and not impact.includes_file(rel):
+        return True
+    return None
+
+def pytest_collection_modifyitems(config, items):
+    """With --tc/--impact, keep only the selected tests."""
+    tc_selection, impact = config._tc_selection, config._impact_selection
+    if tc_selection is None and impact is None:
+        return
+    selected, deselected = [], []
+    for item in items:
+        keep = (tc_selection is None or item.nodeid.split('[', 1)[0] in tc_selection) \
+            and (impact is None or impact.includes(item.nodeid))
+        (selected if keep else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_runtest_setup(item):
+    """
+    Take the test's ``resource`` locks before its fixtures are set up so
+    tests touching the same shared state never overlap on other workers.
+    They are held until teardown finishes. A lock that cannot be acquired
+    fails this test only.
+    """
     # record start time for the test
     item._start_time = time.time()
+    names = resource_names(item)
+    if not names:
+        return
+    locks = ResourceLocks(names)
+    try:
+        locks.acquire()
+    except LockTimeout as e:
+        pytest.fail(f"Shared resource busy: {e}", pytrace=False)
+    item._resource_locks = locks
+    if locks.waited > 1 and logger:
+        logger.info(f"{item.nodeid} waited {locks.waited:.1f}s for {', '.join(locks.names)}")
+    item.user_properties.append(("resource_wait_s", round(locks.waited, 3)))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Release the test's ``resource`` locks once its fixtures are torn down."""
+    yield
+    locks = getattr(item, '_resource_locks', None)
+    if locks is not None:
+        locks.release()
+        item._resource_locks = None
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -214,6 +452,17 @@ def pytest_runtest_makereport(item, call):
     # attach report to item for other fixtures
     setattr(item, "rep_" + rep.when, rep)
 
+    # locators resolved by a fallback candidate during this phase
+    healed = drain_healed()
+    if healed:
+        item._healed_locators = getattr(item, '_healed_locators', []) + healed
+        for event in healed:
+            item.user_properties.append(("healed_locators", f"{event['locator']} -> {event['candidate']}"))
+        if logger:
+            for event in healed:
+                logger.warning(f"{item.nodeid}: healed {event['locator']} "
+                               f"({event['primary']} -> {event['candidate']})")
+
     # Only collect the call phase (the test function execution)
     if rep.when == 'call':
         start = getattr(item, '_start_time', None)
@@ -228,7 +477,7 @@ def pytest_runtest_makereport(item, call):
             driver = item.funcargs.get('driver_for_test') or getattr(item.instance, 'driver', None)
             if rep.failed and driver:
                 ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-                run_dir = getattr(item.config, '_run_dir', os.path.abspath('test_logs'))
+                run_dir = ensure_run_dir(item.config)
                 screenshots_dir = os.path.join(run_dir, 'screenshots')
                 screenshot_path = os.path.join(screenshots_dir, f"failed_{item.name}_{ts}.png")
                 try:
@@ -247,6 +496,8 @@ def pytest_runtest_makereport(item, call):
             'outcome': rep.outcome,
             'duration': duration,
             'screenshot': screenshot_path,
+            'healed_locators': '; '.join(f"{e['locator']} -> {e['candidate']}"
+                                         for e in getattr(item, '_healed_locators', [])),
         }
         try:
             item.config._test_results.append(result)
@@ -254,29 +505,107 @@ def pytest_runtest_makereport(item, call):
             pass
 
 
+def _write_worker_stats(config, name, stats, summary_line):
+    """
+    Save this process's stats as ``artifacts/<name>[_<workerid>].json`` and log a summary.
+    Args:
+        config: pytest config carrying ``_run_dir``
+        name (str): Artifact name
+        stats (dict): JSON-serialisable statistics
+        summary_line (str): One-line summary for the run log
+    """
+    from utils.report_helper import worker_artifact_path
+
+    ensure_run_dir(config)
+    with open(worker_artifact_path(config, name), 'w') as f:
+        json.dump(stats, f, indent=2, sort_keys=True)
+    logger.info(summary_line)
+
 def pytest_sessionfinish(session, exitstatus):
     """Write collected test results to an Excel file in the run directory."""
+    config = session.config
+    workerinput = getattr(config, 'workerinput', None)
+    logs_root = os.path.dirname(config._run_dir)
+    if workerinput is None and os.path.isdir(logs_root):
+        # Controller / single process: prune reports from earlier runs. Under
+        # xdist the controller never creates a run directory (or logger) of
+        # its own, so this must not depend on either
+        from utils.report_helper import cleanup_old_reports
+        cleanup_old_reports(logs_root)
+
+    # Element-cache hit rates of this process, if page objects were used
+    element_cache = sys.modules.get('utils.element_cache')
+    if element_cache is not None and element_cache.cache_stats():
+        stats = element_cache.cache_stats()
+        _write_worker_stats(config, 'element_cache', stats, "Element cache hit rates: " + ", ".join(
+            f"{page} {counts['hit_rate']:.0%} ({counts['hits']}/{counts['hits'] + counts['misses']}, "
+            f"{counts['stale']} stale)" for page, counts in sorted(stats.items())))
+
+    # WebDriver transport latency of this process, if a tuned driver ran
+    transport = sys.modules.get('utils.transport')
+    if transport is not None and transport.transport_stats()['commands']:
+        stats = transport.transport_stats()
+        busiest = sorted(stats['commands'].items(), key=lambda item: -item[1]['count'])[:5]
+        _write_worker_stats(config, 'webdriver_transport', stats,
+                            f"WebDriver transport: floor {stats['floor_ms']} ms, {stats['connections']} "
+                            f"connection(s), {stats['retries']} retries; " + ", ".join(
+                                f"{name} p50 {counts['p50_ms']} / p95 {counts['p95_ms']} ms (n={counts['count']})"
+                                for name, counts in busiest))
+
+    # Asset cache hits of this process, if the warm cache was used
+    asset_cache = sys.modules.get('utils.asset_cache')
+    if asset_cache is not None and asset_cache.asset_stats()['requests']:
+        stats = asset_cache.asset_stats()
+        _write_worker_stats(config, 'asset_cache', stats,
+                            f"Asset cache: {stats['hit_ratio']:.0%} hit ratio "
+                            f"({stats['hits']}/{stats['hits'] + stats['misses']} requests), "
+                            f"{stats['bytes_saved'] / 1024:.0f} KiB saved")
+
     try:
-        run_dir = getattr(session.config, '_run_dir', None)
-        if not run_dir:
-            return
-        results = getattr(session.config, '_test_results', [])
+        results = getattr(config, '_test_results', [])
         if not results:
             # nothing to write
             return
 
+        from openpyxl import Workbook
+
+        run_dir = ensure_run_dir(config)
         wb = Workbook()
         ws = wb.active
         ws.title = 'Test Results'
-        headers = ['name', 'nodeid', 'outcome', 'duration', 'screenshot']
+        headers = ['name', 'nodeid', 'outcome', 'duration', 'screenshot', 'healed_locators']
         ws.append(headers)
         for r in results:
             ws.append([r.get(h, '') for h in headers])
 
-        excel_path = os.path.join(run_dir, f"test_results_{session.config._run_timestamp}.xlsx")
+        # xdist workers share the run directory, so suffix their worker id
+        suffix = f"_{workerinput['workerid']}" if workerinput else ''
+        excel_path = os.path.join(run_dir, f"test_results_{config._run_timestamp}{suffix}.xlsx")
         wb.save(excel_path)
         if logger:
             logger.info(f"Saved Excel test results: {excel_path}")
     except Exception as e:
         if logger:
-            logger.exception('Failed to write Excel test results')
\ No newline at end of file
+            logger.exception('Failed to write Excel test results')
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Summarize the warm asset cache over all workers of the run."""
+    if hasattr(config, 'workerinput') or not test_config.asset_cache['enabled']:
+        return
+    import glob
+
+    totals = {}
+    for path in glob.glob(os.path.join(config._run_dir, 'artifacts', 'asset_cache*.json')):
+        with open(path) as f:
+            for key, value in json.load(f).items():
+                if key != 'hit_ratio':
+                    totals[key] = totals.get(key, 0) + value
+    if not totals:
+        return
+    measured = totals['hits'] + totals['misses']
+    terminalreporter.section("asset cache")
+    terminalreporter.line(
+        f"hit ratio {totals['hits'] / measured if measured else 0:.0%} "
+        f"({totals['hits']}/{measured} requests, {totals['opaque']} opaque), "
+        f"{totals['bytes_saved'] / 1024:.0f} KiB saved, "
+        f"{totals['bytes_transferred'] / 1024:.0f} KiB downloaded")
@@ -1,7 +1,71 @@
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 
+from utils.config import get_config
+from utils.element_cache import ElementCache
+from utils.self_healing import Locator, resolve
+from utils import visual, web_perf
+
+# Change the hash route through the app's router (no reload). Returns false
+# when the current document is not the application.
+NAVIGATE_SCRIPT = """
+if (!/^https?:$/.test(location.protocol)) { return false; }
+if (location.hash.replace(/^#/, '') !== arguments[0]) { location.hash = '#' + arguments[0]; }
+return true;
+"""
+# The router shows ``route``: the hash matches, the app has rendered that
+# route (the stub marks it on #app) and no loading overlay is up
+ROUTE_READY_SCRIPT = """/* read-only */
+var route = arguments[0], hash = location.hash.replace(/^#/, '').split('?')[0];
+if (hash !== route || document.readyState !== 'complete') { return false; }
+var app = document.getElementById('app');
+if (app && app.hasAttribute('data-route') && app.getAttribute('data-route') !== route) { return false; }
+return !document.querySelector('.ngx-spinner-overlay');
+"""
+
+
+class route_ready:
+    """
+    Expected condition: the SPA is showing ``route`` and, if given, the
+    screen's landmark element is present. Both checks are scripts, so the
+    driver's implicit wait does not apply.
+    Args:
+        route (str): Hash route, e.g. "/dashboard/cart"
+        landmark: Locator of an element unique to the screen
+    """
+
+    def __init__(self, route, landmark=None):
+        self.route = route
+        self.landmark = Locator(landmark) if landmark is not None and not isinstance(landmark, Locator) \
+            else landmark
+
+    def __call__(self, driver):
+        if not driver.execute_script(ROUTE_READY_SCRIPT, self.route):
+            return False
+        return self.landmark is None or bool(resolve(driver, self.landmark))
+
+
+def go_to_route(driver, route, landmark=None, timeout=10):
+    """
+    Switch the loaded SPA to ``route`` through its hash router and wait until
+    the screen is ready. The app is not bootstrapped again.
+    Args:
+        driver (WebDriver): Browser showing the application
+        route (str): Hash route, e.g. "/dashboard/myorders"
+        landmark: Locator of an element unique to the target screen
+        timeout (float): Seconds to wait for the route to be ready
+    Raises:
+        ValueError: If the browser is not on the application
+        TimeoutException: If the route does not become ready (e.g. an auth redirect)
+    """
+    if not driver.execute_script(NAVIGATE_SCRIPT, route):
+        raise ValueError(f"Cannot route to {route}: the application is not loaded (open base_url first)")
+    WebDriverWait(driver, timeout).until(route_ready(route, landmark), f"Route {route} not ready after {timeout}s")
+    web_perf.sample(driver)
+
+
 class BasePage:
     """
     Base page object that all page objects should inherit from.
@@ -9,25 +73,117 @@ class BasePage:
     """
     # Common toast message locator
     TOAST_MESSAGE = (By.CSS_SELECTOR, ".toast-message")
+    # Hash route of the screen and an element that is present once it is rendered
+    ROUTE = None
+    READY = None
 
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
+        # Resolved elements, reused while the page is unchanged (utils.element_cache)
+        self._elements = ElementCache(driver, type(self).__name__) \
+            if get_config().browser.get('element_cache', True) else None
 
     def wait_and_find_element(self, locator):
         """Wait for and return an element."""
+        if self._elements is not None:
+            return self._elements.get(locator, self._find)
+        return self._find(locator)
+
+    def _find(self, locator):
+        if isinstance(locator, Locator):
+            return self.wait.until(lambda driver: resolve(driver, locator) or False)[0]
         return self.wait.until(EC.presence_of_element_located(locator))
 
     def wait_and_click(self, locator):
         """Wait for and click an element."""
+        if self._elements is not None:
+            self.wait.until(EC.element_to_be_clickable(self.wait_and_find_element(locator))).click()
+            return
+        if isinstance(locator, Locator):
+            self.wait.until(lambda driver: self._clickable(locator)).click()
+            return
         self.wait.until(EC.element_to_be_clickable(locator)).click()
 
+    def navigate(self, target, timeout=10):
+        """
+        Move to another screen through the SPA's router instead of reloading.
+        Args:
+            target (str|type): Hash route, or a page class with ``ROUTE``
+            timeout (float): Seconds to wait for the route to be ready
+        Returns:
+            BasePage: A ``target`` page object, or this page for a plain route
+        """
+        if isinstance(target, type):
+            go_to_route(self.driver, target.ROUTE, target.READY, timeout)
+            return target(self.driver)
+        go_to_route(self.driver, target, timeout=timeout)
+        return self
+
+    def wait_for_route(self, route, landmark=None, timeout=10):
+        """Wait until the SPA shows ``route``, e.g. after clicking a navigation button."""
+        WebDriverWait(self.driver, timeout).until(route_ready(route, landmark),
+                                                  f"Route {route} not ready after {timeout}s")
+        web_perf.sample(self.driver)
+
+    def invalidate_elements(self):
+        """Drop cached elements, e.g. after changing the page behind the page object's back."""
+        if self._elements is not None:
+            self._elements.clear()
+
+    def find_elements(self, locator, root=None):
+        """
+        Find all matching elements without waiting.
+        Args:
+            locator: Selenium locator or self-healing ``Locator``
+            root (WebElement): Search below this element instead of the page
+        Returns:
+            list: Matching elements (may be empty)
+        """
+        if isinstance(locator, Locator):
+            return resolve(self.driver, locator, root)
+        return (root or self.driver).find_elements(*locator)
+
+    def _clickable(self, locator):
+        elements = resolve(self.driver, locator)
+        try:
+            if elements and elements[0].is_displayed() and elements[0].is_enabled():
+                return elements[0]
+        except StaleElementReferenceException:
+            pass
+        return False
+
     def fill_input(self, locator, text):
         """Wait for, find, and fill an input field."""
         element = self.wait_and_find_element(locator)
         element.clear()  # Clear existing text
         element.send_keys(text)
 
+    def visual_checkpoint(self, name, locator, ignore=(), tolerance=None):
+        """
+        Compare an element's rendering with its baseline (utils.visual). The
+        comparison runs in the background; a mismatch is reported at the end of
+        the session (and fails the test with visual.fail_on_mismatch).
+        Args:
+            name (str): Checkpoint name, unique within the page class
+            locator: Element to capture
+            ignore (tuple): Locators of parts inside the element that may change
+            tolerance (int): Grey-level tolerance per block (default from config)
+        Returns:
+            Future: Comparison result, or None when checkpoints are disabled
+        """
+        if not visual.enabled():
+            return None
+        element = self.wait_and_find_element(locator)
+        masked = [child for part in ignore for child in self.find_elements(part, root=element)]
+        return visual.checkpoint(self.driver, element, f"{type(self).__name__}.{name}", masked, tolerance)
+
+    def select_dropdown(self, locator, text):
+        """Wait for a <select> and choose the option with the given visible text."""
+        from selenium.webdriver.support.ui import Select
+
+        Select(self.wait_and_find_element(locator)).select_by_visible_text(str(text))
+
     def get_toast_message(self):
         """Get text from toast message notification."""
         return self.wait.until(EC.presence_of_element_located(self.TOAST_MESSAGE)).text
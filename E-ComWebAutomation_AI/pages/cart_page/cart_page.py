@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from ..base_page import BasePage
+from utils.self_healing import Locator
 
 
 class CartPage(BasePage):
@@ -7,8 +8,11 @@ class CartPage(BasePage):
     Page Object Model for the Shopping Cart and Checkout functionality.
     Handles test cases CO_01 through CO_08.
     """
+    ROUTE = "/dashboard/cart"
+
     # --- Header Elements ---
     CART_TITLE = (By.CSS_SELECTOR, "h1")
+    READY = CART_TITLE
     CONTINUE_SHOPPING_BTN = (By.CSS_SELECTOR, "button[routerlink='/dashboard']")
     
     # --- Cart Item Elements ---
@@ -16,7 +20,11 @@ class CartPage(BasePage):
     ITEM_IMAGE = (By.CSS_SELECTOR, ".itemImg")
     ITEM_NUMBER = (By.CSS_SELECTOR, ".itemNumber")
     ITEM_TITLE = (By.CSS_SELECTOR, "h3")
-    ITEM_PRICE = (By.CSS_SELECTOR, ".cartSection p:nth-child(4)")  # MRP price
+    ITEM_PRICE = Locator(  # MRP price
+        (By.CSS_SELECTOR, ".cartSection p:nth-child(4)"),
+        (By.XPATH, "//div[contains(@class, 'cartSection')]/p[starts-with(normalize-space(), 'MRP')]"),
+        (By.XPATH, "//p[contains(., 'MRP')]"),
+    )
     ITEM_STOCK_STATUS = (By.CSS_SELECTOR, ".stockStatus")
     
     # --- Item Actions ---
@@ -53,7 +61,7 @@ class CartPage(BasePage):
             item_data = {
                 "number": item.find_element(By.CSS_SELECTOR, ".itemNumber").text.replace("#", ""),
                 "title": item.find_element(By.CSS_SELECTOR, "h3").text,
-                "price": item.find_element(By.CSS_SELECTOR, ".cartSection p:contains('MRP')").text
+                "price": self.find_elements(self.ITEM_PRICE, root=item)[0].text
                     .replace("MRP $", "").strip(),
                 "stock_status": item.find_element(By.CSS_SELECTOR, ".stockStatus").text,
                 "total": item.find_element(By.CSS_SELECTOR, ".prodTotal p").text
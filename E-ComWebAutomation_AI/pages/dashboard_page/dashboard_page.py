@@ -7,6 +7,11 @@ class DashboardPage(BasePage):
     Page Object Model for the E-commerce Dashboard Page.
     Handles product listing, filtering, and cart operations.
     """
+    # --- Routes ---
+    ROUTE = "/dashboard/dash"
+    ORDERS_ROUTE = "/dashboard/myorders"
+    CART_ROUTE = "/dashboard/cart"
+
     # --- Navigation Elements ---
     HOME_BUTTON = (By.CSS_SELECTOR, "button.btn-custom i.fa-home")
     ORDERS_BUTTON = (By.CSS_SELECTOR, "button.btn-custom i.fa-handshake-o")
@@ -41,14 +46,17 @@ class DashboardPage(BasePage):
     
     # --- Results Info ---
     RESULTS_COUNT = (By.CSS_SELECTOR, "#res")
+    READY = SEARCH_INPUT
     
     def navigate_to_orders(self):
-        """Navigate to the orders page."""
+        """Navigate to the orders page with the header button."""
         self.wait_and_click(self.ORDERS_BUTTON)
+        self.wait_for_route(self.ORDERS_ROUTE)
         
     def navigate_to_cart(self):
-        """Navigate to the shopping cart."""
+        """Navigate to the shopping cart with the header button."""
         self.wait_and_click(self.CART_BUTTON)
+        self.wait_for_route(self.CART_ROUTE)
         
     def sign_out(self):
         """Sign out from the application."""
@@ -5,8 +5,11 @@ class ForgotPasswordPage(BasePage):
     """
     Page object for Forgot Password functionality (UA_05).
     """
+    ROUTE = "/auth/password-new"
+
     FORGOT_LINK = (By.LINK_TEXT, "Forgot Password")
     EMAIL_INPUT = (By.CSS_SELECTOR, "input[type='email'], input[name='email']")
+    READY = EMAIL_INPUT
     SUBMIT_BTN = (By.CSS_SELECTOR, "button[type='submit'], .btn-submit")
     SUCCESS_TOAST = (By.CSS_SELECTOR, ".toast-message")
 
@@ -29,10 +32,7 @@ class ForgotPasswordPage(BasePage):
     def request_password_reset(self, email):
         """Full flow: navigate, submit and return success message."""
         if not self.navigate_to_forgot():
-            # If forgot page is directly reachable via route
-            try:
-                self.driver.get(self.driver.current_url + "#/auth/forgotpassword")
-            except:
-                pass
+            # No link on this screen: switch to the route directly
+            self.navigate(ForgotPasswordPage)
         self.submit_email(email)
         return self.get_success_message()
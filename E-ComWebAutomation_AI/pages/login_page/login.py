@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from ..base_page import BasePage
+from utils.self_healing import Locator
 
 
 class LoginPage(BasePage):
@@ -7,11 +8,19 @@ class LoginPage(BasePage):
     Page Object Model for the E-commerce Login Page.
     Handles authentication logic for test cases UA_03 and UA_04.
     """
+    ROUTE = "/auth/login"
+
     # --- Locators ---
     EMAIL_FIELD = (By.ID, "userEmail")
     PASSWORD_FIELD = (By.ID, "userPassword")
     LOGIN_BUTTON = (By.ID, "login")
-    DASHBOARD_HEADER = (By.CSS_SELECTOR, ".dashboard-header")  # Add a more reliable success indicator
+    READY = LOGIN_BUTTON
+    DASHBOARD_HEADER = Locator(
+        (By.CSS_SELECTOR, ".dashboard-header"),
+        (By.XPATH, "//nav[.//button[contains(normalize-space(), 'Sign Out')]]"),
+        (By.CSS_SELECTOR, "button.btn-custom i.fa-sign-out"),
+        ("text", "Automation Practice"),
+    )
 
     def perform_login(self, email, password):
         """
@@ -44,7 +53,7 @@ class LoginPage(BasePage):
                 return False
             
             # Then verify we're on the dashboard
-            self.wait.until(EC.presence_of_element_located(self.DASHBOARD_HEADER))
+            self.wait_and_find_element(self.DASHBOARD_HEADER)
             return True
         except:
             return False
@@ -7,9 +7,12 @@ class RegistrationPage(BasePage):
     Page Object Model for the User Registration Page.
     Handles test cases UA_01 (successful registration) and UA_02 (duplicate email).
     """
+    ROUTE = "/auth/register"
+
     # --- Locators ---
     REGISTER_LINK = (By.LINK_TEXT, "Register")
     FULL_NAME_FIELD = (By.ID, "userName")
+    READY = FULL_NAME_FIELD
     EMAIL_FIELD = (By.ID, "userEmail")
     PASSWORD_FIELD = (By.ID, "userPassword")
     CONFIRM_PASSWORD_FIELD = (By.ID, "confirmPassword")
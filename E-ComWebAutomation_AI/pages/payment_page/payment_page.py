@@ -1,5 +1,7 @@
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 from ..base_page import BasePage
+from utils.self_healing import Locator
 
 class PaymentPage(BasePage):
     """
@@ -21,7 +23,12 @@ class PaymentPage(BasePage):
     CARD_NUMBER_INPUT = (By.CSS_SELECTOR, ".form__cc input[type='text']")
     EXPIRY_MONTH_SELECT = (By.CSS_SELECTOR, ".form__cc select:first-of-type")
     EXPIRY_YEAR_SELECT = (By.CSS_SELECTOR, ".form__cc select:last-of-type")
-    CVV_INPUT = (By.CSS_SELECTOR, "input.txt[type='text']")
+    CVV_INPUT = Locator(
+        (By.XPATH, "//div[@class='title'][contains(., 'CVV')]/following-sibling::input"),
+        (By.CSS_SELECTOR, ".form__cc .row:nth-child(2) .field:last-child input"),
+        ("attributes", {"name": "cvv"}),
+        (By.CSS_SELECTOR, "input.txt[type='text']"),
+    )
     NAME_ON_CARD_INPUT = (By.CSS_SELECTOR, ".form__cc .row:nth-child(3) input")
     
     # Coupon Section
@@ -1,4 +1,6 @@
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 from ..base_page import BasePage
 
@@ -17,6 +19,7 @@ class ProductDetailsPage(BasePage):
     MAIN_IMAGE = (By.CSS_SELECTOR, ".main-image")
     THUMBNAIL_IMAGES = (By.CSS_SELECTOR, ".thumbnail-image")
     ZOOM_VIEW = (By.CSS_SELECTOR, ".zoom-view")
+    IMAGE_SWITCH_TIMEOUT = 3
     
     # Size Chart
     SIZE_CHART_BTN = (By.CSS_SELECTOR, "button[data-target='#sizeChart']")
@@ -71,7 +74,16 @@ class ProductDetailsPage(BasePage):
         """
         thumbnails = self.driver.find_elements(*self.THUMBNAIL_IMAGES)
         if 0 <= index < len(thumbnails):
+            previous = self.wait_and_find_element(self.MAIN_IMAGE).get_attribute("src")
             thumbnails[index].click()
+            try:
+                # Capture the new image, not the old one still on screen
+                WebDriverWait(self.driver, self.IMAGE_SWITCH_TIMEOUT,
+                              ignored_exceptions=(StaleElementReferenceException,)).until(
+                    lambda d: d.find_element(*self.MAIN_IMAGE).get_attribute("src") != previous)
+            except TimeoutException:
+                return True  # Already the main image; nothing new to check
+            self.visual_checkpoint(f"main_image_{index}", self.MAIN_IMAGE)
             return True
         return False
     
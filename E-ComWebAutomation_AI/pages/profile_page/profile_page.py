@@ -6,8 +6,11 @@ class ProfilePage(BasePage):
     Page Object Model for User Profile Management.
     Handles user profile updates and order history.
     """
+    ROUTE = "/dashboard/profile"
+
     # Profile Information
     PROFILE_NAME_INPUT = (By.CSS_SELECTOR, "input[formcontrolname='name']")
+    READY = PROFILE_NAME_INPUT
     EMAIL_DISPLAY = (By.CSS_SELECTOR, ".email-display")
     ADDRESS_TEXTAREA = (By.CSS_SELECTOR, "textarea[formcontrolname='address']")
     PHONE_INPUT = (By.CSS_SELECTOR, "input[formcontrolname='phone']")
@@ -5,8 +5,9 @@ import argparse
 import subprocess
 from pathlib import Path
 from datetime import datetime
-from utils.run_configs import CONFIGS
+from utils.run_configs import CONFIGS, PIPELINES
 from utils.check_environment import main as check_env
+from utils.pipeline import run_pipeline, print_summary, worker_options
 
 def setup_environment(config_name):
     """Set up environment variables for the test run."""
@@ -25,16 +26,18 @@ def create_run_directory():
     run_dir.mkdir(parents=True, exist_ok=True)
     return run_dir
 
-def run_tests(config_name, additional_args=None):
+def run_tests(config_name, additional_args=None, force_checks=False):
     """
     Run tests with specified configuration.
     
     Args:
         config_name (str): Name of the configuration to use
         additional_args (list): Additional pytest arguments
+        force_checks (bool): Re-run environment checks even if the
+            environment fingerprint matches the last successful check
     """
-    # Check environment first
-    if not check_env():
+    # Check environment first (skipped when nothing changed since last pass)
+    if not check_env(use_cache=not force_checks):
         sys.exit(1)
     
     # Get configuration
@@ -75,6 +78,51 @@ def run_tests(config_name, additional_args=None):
         print(f"\nError running tests: {str(e)}")
         return 1
 
+def run_pipeline_mode(config_names, gate=None, browsers=None, additional_args=None,
+                      force_checks=False):
+    """
+    Run several configurations concurrently with a shared browser budget.
+    
+    Args:
+        config_names (list): Names of the configurations to run
+        gate (list): Configurations whose failure cancels the others
+        browsers (int): Maximum concurrent browsers (default: CPU count)
+        additional_args (list): Additional pytest arguments for every config
+        force_checks (bool): Re-run environment checks even if unchanged
+    """
+    if not check_env(use_cache=not force_checks):
+        sys.exit(1)
+    
+    unknown = [name for name in config_names + (gate or []) if name not in CONFIGS]
+    if unknown:
+        print(f"Error: Unknown configuration(s) {', '.join(unknown)}")
+        print(f"Available configurations: {', '.join(CONFIGS.keys())}")
+        sys.exit(1)
+    
+    overrides = worker_options(additional_args)
+    if overrides:
+        print(f"Error: {' '.join(overrides)} cannot be used in pipeline mode; "
+              "the browser budget sets each configuration's workers (use --browsers)")
+        sys.exit(1)
+    
+    run_dir = create_run_directory()
+    budget = browsers or os.cpu_count() or 1
+    
+    print("\n=== Pipeline Run Information ===")
+    print(f"Configurations: {', '.join(config_names)}")
+    print(f"Gate: {', '.join(gate) if gate else 'none'}")
+    print(f"Browser budget: {budget}")
+    print(f"Run Directory: {run_dir}")
+    print("================================\n")
+    
+    try:
+        exit_code, summary = run_pipeline(config_names, budget, gate or [], run_dir, additional_args)
+    except KeyboardInterrupt:
+        print("\nPipeline interrupted by user")
+        return 130
+    print_summary(summary)
+    return exit_code
+
 def list_configurations():
     """Print available test configurations."""
     print("\nAvailable Test Configurations:")
@@ -86,14 +134,48 @@ def list_configurations():
         print("  Environment:")
         for key, value in config['env_vars'].items():
             print(f"    {key}={value}")
+    
+    print("\nAvailable Pipelines (run_tests.py pipeline --pipeline <name>):")
+    print("-------------------------------------------------------------")
+    for name, pipeline in PIPELINES.items():
+        print(f"\n{name}:")
+        print(f"  Description: {pipeline['description']}")
+        print(f"  Configurations: {', '.join(pipeline['configs'])}")
+        print(f"  Gate: {', '.join(pipeline['gate'])}")
 
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Test Runner")
     parser.add_argument(
         "config",
-        choices=list(CONFIGS.keys()) + ["list"],
-        help="Test configuration to use or 'list' to see available configs"
+        choices=list(CONFIGS.keys()) + ["list", "pipeline"],
+        help="Test configuration to use, 'pipeline' to run several, or 'list' to see available configs"
+    )
+    parser.add_argument(
+        "--pipeline",
+        choices=list(PIPELINES.keys()),
+        default="ci",
+        help="Predefined pipeline to run in pipeline mode"
+    )
+    parser.add_argument(
+        "--configs",
+        nargs="+",
+        help="Configurations to run in pipeline mode (overrides --pipeline)"
+    )
+    parser.add_argument(
+        "--gate",
+        nargs="+",
+        help="Configurations whose failure cancels the rest of the pipeline"
+    )
+    parser.add_argument(
+        "--browsers",
+        type=int,
+        help="Maximum concurrent browsers across the pipeline (default: CPU count)"
+    )
+    parser.add_argument(
+        "--force-checks",
+        action="store_true",
+        help="Re-run environment checks even if nothing changed since the last successful run"
     )
     parser.add_argument(
         "pytest_args",
@@ -107,7 +189,14 @@ def main():
         list_configurations()
         return 0
     
-    return run_tests(args.config, args.pytest_args)
+    if args.config == "pipeline":
+        pipeline = PIPELINES[args.pipeline]
+        configs = args.configs or pipeline["configs"]
+        gate = args.gate if args.gate is not None else ([] if args.configs else pipeline["gate"])
+        return run_pipeline_mode(configs, gate, args.browsers, args.pytest_args,
+                                 force_checks=args.force_checks)
+    
+    return run_tests(args.config, args.pytest_args, force_checks=args.force_checks)
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""Local stand-in for the e-commerce application under test.
+
+Serves the login, dashboard, product, cart, payment, orders and profile
+screens with the DOM the page objects expect, plus the JSON APIs behind
+them, so the suite can run and be profiled without network access.
+"""
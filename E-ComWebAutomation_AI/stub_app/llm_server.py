@@ -0,0 +1,163 @@
+"""Local stand-in for an OpenAI-compatible completion endpoint.
+
+Answers ``POST /v1/chat/completions`` deterministically: the requirement
+bullets of the section in the prompt become rows of a markdown test-case
+table. It lets the test-generation pipeline (``utils.llm_testgen``) and its
+cache be exercised offline, and counts requests so cache hits are visible.
+
+Usage:
+    python -m stub_app.llm_server --port 8090 --latency-ms 800
+    python -m utils.llm_testgen --stand-in          # starts one in-process
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from stub_app.server import LatencyProfile
+
+BULLET_PATTERN = re.compile(r"^\s*[•\-*]\s*(?:(?P<name>[^:]{2,60}):\s*)?(?P<text>.+)$")
+
+
+def fake_completion(prompt):
+    """
+    Test-case table for the section in ``prompt``.
+    Returns:
+        str: Markdown table in the catalog's format
+    """
+    match = re.search(r"\b([A-Z]{2,3})_01\b", prompt)
+    prefix = match.group(1) if match else "TC"
+    section = prompt.split("Section:", 1)[-1]
+    rows = ["| TC ID | Test Case Title | Steps | Expected Result | Priority |",
+            "| ----- | --------------- | ----- | --------------- | -------- |"]
+    bullets = [m for m in map(BULLET_PATTERN.match, section.splitlines()) if m]
+    for number, match in enumerate(bullets, 1):
+        name = (match.group("name") or match.group("text")[:40]).strip()
+        text = match.group("text").strip().rstrip(".")
+        priority = "High" if number <= 2 else "Medium"
+        rows.append(f"| {prefix}_{number:02d} | Verify {name.lower()} | 1. Open the {name} feature "
+                    f"<br>2. Exercise: {text} | {text} works as specified | {priority} |")
+    return "\n".join(rows)
+
+
+class CompletionHandler(BaseHTTPRequestHandler):
+    """Serves ``/v1/chat/completions`` and ``/v1/models``."""
+
+    server_version = "StubCompletions/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, payload, status=HTTPStatus.OK):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/v1/models":
+            return self._send_json({"data": [{"id": "stub-model", "object": "model"}]})
+        self._send_json({"error": {"message": "Not found"}}, HTTPStatus.NOT_FOUND)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self._send_json({"error": {"message": "Invalid JSON"}}, HTTPStatus.BAD_REQUEST)
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            return self._send_json({"error": {"message": "Not found"}}, HTTPStatus.NOT_FOUND)
+
+        delay = self.server.latency.delay_for(self.path)
+        if delay:
+            time.sleep(delay)
+        with self.server.lock:
+            self.server.request_count += 1
+            number = self.server.request_count
+
+        prompt = "\n".join(m.get("content", "") for m in request.get("messages", []))
+        content = fake_completion(prompt)
+        self._send_json({
+            "id": f"stub-{number}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub-model"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": len(content.split()),
+                      "total_tokens": len(prompt.split()) + len(content.split())},
+        })
+
+
+class CompletionServer:
+    """
+    Runs the stand-in endpoint on a background thread.
+    Args:
+        host (str): Interface to bind
+        port (int): Port to bind (0 picks a free port)
+        latency (LatencyProfile): Artificial delay per completion
+        verbose (bool): Log every request to stderr
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=None, verbose=False):
+        self.httpd = ThreadingHTTPServer((host, port), CompletionHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency or LatencyProfile()
+        self.httpd.verbose = verbose
+        self.httpd.lock = threading.Lock()
+        self.httpd.request_count = 0
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def request_count(self):
+        return self.httpd.request_count
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stub-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    """Run the stand-in completion endpoint in the foreground."""
+    parser = argparse.ArgumentParser(description="Local stand-in completion endpoint")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay per completion")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    server = CompletionServer(args.host, args.port, LatencyProfile(args.latency_ms), args.verbose)
+    print(f"Stand-in completion endpoint at {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
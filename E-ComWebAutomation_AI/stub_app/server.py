@@ -0,0 +1,569 @@
+"""HTTP server for the stub e-commerce application.
+
+Routes:
+    /client/                 SPA shell (static/index.html)
+    /client/static/...       app.js, styles.css and generated product images
+    /client/views/<route>    server-rendered screen fragments (see views.py)
+    /api/ecom/...            JSON APIs mirroring the real application
+    /__stub__/...            control endpoints (reset, latency)
+
+Usage:
+    python -m stub_app.server --port 8080 --latency-ms 40 --jitter-ms 20
+    TEST_STUB_SERVER=true pytest     # conftest starts one per worker
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+from stub_app import views
+from stub_app.store import StubStore, COUNTRIES, VALID_COUPONS
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".png": "image/png",
+}
+# Static assets are cacheable like a CDN-served build; the shell and APIs are not
+ASSET_CACHE_CONTROL = "public, max-age=3600"
+
+
+class LatencyProfile:
+    """
+    Artificial response delay.
+    Args:
+        base_ms (float): Delay added to every response
+        jitter_ms (float): Extra uniformly random delay (0..jitter_ms)
+        routes (dict): Path prefix -> delay in ms, replacing ``base_ms``
+            for matching requests (longest prefix wins)
+    """
+
+    def __init__(self, base_ms=0, jitter_ms=0, routes=None):
+        self.base_ms = float(base_ms)
+        self.jitter_ms = float(jitter_ms)
+        self.routes = dict(routes or {})
+
+    def delay_for(self, path):
+        """Seconds to wait before answering ``path``."""
+        delay = self.base_ms
+        matches = [prefix for prefix in self.routes if path.startswith(prefix)]
+        if matches:
+            delay = self.routes[max(matches, key=len)]
+        if self.jitter_ms:
+            delay += random.uniform(0, self.jitter_ms)
+        return delay / 1000.0
+
+    def to_dict(self):
+        return {"base_ms": self.base_ms, "jitter_ms": self.jitter_ms, "routes": self.routes}
+
+
+def _placeholder_png(name, size=64):
+    """Solid-colour PNG derived from ``name`` (stands in for product images)."""
+    seed = zlib.crc32(name.encode())
+    color = bytes(((seed >> shift) & 0xFF) for shift in (0, 8, 16))
+    row = b"\x00" + color * size
+    raw = row * size
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Dispatches requests to static files, views and JSON APIs."""
+
+    server_version = "StyleHavenStub/1.0"
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, keep-alive
+    # clients wait for a delayed ACK (~40 ms) on every response
+    disable_nagle_algorithm = True
+
+    # (method, regex) -> handler name; regex groups become arguments
+    API_ROUTES = [
+        ("POST", r"/api/ecom/auth/login", "api_login"),
+        ("POST", r"/api/ecom/auth/register", "api_register"),
+        ("POST", r"/api/ecom/auth/forgot-password", "api_forgot_password"),
+        ("POST", r"/api/ecom/auth/logout", "api_logout"),
+        ("POST", r"/api/ecom/product/get-all-products", "api_products"),
+        ("GET", r"/api/ecom/product/get-product-detail/(\w+)", "api_product_detail"),
+        ("POST", r"/api/ecom/product/add-review/(\w+)", "api_add_review"),
+        ("POST", r"/api/ecom/user/add-to-cart", "api_add_to_cart"),
+        ("POST", r"/api/ecom/user/update-cart-quantity", "api_update_quantity"),
+        ("GET", r"/api/ecom/user/get-cart-products/(\w+)", "api_cart"),
+        ("GET", r"/api/ecom/user/get-cart-count/(\w+)", "api_cart_count"),
+        ("DELETE", r"/api/ecom/user/remove-from-cart/(\w+)/(\w+)", "api_remove_from_cart"),
+        ("POST", r"/api/ecom/user/update-profile", "api_update_profile"),
+        ("POST", r"/api/ecom/user/add-address", "api_add_address"),
+        ("DELETE", r"/api/ecom/user/delete-address/(\d+)", "api_delete_address"),
+        ("GET", r"/api/ecom/user/countries", "api_countries"),
+        ("POST", r"/api/ecom/order/apply-coupon", "api_apply_coupon"),
+        ("POST", r"/api/ecom/order/create-order", "api_create_order"),
+        ("GET", r"/api/ecom/order/get-orders-for-customer/(\w+)", "api_orders"),
+        ("POST", r"/__stub__/reset", "control_reset"),
+        ("GET", r"/__stub__/latency", "control_get_latency"),
+        ("POST", r"/__stub__/latency", "control_set_latency"),
+    ]
+
+    @property
+    def store(self):
+        return self.server.store
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # --- Plumbing ---
+
+    def _dispatch(self, method):
+        parsed = urlparse(self.path)
+        path = parsed.path
+        delay = self.server.latency.delay_for(path)
+        if delay:
+            time.sleep(delay)
+        # Consume the body up front: a request answered without reading it
+        # (no route, 401) would leave it on the keep-alive connection
+        length = int(self.headers.get("Content-Length") or 0)
+        self._raw_body = self.rfile.read(length) if length else b""
+
+        for route_method, pattern, handler in self.API_ROUTES:
+            if route_method == method:
+                match = re.fullmatch(pattern, path)
+                if match:
+                    return getattr(self, handler)(*match.groups())
+
+        if method == "GET":
+            if path in ("/client", "/client/", "/"):
+                return self._send_file(STATIC_DIR / "index.html")
+            if path.startswith("/client/static/img/"):
+                return self._send_asset(_placeholder_png(Path(path).stem), "image/png")
+            if path.startswith("/client/static/"):
+                return self._send_file(STATIC_DIR / path[len("/client/static/"):])
+            if path.startswith("/client/views/"):
+                return self._send_view(path[len("/client/views"):], parse_qs(parsed.query))
+        self._send_json({"message": f"No route for {method} {path}"}, HTTPStatus.NOT_FOUND)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _send(self, status, body, content_type, headers=None):
+        headers = {"Cache-Control": "no-cache", **(headers or {})}
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_asset(self, body, content_type):
+        """Cacheable static asset with an ETag; answers revalidation with 304."""
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        headers = {"Cache-Control": ASSET_CACHE_CONTROL, "ETag": etag}
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(HTTPStatus.NOT_MODIFIED, b"", content_type, headers)
+        self._send(HTTPStatus.OK, body, content_type, headers)
+
+    def _send_json(self, payload, status=HTTPStatus.OK):
+        self._send(status, json.dumps(payload).encode(), "application/json")
+
+    def _send_html(self, html, status=HTTPStatus.OK):
+        self._send(status, html.encode(), "text/html; charset=utf-8")
+
+    def _send_file(self, path):
+        path = Path(path).resolve()
+        if STATIC_DIR.resolve() not in path.parents or not path.is_file():
+            return self._send_json({"message": "Not found"}, HTTPStatus.NOT_FOUND)
+        content_type = CONTENT_TYPES.get(path.suffix, "application/octet-stream")
+        if path.name == "index.html":
+            return self._send(HTTPStatus.OK, path.read_bytes(), content_type)
+        self._send_asset(path.read_bytes(), content_type)
+
+    def _json_body(self):
+        if not self._raw_body:
+            return {}
+        try:
+            body = json.loads(self._raw_body)
+        except ValueError:
+            return {}
+        return body if isinstance(body, dict) else {}
+
+    def _current_user(self):
+        return self.store.user_for_token(self.headers.get("Authorization"))
+
+    def _require_user(self):
+        user = self._current_user()
+        if user is None:
+            self._send_json({"message": "Please login to continue"}, HTTPStatus.UNAUTHORIZED)
+        return user
+
+    def _int_field(self, body, name, default):
+        try:
+            return int(body.get(name, default))
+        except (TypeError, ValueError):
+            self._send_json({"message": f"Invalid {name}"}, HTTPStatus.BAD_REQUEST)
+            return None
+
+    def _float_field(self, body, name, default):
+        try:
+            return float(body.get(name, default))
+        except (TypeError, ValueError):
+            self._send_json({"message": f"Invalid {name}"}, HTTPStatus.BAD_REQUEST)
+            return None
+
+    # --- Views ---
+
+    def _send_view(self, route, query):
+        if route == "/auth/login":
+            return self._send_html(views.login_view())
+        if route == "/auth/register":
+            return self._send_html(views.register_view())
+        if route == "/auth/password-new":
+            return self._send_html(views.forgot_password_view())
+
+        user = self._current_user()
+        if user is None:
+            return self._send_html("", HTTPStatus.UNAUTHORIZED)
+
+        if route in ("/dashboard", "/dashboard/", "/dashboard/dash"):
+            return self._send_html(views.dashboard_view(self.store, user, self._filtered_products(query)))
+        if route == "/dashboard/products":
+            return self._send_html(views.product_list(self._filtered_products(query)))
+        match = re.fullmatch(r"/dashboard/product-details/(\w+)", route)
+        if match and match.group(1) in self.store.products:
+            self.store.record_view(user["_id"], match.group(1))
+            return self._send_html(views.product_details_view(self.store, user, self.store.products[match.group(1)]))
+        if route == "/dashboard/cart":
+            return self._send_html(views.cart_view(self.store, user))
+        if route in ("/dashboard/order", "/dashboard/checkout/order"):
+            product_ids = [p for p in query.get("prop", [""])[0].split(",") if p]
+            return self._send_html(views.payment_view(self.store, user, product_ids))
+        if route == "/dashboard/thankyou":
+            order_ids = [o for o in query.get("order", [""])[0].split(",") if o]
+            return self._send_html(views.thank_you_view(self.store, user, order_ids))
+        if route == "/dashboard/myorders":
+            return self._send_html(views.orders_view(self.store, user))
+        if route == "/dashboard/profile":
+            return self._send_html(views.profile_view(self.store, user))
+        self._send_html("<h1>Page not found</h1>", HTTPStatus.NOT_FOUND)
+
+    def _filtered_products(self, query):
+        def number(key):
+            try:
+                return float(query[key][0])
+            except (KeyError, ValueError):
+                return None
+
+        return self.store.filter_products(
+            name=query.get("productName", [""])[0],
+            min_price=number("minPrice"),
+            max_price=number("maxPrice"),
+            categories=query.get("category", []),
+            subcategories=query.get("subcategory", []),
+        )
+
+    # --- Auth APIs ---
+
+    def api_login(self):
+        body = self._json_body()
+        token, user = self.store.login(body.get("userEmail"), body.get("userPassword"))
+        if not token:
+            return self._send_json({"message": "Invalid email or password"}, HTTPStatus.BAD_REQUEST)
+        self._send_json({"token": token, "userId": user["_id"], "message": "Login Successfully"})
+
+    def api_register(self):
+        body = self._json_body()
+        email = (body.get("userEmail") or "").strip()
+        password = body.get("userPassword") or ""
+        if not email or not password:
+            return self._send_json({"message": "Please fill all required fields"}, HTTPStatus.BAD_REQUEST)
+        if password != body.get("confirmPassword", password):
+            return self._send_json({"message": "Passwords do not match"}, HTTPStatus.BAD_REQUEST)
+        name = body.get("userName") or " ".join(
+            filter(None, [body.get("firstName"), body.get("lastName")]))
+        user = self.store.create_user(email, password, name)
+        if user is None:
+            return self._send_json({"message": "Email already registered"}, HTTPStatus.CONFLICT)
+        self._send_json({"message": "Registration Successfully", "userId": user["_id"]}, HTTPStatus.CREATED)
+
+    def api_forgot_password(self):
+        body = self._json_body()
+        if not body.get("userEmail"):
+            return self._send_json({"message": "Please enter your email"}, HTTPStatus.BAD_REQUEST)
+        self._send_json({"message": "Password reset link sent to your email"})
+
+    def api_logout(self):
+        self.store.logout(self.headers.get("Authorization"))
+        self._send_json({"message": "Logout Successfully"})
+
+    # --- Catalog APIs ---
+
+    def api_products(self):
+        body = self._json_body()
+        products = self.store.filter_products(
+            name=body.get("productName", ""),
+            min_price=body.get("minPrice") or None,
+            max_price=body.get("maxPrice") or None,
+            categories=body.get("productCategory", []),
+            subcategories=body.get("productSubCategory", []),
+        )
+        self._send_json({"data": products, "count": len(products), "message": "All Products fetched Successfully"})
+
+    def api_product_detail(self, product_id):
+        product = self.store.products.get(product_id)
+        if not product:
+            return self._send_json({"message": "Product not found"}, HTTPStatus.NOT_FOUND)
+        self._send_json({"data": product, "message": "Product Details fetched Successfully"})
+
+    def api_add_review(self, product_id):
+        user = self._require_user()
+        if user is None:
+            return
+        body = self._json_body()
+        rating = self._int_field(body, "rating", 0)
+        if rating is None:
+            return
+        self.store.add_review(product_id, rating, body.get("text", ""), user["name"])
+        self._send_json({"message": "Review submitted successfully"})
+
+    # --- Cart APIs ---
+
+    def api_add_to_cart(self):
+        user = self._require_user()
+        if user is None:
+            return
+        body = self._json_body()
+        product_id = (body.get("product") or {}).get("_id") or body.get("productId")
+        quantity = self._int_field(body, "quantity", 1)
+        if quantity is None:
+            return
+        if not self.store.add_to_cart(user["_id"], product_id, quantity):
+            return self._send_json({"message": "Product not found"}, HTTPStatus.NOT_FOUND)
+        self._send_json({"message": "Product Added To Cart"})
+
+    def api_update_quantity(self):
+        user = self._require_user()
+        if user is None:
+            return
+        body = self._json_body()
+        quantity = self._int_field(body, "quantity", 1)
+        if quantity is None:
+            return
+        if quantity < 1 or not self.store.set_quantity(user["_id"], body.get("productId"), quantity):
+            return self._send_json({"message": "Invalid quantity"}, HTTPStatus.BAD_REQUEST)
+        self._send_json({"message": "Quantity updated"})
+
+    def api_cart(self, user_id):
+        user = self._require_user()
+        if user is None:
+            return
+        lines = self.store.cart(user["_id"])
+        products = [dict(product, quantity=qty) for product, qty in lines]
+        if not products:
+            return self._send_json({"message": "No Product in Cart"}, HTTPStatus.NOT_FOUND)
+        self._send_json({"products": products, "count": len(products), "message": "Cart Data Found"})
+
+    def api_cart_count(self, user_id):
+        user = self._require_user()
+        if user is None:
+            return
+        self._send_json({"count": sum(qty for _, qty in self.store.cart(user["_id"]))})
+
+    def api_remove_from_cart(self, user_id, product_id):
+        user = self._require_user()
+        if user is None:
+            return
+        if not self.store.remove_from_cart(user["_id"], product_id):
+            return self._send_json({"message": "Product not in cart"}, HTTPStatus.NOT_FOUND)
+        self._send_json({"message": "Product Removed from Cart"})
+
+    # --- Profile APIs ---
+
+    def api_update_profile(self):
+        user = self._require_user()
+        if user is None:
+            return
+        body = self._json_body()
+        self.store.update_profile(user["_id"], name=body.get("name"), address=body.get("address"),
+                                  phone=body.get("phone"))
+        self._send_json({"message": "Profile updated successfully"})
+
+    def api_add_address(self):
+        user = self._require_user()
+        if user is None:
+            return
+        self.store.add_address(user["_id"], self._json_body())
+        self._send_json({"message": "Address added successfully"})
+
+    def api_delete_address(self, index):
+        user = self._require_user()
+        if user is None:
+            return
+        if not self.store.delete_address(user["_id"], int(index)):
+            return self._send_json({"message": "Address not found"}, HTTPStatus.NOT_FOUND)
+        self._send_json({"message": "Address deleted successfully"})
+
+    # --- Order APIs ---
+
+    def api_countries(self):
+        self._send_json({"data": COUNTRIES})
+
+    def api_apply_coupon(self):
+        code = self._json_body().get("coupon", "")
+        if code not in VALID_COUPONS:
+            return self._send_json({"message": "Invalid coupon code"}, HTTPStatus.BAD_REQUEST)
+        self._send_json({"message": "Discount applied successfully", "discount": VALID_COUPONS[code]})
+
+    def api_create_order(self):
+        user = self._require_user()
+        if user is None:
+            return
+        orders = self._json_body().get("orders") or []
+        if not orders or not all(o.get("country") for o in orders):
+            return self._send_json({"message": "Please select a country"}, HTTPStatus.BAD_REQUEST)
+        order_ids = self.store.create_orders(user["_id"], orders)
+        if not order_ids:
+            return self._send_json({"message": "No valid products to order"}, HTTPStatus.BAD_REQUEST)
+        self._send_json({"orders": order_ids, "message": "Order Placed Successfully"}, HTTPStatus.CREATED)
+
+    def api_orders(self, user_id):
+        user = self._require_user()
+        if user is None:
+            return
+        self._send_json({"data": self.store.orders_for(user["_id"]), "message": "Orders fetched Successfully"})
+
+    # --- Control endpoints ---
+
+    def control_reset(self):
+        self.store.reset()
+        self._send_json({"message": "Store reset"})
+
+    def control_get_latency(self):
+        self._send_json(self.server.latency.to_dict())
+
+    def control_set_latency(self):
+        body = self._json_body()
+        base_ms = self._float_field(body, "base_ms", 0)
+        if base_ms is None:
+            return
+        jitter_ms = self._float_field(body, "jitter_ms", 0)
+        if jitter_ms is None:
+            return
+        routes = body.get("routes") or {}
+        if not isinstance(routes, dict):
+            return self._send_json({"message": "Invalid routes"}, HTTPStatus.BAD_REQUEST)
+        delays = {}
+        for prefix in routes:
+            delays[prefix] = self._float_field(routes, prefix, 0)
+            if delays[prefix] is None:
+                return
+        self.server.latency = LatencyProfile(base_ms, jitter_ms, delays)
+        self._send_json(self.server.latency.to_dict())
+
+
+class StubServer:
+    """
+    Runs the stub application on a background thread.
+    Args:
+        host (str): Interface to bind
+        port (int): Port to bind (0 picks a free port)
+        latency (LatencyProfile): Artificial response delay
+        verbose (bool): Log every request to stderr
+
+    Usage:
+        with StubServer() as stub:
+            driver.get(stub.login_url)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=None, verbose=False):
+        self.httpd = ThreadingHTTPServer((host, port), StubRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.store = StubStore()
+        self.httpd.latency = latency or LatencyProfile()
+        self.httpd.verbose = verbose
+        self._thread = None
+
+    @property
+    def store(self):
+        return self.httpd.store
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def login_url(self):
+        return f"{self.url}/client/#/auth/login"
+
+    def set_latency(self, latency):
+        self.httpd.latency = latency
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stub-app", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def _route_latency(value):
+    prefix, _, ms = value.partition("=")
+    return prefix, float(ms)
+
+
+def main(argv=None):
+    """Run the stub application in the foreground."""
+    parser = argparse.ArgumentParser(description="Local stub of the e-commerce application")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra delay (0..N ms)")
+    parser.add_argument("--route-latency", type=_route_latency, action="append", default=[],
+                        metavar="PREFIX=MS", help="Per-path delay, e.g. /api/ecom/order=300")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    latency = LatencyProfile(args.latency_ms, args.jitter_ms, dict(args.route_latency))
+    server = StubServer(args.host, args.port, latency, args.verbose)
+    print(f"Stub application running at {server.login_url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
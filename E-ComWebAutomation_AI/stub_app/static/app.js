@@ -0,0 +1,306 @@
+/*
+ * Hash router and event wiring for the stub application.
+ * Every screen is rendered server-side (stub_app/views.py); this file only
+ * fetches fragments, forwards form data to the JSON APIs and shows toasts.
+ */
+(function () {
+  "use strict";
+
+  var app = document.getElementById("app");
+  var TOAST_MS = 3000;
+
+  function token() { return localStorage.getItem("token") || ""; }
+  function userId() { return localStorage.getItem("userId") || ""; }
+
+  function api(method, path, body) {
+    return fetch(path, {
+      method: method,
+      headers: { "Content-Type": "application/json", "Authorization": token() },
+      body: body === undefined ? undefined : JSON.stringify(body)
+    }).then(function (res) {
+      return res.json().then(function (data) { data.ok = res.ok; return data; });
+    });
+  }
+
+  function toast(message, isError) {
+    var container = document.getElementById("toast-container");
+    var el = document.createElement("div");
+    el.className = "toast " + (isError ? "toast-error" : "toast-success");
+    el.innerHTML = '<div class="toast-message"></div>';
+    el.firstChild.textContent = message;
+    container.appendChild(el);
+    setTimeout(function () { el.remove(); }, TOAST_MS);
+  }
+
+  function go(route) { location.hash = "#" + route; }
+
+  function currentRoute() {
+    var hash = location.hash.replace(/^#/, "") || "/auth/login";
+    return hash;
+  }
+
+  function render() {
+    var route = currentRoute();
+    if (route.indexOf("/dashboard") === 0 && !token()) { return go("/auth/login"); }
+    fetch("/client/views" + route, { headers: { "Authorization": token() } })
+      .then(function (res) {
+        if (res.status === 401) { localStorage.removeItem("token"); go("/auth/login"); return null; }
+        return res.text();
+      })
+      .then(function (html) {
+        if (html === null) { return; }
+        app.innerHTML = html;
+        app.setAttribute("data-route", route.split("?")[0]);
+        document.dispatchEvent(new CustomEvent("route-rendered", { detail: route }));
+      });
+  }
+
+  function value(scope, selector) {
+    var el = scope.querySelector(selector);
+    return el ? el.value.trim() : "";
+  }
+
+  // --- Forms ---
+
+  var forms = {
+    "login": function (form) {
+      api("POST", "/api/ecom/auth/login", {
+        userEmail: value(form, "#userEmail"), userPassword: value(form, "#userPassword")
+      }).then(function (data) {
+        if (!data.ok) { return toast(data.message, true); }
+        localStorage.setItem("token", data.token);
+        localStorage.setItem("userId", data.userId);
+        toast(data.message);
+        go("/dashboard/dash");
+      });
+    },
+    "register": function (form) {
+      var emailValidation = form.querySelector(".email-validation");
+      var passwordValidation = form.querySelector(".password-validation");
+      emailValidation.textContent = "";
+      passwordValidation.textContent = "";
+      var password = value(form, "#userPassword");
+      if (password !== value(form, "#confirmPassword")) {
+        passwordValidation.textContent = "Passwords do not match";
+        return toast("Passwords do not match", true);
+      }
+      api("POST", "/api/ecom/auth/register", {
+        userName: value(form, "#userName"), userEmail: value(form, "#userEmail"),
+        userPassword: password, confirmPassword: password
+      }).then(function (data) {
+        if (!data.ok) {
+          if (/already registered/.test(data.message)) {
+            emailValidation.textContent = "Email already registered";
+          }
+          return toast(data.message, true);
+        }
+        toast(data.message);
+        go("/auth/login");
+      });
+    },
+    "forgot-password": function (form) {
+      api("POST", "/api/ecom/auth/forgot-password", { userEmail: value(form, "input[type='email']") })
+        .then(function (data) { toast(data.message, !data.ok); });
+    },
+    "review": function (form) {
+      var rating = form.querySelectorAll(".rating-star.selected").length;
+      api("POST", "/api/ecom/product/add-review/" + form.getAttribute("data-product-id"), {
+        rating: rating, text: value(form, "textarea")
+      }).then(function (data) { toast(data.message, !data.ok); if (data.ok) { render(); } });
+    }
+  };
+
+  function filterQuery(form) {
+    var params = new URLSearchParams();
+    ["productName", "minPrice", "maxPrice"].forEach(function (name) {
+      var v = value(form, "[formcontrolname='" + name + "']");
+      if (v) { params.append(name, v); }
+    });
+    form.querySelectorAll("input[type='checkbox']:checked").forEach(function (box) {
+      params.append(box.getAttribute("data-filter"), box.value);
+    });
+    return params.toString();
+  }
+
+  function refreshProducts(form) {
+    fetch("/client/views/dashboard/products?" + filterQuery(form), { headers: { "Authorization": token() } })
+      .then(function (res) { return res.text(); })
+      .then(function (html) { app.querySelector(".products").innerHTML = html; });
+  }
+
+  // --- Payment helpers ---
+
+  function luhn(number) {
+    var sum = 0;
+    for (var i = 0; i < number.length; i++) {
+      var digit = parseInt(number.charAt(number.length - 1 - i), 10);
+      if (i % 2 === 1) { digit *= 2; if (digit > 9) { digit -= 9; } }
+      sum += digit;
+    }
+    return sum % 10 === 0;
+  }
+
+  function placeOrder() {
+    var section = app.querySelector(".payment");
+    var card = value(section, ".form__cc input[type='text']").replace(/\s+/g, "");
+    if (card) {
+      if (!/^\d{16}$/.test(card)) { return toast("Please enter a valid card number", true); }
+      if (!luhn(card)) { return toast("Invalid card details", true); }
+    }
+    var country = value(section, "input[placeholder='Select Country']");
+    if (!country) { return toast("Please select a country", true); }
+    var ids = (section.getAttribute("data-product-ids") || "").split(",").filter(Boolean);
+    var orders = ids.map(function (id) { return { productOrderedId: id, country: country }; });
+    api("POST", "/api/ecom/order/create-order", { orders: orders }).then(function (data) {
+      if (!data.ok) { return toast(data.message, true); }
+      toast(data.message);
+      go("/dashboard/thankyou?order=" + data.orders.join(","));
+    });
+  }
+
+  function showCountries(input) {
+    var results = input.parentNode.querySelector(".ta-results");
+    var query = input.value.trim().toLowerCase();
+    if (!query) { results.innerHTML = ""; return; }
+    api("GET", "/api/ecom/user/countries").then(function (data) {
+      if (input.value.trim().toLowerCase() !== query) { return; }
+      results.innerHTML = "";
+      data.data.filter(function (c) { return c.toLowerCase().indexOf(query) !== -1; })
+        .forEach(function (country) {
+          var item = document.createElement("ngx-typeahead-item");
+          item.innerHTML = '<button type="button" class="ta-item"><span></span></button>';
+          item.querySelector("span").textContent = country;
+          item.addEventListener("click", function () { input.value = country; results.innerHTML = ""; });
+          results.appendChild(item);
+        });
+    });
+  }
+
+  // --- Actions ---
+
+  var actions = {
+    "sign-out": function () {
+      api("POST", "/api/ecom/auth/logout");
+      localStorage.removeItem("token");
+      localStorage.removeItem("userId");
+      toast("Logout Successfully");
+      go("/auth/login");
+    },
+    "view-product": function (el) { go("/dashboard/product-details/" + el.getAttribute("data-product-id")); },
+    "add-to-cart": function (el) {
+      api("POST", "/api/ecom/user/add-to-cart", {
+        _id: userId(), product: { _id: el.getAttribute("data-product-id") }
+      }).then(function (data) {
+        toast(data.message, !data.ok);
+        var label = app.querySelector(".fa-shopping-cart + label");
+        if (data.ok && label) { label.textContent = String(parseInt(label.textContent || "0", 10) + 1); }
+      });
+    },
+    "update-qty": function (el) {
+      var qty = el.parentNode.querySelector(".qty");
+      api("POST", "/api/ecom/user/update-cart-quantity", {
+        productId: el.getAttribute("data-product-id"), quantity: parseInt(qty.value, 10)
+      }).then(function (data) { toast(data.message, !data.ok); render(); });
+    },
+    "remove-from-cart": function (el) {
+      api("DELETE", "/api/ecom/user/remove-from-cart/" + userId() + "/" + el.getAttribute("data-product-id"))
+        .then(function (data) { toast(data.message, !data.ok); render(); });
+    },
+    "buy-now": function (el) { go("/dashboard/order?prop=" + el.getAttribute("data-product-id")); },
+    "checkout": function () { go("/dashboard/checkout/order"); },
+    "payment-type": function (el) {
+      app.querySelectorAll(".payment__type").forEach(function (t) { t.classList.remove("active"); });
+      el.classList.add("active");
+    },
+    "apply-coupon": function () {
+      api("POST", "/api/ecom/order/apply-coupon", { coupon: value(app, "input[name='coupon']") })
+        .then(function (data) { toast(data.message, !data.ok); });
+    },
+    "place-order": placeOrder,
+    "size-chart": function () { app.querySelector("#sizeChart").classList.toggle("show"); },
+    "reviews-tab": function () { app.querySelector(".review-list").classList.add("show"); },
+    "add-review": function () { app.querySelector(".review-form").classList.add("show"); },
+    "add-address": function () { app.querySelector(".address-form").classList.add("show"); },
+    "delete-address": function (el) {
+      api("DELETE", "/api/ecom/user/delete-address/" + el.getAttribute("data-index"))
+        .then(function (data) { toast(data.message, !data.ok); render(); });
+    },
+    "save-profile": function () {
+      var form = app.querySelector(".profile-form");
+      var addressForm = form.querySelector(".address-form");
+      var requests = [api("POST", "/api/ecom/user/update-profile", {
+        name: value(form, "[formcontrolname='name']"),
+        address: value(form, "[formcontrolname='address']"),
+        phone: value(form, "[formcontrolname='phone']")
+      })];
+      if (addressForm.classList.contains("show")) {
+        var address = {};
+        addressForm.querySelectorAll("input").forEach(function (input) {
+          address[input.getAttribute("formcontrolname")] = input.value.trim();
+        });
+        requests.push(api("POST", "/api/ecom/user/add-address", address));
+      }
+      Promise.all(requests).then(function (results) {
+        var last = results[results.length - 1];
+        toast(last.message, !last.ok);
+        render();
+      });
+    },
+    "orders-tab": function () { app.querySelector(".order-history").classList.add("show"); }
+  };
+
+  // --- Delegated listeners ---
+
+  app.addEventListener("click", function (event) {
+    var target = event.target.closest("[data-action], [data-route], .rating-star, .thumbnail-image");
+    if (!target) { return; }
+    if (target.classList.contains("rating-star")) {
+      var n = parseInt(target.getAttribute("data-value"), 10);
+      target.parentNode.querySelectorAll(".rating-star").forEach(function (star, i) {
+        star.classList.toggle("selected", i < n);
+        star.innerHTML = i < n ? "&#9733;" : "&#9734;";
+      });
+      return;
+    }
+    if (target.classList.contains("thumbnail-image")) {
+      app.querySelector(".main-image").src = target.getAttribute("data-src");
+      return;
+    }
+    event.preventDefault();
+    if (target.hasAttribute("data-route")) { return go(target.getAttribute("data-route")); }
+    var action = actions[target.getAttribute("data-action")];
+    if (action) { action(target); }
+  });
+
+  app.addEventListener("submit", function (event) {
+    var form = event.target.closest("[data-form]");
+    if (!form) { return; }
+    event.preventDefault();
+    var handler = forms[form.getAttribute("data-form")];
+    if (handler) { handler(form); }
+  });
+
+  app.addEventListener("input", function (event) {
+    var form = event.target.closest("[data-form='filters']");
+    if (form) { return refreshProducts(form); }
+    if (event.target.matches("input[placeholder='Select Country']")) { showCountries(event.target); }
+  });
+
+  app.addEventListener("change", function (event) {
+    var form = event.target.closest("[data-form='filters']");
+    if (form && event.target.type === "checkbox") { refreshProducts(form); }
+  });
+
+  app.addEventListener("mouseover", function (event) {
+    var wrap = event.target.closest(".image-wrap");
+    if (wrap) { wrap.querySelector(".zoom-view").classList.add("show"); }
+  });
+
+  app.addEventListener("mouseout", function (event) {
+    var wrap = event.target.closest(".image-wrap");
+    if (wrap && !wrap.contains(event.relatedTarget)) { wrap.querySelector(".zoom-view").classList.remove("show"); }
+  });
+
+  window.addEventListener("hashchange", render);
+  render();
+})();
@@ -0,0 +1,265 @@
+"""In-memory data store for the stub application."""
+import secrets
+import threading
+import time
+import uuid
+from copy import deepcopy
+
+# Catalog mirrors Tests/test_data.py (titles, prices, categories)
+PRODUCTS = [
+    {
+        "_id": "6581ca399fd99c85e8ee7f45",
+        "productName": "ZARA COAT 3",
+        "productCategory": "fashion",
+        "productSubCategory": "t-shirts",
+        "productPrice": 11500,
+        "productDescription": "Zara coat for Women and girls",
+        "productImage": "/client/static/img/zara.png",
+        "productFor": "women",
+    },
+    {
+        "_id": "6581cade9fd99c85e8ee7ff5",
+        "productName": "ADIDAS ORIGINAL",
+        "productCategory": "fashion",
+        "productSubCategory": "shoes",
+        "productPrice": 11500,
+        "productDescription": "Adidas shoes for Men",
+        "productImage": "/client/static/img/adidas.png",
+        "productFor": "men",
+    },
+    {
+        "_id": "6581cb199fd99c85e8ee80d4",
+        "productName": "iphone 13 pro",
+        "productCategory": "electronics",
+        "productSubCategory": "mobiles",
+        "productPrice": 55000,
+        "productDescription": "Apple phone",
+        "productImage": "/client/static/img/iphone.png",
+        "productFor": "women",
+    },
+]
+
+CATEGORIES = {
+    "fashion": ["t-shirts", "shirts", "shoes"],
+    "electronics": ["mobiles", "laptops"],
+    "household": [],
+}
+
+COUNTRIES = ["India", "Indonesia", "British Indian Ocean Territory", "United States",
+             "United Kingdom", "Germany", "France", "Australia", "Canada", "Japan"]
+
+VALID_COUPONS = {"DISCOUNT20": 20, "rahulshettyacademy": 10}
+
+DEFAULT_USERS = [
+    {"email": "test.qa@shop.com", "password": "ValidPassword123!", "name": "Test User"},
+    {"email": "admin@shop.com", "password": "AdminPass456!", "name": "Admin User"},
+]
+
+SAMPLE_REVIEWS = [
+    {"rating": 5, "text": "Great quality, fits well", "author": "Asha"},
+    {"rating": 4, "text": "Good value for money", "author": "Rohan"},
+]
+
+
+class StubStore:
+    """Thread-safe in-memory users, carts, orders and sessions."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        """Restore the initial catalog and users; drop carts and orders."""
+        with self._lock:
+            self.products = {p["_id"]: deepcopy(p) for p in PRODUCTS}
+            self.users = {}
+            self.tokens = {}
+            self.carts = {}
+            self.orders = {}
+            self.history = {}
+            self.reviews = {pid: deepcopy(SAMPLE_REVIEWS) for pid in self.products}
+            for user in DEFAULT_USERS:
+                self.create_user(user["email"], user["password"], user["name"])
+
+    # --- Users and sessions ---
+
+    def create_user(self, email, password, name=""):
+        """
+        Register a user.
+        Returns:
+            dict: The new user, or None if the email is taken
+        """
+        with self._lock:
+            if self.find_user(email):
+                return None
+            user = {
+                "_id": uuid.uuid4().hex[:24],
+                "email": email.lower(),
+                "password": password,
+                "name": name,
+                "address": "",
+                "phone": "",
+                "addresses": [],
+            }
+            self.users[user["_id"]] = user
+            self.carts[user["_id"]] = []
+            self.orders[user["_id"]] = []
+            self.history[user["_id"]] = []
+            return user
+
+    def find_user(self, email):
+        with self._lock:
+            email = (email or "").lower()
+            return next((u for u in self.users.values() if u["email"] == email), None)
+
+    def login(self, email, password):
+        """
+        Returns:
+            tuple: (token, user) or (None, None) on bad credentials
+        """
+        with self._lock:
+            user = self.find_user(email)
+            if not user or user["password"] != password:
+                return None, None
+            token = secrets.token_hex(16)
+            self.tokens[token] = user["_id"]
+            return token, user
+
+    def user_for_token(self, token):
+        with self._lock:
+            user_id = self.tokens.get(token or "")
+            return self.users.get(user_id) if user_id else None
+
+    def logout(self, token):
+        with self._lock:
+            self.tokens.pop(token or "", None)
+
+    def update_profile(self, user_id, **fields):
+        with self._lock:
+            user = self.users[user_id]
+            for key in ("name", "address", "phone"):
+                if fields.get(key) is not None:
+                    user[key] = fields[key]
+            return user
+
+    def add_address(self, user_id, address):
+        with self._lock:
+            self.users[user_id]["addresses"].append(dict(address))
+
+    def delete_address(self, user_id, index):
+        with self._lock:
+            addresses = self.users[user_id]["addresses"]
+            if 0 <= index < len(addresses):
+                addresses.pop(index)
+                return True
+            return False
+
+    # --- Catalog ---
+
+    def filter_products(self, name="", min_price=None, max_price=None, categories=(), subcategories=()):
+        """Return catalog entries matching the dashboard filters."""
+        with self._lock:
+            result = []
+            for product in self.products.values():
+                if name and name.lower() not in product["productName"].lower():
+                    continue
+                if min_price is not None and product["productPrice"] < min_price:
+                    continue
+                if max_price is not None and product["productPrice"] > max_price:
+                    continue
+                if categories and product["productCategory"] not in categories:
+                    continue
+                if subcategories and product["productSubCategory"] not in subcategories:
+                    continue
+                result.append(product)
+            return result
+
+    def record_view(self, user_id, product_id):
+        with self._lock:
+            if product_id in self.products:
+                self.history.setdefault(user_id, []).append(product_id)
+
+    def recommendations(self, user_id):
+        """Products sharing a category with the user's browsing history."""
+        with self._lock:
+            viewed = self.history.get(user_id, [])
+            categories = {self.products[pid]["productCategory"] for pid in viewed}
+            return [p for p in self.products.values() if p["productCategory"] in categories]
+
+    def add_review(self, product_id, rating, text, author):
+        with self._lock:
+            self.reviews.setdefault(product_id, []).append(
+                {"rating": rating, "text": text, "author": author}
+            )
+
+    # --- Cart ---
+
+    def cart(self, user_id):
+        """Cart lines as (product, quantity) pairs."""
+        with self._lock:
+            return [(self.products[line["productId"]], line["quantity"])
+                    for line in self.carts.get(user_id, [])]
+
+    def add_to_cart(self, user_id, product_id, quantity=1):
+        with self._lock:
+            if product_id not in self.products:
+                return False
+            lines = self.carts.setdefault(user_id, [])
+            for line in lines:
+                if line["productId"] == product_id:
+                    line["quantity"] += quantity
+                    return True
+            lines.append({"productId": product_id, "quantity": quantity})
+            return True
+
+    def set_quantity(self, user_id, product_id, quantity):
+        with self._lock:
+            for line in self.carts.get(user_id, []):
+                if line["productId"] == product_id:
+                    line["quantity"] = quantity
+                    return True
+            return False
+
+    def remove_from_cart(self, user_id, product_id):
+        with self._lock:
+            lines = self.carts.get(user_id, [])
+            kept = [line for line in lines if line["productId"] != product_id]
+            self.carts[user_id] = kept
+            return len(kept) != len(lines)
+
+    def clear_cart(self, user_id):
+        with self._lock:
+            self.carts[user_id] = []
+
+    # --- Orders ---
+
+    def create_orders(self, user_id, orders):
+        """
+        Place one order per ``{"productOrderedId", "country"}`` entry.
+        Ordered products are removed from the cart.
+        Returns:
+            list: New order ids
+        """
+        with self._lock:
+            order_ids = []
+            for entry in orders:
+                product = self.products.get(entry.get("productOrderedId"))
+                if not product:
+                    continue
+                order = {
+                    "_id": uuid.uuid4().hex[:24],
+                    "productOrderedId": product["_id"],
+                    "productName": product["productName"],
+                    "orderPrice": product["productPrice"],
+                    "country": entry.get("country", ""),
+                    "status": "Confirmed",
+                    "createdAt": time.strftime("%Y-%m-%d"),
+                }
+                self.orders.setdefault(user_id, []).append(order)
+                self.remove_from_cart(user_id, product["_id"])
+                order_ids.append(order["_id"])
+            return order_ids
+
+    def orders_for(self, user_id):
+        with self._lock:
+            return list(self.orders.get(user_id, []))
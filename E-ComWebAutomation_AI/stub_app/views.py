@@ -0,0 +1,352 @@
+"""Server-side rendered screens for the stub application.
+
+``static/app.js`` is a thin hash router: for ``#/<route>`` it fetches
+``/client/views/<route>`` and swaps the returned fragment into the page.
+Markup follows the locators in ``pages/``, so it doubles as a DOM snapshot
+source for offline checks.
+"""
+from html import escape
+
+from stub_app.store import CATEGORIES
+
+
+def _price(value):
+    return f"{int(value)}" if float(value).is_integer() else f"{value:.2f}"
+
+
+# --- Auth screens ---
+
+def login_view():
+    return """
+<section class="login-wrapper">
+  <h1 class="login-title">Log in</h1>
+  <form class="login-form" data-form="login" novalidate>
+    <label for="userEmail">Email</label>
+    <input id="userEmail" type="email" class="form-control" placeholder="email@example.com">
+    <label for="userPassword">Password</label>
+    <input id="userPassword" type="password" class="form-control" placeholder="enter your passsword">
+    <input id="login" type="submit" class="btn btn-block login-btn" value="Login">
+  </form>
+  <a class="forgot-password-link" href="#/auth/password-new">Forgot Password</a>
+  <p class="register-line">Don't have an account? <a href="#/auth/register">Register</a></p>
+  <div class="social-login">
+    <button class="btn auth-provider" data-provider="google">Login with Google</button>
+    <button class="btn auth-provider" data-provider="facebook">Login with Facebook</button>
+  </div>
+</section>"""
+
+
+def register_view():
+    return """
+<section class="login-wrapper">
+  <h1 class="login-title">Register</h1>
+  <form class="register-form" data-form="register" novalidate>
+    <input id="userName" type="text" class="form-control" placeholder="Full Name">
+    <input id="userEmail" type="email" class="form-control" placeholder="email@example.com">
+    <p class="email-validation invalid-feedback"></p>
+    <input id="userPassword" type="password" class="form-control" placeholder="Passsword">
+    <p class="password-validation invalid-feedback"></p>
+    <input id="confirmPassword" type="password" class="form-control" placeholder="Confirm Passsword">
+    <input id="login" type="submit" class="btn btn-block login-btn" value="Register">
+  </form>
+  <p>Already have an account? <a href="#/auth/login">Log in</a></p>
+</section>"""
+
+
+def forgot_password_view():
+    return """
+<section class="login-wrapper">
+  <h1 class="login-title">Enter New Password</h1>
+  <form data-form="forgot-password" novalidate>
+    <input type="email" name="email" class="form-control" placeholder="Enter your email address">
+    <button type="submit" class="btn btn-custom btn-submit">Save New Password</button>
+  </form>
+</section>"""
+
+
+# --- Dashboard chrome ---
+
+def _nav(cart_count):
+    return f"""
+<nav class="navbar dashboard-header">
+  <a class="navbar-brand" href="#/dashboard/dash">Automation Practice</a>
+  <ul class="nav-buttons">
+    <li><button class="btn btn-custom" data-route="/dashboard/dash"><i class="fa fa-home"></i> HOME</button></li>
+    <li><button class="btn btn-custom" data-route="/dashboard/myorders"><i class="fa fa-handshake-o"></i> ORDERS</button></li>
+    <li><button class="btn btn-custom" data-route="/dashboard/cart"><i class="fa fa-shopping-cart"></i><label>{cart_count}</label> Cart</button></li>
+    <li><button class="btn btn-custom" data-route="/dashboard/profile"><i class="fa fa-user"></i> PROFILE</button></li>
+    <li><button class="btn btn-custom" data-action="sign-out"><i class="fa fa-sign-out"></i> Sign Out</button></li>
+  </ul>
+</nav>"""
+
+
+def dashboard_chrome(store, user, body):
+    """Wrap a dashboard screen in the navigation bar."""
+    cart_count = sum(qty for _, qty in store.cart(user["_id"]))
+    return f"{_nav(cart_count)}\n<main class=\"dashboard-body\">{body}</main>"
+
+
+# --- Dashboard / products ---
+
+def product_card(product):
+    pid = escape(product["_id"])
+    return f"""
+<div class="col-lg-4 col-md-6 col-sm-10 offset-md-0 offset-sm-1 mb-3">
+  <div class="card" data-product-id="{pid}">
+    <img class="card-img-top" src="{escape(product['productImage'])}" alt="">
+    <div class="card-body">
+      <h5><b>{escape(product['productName'])}</b></h5>
+      <div class="text-muted">$ {_price(product['productPrice'])}</div>
+      <button class="btn w-40 rounded" data-action="view-product" data-product-id="{pid}"><i class="fa fa-eye"></i> View</button>
+      <button class="btn w-10 rounded" data-action="add-to-cart" data-product-id="{pid}"><i class="fa fa-shopping-cart"></i> Add To Cart</button>
+    </div>
+  </div>
+</div>"""
+
+
+def product_list(products):
+    """Product grid fragment (re-rendered on every filter change)."""
+    cards = "".join(product_card(p) for p in products)
+    return f"""
+<div id="res" class="mt-2 mb-2">Showing {len(products)} results</div>
+<div class="row">{cards}</div>"""
+
+
+def _filter_checkbox(name, filter_type):
+    return (f'<div class="form-group"><input type="checkbox" class="ng-untouched" '
+            f'data-filter="{filter_type}" value="{escape(name)}"><label>{escape(name)}</label></div>')
+
+
+def dashboard_view(store, user, products):
+    categories = "".join(_filter_checkbox(c, "category") for c in CATEGORIES)
+    subcategories = "".join(_filter_checkbox(s, "subcategory")
+                            for subs in CATEGORIES.values() for s in subs)
+    recommended = store.recommendations(user["_id"])
+    recommendations = ""
+    if recommended:
+        cards = "".join(product_card(p) for p in recommended)
+        recommendations = f'<section class="recommended"><h4>Recommended for you</h4><div class="row">{cards}</div></section>'
+    return dashboard_chrome(store, user, f"""
+<section class="container-fluid dashboard">
+  <aside class="filters">
+    <form data-form="filters" novalidate>
+      <input type="text" class="form-control" formcontrolname="productName" placeholder="search">
+      <h6>Price Range</h6>
+      <input type="text" class="form-control" formcontrolname="minPrice" placeholder="Min Price">
+      <input type="text" class="form-control" formcontrolname="maxPrice" placeholder="Max Price">
+      <h6>Categories</h6>{categories}
+      <h6>Sub Categories</h6>{subcategories}
+    </form>
+  </aside>
+  <section class="products">{product_list(products)}</section>
+  {recommendations}
+</section>""")
+
+
+def _review(review):
+    stars = "".join('<i class="star-filled">&#9733;</i>' for _ in range(review["rating"]))
+    return (f'<div class="review-item"><span class="review-rating">{stars}</span>'
+            f'<p class="review-text">{escape(review["text"])}</p>'
+            f'<p class="review-author">{escape(review["author"])}</p></div>')
+
+
+def product_details_view(store, user, product):
+    pid = escape(product["_id"])
+    thumbnails = "".join(
+        f'<img class="thumbnail-image" data-src="{escape(product["productImage"])}?v={i}" '
+        f'src="{escape(product["productImage"])}?v={i}" alt="">' for i in range(3)
+    )
+    reviews = "".join(_review(r) for r in store.reviews.get(product["_id"], []))
+    sizes = "".join(f'<span class="size-option">{s}</span>' for s in ("S", "M", "L", "XL"))
+    stars = "".join(f'<span class="rating-star" data-value="{n}">&#9734;</span>' for n in range(1, 6))
+    return dashboard_chrome(store, user, f"""
+<section class="product-details" data-product-id="{pid}">
+  <div class="image-wrap">
+    <img class="main-image" src="{escape(product['productImage'])}" alt="">
+    <div class="zoom-view"><img src="{escape(product['productImage'])}" alt=""></div>
+    <div class="thumbnails">{thumbnails}</div>
+  </div>
+  <div class="info">
+    <h2 class="product-title">{escape(product['productName'])}</h2>
+    <h3 class="product-price">$ {_price(product['productPrice'])}</h3>
+    <p class="product-description">{escape(product['productDescription'])}</p>
+    <p class="product-category">{escape(product['productCategory'])}</p>
+    <button class="btn btn-link" data-target="#sizeChart" data-action="size-chart">Size Chart</button>
+    <div id="sizeChart" class="modal-panel">{sizes}</div>
+    <button class="btn btn-primary" data-action="add-to-cart" data-product-id="{pid}">Add to Cart</button>
+  </div>
+  <div class="reviews">
+    <button class="btn reviews-tab" data-action="reviews-tab">Reviews</button>
+    <div class="review-list">{reviews}</div>
+    <button class="btn add-review-btn" data-action="add-review">Write a review</button>
+    <form class="review-form" data-form="review" data-product-id="{pid}" novalidate>
+      <div class="rating">{stars}</div>
+      <textarea formcontrolname="review" class="form-control"></textarea>
+      <button type="submit" class="btn btn-primary">Submit</button>
+    </form>
+  </div>
+</section>""")
+
+
+# --- Cart and checkout ---
+
+def cart_view(store, user):
+    lines = store.cart(user["_id"])
+    if not lines:
+        return dashboard_chrome(store, user, """
+<div class="heading cf"><h1>No Products in Your Cart !</h1>
+  <button class="btn btn-primary" routerlink="/dashboard" data-route="/dashboard/dash">Continue Shopping</button>
+</div>""")
+    items = []
+    for index, (product, quantity) in enumerate(lines):
+        pid = escape(product["_id"])
+        parity = "odd" if index % 2 == 0 else "even"
+        items.append(f"""
+  <li class="items {parity}" data-product-id="{pid}">
+    <div class="infoWrap">
+      <div class="cartSection">
+        <img class="itemImg" src="{escape(product['productImage'])}" alt="">
+        <p class="itemNumber">#{pid}</p>
+        <h3>{escape(product['productName'])}</h3>
+        <p>MRP $ {_price(product['productPrice'])}</p>
+        <p class="stockStatus">In Stock</p>
+        <input type="number" class="qty" min="1" value="{quantity}">
+        <button class="update-qty" data-action="update-qty" data-product-id="{pid}">Update</button>
+      </div>
+      <div class="prodTotal cartSection"><p>${_price(product['productPrice'] * quantity)}</p></div>
+      <div class="cartSection removeWrap">
+        <button class="btn btn-primary" data-action="buy-now" data-product-id="{pid}">Buy Now&#10095;</button>
+        <button class="btn btn-danger" data-action="remove-from-cart" data-product-id="{pid}"><i class="fa fa-trash-o"></i></button>
+      </div>
+    </div>
+  </li>""")
+    total = sum(product["productPrice"] * quantity for product, quantity in lines)
+    return dashboard_chrome(store, user, f"""
+<div class="heading cf"><h1>My Cart</h1>
+  <button class="btn btn-primary" routerlink="/dashboard" data-route="/dashboard/dash">Continue Shopping</button>
+</div>
+<div class="cart">
+  <ul class="cartWrap">{''.join(items)}</ul>
+</div>
+<div class="subtotal cf">
+  <ul>
+    <li class="totalRow"><span class="label">Subtotal</span><span class="value">${_price(total)}</span></li>
+    <li class="totalRow"><span class="label">Total</span><span class="value">${_price(total)}</span></li>
+    <li class="totalRow"><button class="btn btn-primary" data-action="checkout">Checkout&#10095;</button></li>
+  </ul>
+</div>""")
+
+
+def payment_view(store, user, product_ids=None):
+    lines = store.cart(user["_id"])
+    if product_ids:
+        lines = [(p, q) for p, q in lines if p["_id"] in product_ids] or \
+                [(store.products[pid], 1) for pid in product_ids if pid in store.products]
+    items = "".join(f"""
+  <div class="item" data-product-id="{escape(product['_id'])}">
+    <img class="iphone" src="{escape(product['productImage'])}" alt="">
+    <div class="item__details">
+      <div class="item__title">{escape(product['productName'])}</div>
+      <div class="item__price">$ {_price(product['productPrice'])}</div>
+      <div class="item__quantity">Quantity: {quantity}</div>
+      <div class="item__description"><ul><li>{escape(product['productDescription'])}</li></ul></div>
+    </div>
+  </div>""" for product, quantity in lines)
+    months = "".join(f"<option>{m:02d}</option>" for m in range(1, 13))
+    days = "".join(f"<option>{d:02d}</option>" for d in range(1, 32))
+    return dashboard_chrome(store, user, f"""
+<section class="payment" data-product-ids="{escape(','.join(p['_id'] for p, _ in lines))}">
+  <div class="payment__info">
+    <div class="payment__types">
+      <div class="payment__type payment__type--cc active" data-action="payment-type">Credit Card</div>
+      <div class="payment__type payment__type--paypal" data-action="payment-type">Paypal</div>
+    </div>
+    <div class="payment__info">
+      <div class="form__cc">
+        <div class="row">
+          <div class="field"><div class="title">Credit Card Number</div>
+            <input class="input txt text-validated" type="text" value=""></div>
+        </div>
+        <div class="row">
+          <div class="field small"><div class="title">Expiry Date</div>
+            <select class="input ddl">{months}</select>
+            <select class="input ddl">{days}</select></div>
+          <div class="field small"><div class="title">CVV Code</div>
+            <input class="input txt" type="text"></div>
+        </div>
+        <div class="row">
+          <div class="field"><div class="title">Name on Card</div>
+            <input class="input txt" type="text"></div>
+        </div>
+        <div class="row">
+          <div class="field small"><div class="title">Apply Coupon</div>
+            <input class="input txt" type="text" name="coupon"></div>
+          <button class="btn btn-primary mt-1" type="submit" data-action="apply-coupon">Apply Coupon</button>
+        </div>
+      </div>
+    </div>
+  </div>
+  <div class="payment__shipping">
+    <div class="user__name"><label type="text">{escape(user['email'])}</label></div>
+    <div class="form-group">
+      <input class="input txt text-validated" placeholder="Select Country" type="text">
+      <section class="ta-results"></section>
+    </div>
+    <div class="actions"><a class="btnn action__submit" data-action="place-order">Place Order</a></div>
+  </div>
+  <div class="details__item">{items}</div>
+</section>""")
+
+
+def thank_you_view(store, user, order_ids):
+    rows = "".join(f'<tr><td><label class="ng-star-inserted">| {escape(o)} |</label></td></tr>' for o in order_ids)
+    return dashboard_chrome(store, user, f"""
+<section class="thankyou">
+  <h1 class="hero-primary">Thankyou for the order.</h1>
+  <table class="order-ids"><tbody>{rows}</tbody></table>
+</section>""")
+
+
+def orders_view(store, user):
+    rows = "".join(f"""
+    <tr><th scope="row">{escape(o['_id'])}</th><td>{escape(o['productName'])}</td>
+      <td>$ {_price(o['orderPrice'])}</td><td>{escape(o['createdAt'])}</td>
+      <td><button class="btn btn-primary">View</button></td></tr>""" for o in store.orders_for(user["_id"]))
+    body = rows or '<tr><td colspan="5">You have No Orders to show at this time.</td></tr>'
+    return dashboard_chrome(store, user, f"""
+<section class="orders">
+  <h1>Your Orders</h1>
+  <table class="table table-bordered table-hover"><tbody>{body}</tbody></table>
+</section>""")
+
+
+# --- Profile ---
+
+def profile_view(store, user):
+    orders = "".join(f"""
+    <div class="order-card"><span class="order-id">{escape(o['_id'])}</span>
+      <span class="order-date">{escape(o['createdAt'])}</span>
+      <span class="order-status">{escape(o['status'])}</span>
+      <span class="order-total">$ {_price(o['orderPrice'])}</span></div>""" for o in store.orders_for(user["_id"]))
+    addresses = "".join(f"""
+    <div class="address-item{' default' if i == 0 else ''}">{escape(', '.join(str(v) for v in a.values()))}
+      <button class="edit-address">Edit</button>
+      <button class="delete-address" data-action="delete-address" data-index="{i}">Delete</button></div>"""
+                        for i, a in enumerate(user["addresses"]))
+    address_fields = "".join(f'<input type="text" class="form-control" formcontrolname="{f}" placeholder="{f}">'
+                             for f in ("street", "city", "state", "zip", "country"))
+    return dashboard_chrome(store, user, f"""
+<section class="profile">
+  <form class="profile-form" data-form="profile" novalidate>
+    <input type="text" class="form-control" formcontrolname="name" value="{escape(user['name'])}">
+    <p class="email-display">{escape(user['email'])}</p>
+    <textarea class="form-control" formcontrolname="address">{escape(user['address'])}</textarea>
+    <input type="text" class="form-control" formcontrolname="phone" value="{escape(user['phone'])}">
+    <div class="address-form">{address_fields}</div>
+    <button type="button" class="btn btn-save" data-action="save-profile">Save</button>
+  </form>
+  <button class="btn add-address" data-action="add-address">Add Address</button>
+  <div class="address-list">{addresses}</div>
+  <button class="btn orders-tab" data-action="orders-tab">Order History</button>
+  <div class="order-history">{orders}</div>
+</section>""")
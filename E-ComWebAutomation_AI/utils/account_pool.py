@@ -0,0 +1,193 @@
+"""Leased test accounts for parallel workers.
+
+Tests that mutate per-user state (cart, orders, profile) lease an account
+instead of sharing ``TestData.VALID_USER``. The pool is a JSON file guarded
+by a cross-process lock, so every xdist worker sees the same leases. Leases
+left behind by a dead worker expire; returned accounts have their cart
+emptied and their profile (name, phone, address, saved addresses) restored;
+the pool grows when every account is taken.
+
+Usage:
+    python -m utils.account_pool --provision 8     # create accounts ahead of time
+    python -m utils.account_pool --status
+"""
+import argparse
+import json
+import os
+import re
+import socket
+import sys
+import time
+import uuid
+
+from utils.api_seed import SeedError
+from utils.locks import FileLock, LOCKS_DIR
+from utils.run_configs import ARTIFACTS_DIR
+
+POOL_DIR = ARTIFACTS_DIR / ".cache" / "accounts"
+ACCOUNT_PASSWORD = "PoolUser@12345"
+LEASE_TTL_SECONDS = 30 * 60
+
+
+def _pid_alive(pid):
+    if os.name == "nt":
+        return True  # rely on the lease TTL
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class AccountPool:
+    """
+    Cross-process pool of test accounts for one application.
+    Args:
+        seeder (ApiSeeder): API client used to create and reset accounts
+        namespace (str): Pool name, usually the application host
+        lease_ttl (float): Seconds after which an unreleased lease expires
+    """
+
+    def __init__(self, seeder, namespace, lease_ttl=LEASE_TTL_SECONDS):
+        self.seeder = seeder
+        self.namespace = re.sub(r"[^\w.-]", "_", namespace)
+        self.lease_ttl = lease_ttl
+        self.path = POOL_DIR / f"{self.namespace}.json"
+        self.lock = FileLock(LOCKS_DIR / f"accounts_{self.namespace}.lock", timeout=60)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    # --- State file (callers hold the lock) ---
+
+    def _load(self):
+        if not self.path.exists():
+            return {"accounts": []}
+        with open(self.path) as f:
+            return json.load(f)
+
+    def _save(self, state):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def _is_free(self, account, now):
+        lease = account.get("lease")
+        if not lease:
+            return True
+        if now - lease["at"] > self.lease_ttl:
+            return True
+        host, _, pid = lease["owner"].rpartition(":")
+        return host == socket.gethostname() and not _pid_alive(int(pid))
+
+    @staticmethod
+    def _new_account(index):
+        return {
+            "email": f"pool_{index:03d}_{uuid.uuid4().hex[:8]}@gauto.com",
+            "password": ACCOUNT_PASSWORD,
+            "name": f"Pool User {index}",
+            "lease": None,
+        }
+
+    # --- Public API ---
+
+    def provision(self, count):
+        """
+        Make sure at least ``count`` accounts exist (registered through the API).
+        Returns:
+            int: Number of accounts created
+        """
+        with self.lock:
+            state = self._load()
+            created = 0
+            while len(state["accounts"]) < count:
+                account = self._new_account(len(state["accounts"]))
+                self.seeder.ensure_user(account["email"], account["password"], account["name"])
+                state["accounts"].append(account)
+                created += 1
+            self._save(state)
+        return created
+
+    def lease(self):
+        """
+        Take an account for exclusive use, growing the pool if all are taken.
+        Returns:
+            dict: ``email``, ``password`` and ``name`` (TestData.VALID_USER shape)
+        """
+        with self.lock:
+            state = self._load()
+            now = time.time()
+            account = next((a for a in state["accounts"] if self._is_free(a, now)), None)
+            if account is None:
+                account = self._new_account(len(state["accounts"]))
+                state["accounts"].append(account)
+            account["lease"] = {"owner": self.owner, "at": now}
+            self._save(state)
+
+        # Accounts missing on this server (e.g. a fresh stub application)
+        # are registered on first lease
+        try:
+            self.seeder.login(account["email"], account["password"])
+        except SeedError:
+            self.seeder.ensure_user(account["email"], account["password"], account["name"])
+        return {k: account[k] for k in ("email", "password", "name")}
+
+    def release(self, account, reset=True):
+        """
+        Return a leased account, emptying its cart and restoring its profile first.
+        Args:
+            account (dict): Value returned by :meth:`lease`
+            reset (bool): Clear per-user state before returning it
+        """
+        try:
+            if reset:
+                user = self.seeder.login(account["email"], account["password"])
+                self.seeder.clear_cart(user)
+                self.seeder.reset_profile(user, account["name"])
+        finally:
+            with self.lock:
+                state = self._load()
+                for entry in state["accounts"]:
+                    if entry["email"] == account["email"]:
+                        entry["lease"] = None
+                self._save(state)
+
+    def status(self):
+        """
+        Returns:
+            list: (email, lease owner or None) for every account
+        """
+        with self.lock:
+            state = self._load()
+        return [(a["email"], (a.get("lease") or {}).get("owner")) for a in state["accounts"]]
+
+
+def main(argv=None):
+    """Provision or inspect the account pool."""
+    from urllib.parse import urlsplit
+    from utils.api_seed import ApiSeeder
+
+    parser = argparse.ArgumentParser(description="Test account pool")
+    parser.add_argument("--base-url", default=os.getenv("TEST_BASE_URL",
+                        "https://rahulshettyacademy.com/client/#/auth/login"))
+    parser.add_argument("--provision", type=int, metavar="N", help="Ensure at least N accounts exist")
+    parser.add_argument("--status", action="store_true", help="List accounts and leases")
+    args = parser.parse_args(argv)
+
+    seeder = ApiSeeder(args.base_url)
+    pool = AccountPool(seeder, urlsplit(args.base_url).netloc)
+    try:
+        if args.provision:
+            print(f"Created {pool.provision(args.provision)} account(s) in {pool.path}")
+        if args.status or not args.provision:
+            for email, owner in pool.status():
+                print(f"{email:40s} {'leased by ' + owner if owner else 'free'}")
+    finally:
+        seeder.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""Precondition seeding through the application's REST API.
+
+Fixtures that only need a state (a user, a filled cart, existing orders)
+create it here instead of clicking through the UI, then hand the browser an
+authenticated session. UI steps are left for the behavior under test.
+
+Usage:
+    seeded = api_seeder.seed(user=TestData.VALID_USER, cart=["ZARA COAT 3"])
+    api_seeder.open_session(driver, seeded.user, route="/dashboard/cart")
+"""
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Seconds to wait for the router to show a route before reloading the app instead
+ROUTE_TIMEOUT = 5
+# Upper bound on saved addresses deleted when resetting a profile
+MAX_ADDRESSES = 100
+# Statuses of an API route the server does not have (or of "nothing left")
+MISSING_ROUTE = (404, 405)
+
+
+def _landmark(route):
+    """``READY`` locator of the signed-in page object whose ``ROUTE`` is ``route``, or None."""
+    from pages.cart_page.cart_page import CartPage
+    from pages.dashboard_page.dashboard_page import DashboardPage
+    from pages.profile_page.profile_page import ProfilePage
+
+    return next((page.READY for page in (DashboardPage, CartPage, ProfilePage) if page.ROUTE == route), None)
+
+
+class SeedError(RuntimeError):
+    """Raised when the API rejects a seeding request."""
+
+
+@dataclass
+class SeededUser:
+    """Authenticated API user."""
+    email: str
+    password: str
+    user_id: str
+    token: str
+
+
+@dataclass
+class SeedResult:
+    """Everything created by :meth:`ApiSeeder.seed`."""
+    user: SeededUser
+    cart: list = field(default_factory=list)
+    orders: list = field(default_factory=list)
+
+
+class ApiSeeder:
+    """
+    Creates users, carts and orders over one pooled HTTP session.
+    Args:
+        base_url (str): Application URL (``base_url`` fixture); the API is
+            served from the same origin
+        pool_size (int): Keep-alive connections kept per host
+        timeout (float): Per-request timeout in seconds
+        retries (int): Retries for connection errors and 502/503/504 on
+            idempotent requests
+    """
+
+    def __init__(self, base_url, pool_size=10, timeout=10, retries=2):
+        parts = urlsplit(base_url)
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self.app_url = base_url.split("#", 1)[0]
+        self.api_root = f"{self.origin}/api/ecom"
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        retry = Retry(total=retries, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+
+        self._users = {}
+        self._catalog = None
+
+    def close(self):
+        self.session.close()
+
+    # --- Plumbing ---
+
+    def _request(self, method, path, token=None, payload=None, allow=()):
+        headers = {"Authorization": token} if token else {}
+        response = self.session.request(method, f"{self.api_root}{path}", json=payload,
+                                        headers=headers, timeout=self.timeout)
+        try:
+            body = response.json()
+        except ValueError:
+            body = {"message": response.text[:200]}
+        if not response.ok and response.status_code not in allow:
+            raise SeedError(f"{method} {path} -> {response.status_code}: {body.get('message')}")
+        body["status_code"] = response.status_code
+        return body
+
+    # --- Users ---
+
+    def login(self, email, password):
+        """
+        Log in through the API (cached per email for the session).
+        Returns:
+            SeededUser: Token and user id
+        """
+        cached = self._users.get(email.lower())
+        if cached and cached.password == password:
+            return cached
+        body = self._request("POST", "/auth/login", payload={"userEmail": email, "userPassword": password})
+        user = SeededUser(email, password, body["userId"], body["token"])
+        self._users[email.lower()] = user
+        return user
+
+    def ensure_user(self, email, password, name="Test User"):
+        """
+        Register a user unless the email already exists, then log in.
+        Returns:
+            SeededUser: The logged-in user
+        """
+        first, _, last = name.partition(" ")
+        payload = {
+            "firstName": first, "lastName": last or first, "userName": name,
+            "userEmail": email, "userRole": "customer", "occupation": "Engineer",
+            "gender": "Male", "userMobile": "9999999999",
+            "userPassword": password, "confirmPassword": password, "required": True,
+        }
+        body = self._request("POST", "/auth/register", payload=payload, allow=(400, 409))
+        if body["status_code"] in (400, 409) and "already" not in (body.get("message") or "").lower():
+            raise SeedError(f"Registering {email} failed: {body.get('message')}")
+        return self.login(email, password)
+
+    # --- Catalog and cart ---
+
+    def catalog(self):
+        """Products keyed by title (fetched once per session)."""
+        if self._catalog is None:
+            body = self._request("POST", "/product/get-all-products", payload={})
+            self._catalog = {p["productName"]: p for p in body.get("data", [])}
+        return self._catalog
+
+    def _product(self, title):
+        catalog = self.catalog()
+        for name, product in catalog.items():
+            if name.lower() == title.lower():
+                return product
+        raise SeedError(f"Product '{title}' is not in the catalog")
+
+    def clear_cart(self, user):
+        """Remove every product from the user's cart."""
+        body = self._request("GET", f"/user/get-cart-products/{user.user_id}", token=user.token, allow=(404,))
+        for product in body.get("products", []):
+            self._request("DELETE", f"/user/remove-from-cart/{user.user_id}/{product['_id']}", token=user.token)
+
+    # --- Profile ---
+
+    def reset_profile(self, user, name):
+        """
+        Restore the profile of a freshly registered account: ``name``, empty
+        phone and address, no saved addresses. Servers without the profile
+        routes (404/405) are left alone.
+        Args:
+            user (SeededUser): Account owner
+            name (str): Name the account was registered with
+        Returns:
+            bool: False if the server has no profile API
+        """
+        body = self._request("POST", "/user/update-profile", token=user.token, allow=MISSING_ROUTE,
+                             payload={"name": name, "phone": "", "address": ""})
+        if body["status_code"] in MISSING_ROUTE:
+            return False
+        for _ in range(MAX_ADDRESSES):
+            body = self._request("DELETE", "/user/delete-address/0", token=user.token, allow=MISSING_ROUTE)
+            if body["status_code"] in MISSING_ROUTE:
+                break
+        return True
+
+    def fill_cart(self, user, titles, replace=True):
+        """
+        Put products in the user's cart.
+        Args:
+            user (SeededUser): Cart owner
+            titles (list): Product titles
+            replace (bool): Empty the cart first
+        Returns:
+            list: Product ids added
+        """
+        if replace:
+            self.clear_cart(user)
+        added = []
+        for title in titles:
+            product = self._product(title)
+            self._request("POST", "/user/add-to-cart", token=user.token,
+                          payload={"_id": user.user_id, "product": product})
+            added.append(product["_id"])
+        return added
+
+    # --- Orders ---
+
+    def place_orders(self, user, titles, country="India"):
+        """
+        Place one order per product in a single request.
+        Returns:
+            list: New order ids
+        """
+        orders = [{"country": country, "productOrderedId": self._product(t)["_id"]} for t in titles]
+        body = self._request("POST", "/order/create-order", token=user.token, payload={"orders": orders})
+        return body.get("orders", [])
+
+    # --- Fixtures entry point ---
+
+    def seed(self, user, cart=(), orders=(), country="India", register=False):
+        """
+        Bring the application into a known state in one call.
+        Args:
+            user (dict): ``email``, ``password`` and optional ``name``
+            cart (list): Product titles the cart should contain (replaces it)
+            orders (list): Product titles to place orders for
+            country (str): Shipping country for the orders
+            register (bool): Create the user if it does not exist
+        Returns:
+            SeedResult: Seeded user, cart product ids and order ids
+        """
+        if register:
+            seeded_user = self.ensure_user(user["email"], user["password"], user.get("name", "Test User"))
+        else:
+            seeded_user = self.login(user["email"], user["password"])
+        result = SeedResult(seeded_user)
+        if orders:
+            result.orders = self.place_orders(seeded_user, orders, country)
+        result.cart = self.fill_cart(seeded_user, cart)
+        return result
+
+    def open_session(self, driver, user, route="/dashboard/dash"):
+        """
+        Sign the browser in with a seeded user's token and open ``route``.
+        The driver must already be on the application's origin. The route is
+        opened through the app's router and counts as shown once its page
+        object's ``READY`` landmark is present; the app is reloaded when that
+        does not happen (e.g. it redirects to login) or when no page object
+        owns the route.
+        Args:
+            route (str|type): Hash route, or a page class with ``ROUTE``/``READY``
+        """
+        from selenium.common.exceptions import TimeoutException
+        from pages.base_page import go_to_route
+
+        route, landmark = (route.ROUTE, route.READY) if isinstance(route, type) else (route, _landmark(route))
+        driver.execute_script(
+            "localStorage.setItem('token', arguments[0]); localStorage.setItem('userId', arguments[1]);",
+            user.token, user.user_id)
+        if landmark is not None:
+            try:
+                go_to_route(driver, route, landmark, timeout=ROUTE_TIMEOUT)
+                return
+            except (TimeoutException, ValueError):
+                pass
+        driver.get(f"{self.app_url}#{route}")
+        driver.refresh()
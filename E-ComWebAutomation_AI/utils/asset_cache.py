@@ -0,0 +1,199 @@
+"""Shared warm HTTP asset cache for browser sessions.
+
+By default every session starts with ``--disk-cache-size=0`` and downloads
+the SPA bundle, styles and images again. With ``asset_cache.enabled`` the
+first session of a run loads ``base_url`` once in a dedicated browser whose
+disk cache goes to ``test_logs/.cache/assets/<build>``. That master copy is
+keyed by app build (origin plus a hash of the SPA shell and the assets it
+references), warmed under a file lock so concurrent workers wait for one
+warm-up, and refreshed once per run.
+
+Sessions never write to the master: each one gets a private copy as its
+``--disk-cache-dir``, which is deleted with the session. Whether an asset
+came from the cache is read from the Resource Timing entries of the page
+(``transferSize`` smaller than the body) before the browser quits.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from collections import Counter
+from urllib.parse import urljoin, urlsplit
+
+from utils.locks import FileLock, LOCKS_DIR
+from utils.run_configs import ARTIFACTS_DIR
+
+ASSET_CACHE_DIR = ARTIFACTS_DIR / ".cache" / "assets"
+MARKER = "asset_cache.json"
+WARM_TIMEOUT_SECONDS = 30
+QUIET_SECONDS = 0.5
+
+ASSET_REF = re.compile(r"""<(?:script|link|img)\b[^>]*?\b(?:src|href)\s*=\s*["']([^"']+)["']""", re.I)
+
+# Navigation and resource entries of the current document
+TIMING_SCRIPT = """/* read-only */
+return [document.readyState].concat(
+  performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'))
+    .map(function (e) { return [e.name, e.transferSize, e.encodedBodySize]; }));
+"""
+
+_stats = Counter()
+
+
+def build_key(base_url, timeout=10):
+    """
+    Cache key for the build served at ``base_url``.
+    Args:
+        base_url (str): Application entry URL
+        timeout (float): Seconds to wait for the SPA shell
+    Returns:
+        str: ``<host>_<port>-<hash>``
+    Raises:
+        requests.RequestException: If the shell cannot be fetched
+    """
+    import requests
+
+    response = requests.get(base_url, timeout=timeout)
+    response.raise_for_status()
+    refs = sorted(urljoin(response.url, ref) for ref in ASSET_REF.findall(response.text))
+    digest = hashlib.sha1(response.content)
+    digest.update(json.dumps(refs).encode("utf-8"))
+    origin = urlsplit(response.url)
+    port = origin.port or (443 if origin.scheme == "https" else 80)
+    return f"{origin.hostname}_{port}-{digest.hexdigest()[:12]}"
+
+
+def _read_marker(directory):
+    try:
+        with open(directory / MARKER, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _wait_until_quiet(driver, timeout=WARM_TIMEOUT_SECONDS):
+    """Wait for the document to load and no new resources for ``QUIET_SECONDS``."""
+    deadline = time.monotonic() + timeout
+    last_count, stable_since = -1, time.monotonic()
+    while time.monotonic() < deadline:
+        timings = driver.execute_script(TIMING_SCRIPT)
+        if len(timings) != last_count:
+            last_count, stable_since = len(timings), time.monotonic()
+        elif timings[0] == "complete" and time.monotonic() - stable_since >= QUIET_SECONDS:
+            return len(timings) - 1
+        time.sleep(0.1)
+    return last_count - 1
+
+
+def _prune(keep, max_age_hours):
+    """Remove master copies of other builds not refreshed within ``max_age_hours``."""
+    cutoff = time.time() - max_age_hours * 3600
+    for directory in ASSET_CACHE_DIR.iterdir():
+        if directory == keep or not directory.is_dir():
+            continue
+        marker = _read_marker(directory)
+        if marker is None or marker.get("warmed_at", 0) < cutoff:
+            shutil.rmtree(directory, ignore_errors=True)
+            (LOCKS_DIR / f"assets_{directory.name}.lock").unlink(missing_ok=True)
+
+
+def warm(base_url, run_id, launch, max_age_hours=24):
+    """
+    Master cache directory for the build at ``base_url``, warming it first
+    if this run has not done so yet.
+    Args:
+        base_url (str): Application entry URL
+        run_id (str): Run identifier shared by all workers
+        launch (callable): ``launch(cache_dir)`` returns a WebDriver whose
+            disk cache is ``cache_dir``
+        max_age_hours (float): Age after which other builds' copies are removed
+    Returns:
+        Path: Master cache directory (read-only for sessions)
+    """
+    key = build_key(base_url)
+    master = ASSET_CACHE_DIR / key
+    with FileLock(LOCKS_DIR / f"assets_{key}.lock", timeout=WARM_TIMEOUT_SECONDS * 4):
+        marker = _read_marker(master)
+        if marker and marker.get("run_id") == run_id:
+            return master
+        ASSET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        staging = ASSET_CACHE_DIR / f"{key}.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        driver = launch(staging)
+        try:
+            driver.get(base_url)
+            resources = _wait_until_quiet(driver)
+        finally:
+            driver.quit()  # flushes the cache index to disk
+        with open(staging / MARKER, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "base_url": base_url, "run_id": run_id,
+                       "warmed_at": time.time(), "resources": resources}, f, indent=2)
+        retired = ASSET_CACHE_DIR / f"{key}.{os.getpid()}.old"
+        if master.exists():
+            os.replace(master, retired)
+        os.replace(staging, master)
+        shutil.rmtree(retired, ignore_errors=True)
+        _prune(master, max_age_hours)
+    return master
+
+
+def session_copy(master):
+    """
+    Private, writable copy of the master cache for one browser session.
+    Args:
+        master (Path): Directory returned by :func:`warm`
+    Returns:
+        str: Copy to pass as ``--disk-cache-dir`` (None if copying failed;
+        the session then runs without the cache)
+    """
+    root = tempfile.mkdtemp(prefix="asset-cache-")
+    try:
+        return shutil.copytree(master, os.path.join(root, "cache"), ignore=shutil.ignore_patterns(MARKER))
+    except (OSError, shutil.Error):
+        shutil.rmtree(root, ignore_errors=True)
+        return None
+
+
+def discard(copy):
+    """Delete a directory returned by :func:`session_copy`."""
+    if copy:
+        shutil.rmtree(os.path.dirname(copy), ignore_errors=True)
+
+
+def record(driver):
+    """
+    Count cache hits of the current document's requests. Call before quitting.
+    Entries with an unknown body size (cross-origin without
+    ``Timing-Allow-Origin``) are counted as opaque.
+    """
+    try:
+        timings = driver.execute_script(TIMING_SCRIPT)[1:]
+    except Exception:
+        return  # browser already gone
+    for _name, transferred, body in timings:
+        _stats["requests"] += 1
+        if not body:
+            _stats["opaque"] += 1
+        elif transferred < body:
+            _stats["hits"] += 1
+            _stats["bytes_saved"] += body - transferred
+        else:
+            _stats["misses"] += 1
+            _stats["bytes_transferred"] += transferred
+
+
+def asset_stats():
+    """
+    Asset cache counters of this process.
+    Returns:
+        dict: requests, hits, misses, opaque, hit_ratio, bytes_saved, bytes_transferred
+    """
+    stats = {name: _stats[name] for name in
+             ("requests", "hits", "misses", "opaque", "bytes_saved", "bytes_transferred")}
+    measured = stats["hits"] + stats["misses"]
+    stats["hit_ratio"] = round(stats["hits"] / measured, 3) if measured else 0.0
+    return stats
@@ -0,0 +1,118 @@
+"""Shared helpers for framework benchmarks: percentiles and baselines."""
+import json
+import math
+import platform
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from utils.run_configs import ARTIFACTS_DIR
+
+# Baselines are machine specific, so they live with the run artifacts
+BASELINES_DIR = ARTIFACTS_DIR / "baselines"
+
+
+def percentile(samples, pct):
+    """
+    Linear-interpolated percentile of a list of numbers.
+    Args:
+        samples (list): Measured values
+        pct (float): Percentile in the range 0-100
+    Returns:
+        float: Percentile value (0.0 for an empty list)
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low, high = math.floor(rank), math.ceil(rank)
+    if low == high:
+        return ordered[int(rank)]
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples):
+    """
+    Summarize a list of timings.
+    Returns:
+        dict: count, min, p50, p90, p99 and max
+    """
+    return {
+        "count": len(samples),
+        "min": min(samples) if samples else 0.0,
+        "p50": percentile(samples, 50),
+        "p90": percentile(samples, 90),
+        "p99": percentile(samples, 99),
+        "max": max(samples) if samples else 0.0,
+    }
+
+
+def baseline_path(name):
+    """Path of the stored baseline for a benchmark."""
+    return BASELINES_DIR / f"{name}.json"
+
+
+def load_baseline(name):
+    """
+    Load a stored baseline.
+    Returns:
+        dict: Baseline results keyed by case name, or None if missing
+    """
+    path = baseline_path(name)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(name, results):
+    """
+    Store benchmark results as the new baseline.
+    Args:
+        name (str): Benchmark name
+        results (dict): Summaries keyed by case name
+    Returns:
+        Path: Written baseline file
+    """
+    path = baseline_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "machine": platform.node(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+    return path
+
+
+def append_history(name, results):
+    """Append one run's results to the benchmark history (JSON lines)."""
+    path = BASELINES_DIR / f"{name}_history.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {"created": datetime.now().isoformat(timespec="seconds"), "results": results}
+    with open(path, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def compare_to_baseline(results, baseline, tolerance, metric="p50"):
+    """
+    Find cases that got slower than the baseline.
+    Args:
+        results (dict): Current summaries keyed by case name
+        baseline (dict): Baseline summaries keyed by case name
+        tolerance (float): Allowed relative slowdown, e.g. 0.2 for 20%
+        metric (str): Summary field to compare
+    Returns:
+        list: (case, baseline_value, current_value, ratio) for each regression
+    """
+    regressions = []
+    for case, summary in results.items():
+        reference = (baseline or {}).get(case)
+        if not reference or not reference.get(metric):
+            continue
+        ratio = summary[metric] / reference[metric]
+        if ratio > 1 + tolerance:
+            regressions.append((case, reference[metric], summary[metric], ratio))
+    return regressions
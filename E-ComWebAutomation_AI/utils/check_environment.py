@@ -1,10 +1,24 @@
 """Environment check and setup script for test framework."""
 import sys
 import os
+import glob
+import json
+import hashlib
 import subprocess
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from utils.run_configs import ARTIFACTS_DIR
+
+BASE_DIR = Path(__file__).parent.parent
+
+# Fingerprint of the last environment that passed every check
+PREFLIGHT_CACHE = ARTIFACTS_DIR / ".cache" / "preflight.json"
+
+# Files whose content invalidates the cached preflight result
+FINGERPRINT_FILES = ["requirements.txt", "pytest.ini", "conftest.py", "config/*.json"]
+
 def check_python_version():
     """Check if Python version meets requirements."""
     required_version = (3, 8)
@@ -105,22 +119,133 @@ def check_environment_variables():
         else:
             print(f"✓ Environment variable {var} is set")
 
-def main():
-    """Run all environment checks."""
+def _run_version_command(cmd):
+    """Return the stripped output of a ``--version`` style command, or None."""
     try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    output = (result.stdout or result.stderr).strip()
+    return output or None
+
+
+def get_chrome_version():
+    """Best-effort detection of the installed Chrome version string."""
+    if platform.system() == "Windows":
+        output = _run_version_command(
+            ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"]
+        )
+        return output.split()[-1] if output else None
+    candidates = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+                  "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+    for binary in candidates:
+        output = _run_version_command([binary, "--version"])
+        if output:
+            return output
+    return None
+
+
+def get_chromedriver_version():
+    """Best-effort detection of the ChromeDriver version string."""
+    local_driver = BASE_DIR / "chromedriver.exe"
+    binary = str(local_driver) if local_driver.exists() else "chromedriver"
+    return _run_version_command([binary, "--version"])
+
+
+def _hash_files(patterns):
+    """Map each file matching ``patterns`` (relative to BASE_DIR) to its SHA-256."""
+    hashes = {}
+    for pattern in patterns:
+        for path in sorted(glob.glob(str(BASE_DIR / pattern))):
+            with open(path, "rb") as f:
+                hashes[os.path.relpath(path, BASE_DIR)] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+
+def compute_fingerprint():
+    """
+    Describe the environment the checks depend on.
+    Returns:
+        dict: Python, platform, Chrome/driver versions and file hashes
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        chrome = pool.submit(get_chrome_version)
+        driver = pool.submit(get_chromedriver_version)
+        fingerprint = {
+            "python": sys.version,
+            "executable": sys.executable,
+            "platform": platform.platform(),
+            "files": _hash_files(FINGERPRINT_FILES),
+            "chrome": chrome.result(),
+            "chromedriver": driver.result(),
+        }
+    fingerprint["digest"] = hashlib.sha256(
+        json.dumps(fingerprint, sort_keys=True).encode()
+    ).hexdigest()[:16]
+    return fingerprint
+
+
+def load_cached_fingerprint():
+    """Return the fingerprint of the last successful preflight, if any."""
+    try:
+        with open(PREFLIGHT_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_fingerprint(fingerprint):
+    """Record ``fingerprint`` as the last successful preflight."""
+    PREFLIGHT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    with open(PREFLIGHT_CACHE, "w") as f:
+        json.dump(fingerprint, f, indent=2)
+
+
+def clear_cached_fingerprint():
+    """Forget the last successful preflight."""
+    try:
+        PREFLIGHT_CACHE.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def main(use_cache=True):
+    """
+    Run all environment checks.
+    Args:
+        use_cache (bool): Skip the checks when the environment fingerprint
+            matches the last successful run
+    Returns:
+        bool: True if the environment is ready
+    """
+    try:
+        fingerprint = compute_fingerprint()
+        cached = load_cached_fingerprint() if use_cache else None
+        if cached and cached.get("digest") == fingerprint["digest"]:
+            print(f"\n✓ Environment unchanged since last successful check "
+                  f"(fingerprint {fingerprint['digest']}) - skipping checks")
+            check_environment_variables()
+            return True
+
         print("\n=== Running Environment Checks ===\n")
         
         print("1. Checking Python version...")
         check_python_version()
         print("✓ Python version OK\n")
         
-        print("2. Checking dependencies...")
-        check_dependencies()
-        print("✓ All dependencies installed\n")
-        
-        print("3. Checking WebDriver...")
-        check_webdriver()
-        print("✓ WebDriver setup OK\n")
+        # The slow checks (pip freeze, launching Chrome) are independent,
+        # so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            dependencies = pool.submit(check_dependencies)
+            webdriver = pool.submit(check_webdriver)
+
+            print("2. Checking dependencies...")
+            dependencies.result()
+            print("✓ All dependencies installed\n")
+
+            print("3. Checking WebDriver...")
+            webdriver.result()
+            print("✓ WebDriver setup OK\n")
         
         print("4. Checking directories...")
         check_directories()
@@ -134,8 +259,9 @@ def main():
         check_environment_variables()
         print("")
         
+        save_fingerprint(fingerprint)
         print("\n=== Environment Check Complete ===")
-        print("✓ All checks passed - ready to run tests")
+        print(f"✓ All checks passed - ready to run tests (fingerprint {fingerprint['digest']})")
         print("\nTo run tests:")
         print("1. Basic run:           pytest -v")
         print("2. Parallel run:        pytest -v -n auto")
@@ -144,8 +270,9 @@ def main():
         return True
         
     except Exception as e:
+        clear_cached_fingerprint()
         print(f"\n❌ Environment check failed: {str(e)}")
         return False
 
 if __name__ == "__main__":
-    sys.exit(0 if main() else 1)
\ No newline at end of file
+    sys.exit(0 if main(use_cache="--force" not in sys.argv[1:]) else 1)
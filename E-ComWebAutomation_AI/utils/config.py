@@ -1,87 +1,278 @@
-"""Configuration management for test framework."""
+"""Configuration management for test framework.
+
+Configuration is layered as defaults < ``config/<env>_config.json`` <
+environment variables. Layers are deep-merged, so an environment file only
+needs to list the keys it changes. The result is frozen and built once per
+process; under xdist the controller builds it and ships the snapshot to the
+workers (see ``pytest_configure_node`` in ``conftest.py``).
+"""
 import os
 import json
 from pathlib import Path
+from types import MappingProxyType
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+# Base config
+DEFAULT_CONFIG = {
+    'browser': {
+        'headless': True,
+        'viewport_width': 1920,
+        'viewport_height': 1080,
+        'timeout': 10,
+        'element_cache': True
+    },
+    'test': {
+        'parallel': True,
+        'max_workers': 'auto',
+        'rerun_failures': True,
+        'max_reruns': 2
+    },
+    'reporting': {
+        'screenshots_on_failure': True,
+        'video_recording': False,
+        'excel_report': True,
+        'html_report': True
+    },
+    'logging': {
+        'console_level': 'INFO',
+        'file_level': 'DEBUG',
+        'capture_stdout': True
+    },
+    'stub': {
+        'enabled': False,
+        'latency_ms': 0,
+        'jitter_ms': 0
+    },
+    'llm': {
+        'endpoint': '',
+        'model': 'gpt-4o-mini',
+        'temperature': 0.0,
+        'max_tokens': 1500,
+        'cache_max_entries': 500,
+        'cache_max_mb': 50
+    },
+    'health': {
+        'enabled': True,
+        'threshold': 2,
+        'on_broken': 'skip'
+    },
+    'webdriver': {
+        'tuned_transport': True,
+        'pool_size': 4,
+        'connect_timeout': 5,
+        'read_timeout': 120,
+        'retries': 2,
+        'backoff_ms': 50
+    },
+    'asset_cache': {
+        'enabled': False,
+        'max_age_hours': 24
+    },
+    'web_perf': {
+        'enabled': True,
+        'metric': 'p90',
+        'tolerance_pct': 25,
+        'min_samples': 5,
+        'fail_on_regression': False
+    },
+    'visual': {
+        'enabled': True,
+        'max_size': 256,
+        'block_size': 8,
+        'tolerance': 12,
+        'phash_distance': 6,
+        'workers': 2,
+        'fail_on_mismatch': False
+    },
+    'features': {}
+}
+
+# Environment variable -> (section, key)
+ENV_MAPPING = {
+    'TEST_HEADLESS': ('browser', 'headless'),
+    'TEST_VIEWPORT_WIDTH': ('browser', 'viewport_width'),
+    'TEST_VIEWPORT_HEIGHT': ('browser', 'viewport_height'),
+    'TEST_TIMEOUT': ('browser', 'timeout'),
+    'TEST_ELEMENT_CACHE': ('browser', 'element_cache'),
+    'TEST_PARALLEL': ('test', 'parallel'),
+    'TEST_MAX_WORKERS': ('test', 'max_workers'),
+    'TEST_RERUN_FAILURES': ('test', 'rerun_failures'),
+    'TEST_MAX_RERUNS': ('test', 'max_reruns'),
+    'TEST_SCREENSHOTS_ON_FAILURE': ('reporting', 'screenshots_on_failure'),
+    'TEST_VIDEO_RECORDING': ('reporting', 'video_recording'),
+    'TEST_EXCEL_REPORT': ('reporting', 'excel_report'),
+    'TEST_HTML_REPORT': ('reporting', 'html_report'),
+    'TEST_CONSOLE_LOG_LEVEL': ('logging', 'console_level'),
+    'TEST_FILE_LOG_LEVEL': ('logging', 'file_level'),
+    'TEST_CAPTURE_STDOUT': ('logging', 'capture_stdout'),
+    'TEST_STUB_SERVER': ('stub', 'enabled'),
+    'TEST_STUB_LATENCY_MS': ('stub', 'latency_ms'),
+    'TEST_STUB_JITTER_MS': ('stub', 'jitter_ms'),
+    'TEST_LLM_ENDPOINT': ('llm', 'endpoint'),
+    'TEST_LLM_MODEL': ('llm', 'model'),
+    'TEST_LLM_CACHE_MAX_ENTRIES': ('llm', 'cache_max_entries'),
+    'TEST_HEALTH_GATING': ('health', 'enabled'),
+    'TEST_HEALTH_THRESHOLD': ('health', 'threshold'),
+    'TEST_HEALTH_ON_BROKEN': ('health', 'on_broken'),
+    'TEST_WEBDRIVER_TUNED_TRANSPORT': ('webdriver', 'tuned_transport'),
+    'TEST_WEBDRIVER_POOL_SIZE': ('webdriver', 'pool_size'),
+    'TEST_WEBDRIVER_CONNECT_TIMEOUT': ('webdriver', 'connect_timeout'),
+    'TEST_WEBDRIVER_READ_TIMEOUT': ('webdriver', 'read_timeout'),
+    'TEST_WEBDRIVER_RETRIES': ('webdriver', 'retries'),
+    'TEST_WEBDRIVER_BACKOFF_MS': ('webdriver', 'backoff_ms'),
+    'TEST_ASSET_CACHE': ('asset_cache', 'enabled'),
+    'TEST_ASSET_CACHE_MAX_AGE_HOURS': ('asset_cache', 'max_age_hours'),
+    'TEST_WEB_PERF': ('web_perf', 'enabled'),
+    'TEST_WEB_PERF_METRIC': ('web_perf', 'metric'),
+    'TEST_WEB_PERF_TOLERANCE_PCT': ('web_perf', 'tolerance_pct'),
+    'TEST_WEB_PERF_MIN_SAMPLES': ('web_perf', 'min_samples'),
+    'TEST_WEB_PERF_FAIL_ON_REGRESSION': ('web_perf', 'fail_on_regression'),
+    'TEST_VISUAL': ('visual', 'enabled'),
+    'TEST_VISUAL_TOLERANCE': ('visual', 'tolerance'),
+    'TEST_VISUAL_PHASH_DISTANCE': ('visual', 'phash_distance'),
+    'TEST_VISUAL_WORKERS': ('visual', 'workers'),
+    'TEST_VISUAL_FAIL_ON_MISMATCH': ('visual', 'fail_on_mismatch')
+}
+
+# TEST_FEATURE_<NAME>=true|false toggles features.<name>
+FEATURE_ENV_PREFIX = 'TEST_FEATURE_'
+
+_TRUE_VALUES = {'true', '1', 'yes', 'on'}
+_FALSE_VALUES = {'false', '0', 'no', 'off'}
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration layer contains an invalid value."""
+
+
+def deep_merge(base, override):
+    """
+    Recursively merge ``override`` into a copy of ``base``.
+    Args:
+        base (dict): Lower-priority layer
+        override (dict): Higher-priority layer
+    Returns:
+        dict: New merged dictionary (inputs are not modified)
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def freeze(value):
+    """Return a read-only view of a nested dict/list structure."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """Inverse of :func:`freeze`, used for JSON serialization."""
+    if isinstance(value, MappingProxyType) or isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _parse_bool(env_var, raw):
+    value = raw.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise ConfigError(f"{env_var}={raw!r} is not a boolean (use true/false)")
+
+
+def _coerce_env_value(env_var, raw, current):
+    """Convert an environment string to the type of the value it overrides."""
+    if isinstance(current, bool):
+        return _parse_bool(env_var, raw)
+    if isinstance(current, int) or env_var == 'TEST_MAX_WORKERS':
+        if env_var == 'TEST_MAX_WORKERS' and raw.strip().lower() == 'auto':
+            return 'auto'
+        try:
+            value = int(raw)
+        except ValueError:
+            raise ConfigError(f"{env_var}={raw!r} is not an integer") from None
+        if value < 0:
+            raise ConfigError(f"{env_var}={raw!r} must not be negative")
+        return value
+    return raw
+
 
 class TestConfig:
     """Test framework configuration handler."""
-    
-    def __init__(self):
-        self._config = {}
-        self._load_config()
-    
+
+    def __init__(self, data=None):
+        """
+        Args:
+            data (dict, optional): Already-resolved configuration, e.g. a
+                snapshot received from the xdist controller. When omitted
+                the layers are loaded from disk and the environment.
+        """
+        if data is None:
+            data = self._load_config()
+        self._config = freeze(data)
+        # Flat lookup table so get(section, key) is a single dict access
+        self._lookup = {
+            (section, key): value
+            for section, values in self._config.items()
+            if isinstance(values, MappingProxyType)
+            for key, value in values.items()
+        }
+
     def _load_config(self):
         """Load configuration from config files and environment."""
-        # Base config
-        base_config = {
-            'browser': {
-                'headless': True,
-                'viewport_width': 1920,
-                'viewport_height': 1080,
-                'timeout': 10
-            },
-            'test': {
-                'parallel': True,
-                'max_workers': 'auto',
-                'rerun_failures': True,
-                'max_reruns': 2
-            },
-            'reporting': {
-                'screenshots_on_failure': True,
-                'video_recording': False,
-                'excel_report': True,
-                'html_report': True
-            },
-            'logging': {
-                'console_level': 'INFO',
-                'file_level': 'DEBUG',
-                'capture_stdout': True
-            }
-        }
-        
+        config = DEFAULT_CONFIG
+
         # Load environment-specific config
         env = os.getenv('TEST_ENV', 'qa').lower()
-        env_config_path = Path(__file__).parent.parent / f"config/{env}_config.json"
-        
+        env_config_path = CONFIG_DIR / f"{env}_config.json"
+
         if env_config_path.exists():
             with open(env_config_path) as f:
-                env_config = json.load(f)
-                base_config.update(env_config)
-        
+                config = deep_merge(config, json.load(f))
+
         # Override with environment variables
-        self._update_from_env(base_config)
-        self._config = base_config
-    
-    def _update_from_env(self, config):
-        """Update config with environment variables."""
-        env_mapping = {
-            'TEST_HEADLESS': ('browser', 'headless'),
-            'TEST_VIEWPORT_WIDTH': ('browser', 'viewport_width'),
-            'TEST_VIEWPORT_HEIGHT': ('browser', 'viewport_height'),
-            'TEST_TIMEOUT': ('browser', 'timeout'),
-            'TEST_PARALLEL': ('test', 'parallel'),
-            'TEST_MAX_WORKERS': ('test', 'max_workers'),
-            'TEST_RERUN_FAILURES': ('test', 'rerun_failures'),
-            'TEST_MAX_RERUNS': ('test', 'max_reruns'),
-            'TEST_SCREENSHOTS_ON_FAILURE': ('reporting', 'screenshots_on_failure'),
-            'TEST_VIDEO_RECORDING': ('reporting', 'video_recording'),
-            'TEST_EXCEL_REPORT': ('reporting', 'excel_report'),
-            'TEST_HTML_REPORT': ('reporting', 'html_report'),
-            'TEST_CONSOLE_LOG_LEVEL': ('logging', 'console_level'),
-            'TEST_FILE_LOG_LEVEL': ('logging', 'file_level'),
-            'TEST_CAPTURE_STDOUT': ('logging', 'capture_stdout')
-        }
-        
-        for env_var, (section, key) in env_mapping.items():
+        return deep_merge(config, self._env_overrides(config))
+
+    @staticmethod
+    def _env_overrides(config):
+        """
+        Collect and validate overrides from environment variables.
+        Raises:
+            ConfigError: If a variable cannot be converted to the type of
+                the value it overrides
+        """
+        overrides = {}
+        for env_var, (section, key) in ENV_MAPPING.items():
             if env_var in os.environ:
-                value = os.getenv(env_var)
-                # Convert string to appropriate type
-                if isinstance(config[section][key], bool):
-                    value = value.lower() == 'true'
-                elif isinstance(config[section][key], int):
-                    value = int(value)
-                config[section][key] = value
-    
+                value = _coerce_env_value(env_var, os.environ[env_var], config[section][key])
+                overrides.setdefault(section, {})[key] = value
+
+        for env_var, raw in os.environ.items():
+            if env_var.startswith(FEATURE_ENV_PREFIX):
+                flag = env_var[len(FEATURE_ENV_PREFIX):].lower()
+                overrides.setdefault('features', {})[flag] = _parse_bool(env_var, raw)
+        return overrides
+
+    def to_json(self):
+        """Serialize the resolved configuration (for xdist workers)."""
+        return json.dumps(thaw(self._config), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, payload):
+        """Rebuild a configuration snapshot produced by :meth:`to_json`."""
+        return cls(json.loads(payload))
+
     def get(self, section, key=None):
         """
         Get configuration value.
@@ -92,25 +283,101 @@ class TestConfig:
             Value from configuration
         """
         if key:
-            return self._config[section][key]
+            try:
+                return self._lookup[(section, key)]
+            except KeyError:
+                raise KeyError(f"{section}.{key}") from None
         return self._config[section]
-    
+
+    def is_feature_enabled(self, flag_name):
+        """
+        Check the feature-flag table.
+        Args:
+            flag_name (str): Flag name as listed under ``features``
+        Returns:
+            bool: True if the flag is present and enabled
+        """
+        return bool(self._lookup.get(('features', flag_name.lower()), False))
+
     @property
     def browser(self):
         """Get browser configuration."""
         return self._config['browser']
-    
+
     @property
     def test(self):
         """Get test configuration."""
         return self._config['test']
-    
+
     @property
     def reporting(self):
         """Get reporting configuration."""
         return self._config['reporting']
-    
+
     @property
     def logging(self):
         """Get logging configuration."""
-        return self._config['logging']
\ No newline at end of file
+        return self._config['logging']
+
+    @property
+    def stub(self):
+        """Get local stub application configuration."""
+        return self._config['stub']
+
+    @property
+    def llm(self):
+        """Get LLM test-generation configuration."""
+        return self._config['llm']
+
+    @property
+    def health(self):
+        """Get capability health-gating configuration."""
+        return self._config['health']
+
+    @property
+    def webdriver(self):
+        """Get WebDriver HTTP transport configuration."""
+        return self._config['webdriver']
+
+    @property
+    def asset_cache(self):
+        """Get shared asset cache configuration."""
+        return self._config['asset_cache']
+
+    @property
+    def web_perf(self):
+        """Get front-end performance telemetry configuration."""
+        return self._config['web_perf']
+
+    @property
+    def visual(self):
+        """Get visual checkpoint configuration."""
+        return self._config['visual']
+
+    @property
+    def features(self):
+        """Get feature-flag table."""
+        return self._config['features']
+
+
+# Process-wide snapshot
+_active_config = None
+
+
+def get_config():
+    """
+    Return the process-wide configuration snapshot, building it on first use.
+    Returns:
+        TestConfig: Shared, read-only configuration
+    """
+    global _active_config
+    if _active_config is None:
+        _active_config = TestConfig()
+    return _active_config
+
+
+def set_config(config):
+    """Install ``config`` as the process-wide snapshot."""
+    global _active_config
+    _active_config = config
+    return config
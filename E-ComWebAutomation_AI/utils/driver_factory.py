@@ -0,0 +1,92 @@
+"""Chrome WebDriver construction.
+
+Kept out of ``conftest.py`` so the Selenium and webdriver_manager imports are
+only paid by processes that actually start a browser (not by
+``--collect-only`` or idle xdist workers).
+"""
+import os
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+from utils.config import get_config
+
+# Project root (where setup_chromedriver.py drops chromedriver.exe)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_chrome_options(browser_config, cache_dir=None):
+    """
+    Build Chrome options for a test session.
+    Args:
+        browser_config (Mapping): ``browser`` section of the test config
+        cache_dir (str): Disk cache directory (utils.asset_cache); caching is off without one
+    Returns:
+        Options: Configured Chrome options
+    """
+    chrome_options = Options()
+    chrome_options.page_load_strategy = 'none'  # Don't wait for full page load
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--ignore-certificate-errors')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-software-rasterizer')
+    if cache_dir:
+        chrome_options.add_argument(f'--disk-cache-dir={cache_dir}')
+    else:
+        chrome_options.add_argument('--disk-cache-size=0')  # Disable disk cache
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])  # Reduce logging
+
+    # Apply browser config
+    if browser_config['headless']:
+        chrome_options.add_argument('--headless=new')  # new headless mode
+
+    # Set viewport size
+    chrome_options.add_argument(f"--window-size={browser_config['viewport_width']},{browser_config['viewport_height']}")
+    return chrome_options
+
+
+def resolve_driver_path():
+    """
+    Locate ChromeDriver, preferring a local chromedriver.exe.
+    Returns:
+        str: Path to the ChromeDriver executable
+    Raises:
+        Exception: If webdriver_manager fails to install a driver
+    """
+    driver_path = os.path.join(PROJECT_DIR, "chromedriver.exe")
+    if not os.path.exists(driver_path):
+        driver_path = ChromeDriverManager().install()
+    return driver_path
+
+
+def create_driver(browser_config, driver_path, transport_config=None, cache_dir=None):
+    """
+    Start a Chrome session.
+    Args:
+        browser_config (Mapping): ``browser`` section of the test config
+        driver_path (str): Path returned by :func:`resolve_driver_path`
+        transport_config (Mapping): ``webdriver`` section; defaults to the active config
+        cache_dir (str): Disk cache directory for the session (utils.asset_cache)
+    Returns:
+        WebDriver: Running Chrome instance
+    """
+    transport_config = transport_config or get_config().webdriver
+    service = ChromeService(driver_path)
+    options = build_chrome_options(browser_config, cache_dir)
+    if transport_config['tuned_transport']:
+        from utils.transport import TunedChrome
+
+        driver = TunedChrome(transport_config, service=service, options=options)
+    else:
+        driver = webdriver.Chrome(service=service, options=options)
+    driver.implicitly_wait(browser_config['timeout'])
+    if get_config().web_perf['enabled']:
+        from utils.web_perf import install
+        install(driver)
+
+    if not browser_config['headless']:
+        driver.maximize_window()
+    return driver
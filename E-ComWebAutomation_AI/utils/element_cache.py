@@ -0,0 +1,194 @@
+"""Element handle cache for page objects.
+
+``BasePage`` keeps the WebElement it resolved for each locator and reuses it
+while the page is provably unchanged. Validity is a token read from the
+browser: the URL, the document's ``performance.timeOrigin`` (new on every
+navigation) and a DOM generation counted by a ``MutationObserver`` for
+added/removed nodes. The token is re-read only after a command that can
+change the page (click, typing, navigation, scripts) or after
+``MAX_AGE_SECONDS``; lookups in between cost no round trip at all.
+
+Cached handles re-locate themselves when the browser reports them stale, so
+a DOM change the token has not seen yet costs one retry instead of a
+failure. Hits, misses and stale recoveries are counted per page class
+(``cache_stats()``).
+"""
+import time
+from collections import Counter
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+MAX_AGE_SECONDS = 2.0
+
+# Commands that cannot change the page
+READ_ONLY_COMMANDS = frozenset({
+    Command.FIND_ELEMENT, Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS,
+    Command.GET_CURRENT_URL, Command.GET_TITLE, Command.GET_PAGE_SOURCE,
+    Command.GET_ELEMENT_TEXT, Command.GET_ELEMENT_TAG_NAME, Command.GET_ELEMENT_RECT,
+    Command.GET_ELEMENT_ATTRIBUTE, Command.GET_ELEMENT_PROPERTY, Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+    Command.GET_ELEMENT_ARIA_ROLE, Command.GET_ELEMENT_ARIA_LABEL,
+    Command.IS_ELEMENT_SELECTED, Command.IS_ELEMENT_ENABLED,
+    Command.SCREENSHOT, Command.ELEMENT_SCREENSHOT, Command.GET_LOG,
+    Command.W3C_GET_CURRENT_WINDOW_HANDLE, Command.W3C_GET_WINDOW_HANDLES, Command.GET_WINDOW_RECT,
+    Command.GET_TIMEOUTS, Command.GET_ALL_COOKIES, Command.GET_COOKIE,
+})
+# Scripts known not to modify the page: Selenium's isDisplayed/getAttribute
+# atoms and framework scripts marked "/* read-only */"
+READ_ONLY_SCRIPT_PREFIXES = ("/* isDisplayed */", "/* getAttribute */", "/* read-only */")
+
+GENERATION_SCRIPT = """/* read-only */
+var w = window;
+if (!w.__domGeneration) {
+  w.__domGeneration = {count: 0};
+  new MutationObserver(function () { w.__domGeneration.count++; })
+    .observe(document.documentElement || document, {childList: true, subtree: true});
+}
+return [location.href, performance.timeOrigin, w.__domGeneration.count];
+"""
+
+_stats = Counter()
+
+
+def is_read_only(command, params):
+    """
+    Whether a WebDriver command certainly leaves the page unchanged.
+    Args:
+        command (str): Selenium ``Command`` name
+        params (dict): Command parameters
+    Returns:
+        bool: True for reads and scripts marked read-only
+    """
+    if command in READ_ONLY_COMMANDS:
+        return True
+    if command == Command.W3C_EXECUTE_SCRIPT and params:
+        return str(params.get("script", "")).lstrip().startswith(READ_ONLY_SCRIPT_PREFIXES)
+    return False
+
+
+class DomState:
+    """
+    Per-driver page-change tracker. Counts commands that may change the
+    page by wrapping ``driver.execute``; created once per driver (``of``).
+    Args:
+        driver (WebDriver): Browser session
+        max_age (float): Seconds a token is trusted without re-reading it
+    """
+
+    def __init__(self, driver, max_age=MAX_AGE_SECONDS):
+        self.driver = driver
+        self.max_age = max_age
+        self.changes = 0
+        self.token = None
+        self._seen = -1
+        self._read_at = 0.0
+        execute = driver.execute
+
+        def tracked_execute(command, params=None):
+            if not is_read_only(command, params):
+                self.changes += 1
+            return execute(command, params)
+
+        driver.execute = tracked_execute
+
+    @classmethod
+    def of(cls, driver):
+        state = getattr(driver, "_dom_state", None)
+        if state is None:
+            state = driver._dom_state = cls(driver)
+        return state
+
+    def current(self):
+        """
+        Token for the current document and DOM generation.
+        Returns:
+            tuple: (url, time origin, generation)
+        """
+        now = time.monotonic()
+        if self.token is None or self.changes != self._seen or now - self._read_at > self.max_age:
+            self.token = tuple(self.driver.execute_script(GENERATION_SCRIPT))
+            self._seen = self.changes
+            self._read_at = now
+        return self.token
+
+
+class CachedElement(WebElement):
+    """
+    WebElement that finds itself again once when the browser reports it
+    stale, then repeats the command.
+    Args:
+        element (WebElement): Resolved element
+        relocate (callable): Returns a fresh element for the same locator
+        owner (str): Page class name, for statistics
+    """
+
+    def __init__(self, element, relocate, owner):
+        super().__init__(element.parent, element.id)
+        self._relocate = relocate
+        self._owner = owner
+
+    def _retry(self, call):
+        try:
+            return call()
+        except StaleElementReferenceException:
+            _stats[(self._owner, "stale")] += 1
+            self._id = self._relocate().id
+            return call()
+
+    def _execute(self, command, params=None):
+        return self._retry(lambda: super(CachedElement, self)._execute(command, dict(params or {})))
+
+    # These two run as scripts with the element as an argument, not via _execute
+    def is_displayed(self):
+        return self._retry(super().is_displayed)
+
+    def get_attribute(self, name):
+        return self._retry(lambda: super(CachedElement, self).get_attribute(name))
+
+
+class ElementCache:
+    """
+    Resolved elements of one page object, keyed by locator.
+    Args:
+        driver (WebDriver): Browser session shared with other page objects
+        owner (str): Page class name, for statistics
+    """
+
+    def __init__(self, driver, owner):
+        self.dom = DomState.of(driver)
+        self.owner = owner
+        self._entries = {}
+
+    def get(self, locator, find):
+        """
+        Cached element for ``locator`` if the page has not changed, else
+        ``find(locator)`` wrapped and stored.
+        """
+        token = self.dom.current()
+        entry = self._entries.get(locator)
+        if entry is not None and entry[0] == token:
+            _stats[(self.owner, "hits")] += 1
+            return entry[1]
+        _stats[(self.owner, "misses")] += 1
+        element = CachedElement(find(locator), lambda: find(locator), self.owner)
+        self._entries[locator] = (token, element)
+        return element
+
+    def clear(self):
+        self._entries.clear()
+
+
+def cache_stats():
+    """
+    Hits, misses, stale recoveries and hit rate per page class.
+    Returns:
+        dict: page class -> counts
+    """
+    pages = {}
+    for (owner, event), count in _stats.items():
+        pages.setdefault(owner, {"hits": 0, "misses": 0, "stale": 0})[event] = count
+    for counts in pages.values():
+        lookups = counts["hits"] + counts["misses"]
+        counts["hit_rate"] = round(counts["hits"] / lookups, 3) if lookups else 0.0
+    return pages
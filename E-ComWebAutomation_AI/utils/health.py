@@ -0,0 +1,265 @@
+"""Run-wide capability health: stop running tests that are bound to fail.
+
+Fixtures and tests declare the application capabilities they exercise
+(``login``, ``add_to_cart``, ``checkout``). Failures are counted per
+capability in one state file shared by every xdist worker. Once a capability
+has failed ``health.threshold`` times in a row, it is down for the rest of
+the run: every test that needs it, or a capability it depends on, is skipped
+(or failed, with ``health.on_broken = "fail"``) before its fixtures start a
+browser. The message points at the first failure of the streak.
+
+Declaring capabilities:
+
+    @pytest.fixture
+    @establishes("login")                # fixture failures count against login
+    def dashboard_page(driver_for_test): ...
+
+    @pytest.mark.capability("login")     # test failures count against login
+    @pytest.mark.requires("checkout")    # only gated, failures not counted
+"""
+import json
+import os
+import time
+
+import pytest
+
+from utils.config import ConfigError
+from utils.locks import FileLock, LOCKS_DIR
+from utils.run_configs import ARTIFACTS_DIR
+
+HEALTH_DIR = ARTIFACTS_DIR / ".cache" / "health"
+# capability -> capabilities it cannot work without
+DEPENDENCIES = {
+    "login": (),
+    "add_to_cart": ("login",),
+    "checkout": ("add_to_cart",),
+}
+POLICIES = ("skip", "fail")
+
+
+def establishes(*names):
+    """
+    Declare the capabilities a fixture establishes. Place it below
+    ``@pytest.fixture``. Tests using the fixture are gated on them, and
+    errors raised while the fixture is set up count as their failures.
+    """
+    def decorate(func):
+        func._capabilities = tuple(func.__dict__.get("_capabilities", ())) + names
+        return func
+    return decorate
+
+
+def prerequisites(name):
+    """``name`` followed by everything it depends on, transitively."""
+    order, pending = [], [name]
+    while pending:
+        current = pending.pop(0)
+        if current not in order:
+            order.append(current)
+            pending.extend(DEPENDENCIES.get(current, ()))
+    return order
+
+
+def _describe(excinfo):
+    """One line for an exception: type and first message line."""
+    message = str(excinfo.value).strip().splitlines()
+    text = f"{excinfo.typename}: {message[0]}" if message else excinfo.typename
+    return text[:200]
+
+
+class HealthGraph:
+    """
+    Capability state of one test run, shared between processes.
+    The state file is replaced atomically, so reads need no lock; updates
+    are read-modify-write under a file lock.
+    Args:
+        run_id (str): Run identifier shared by all workers
+        threshold (int): Consecutive failures that take a capability down
+        root (Path): Directory for state files
+    """
+
+    def __init__(self, run_id, threshold=2, root=HEALTH_DIR):
+        self.path = root / f"{run_id}.json"
+        self.threshold = max(1, threshold)
+        self.lock = FileLock(LOCKS_DIR / f"health_{run_id}.lock", timeout=60)
+        self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self._state = {}
+        self._stamp = None
+
+    def state(self):
+        """Current state, re-read only when the file changed."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return {}
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._state = json.load(f)
+            except (OSError, ValueError):
+                return self._state
+            self._stamp = stamp
+        return self._state
+
+    def _update(self, change):
+        with self.lock:
+            self._stamp = None
+            state = json.loads(json.dumps(self.state()))  # private copy
+            change(state)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp, self.path)
+
+    def record(self, name, ok, nodeid, detail=""):
+        """
+        Count one pass or failure of capability ``name``. A pass resets the
+        failure streak unless the capability is already down.
+        """
+        def change(state):
+            entry = state.setdefault(name, {"passes": 0, "failures": 0, "streak": [],
+                                            "down": None, "short_circuited": 0})
+            if entry["down"]:
+                return
+            if ok:
+                entry["passes"] += 1
+                entry["streak"] = []
+                return
+            entry["failures"] += 1
+            entry["streak"].append({"nodeid": nodeid, "worker": self.worker,
+                                    "detail": detail, "at": time.time()})
+            if len(entry["streak"]) >= self.threshold:
+                entry["down"] = entry["streak"][0]
+
+        self._update(change)
+
+    def broken(self, names):
+        """
+        First capability among ``names`` and their prerequisites that is down.
+        Returns:
+            tuple: (name, root failure dict), or None if all are healthy
+        """
+        state = self.state()
+        if not state:
+            return None
+        for name in names:
+            for needed in prerequisites(name):
+                down = state.get(needed, {}).get("down")
+                if down:
+                    return needed, down
+        return None
+
+    def short_circuited(self, name):
+        def change(state):
+            state[name]["short_circuited"] = state[name].get("short_circuited", 0) + 1
+
+        self._update(change)
+
+    def remove(self):
+        self.path.unlink(missing_ok=True)
+        self.lock.path.unlink(missing_ok=True)
+
+
+class HealthMonitor:
+    """
+    pytest plugin gating tests on capability health (see module docstring).
+    Args:
+        config: pytest config; ``_run_timestamp`` identifies the run
+        settings (Mapping): The ``health`` configuration section
+    """
+
+    def __init__(self, config, settings):
+        if settings["on_broken"] not in POLICIES:
+            raise ConfigError(f"health.on_broken must be one of {', '.join(POLICIES)}, "
+                              f"not {settings['on_broken']!r}")
+        self.config = config
+        self.policy = settings["on_broken"]
+        self.graph = HealthGraph(config._run_timestamp, settings["threshold"])
+        self._fixture_caps = {}
+
+    def _fixture_capabilities(self, fixturedef):
+        caps = self._fixture_caps.get(fixturedef)
+        if caps is None:
+            func = getattr(fixturedef.func, "__func__", fixturedef.func)
+            caps = self._fixture_caps[fixturedef] = tuple(getattr(func, "_capabilities", ()))
+        return caps
+
+    def needed_by(self, item):
+        """Capabilities ``item`` needs: its markers and its fixtures' declarations."""
+        names = [name for mark in ("capability", "requires")
+                 for marker in item.iter_markers(mark) for name in marker.args]
+        fixtureinfo = getattr(item, "_fixtureinfo", None)
+        if fixtureinfo is not None:
+            for fixturedefs in fixtureinfo.name2fixturedefs.values():
+                if fixturedefs:
+                    names.extend(self._fixture_capabilities(fixturedefs[-1]))
+        return list(dict.fromkeys(names))
+
+    def _gate(self, names):
+        broken = self.graph.broken(names)
+        if broken is None:
+            return
+        name, root = broken
+        self.graph.short_circuited(name)
+        message = (f"capability '{name}' is down; root failure: {root['nodeid']} "
+                   f"[{root['worker']}] {root['detail']}")
+        exc = pytest.fail.Exception(message, pytrace=False) if self.policy == "fail" \
+            else pytest.skip.Exception(message)
+        exc.capability_down = name  # not a failure of the fixture that hit the gate
+        raise exc
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        # Before any fixture runs, so no browser is started for a doomed test
+        self._gate(self.needed_by(item))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        names = self._fixture_capabilities(fixturedef)
+        if names:
+            # Another worker may have taken a capability down meanwhile
+            self._gate(names)
+        outcome = yield
+        if not names:
+            return
+        excinfo = outcome.excinfo
+        if excinfo and (isinstance(excinfo[1], pytest.skip.Exception)
+                        or hasattr(excinfo[1], "capability_down")):
+            return
+        nodeid = request.node.nodeid
+        for name in names:
+            if excinfo:
+                self.graph.record(name, False, nodeid, _describe(pytest.ExceptionInfo.from_exc_info(excinfo)))
+            else:
+                self.graph.record(name, True, nodeid)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when != "call" or report.skipped:
+            return
+        for marker in item.iter_markers("capability"):
+            for name in marker.args:
+                detail = _describe(call.excinfo) if call.excinfo else ""
+                self.graph.record(name, report.passed, item.nodeid, detail)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if hasattr(self.config, "workerinput"):
+            return
+        down = {name: entry for name, entry in self.graph.state().items() if entry.get("down")}
+        if not down:
+            return
+        terminalreporter.section("capability health")
+        for name, entry in sorted(down.items()):
+            root = entry["down"]
+            terminalreporter.line(
+                f"{name} DOWN after {len(entry['streak'])} consecutive failures, "
+                f"{entry['short_circuited']} tests short-circuited")
+            terminalreporter.line(f"  root failure: {root['nodeid']} [{root['worker']}] {root['detail']}")
+
+    def pytest_unconfigure(self, config):
+        if not hasattr(config, "workerinput"):
+            self.graph.remove()
@@ -0,0 +1,548 @@
+"""Change-based test impact analysis.
+
+Two dependency sources are combined:
+
+* a static import graph (``ast``, lazy imports included) from every test
+  module to the page objects, utils and test data it imports, plus the
+  modules that the ``conftest.py`` fixtures it requests import;
+* recorded coverage: ``pytest --record-impact`` notes which project
+  functions (page-object methods, seeding helpers, ...) each test executed,
+  including those run by session-scoped fixtures.
+
+Given a git diff, changed lines are mapped to the functions containing them
+(old and new side), and only tests that executed a changed function, or that
+import a changed module where coverage cannot tell, are selected. Changes to
+shared configuration (``conftest.py``, ``pytest.ini``, ``config/`` ...) fall
+back to the full suite, as do changes to modules conftest.py imports at
+module level or in its hooks when no coverage is recorded.
+
+Usage:
+    pytest --record-impact                     # refresh recorded coverage
+    pytest --impact origin/main                # run tests affected since a ref
+    python -m utils.impact --base origin/main  # explain the selection
+"""
+import argparse
+import ast
+import fnmatch
+import json
+import os
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from utils.run_configs import ARTIFACTS_DIR
+from utils.tc_registry import PROJECT_DIR
+
+COVERAGE_DIR = ARTIFACTS_DIR / ".cache" / "impact"
+# Changes here can affect any test; the whole suite runs
+FULL_SUITE_PATTERNS = (
+    "conftest.py", "pytest.ini", "requirements.txt", "Tests/__init__.py",
+    "config/*", "utils/config.py", "utils/driver_factory.py", "utils/transport.py",
+    "utils/asset_cache.py", "stub_app/*",
+)
+SOURCE_DIRS = ("pages", "utils", "Tests", "stub_app", "config")
+
+
+# --- Static import graph ---
+
+def _module_path(module, root):
+    """Project-relative file for a dotted module name, or None if external."""
+    parts = module.split(".")
+    if not (root / parts[0]).exists() and not (root / f"{parts[0]}.py").exists():
+        return None
+    for candidate in (Path(*parts).with_suffix(".py"), Path(*parts) / "__init__.py"):
+        if (root / candidate).exists():
+            return candidate.as_posix()
+    # Module deleted in the working tree: keep the edge so its dependents are found
+    return Path(*parts).with_suffix(".py").as_posix()
+
+
+def _module_level(tree):
+    """Nodes of ``tree`` outside function bodies."""
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(child for child in ast.iter_child_nodes(node)
+                     if not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)))
+
+
+def imports_of(source, rel_path="", root=PROJECT_DIR, lazy=True):
+    """
+    Project modules imported in ``source``.
+    Args:
+        source (bytes or ast.AST): Module source, or an already parsed node
+        rel_path (str): Project-relative path of the module (for relative imports)
+        lazy (bool): Include imports inside functions
+    Returns:
+        set: Project-relative paths
+    """
+    tree = source if isinstance(source, ast.AST) else ast.parse(source)
+    found = set()
+    package = rel_path.split("/")[:-1]
+    for node in (ast.walk(tree) if lazy else _module_level(tree)):
+        if isinstance(node, ast.Import):
+            modules, members = [alias.name for alias in node.names], []
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module
+            if node.level:
+                # "from ..base_page import BasePage" inside pages/cart_page/
+                anchor = package[:len(package) - node.level + 1]
+                base = ".".join(anchor + ([node.module] if node.module else []))
+            if not base:
+                continue
+            # "from utils import api_seed" may name a submodule
+            modules, members = [base], [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for name in modules:
+            path = _module_path(name, root)
+            if path:
+                found.add(path)
+        for name in members:
+            path = _module_path(name, root)
+            if path and (root / path).exists():
+                found.add(path)
+    return found
+
+
+def module_graph(root=PROJECT_DIR, lazy=True):
+    """
+    Args:
+        lazy (bool): Include imports inside functions
+    Returns:
+        dict: Project-relative path -> set of project modules it imports
+    """
+    root = Path(root)
+    files = [root / "conftest.py"] + [p for d in SOURCE_DIRS for p in (root / d).rglob("*.py")]
+    graph = {}
+    for path in files:
+        if path.exists():
+            try:
+                rel = path.relative_to(root).as_posix()
+                graph[rel] = imports_of(path.read_bytes(), rel, root, lazy)
+            except SyntaxError:
+                graph[path.relative_to(root).as_posix()] = set()
+    return graph
+
+
+def closure(graph, start):
+    """All modules reachable from ``start`` (inclusive)."""
+    seen, stack = set(), [start]
+    while stack:
+        path = stack.pop()
+        if path not in seen:
+            seen.add(path)
+            stack.extend(graph.get(path, ()))
+    return seen
+
+
+def _is_fixture(node):
+    for decorator in node.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if isinstance(target, ast.Attribute) and target.attr == "fixture":
+            return True
+    return False
+
+
+def conftest_dependencies(root=PROJECT_DIR):
+    """
+    Split what ``conftest.py`` imports by who runs it.
+    Returns:
+        tuple: (set of modules imported at module level or in hooks, i.e. for
+            every test; dict fixture name -> (set of fixtures it requests,
+            set of modules its body imports); set of autouse fixtures)
+    """
+    path = Path(root) / "conftest.py"
+    if not path.exists():
+        return set(), {}, set()
+    try:
+        tree = ast.parse(path.read_bytes())
+    except SyntaxError:
+        return set(), {}, set()
+    hooks = imports_of(tree, "conftest.py", root, lazy=False)
+    fixtures, autouse = {}, set()
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        body = imports_of(ast.Module(body=node.body, type_ignores=[]), "conftest.py", root)
+        if not _is_fixture(node):
+            hooks |= body
+            continue
+        fixtures[node.name] = ({a.arg for a in node.args.args}, body)
+        if any(isinstance(d, ast.Call) and any(k.arg == "autouse" and getattr(k.value, "value", False)
+                                               for k in d.keywords) for d in node.decorator_list):
+            autouse.add(node.name)
+    return hooks, fixtures, autouse
+
+
+def requested_fixtures(path):
+    """Names a test module requests: function arguments and ``usefixtures`` marks."""
+    names = set()
+    for node in ast.walk(ast.parse(Path(path).read_bytes())):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            names.update(a.arg for a in node.args.args)
+        elif (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+              and node.func.attr == "usefixtures"):
+            names.update(a.value for a in node.args if isinstance(a, ast.Constant))
+    return names
+
+
+def fixture_closure(fixtures, names):
+    """``names`` plus every conftest fixture they request, transitively."""
+    seen, stack = set(), list(names)
+    while stack:
+        name = stack.pop()
+        if name in fixtures and name not in seen:
+            seen.add(name)
+            stack.extend(fixtures[name][0])
+    return seen
+
+
+def test_nodeids(path, root=PROJECT_DIR):
+    """Test nodeids defined in a test module (without parametrize ids)."""
+    rel = Path(path).relative_to(root).as_posix()
+    tree = ast.parse(Path(path).read_bytes())
+    ids = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+            ids.append(f"{rel}::{node.name}")
+        elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            ids += [f"{rel}::{node.name}::{child.name}" for child in node.body
+                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)) and child.name.startswith("test")]
+    return ids
+
+
+# --- Functions touched by a diff ---
+
+def function_spans(source):
+    """
+    Top-level functions and methods with their line spans. Nested functions
+    belong to their enclosing function, as recorded coverage does.
+    Returns:
+        list: (first line, last line, qualname)
+    """
+    spans = []
+
+    def visit(body, prefix):
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                first = min([node.lineno] + [d.lineno for d in node.decorator_list])
+                spans.append((first, node.end_lineno, f"{prefix}{node.name}"))
+            elif isinstance(node, ast.ClassDef):
+                visit(node.body, f"{prefix}{node.name}.")
+
+    visit(ast.parse(source).body, "")
+    return spans
+
+
+def touched_functions(source, lines):
+    """
+    Qualnames containing any of ``lines``; None stands for a change outside
+    every function (module or class level, e.g. a locator constant).
+    """
+    if source is None:
+        return {None}
+    try:
+        spans = function_spans(source)
+    except SyntaxError:
+        return {None}
+    touched = set()
+    for line in lines:
+        owner = next((name for first, last, name in spans if first <= line <= last), None)
+        touched.add(owner)
+    return touched
+
+
+def _git(args, cwd=PROJECT_DIR):
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True).stdout
+
+
+def diff_changes(base, cwd=PROJECT_DIR):
+    """
+    Changed files between ``base`` and the working tree (untracked included).
+    Returns:
+        dict: Project-relative path -> {"old": set, "new": set} of changed
+            line numbers, or None when the whole file counts as changed
+    """
+    changes = {}
+    current, old_path = None, None
+    for line in _git(["diff", "-U0", "--no-color", "--relative", base, "--", "."], cwd).splitlines():
+        if line.startswith("--- "):
+            old_path = None if line == "--- /dev/null" else line[6:]
+        elif line.startswith("+++ "):
+            current = old_path if line == "+++ /dev/null" else line[6:]
+            changes[current] = {"old": set(), "new": set()} if old_path and line != "+++ /dev/null" else None
+        elif line.startswith("@@") and current and changes.get(current) is not None:
+            old, new = line.split()[1:3]
+            for side, spec in (("old", old[1:]), ("new", new[1:])):
+                start, _, count = spec.partition(",")
+                start, count = int(start), int(count or 1)
+                # count 0: nothing on this side (pure insertion or deletion)
+                changes[current][side].update(range(start, start + count))
+    for path in _git(["ls-files", "--others", "--exclude-standard"], cwd).splitlines():
+        changes[path] = None
+    return changes
+
+
+def changed_functions(path, lines, base, root=PROJECT_DIR):
+    """Functions of ``path`` touched on either side of the diff (see touched_functions)."""
+    if lines is None:
+        return {None}
+    current = root / path
+    new_source = current.read_bytes() if current.exists() else None
+    try:
+        old_source = _git(["show", f"{base}:./{path}"], root)
+    except subprocess.CalledProcessError:
+        old_source = None
+    touched = set()
+    if lines["new"]:
+        touched |= touched_functions(new_source, lines["new"])
+    if lines["old"]:
+        touched |= touched_functions(old_source, lines["old"])
+    return touched
+
+
+# --- Recorded coverage ---
+
+class CoverageRecorder:
+    """
+    pytest plugin recording the project functions each test executes
+    (``sys.setprofile``; enabled by ``--record-impact``). Calls made while
+    a session/module/class-scoped fixture is being set up are recorded for
+    that fixture, since only the first test using it would see them.
+    """
+
+    def __init__(self, config, root=PROJECT_DIR):
+        self.config = config
+        self.root = str(Path(root).resolve()) + os.sep
+        self.tests = {}
+        self.fixtures = {}
+        self._bucket = None
+        self._files = {}
+
+    def _relpath(self, filename):
+        rel = self._files.get(filename)
+        if rel is None:
+            rel = ""
+            if filename.startswith(self.root):
+                rel = filename[len(self.root):].replace(os.sep, "/")
+                if rel in ("conftest.py", "utils/impact.py"):
+                    rel = ""  # covered statically, or the recorder itself
+            self._files[filename] = rel
+        return rel
+
+    def _profile(self, frame, event, arg):
+        if event == "call" and self._bucket is not None:
+            code = frame.f_code
+            rel = self._relpath(code.co_filename)
+            if rel and code.co_name != "<module>":
+                self._bucket.add(f"{rel}::{getattr(code, 'co_qualname', code.co_name).split('.<locals>')[0]}")
+
+    def _start(self, bucket):
+        previous = self._bucket
+        self._bucket = bucket
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)
+        return previous
+
+    def _stop(self, previous):
+        self._bucket = previous
+        if previous is None:
+            sys.setprofile(None)
+            threading.setprofile(None)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self._files[str(item.path)] = ""  # test modules are covered statically
+        bucket = set()
+        previous = self._start(bucket)
+        try:
+            yield
+        finally:
+            self._stop(previous)
+            # Parametrized cases share one entry
+            nodeid = item.nodeid.split("[", 1)[0]
+            seen = set(self.tests.get(nodeid, {}).get("functions", ()))
+            self.tests[nodeid] = {"functions": sorted(bucket | seen), "fixtures": sorted(item.fixturenames)}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef):
+        if fixturedef.scope == "function":
+            yield
+            return
+        bucket = self.fixtures.setdefault(fixturedef.argname, set())
+        previous = self._start(bucket)
+        try:
+            yield
+        finally:
+            self._stop(previous)
+
+    def pytest_sessionfinish(self):
+        if not self.tests:
+            return  # e.g. the xdist controller
+        worker = getattr(self.config, "workerinput", {}).get("workerid", "main")
+        COVERAGE_DIR.mkdir(parents=True, exist_ok=True)
+        path = COVERAGE_DIR / f"coverage-{worker}.json"
+        with open(path, "w") as f:
+            json.dump({"tests": self.tests,
+                       "fixtures": {k: sorted(v) for k, v in self.fixtures.items()}}, f, indent=1)
+
+
+def load_coverage(directory=COVERAGE_DIR):
+    """
+    Merge recorded coverage from every worker file (newest wins per test).
+    Returns:
+        dict: {"tests": {nodeid: {...}}, "fixtures": {name: [...]}} or None
+    """
+    files = sorted(Path(directory).glob("coverage-*.json"), key=lambda p: p.stat().st_mtime)
+    if not files:
+        return None
+    merged = {"tests": {}, "fixtures": {}}
+    for path in files:
+        with open(path) as f:
+            data = json.load(f)
+        merged["tests"].update(data.get("tests", {}))
+        for name, functions in data.get("fixtures", {}).items():
+            merged["fixtures"][name] = sorted(set(merged["fixtures"].get(name, ())) | set(functions))
+    return merged
+
+
+# --- Selection ---
+
+@dataclass
+class ImpactSelection:
+    """Tests to run for a change set."""
+    full: bool = False
+    files: set = field(default_factory=set)
+    nodeids: set = field(default_factory=set)
+    reasons: list = field(default_factory=list)
+
+    def includes_file(self, rel):
+        return self.full or rel in self.files or any(n.startswith(rel + "::") for n in self.nodeids)
+
+    def includes(self, nodeid):
+        base = nodeid.split("[", 1)[0]
+        return self.full or base.split("::", 1)[0] in self.files or base in self.nodeids
+
+    def to_json(self):
+        return json.dumps({"full": self.full, "files": sorted(self.files), "nodeids": sorted(self.nodeids),
+                           "reasons": self.reasons})
+
+    @classmethod
+    def from_json(cls, payload):
+        data = json.loads(payload)
+        return cls(data["full"], set(data["files"]), set(data["nodeids"]), data["reasons"])
+
+
+def select_tests(changes, base, graph=None, coverage=None, root=PROJECT_DIR):
+    """
+    Minimal set of tests affected by ``changes``.
+    Args:
+        changes (dict): Output of :func:`diff_changes`
+        base (str): Git ref the diff is against (to read old sources)
+        graph (dict): Output of :func:`module_graph`
+        coverage (dict): Output of :func:`load_coverage` (None: static only)
+    Returns:
+        ImpactSelection: Files and nodeids to run, or ``full``
+    """
+    graph = graph if graph is not None else module_graph(root)
+    selection = ImpactSelection()
+    test_files = sorted(p for p in graph if p.startswith("Tests/") and p.rsplit("/", 1)[-1].startswith("test_")
+                        and test_nodeids(root / p, root))
+    # Only what conftest.py runs for every test is shared; modules its
+    # fixtures import lazily matter to the tests requesting those fixtures
+    hooks, fixtures, autouse = conftest_dependencies(root)
+    eager = module_graph(root, lazy=False)
+    shared = {"conftest.py"}.union(*(closure(eager, m) for m in hooks))
+    fixture_modules = {name: set().union(*(closure(graph, m) for m in body))
+                       for name, (_, body) in fixtures.items()}
+    depends = {}
+    for t in test_files:
+        used = fixture_closure(fixtures, requested_fixtures(root / t) | autouse)
+        depends[t] = closure(graph, t).union(*(fixture_modules[name] for name in used))
+    recorded = set(coverage["tests"]) if coverage else set()
+
+    for path, lines in sorted(changes.items(), key=lambda c: c[0]):
+        if any(fnmatch.fnmatch(path, pattern) for pattern in FULL_SUITE_PATTERNS):
+            return ImpactSelection(full=True, reasons=[f"{path}: shared configuration, running everything"])
+        if not path.endswith(".py"):
+            continue
+        if path in test_files:
+            selection.files.add(path)
+            selection.reasons.append(f"{path}: test module changed")
+            continue
+
+        importers = [t for t in test_files if path in depends[t]]
+        if path in shared and not coverage:
+            return ImpactSelection(full=True, reasons=[
+                f"{path}: used by conftest.py for every test and no coverage is recorded (pytest --record-impact)"])
+        if not importers and path not in shared:
+            continue
+
+        functions = changed_functions(path, lines, base, root)
+        if coverage is None:
+            selection.files.update(importers)
+            selection.reasons.append(f"{path}: used by {len(importers)} test module(s)")
+            continue
+
+        prefix = f"{path}::"
+        if None in functions:
+            # Module/class-level change: anything that ran code from this file
+            hit = lambda name: name.startswith(prefix)
+        else:
+            wanted = {prefix + f for f in functions}
+            hit = lambda name, wanted=wanted: name in wanted or any(name.startswith(w + ".") for w in wanted)
+        fixtures = {name for name, called in coverage["fixtures"].items() if any(map(hit, called))}
+        users = {nodeid for nodeid, record in coverage["tests"].items()
+                 if any(map(hit, record["functions"])) or fixtures & set(record["fixtures"])}
+        # Tests added since the coverage was recorded cannot be ruled out
+        candidates = importers if path not in shared else test_files
+        unrecorded = {n for t in candidates if (root / t).exists() for n in test_nodeids(root / t, root)
+                      if n not in recorded}
+        if None in functions and path not in shared:
+            selection.files.update(importers)
+        selection.nodeids |= users | unrecorded
+        label = "module-level code" if None in functions else ", ".join(sorted(functions))
+        selection.reasons.append(f"{path}: {label} -> {len(users)} recorded test(s)"
+                                 + (f", {len(unrecorded)} unrecorded" if unrecorded else ""))
+    return selection
+
+
+def impact_since(base, root=PROJECT_DIR):
+    """Selection for the working tree compared with ``base``."""
+    return select_tests(diff_changes(base, root), base, module_graph(root), load_coverage(), root)
+
+
+def main(argv=None):
+    """Explain which tests a change set affects."""
+    parser = argparse.ArgumentParser(description="Change-based test impact analysis")
+    parser.add_argument("--base", default="HEAD", help="Git ref to diff against (default: HEAD)")
+    parser.add_argument("--args", action="store_true", help="Print only pytest arguments")
+    args = parser.parse_args(argv)
+
+    selection = impact_since(args.base)
+    targets = sorted(selection.files) + sorted(n for n in selection.nodeids
+                                               if n.split("::", 1)[0] not in selection.files)
+    if args.args:
+        print(" ".join(targets) if not selection.full else "")
+        return 0
+    for reason in selection.reasons:
+        print(reason)
+    if selection.full:
+        print("-> full suite")
+    elif not targets:
+        print("-> no affected tests")
+    else:
+        print(f"-> {len(targets)} target(s):")
+        for target in targets:
+            print(f"   {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,345 @@
+"""LLM test-case generation from the Style Haven SRS, with a prompt cache.
+
+The SRS is split into sections (one per requirement heading) and each
+section is sent to an OpenAI-compatible chat-completion endpoint with the
+test-case template. Responses are stored in a content-addressed on-disk
+cache: the key is a hash of the rendered prompt and the model settings, so
+after an SRS edit only the changed sections are paid for again.
+The cache is bounded (entries and bytes) and evicts least recently used
+responses.
+
+Usage:
+    python -m utils.llm_testgen --stand-in                  # offline, local endpoint
+    TEST_LLM_ENDPOINT=https://api.openai.com/v1 LLM_API_KEY=... python -m utils.llm_testgen
+    python -m utils.llm_testgen --srs srs.txt -o test_logs/generated_test_cases.md
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from utils.locks import FileLock, LOCKS_DIR
+from utils.run_configs import ARTIFACTS_DIR
+from utils.tc_registry import PROJECT_DIR
+
+SRS_FILE = PROJECT_DIR.parent / "test_plan_generation_from_srs.md"
+CACHE_DIR = ARTIFACTS_DIR / ".cache" / "llm"
+OUTPUT_FILE = ARTIFACTS_DIR / "generated_test_cases.md"
+
+# "1. User Accounts:" / "Non-Functional Requirements:" on a line of their own
+HEADING_PATTERN = re.compile(r"^(?:\d+\.\s+)?(?P<title>[A-Z][^:•]{2,60}):\s*$")
+
+DEFAULT_TEMPLATE = """You are a QA engineer on "{project}", a fashion e-commerce platform.
+Write functional test cases for the requirement section below as one markdown
+table with the columns | TC ID | Test Case Title | Steps | Expected Result | Priority |.
+Number the IDs {prefix}_01, {prefix}_02, ... and separate steps with <br>.
+Reply with the table only.
+
+Section: {title}
+{text}
+"""
+
+
+class LLMError(RuntimeError):
+    """Raised when the completion endpoint fails or returns no content."""
+
+
+@dataclass
+class Section:
+    """One requirement section of the SRS."""
+    title: str
+    text: str
+
+    @property
+    def prefix(self):
+        """TC ID prefix: initials of a multi-word title, else its first two letters."""
+        words = re.findall(r"[A-Za-z]+", self.title)
+        letters = "".join(w[0] for w in words[:2]) if len(words) > 1 else self.title[:2]
+        return letters.upper()
+
+
+# --- SRS ---
+
+def extract_srs(text):
+    """
+    The requirements part of ``text``. For the recorded conversation in
+    ``test_plan_generation_from_srs.md`` that is the first question (up to
+    the first answer); other documents are returned unchanged.
+    """
+    lines = text.splitlines()
+    if lines and any(line.startswith("A:") for line in lines):
+        start = next((i for i, line in enumerate(lines) if line.startswith("Q:")), -1) + 1
+        end = next(i for i, line in enumerate(lines) if line.startswith("A:"))
+        lines = lines[start:end]
+    return "\n".join(lines)
+
+
+def split_sections(text):
+    """
+    Split an SRS into sections at heading lines. Text before the first heading
+    becomes an "Overview" section; headings without body text are dropped.
+    Returns:
+        list: Section objects in document order
+    """
+    sections, title, body = [], "Overview", []
+
+    def flush():
+        content = "\n".join(body).strip()
+        if content:
+            sections.append(Section(title, content))
+
+    for line in text.splitlines():
+        match = HEADING_PATTERN.match(line.strip())
+        if match:
+            flush()
+            title, body = match.group("title").strip(), []
+        else:
+            body.append(line.rstrip())
+    flush()
+    return sections
+
+
+def project_name(text):
+    match = re.search(r"Project Name:\s*[“\"]?([^”\"–\n]+)", text)
+    return match.group(1).strip() if match else "the application"
+
+
+# --- Cache ---
+
+class PromptCache:
+    """
+    Content-addressed response store with LRU eviction.
+    Entries live in ``<root>/<key[:2]>/<key>.json``; a hit refreshes the
+    entry's mtime, which is the recency used for eviction. Eviction holds a
+    file lock so concurrent runs do not race.
+    Args:
+        root (Path): Cache directory
+        max_entries (int): Entries kept after eviction
+        max_bytes (int): Total size kept after eviction
+    """
+
+    def __init__(self, root=CACHE_DIR, max_entries=500, max_bytes=50 * 1024 * 1024):
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = FileLock(LOCKS_DIR / "llm_cache.lock", timeout=60)
+
+    @staticmethod
+    def key(prompt, settings):
+        """Stable hash of everything that determines the response: the prompt as sent and the model settings."""
+        payload = json.dumps({"prompt": prompt, "settings": settings}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """
+        Returns:
+            dict: Stored entry (``content``, ``usage``, ...) or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key, entry):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def entries(self):
+        """(mtime, size, path) of every entry, least recently used first."""
+        found = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            found.append((stat.st_mtime, stat.st_size, path))
+        return sorted(found)
+
+    def evict(self):
+        """
+        Remove least recently used entries until both limits hold.
+        Returns:
+            int: Entries removed
+        """
+        with self.lock:
+            entries = self.entries()
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in entries:
+                if len(entries) - removed <= self.max_entries and total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+        return removed
+
+
+# --- Endpoint ---
+
+class CompletionClient:
+    """
+    Minimal OpenAI-compatible chat-completion client over a pooled session.
+    Args:
+        endpoint (str): Base URL, e.g. ``https://api.openai.com/v1``
+        api_key (str): Bearer token (optional for local endpoints)
+        timeout (float): Per-request timeout in seconds
+        retries (int): Retries on connection errors, 429 and 5xx
+    """
+
+    def __init__(self, endpoint, api_key=None, timeout=120, retries=3, pool_size=8):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.url = endpoint.rstrip("/") + "/chat/completions"
+        self.timeout = timeout
+        self.session = requests.Session()
+        retry = Retry(total=retries, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset({"POST"}), respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if api_key:
+            self.session.headers["Authorization"] = f"Bearer {api_key}"
+
+    def complete(self, prompt, settings):
+        """
+        Returns:
+            dict: ``content`` and ``usage`` of the first choice
+        """
+        payload = {"messages": [{"role": "user", "content": prompt}], **settings}
+        response = self.session.post(self.url, json=payload, timeout=self.timeout)
+        if not response.ok:
+            raise LLMError(f"{self.url} -> {response.status_code}: {response.text[:200]}")
+        body = response.json()
+        try:
+            content = body["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            raise LLMError(f"Unexpected response from {self.url}: {str(body)[:200]}") from None
+        return {"content": content, "usage": body.get("usage", {})}
+
+    def close(self):
+        self.session.close()
+
+
+# --- Pipeline ---
+
+def generate(sections, client, cache, settings, template=DEFAULT_TEMPLATE, project="Style Haven", workers=4):
+    """
+    Generate test cases for every section, serving unchanged ones from cache.
+    Args:
+        sections (list): Section objects
+        client (CompletionClient): Endpoint used on cache misses
+        cache (PromptCache): Response cache
+        settings (dict): Model settings sent with every request (part of the key)
+        template (str): Prompt template
+        project (str): Project name for the template
+        workers (int): Concurrent requests for cache misses
+    Returns:
+        tuple: (list of (Section, content), stats dict)
+    """
+    prompts = [template.format(project=project, prefix=s.prefix, title=s.title, text=s.text) for s in sections]
+    keys = [cache.key(prompt, settings) for prompt in prompts]
+    results = {key: cache.get(key) for key in keys}
+    misses = [(key, section, prompt) for key, section, prompt in zip(keys, sections, prompts)
+              if results[key] is None]
+
+    def fetch(item):
+        key, section, prompt = item
+        start = time.perf_counter()
+        entry = client.complete(prompt, settings)
+        entry.update(section=section.title, elapsed_s=round(time.perf_counter() - start, 3),
+                     created=time.time())
+        cache.put(key, entry)
+        return key, entry
+
+    if misses:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            results.update(pool.map(fetch, misses))
+        cache.evict()
+
+    fresh = {key for key, _, _ in misses}
+    stats = {
+        "sections": len(sections),
+        "hits": len(sections) - len(misses),
+        "misses": len(misses),
+        "tokens": sum(results[k].get("usage", {}).get("total_tokens", 0) for k in fresh),
+        "tokens_saved": sum(results[k].get("usage", {}).get("total_tokens", 0)
+                            for k in set(keys) - fresh),
+    }
+    return [(section, results[key]["content"]) for key, section in zip(keys, sections)], stats
+
+
+def render(results):
+    return "".join(f"## {section.title}\n\n{content.strip()}\n\n" for section, content in results)
+
+
+def main(argv=None):
+    """Generate test cases from the SRS through the cached LLM pipeline."""
+    from utils.config import get_config
+
+    llm = get_config().llm
+    parser = argparse.ArgumentParser(description="Cached LLM test-case generation from the SRS")
+    parser.add_argument("--srs", default=SRS_FILE, help="SRS text or the recorded SRS conversation")
+    parser.add_argument("-o", "--output", default=OUTPUT_FILE, help="Markdown file to write")
+    parser.add_argument("--endpoint", default=llm["endpoint"], help="OpenAI-compatible base URL")
+    parser.add_argument("--model", default=llm["model"])
+    parser.add_argument("--template", help="File with a prompt template (default: built-in)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent requests on cache misses")
+    parser.add_argument("--stand-in", action="store_true",
+                        help="Use a local stand-in endpoint (stub_app.llm_server), no network")
+    args = parser.parse_args(argv)
+
+    text = extract_srs(Path(args.srs).read_text(encoding="utf-8"))
+    sections = split_sections(text)
+    template = Path(args.template).read_text(encoding="utf-8") if args.template else DEFAULT_TEMPLATE
+    settings = {"model": args.model, "temperature": llm["temperature"], "max_tokens": llm["max_tokens"]}
+    cache = PromptCache(max_entries=llm["cache_max_entries"], max_bytes=llm["cache_max_mb"] * 1024 * 1024)
+
+    stand_in = None
+    endpoint = args.endpoint
+    if args.stand_in:
+        from stub_app.llm_server import CompletionServer
+
+        stand_in = CompletionServer().start()
+        endpoint = stand_in.url
+    if not endpoint:
+        parser.error("no endpoint: set TEST_LLM_ENDPOINT, pass --endpoint or use --stand-in")
+
+    client = CompletionClient(endpoint, os.getenv("LLM_API_KEY"))
+    try:
+        results, stats = generate(sections, client, cache, settings, template, project_name(text), args.workers)
+    finally:
+        client.close()
+        if stand_in:
+            stand_in.stop()
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(render(results), encoding="utf-8")
+    print(f"{stats['sections']} sections: {stats['hits']} from cache, {stats['misses']} generated "
+          f"({stats['tokens']} tokens used, {stats['tokens_saved']} saved) -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
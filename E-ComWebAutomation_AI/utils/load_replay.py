@@ -0,0 +1,495 @@
+"""Load generation by replaying recorded UI flows at the HTTP layer.
+
+A flow is driven once in a real browser with the page objects. Every
+``fetch``/``XMLHttpRequest`` the application makes is recorded in the page
+(method, URL, headers it set, body, status and response text), so the
+recording is exactly what the UI sends, including the view fragments.
+
+``build_scenario`` turns the recording into a replayable scenario:
+
+- the origin becomes ``${base}`` and the user's credentials ``${email}`` and
+  ``${password}``;
+- dynamic values are correlated: a string from an earlier JSON response
+  (token, user id, order id...) that reappears in a later URL, header or
+  body becomes a variable, extracted from that response on every replay.
+
+``run_load`` replays the scenario with asyncio virtual users (one HTTP
+session each, ramped up over ``ramp_up`` seconds) against any target and
+reports throughput and per-step latency percentiles.
+
+Usage:
+    python -m utils.load_replay record checkout --stub
+    python -m utils.load_replay run checkout --stub --vus 20 --duration 30
+    python -m utils.load_replay run test_logs/load/checkout.json --target https://shop.example --vus 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from string import Template
+from urllib.parse import urlsplit
+
+from utils.benchmark import summarize
+from utils.run_configs import ARTIFACTS_DIR
+
+SCENARIO_DIR = ARTIFACTS_DIR / "load"
+LOG_KEY = "__httpLog"
+MIN_CORRELATED_LENGTH = 8
+MAX_RESPONSE_CHARS = 65536
+
+# Idempotent: records every fetch/XHR of the page in sessionStorage, which
+# survives reloads of the tab
+RECORDER_JS = """(function () {
+  if (window.__httpRecorder) { return; }
+  var rec = window.__httpRecorder = {pending: 0}, KEY = '%(key)s', MAX = %(max)d;
+  function save(entry) {
+    var log = JSON.parse(sessionStorage.getItem(KEY) || '[]');
+    log.push(entry);
+    sessionStorage.setItem(KEY, JSON.stringify(log));
+  }
+  function clip(text) { return typeof text === 'string' ? text.slice(0, MAX) : null; }
+  var fetch = window.fetch;
+  window.fetch = function (input, init) {
+    init = init || {};
+    var request = typeof input === 'string' ? null : input, headers = {};
+    new Headers(init.headers || (request && request.headers) || {})
+      .forEach(function (value, name) { headers[name] = value; });
+    var entry = {method: (init.method || (request && request.method) || 'GET').toUpperCase(),
+                 url: new URL(request ? request.url : input, location.href).href, headers: headers,
+                 body: typeof init.body === 'string' ? init.body : null, started: Date.now()};
+    rec.pending++;
+    return fetch.apply(this, arguments).then(function (res) {
+      entry.status = res.status; entry.elapsed = Date.now() - entry.started;
+      res.clone().text().then(function (text) { entry.response = clip(text); save(entry); rec.pending--; },
+                              function () { save(entry); rec.pending--; });
+      return res;
+    }, function (error) { rec.pending--; throw error; });
+  };
+  var open = XMLHttpRequest.prototype.open, send = XMLHttpRequest.prototype.send,
+      setRequestHeader = XMLHttpRequest.prototype.setRequestHeader;
+  XMLHttpRequest.prototype.open = function (method, url) {
+    this.__entry = {method: method.toUpperCase(), url: new URL(url, location.href).href, headers: {}};
+    return open.apply(this, arguments);
+  };
+  XMLHttpRequest.prototype.setRequestHeader = function (name, value) {
+    if (this.__entry) { this.__entry.headers[name.toLowerCase()] = value; }
+    return setRequestHeader.apply(this, arguments);
+  };
+  XMLHttpRequest.prototype.send = function (body) {
+    var xhr = this, entry = this.__entry;
+    if (entry) {
+      entry.body = typeof body === 'string' ? body : null;
+      entry.started = Date.now();
+      rec.pending++;
+      xhr.addEventListener('loadend', function () {
+        entry.status = xhr.status; entry.elapsed = Date.now() - entry.started;
+        entry.response = clip(xhr.responseType === 'json' ? JSON.stringify(xhr.response)
+                              : (xhr.responseType === '' || xhr.responseType === 'text') ? xhr.responseText : null);
+        save(entry); rec.pending--;
+      });
+    }
+    return send.apply(this, arguments);
+  };
+})();
+""" % {"key": LOG_KEY, "max": MAX_RESPONSE_CHARS}
+
+READ_LOG_SCRIPT = """/* read-only */
+var rec = window.__httpRecorder;
+return [rec ? rec.pending : 0, sessionStorage.getItem('%s') || '[]'];
+""" % LOG_KEY
+
+
+# --- Recording ---
+
+def _checkout_flow(driver, base_url, user):
+    from pages.login_page.login import LoginPage
+    from pages.dashboard_page.dashboard_page import DashboardPage
+    from pages.cart_page.cart_page import CartPage
+    from pages.payment_page.payment_page import PaymentPage
+    from Tests.test_data import TestData
+
+    product = TestData.PRODUCTS["zara_coat"]["title"]
+    driver.get(base_url)
+    LoginPage(driver).perform_login(user["email"], user["password"])
+    dashboard = DashboardPage(driver)
+    dashboard.wait_for_route(DashboardPage.ROUTE, DashboardPage.READY)
+    dashboard.search_products(product)
+    dashboard.add_product_to_cart(product)
+    dashboard.navigate(CartPage).proceed_to_checkout()
+    payment = PaymentPage(driver)
+    payment.select_country("India")
+    payment.place_order()
+
+
+def _browse_flow(driver, base_url, user):
+    from pages.login_page.login import LoginPage
+    from pages.dashboard_page.dashboard_page import DashboardPage
+    from pages.cart_page.cart_page import CartPage
+    from Tests.test_data import TestData
+
+    driver.get(base_url)
+    LoginPage(driver).perform_login(user["email"], user["password"])
+    dashboard = DashboardPage(driver)
+    dashboard.wait_for_route(DashboardPage.ROUTE, DashboardPage.READY)
+    dashboard.view_product_details(TestData.PRODUCTS["adidas"]["title"])
+    dashboard.navigate(CartPage)
+
+
+FLOWS = {
+    "checkout": _checkout_flow,
+    "browse": _browse_flow,
+}
+
+
+def read_log(driver, timeout=5):
+    """
+    Requests recorded in the current tab, oldest first, once none is pending.
+    Returns:
+        list: dicts with method, url, headers, body, status, response, started, elapsed
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        pending, log = driver.execute_script(READ_LOG_SCRIPT)
+        if not pending or time.monotonic() > deadline:
+            return sorted(json.loads(log), key=lambda entry: entry["started"])
+        time.sleep(0.1)
+
+
+def record(flow, base_url, user):
+    """
+    Drive a flow in a new browser and return its HTTP log.
+    Args:
+        flow (str): Key of FLOWS
+        base_url (str): Application entry URL
+        user (dict): ``email`` and ``password`` to sign in with
+    Returns:
+        list: Recorded requests (see :func:`read_log`)
+    """
+    from utils.config import get_config
+    from utils.driver_factory import resolve_driver_path, create_driver
+
+    driver = create_driver(get_config().browser, resolve_driver_path())
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": RECORDER_JS})
+        FLOWS[flow](driver, base_url, user)
+        return read_log(driver)
+    finally:
+        driver.quit()
+
+
+# --- Scenario building ---
+
+def _json(text):
+    try:
+        return json.loads(text) if text else None
+    except ValueError:
+        return None
+
+
+def _dynamic_values(document, path=()):
+    """(path, value) for strings in a JSON document that look generated (ids, tokens)."""
+    if isinstance(document, dict):
+        for key, value in document.items():
+            yield from _dynamic_values(value, path + (key,))
+    elif isinstance(document, list):
+        for index, value in enumerate(document):
+            yield from _dynamic_values(value, path + (index,))
+    elif (isinstance(document, str) and len(document) >= MIN_CORRELATED_LENGTH
+          and not any(c.isspace() for c in document) and any(c.isdigit() for c in document)):
+        yield path, document
+
+
+def _variable_name(path, taken):
+    key = next((part for part in reversed(path) if isinstance(part, str)), "value")
+    base = re.sub(r"\W+", "_", key).strip("_") or "value"
+    name, n = base, 2
+    while name in taken:
+        name, n = f"{base}_{n}", n + 1
+    return name
+
+
+def _step_name(method, url):
+    return f"{method} {url.replace('${base}', '') or '/'}"
+
+
+def build_scenario(log, user, base_url, name="scenario"):
+    """
+    Turn a recorded HTTP log into a replayable, correlated scenario.
+    Args:
+        log (list): Requests from :func:`record`
+        user (dict): Credentials used while recording
+        base_url (str): Application URL; only requests to its origin are kept
+        name (str): Scenario name
+    Returns:
+        dict: ``name``, ``variables`` and ``steps`` (method, url, headers, body,
+        status, think_ms, extract)
+    """
+    parts = urlsplit(base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    entries = [entry for entry in log if entry["url"].startswith(origin + "/")]
+    literals = [(origin, "${base}"), (user["email"], "${email}"), (user["password"], "${password}")]
+
+    def template(text):
+        if text is None:
+            return None
+        text = text.replace("$", "$$")
+        for value, variable in literals:
+            text = text.replace(value.replace("$", "$$"), variable)
+        return text
+
+    steps = [{"name": "", "method": entry["method"], "url": template(entry["url"]),
+              "headers": {k: template(v) for k, v in entry.get("headers", {}).items()},
+              "body": template(entry.get("body")), "status": entry.get("status"),
+              "think_ms": 0, "extract": {}} for entry in entries]
+    # Correlate: a generated value from an earlier response used in a later request
+    variables = ["base", "email", "password"]
+    for i, entry in enumerate(entries):
+        candidates = sorted(_dynamic_values(_json(entry.get("response"))), key=lambda item: -len(item[1]))
+        for path, value in candidates:
+            placeholder = value.replace("$", "$$")
+            later = steps[i + 1:]
+            if not any(placeholder in text for step in later
+                       for text in [step["url"], step["body"] or ""] + list(step["headers"].values())):
+                continue
+            variable = _variable_name(path, variables)
+            variables.append(variable)
+            steps[i]["extract"][variable] = list(path)
+            for step in later:
+                step["url"] = step["url"].replace(placeholder, "${%s}" % variable)
+                step["body"] = step["body"] and step["body"].replace(placeholder, "${%s}" % variable)
+                step["headers"] = {k: v.replace(placeholder, "${%s}" % variable)
+                                   for k, v in step["headers"].items()}
+    previous_end = None
+    for step, entry in zip(steps, entries):
+        step["name"] = _step_name(step["method"], step["url"])
+        if previous_end is not None:
+            step["think_ms"] = max(0, entry["started"] - previous_end)
+        previous_end = entry["started"] + entry.get("elapsed", 0)
+    return {"name": name, "recorded_from": origin, "variables": variables, "steps": steps}
+
+
+def scenario_path(name_or_path):
+    """A scenario file given a path or the name of a recorded flow."""
+    if name_or_path.endswith(".json"):
+        return name_or_path
+    return str(SCENARIO_DIR / f"{name_or_path}.json")
+
+
+def save_scenario(scenario, path=None):
+    path = path or scenario_path(scenario["name"])
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(scenario, f, indent=2)
+    return path
+
+
+def load_scenario(name_or_path):
+    with open(scenario_path(name_or_path), encoding="utf-8") as f:
+        return json.load(f)
+
+
+# --- Replay ---
+
+def _extract(document, path):
+    for part in path:
+        document = document[part]
+    return document
+
+
+class LoadStats:
+    """Latencies and failures per step, collected by all virtual users."""
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        self.iterations = 0
+        self.failed_iterations = 0
+
+    def observe(self, step, elapsed_ms, error=None):
+        self.latencies.setdefault(step, []).append(elapsed_ms)
+        if error:
+            self.errors.setdefault(step, {}).setdefault(error, 0)
+            self.errors[step][error] += 1
+
+    def report(self, elapsed):
+        """
+        Returns:
+            dict: totals (requests, errors, req/s, iterations/s) and ``steps``
+            (step -> latency summary in ms plus ``errors``)
+        """
+        requests = sum(len(values) for values in self.latencies.values())
+        errors = sum(sum(kinds.values()) for kinds in self.errors.values())
+        steps = {}
+        for step, values in self.latencies.items():
+            steps[step] = summarize(values)
+            steps[step]["errors"] = self.errors.get(step, {})
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "requests": requests,
+            "errors": errors,
+            "error_pct": round(100 * errors / requests, 2) if requests else 0.0,
+            "requests_per_s": round(requests / elapsed, 1) if elapsed else 0.0,
+            "iterations": self.iterations,
+            "failed_iterations": self.failed_iterations,
+            "iterations_per_s": round(self.iterations / elapsed, 2) if elapsed else 0.0,
+            "steps": steps,
+        }
+
+
+async def _iteration(session, scenario, variables, stats, think):
+    for step in scenario["steps"]:
+        if think and step["think_ms"]:
+            await asyncio.sleep(step["think_ms"] * think / 1000)
+        url = Template(step["url"]).safe_substitute(variables)
+        headers = {k: Template(v).safe_substitute(variables) for k, v in step["headers"].items()}
+        body = Template(step["body"]).safe_substitute(variables) if step["body"] is not None else None
+        start = time.perf_counter()
+        try:
+            async with session.request(step["method"], url, headers=headers, data=body) as response:
+                text = await response.text()
+                status = response.status
+        except Exception as e:
+            stats.observe(step["name"], (time.perf_counter() - start) * 1000, type(e).__name__)
+            return False
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if step["status"] and status != step["status"]:
+            stats.observe(step["name"], elapsed_ms, f"HTTP {status}")
+            return False  # later steps depend on this one
+        try:
+            document = _json(text) if step["extract"] else None
+            for variable, path in step["extract"].items():
+                variables[variable] = str(_extract(document, path))
+        except (KeyError, IndexError, TypeError):
+            stats.observe(step["name"], elapsed_ms, "correlation")
+            return False
+        stats.observe(step["name"], elapsed_ms)
+    return True
+
+
+async def _virtual_user(index, scenario, base, users, stats, deadline, iterations, ramp_up, vus, think,
+                        timeout):
+    import aiohttp
+
+    await asyncio.sleep(ramp_up * index / vus)
+    user = users[index % len(users)]
+    done = 0
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout),
+                                     connector=aiohttp.TCPConnector(limit=2)) as session:
+        while time.monotonic() < deadline and (iterations is None or done < iterations):
+            variables = {"base": base, "email": user["email"], "password": user["password"]}
+            if await _iteration(session, scenario, variables, stats, think):
+                stats.iterations += 1
+            else:
+                stats.failed_iterations += 1
+            done += 1
+
+
+def run_load(scenario, target, users, vus=10, duration=30, iterations=None, ramp_up=0, think=0.0,
+             timeout=30):
+    """
+    Replay a scenario with concurrent virtual users.
+    Args:
+        scenario (dict): From :func:`build_scenario`
+        target (str): Target URL; only its origin is used
+        users (list): Credentials (``email``/``password``); virtual user i
+            signs in as ``users[i % len(users)]``
+        vus (int): Concurrent virtual users
+        duration (float): Seconds to run (each user stops after its current iteration)
+        iterations (int): Iterations per user (None: until ``duration``)
+        ramp_up (float): Seconds over which the users are started
+        think (float): Multiplier of the recorded pauses between requests (0: none)
+        timeout (float): Per-request timeout in seconds
+    Returns:
+        dict: See :meth:`LoadStats.report`
+    """
+    parts = urlsplit(target)
+    base = f"{parts.scheme}://{parts.netloc}"
+    stats = LoadStats()
+
+    async def main():
+        deadline = time.monotonic() + (duration if iterations is None else float("inf"))
+        await asyncio.gather(*(_virtual_user(i, scenario, base, users, stats, deadline, iterations, ramp_up,
+                                             vus, think, timeout) for i in range(vus)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return stats.report(time.perf_counter() - start)
+
+
+def print_report(report):
+    print(f"{report['requests']} requests in {report['elapsed_s']}s: {report['requests_per_s']} req/s, "
+          f"{report['iterations']} iterations ({report['iterations_per_s']}/s), "
+          f"{report['errors']} errors ({report['error_pct']}%)")
+    for step, s in report["steps"].items():
+        errors = ", ".join(f"{kind} x{count}" for kind, count in s["errors"].items())
+        print(f"  {step[:60]:60s} n={s['count']:<6d} p50={s['p50']:.1f}ms p90={s['p90']:.1f}ms "
+              f"p99={s['p99']:.1f}ms max={s['max']:.1f}ms" + (f"  [{errors}]" if errors else ""))
+
+
+def main(argv=None):
+    """Record a flow or replay a scenario."""
+    from Tests.test_data import TestData
+
+    parser = argparse.ArgumentParser(description="Replay recorded UI flows as HTTP load")
+    commands = parser.add_subparsers(dest="command", required=True)
+    rec = commands.add_parser("record", help="Drive a flow in the browser and save its scenario")
+    rec.add_argument("flow", choices=list(FLOWS))
+    rec.add_argument("--output", help="Scenario file (default test_logs/load/<flow>.json)")
+    run = commands.add_parser("run", help="Replay a scenario with virtual users")
+    run.add_argument("scenario", help="Recorded flow name or scenario file")
+    run.add_argument("--vus", type=int, default=10, help="Concurrent virtual users")
+    run.add_argument("--duration", type=float, default=30, help="Seconds to run")
+    run.add_argument("--iterations", type=int, help="Iterations per user instead of a duration")
+    run.add_argument("--ramp-up", type=float, default=0, help="Seconds over which users start")
+    run.add_argument("--think", type=float, default=0, help="Multiplier of recorded pauses (1 = as recorded)")
+    run.add_argument("--users", help="JSON file with a list of {email, password} "
+                                     "(default: the test user; one new account per user with --stub)")
+    run.add_argument("--max-error-pct", type=float, default=1.0, help="Exit non-zero above this error rate")
+    run.add_argument("--report", help="Write the report as JSON to this file")
+    for sub in (rec, run):
+        sub.add_argument("--target", default=TestData.BASE_URL, help="Application URL")
+        sub.add_argument("--stub", action="store_true", help="Start the local stub application as the target")
+    args = parser.parse_args(argv)
+
+    stub = None
+    if args.stub:
+        from stub_app.server import StubServer
+
+        stub = StubServer().start()
+        args.target = stub.login_url
+    try:
+        if args.command == "record":
+            user = TestData.VALID_USER
+            log = record(args.flow, args.target, user)
+            scenario = build_scenario(log, user, args.target, args.flow)
+            path = save_scenario(scenario, args.output)
+            print(f"Recorded {len(scenario['steps'])} requests, correlated "
+                  f"{', '.join(scenario['variables'][3:]) or 'nothing'}: {path}")
+            return 0
+        users = [TestData.VALID_USER]
+        if args.users:
+            with open(args.users, encoding="utf-8") as f:
+                users = json.load(f)
+        elif stub:
+            # One account per virtual user so carts and orders do not interfere
+            users = [{"email": f"load.vu{i}@shop.com", "password": TestData.VALID_USER["password"]}
+                     for i in range(args.vus)]
+            for user in users:
+                stub.store.create_user(user["email"], user["password"], "Load User")
+        report = run_load(load_scenario(args.scenario), args.target, users, args.vus, args.duration,
+                          args.iterations, args.ramp_up, args.think)
+    finally:
+        if stub:
+            stub.stop()
+    print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["error_pct"] > args.max_error_pct else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
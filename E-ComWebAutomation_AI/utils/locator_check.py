@@ -0,0 +1,470 @@
+"""Offline page-object locator validation.
+
+Every locator in ``pages/`` is found with ``ast`` (class attributes,
+``Locator(...)`` candidates, ``*_MAP`` XPath tables and inline
+``find_element(By..., "...")`` calls) and checked without a browser:
+
+* syntax: CSS with ``cssselect`` (jQuery-only pseudo-classes such as
+  ``:contains`` are rejected, browsers throw on them), XPath with ``lxml``;
+* names: names a page module uses but never binds (a missing import), and
+  ``self.<attr>`` references that no class in the page hierarchy defines;
+* DOM: each locator is run against snapshots of the screens its page object
+  drives. Snapshots are rendered from the stub application; an
+  ``<screen>.html`` file in ``test_logs/dom_snapshots/`` (e.g. a saved
+  ``driver.page_source`` of the real site) replaces the rendered screen.
+
+Syntax and name problems are errors and stop the pytest run before any
+browser starts; misses are warnings, since some elements (toasts, typeahead
+options) only appear after an interaction.
+
+Usage:
+    python -m utils.locator_check            # report, exit 1 on errors
+    python -m utils.locator_check --strict   # misses count as errors
+    python -m utils.locator_check --write-snapshots
+"""
+import argparse
+import ast
+import builtins
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from utils.run_configs import ARTIFACTS_DIR
+from utils.self_healing import to_query
+from utils.tc_registry import PROJECT_DIR
+
+PAGES_DIR = PROJECT_DIR / "pages"
+SNAPSHOT_DIR = ARTIFACTS_DIR / "dom_snapshots"
+
+# Page object -> screens it drives (a locator passes if any screen matches)
+PAGE_SCREENS = {
+    "BasePage": ("login", "dashboard"),
+    "LoginPage": ("login", "dashboard"),
+    "RegistrationPage": ("login", "register"),
+    "ForgotPasswordPage": ("login", "forgot_password"),
+    "DashboardPage": ("dashboard",),
+    "ProductDetailsPage": ("product_details",),
+    "CartPage": ("cart",),
+    "PaymentPage": ("payment", "thank_you"),
+    "ProfilePage": ("profile", "orders"),
+}
+# Elements that only exist after an interaction; not expected in snapshots
+TRANSIENT = {"BasePage.TOAST_MESSAGE", "ForgotPasswordPage.SUCCESS_TOAST", "PaymentPage.COUNTRY_OPTIONS"}
+BY_NAMES = {
+    "ID": "id", "NAME": "name", "XPATH": "xpath", "CSS_SELECTOR": "css selector",
+    "CLASS_NAME": "class name", "TAG_NAME": "tag name",
+    "LINK_TEXT": "link text", "PARTIAL_LINK_TEXT": "partial link text",
+}
+# Pseudo-classes cssselect accepts but browsers' querySelector rejects
+NON_STANDARD_PSEUDO = {"contains", "eq", "gt", "lt", "first", "last", "even", "odd", "selected", "visible", "hidden"}
+
+
+@dataclass
+class LocatorRef:
+    """One locator (or one candidate of a ``Locator``) found in a page module."""
+    path: str
+    line: int
+    owner: str
+    name: str
+    by: str
+    value: object
+    candidate: int = 0
+
+    @property
+    def where(self):
+        label = self.name if not self.candidate else f"{self.name}[{self.candidate}]"
+        return f"{self.path}:{self.line} {self.owner}.{label}"
+
+
+@dataclass
+class Finding:
+    level: str  # "error" or "warning"
+    where: str
+    message: str
+
+    def __str__(self):
+        return f"{self.level.upper():7} {self.where}: {self.message}"
+
+
+# --- Extraction ---
+
+def _by(node):
+    """Selenium strategy for ``By.X`` or a plain strategy string, else None."""
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "By":
+        return BY_NAMES.get(node.attr)
+    if isinstance(node, ast.Constant) and node.value in ("text", "attributes"):
+        return node.value
+    return None
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return None  # f-string or computed value: checked at run time only
+
+
+def _pair(node):
+    """(by, value) for ``(By.X, "...")``, else None."""
+    if isinstance(node, ast.Tuple) and len(node.elts) == 2:
+        by = _by(node.elts[0])
+        value = _literal(node.elts[1])
+        if by and value is not None:
+            return by, value
+    return None
+
+
+def extract_locators(path, root=PROJECT_DIR):
+    """
+    Locators declared or used in one page module.
+    Args:
+        path (Path): Python file
+    Returns:
+        list: LocatorRef objects
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    rel = Path(path).resolve().relative_to(Path(root).resolve()).as_posix()
+    refs = []
+
+    def add(owner, name, node, by, value, candidate=0):
+        refs.append(LocatorRef(rel, node.lineno, owner, name, by, value, candidate))
+
+    for cls in (n for n in tree.body if isinstance(n, ast.ClassDef)):
+        for stmt in cls.body:
+            if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+                name, value = stmt.targets[0].id, stmt.value
+                pair = _pair(value)
+                if pair:
+                    add(cls.name, name, stmt, *pair)
+                elif isinstance(value, ast.Call) and getattr(value.func, "id", None) == "Locator":
+                    for index, arg in enumerate(value.args):
+                        pair = _pair(arg)
+                        if pair:
+                            add(cls.name, name, arg, *pair, candidate=index)
+                elif isinstance(value, ast.Dict) and name.endswith("_MAP"):
+                    for key, item in zip(value.keys, value.values):
+                        text = _literal(item)
+                        if isinstance(text, str) and text.startswith(("/", "(")):
+                            add(cls.name, f"{name}[{_literal(key)!r}]", item, "xpath", text)
+        for func in (n for n in ast.walk(cls) if isinstance(n, ast.FunctionDef)):
+            for node in ast.walk(func):
+                if isinstance(node, ast.Call) and len(node.args) >= 2 and _by(node.args[0]):
+                    value = _literal(node.args[1])
+                    if value is not None:
+                        add(cls.name, f"{func.name}()", node, _by(node.args[0]), value)
+                elif isinstance(node, ast.Tuple) and _pair(node):
+                    add(cls.name, f"{func.name}()", node, *_pair(node))
+    return refs
+
+
+# --- Syntax ---
+
+def _walk_selector(node):
+    """Yield every parsed-selector node below ``node`` (cssselect classes)."""
+    yield node
+    for value in vars(node).values() if hasattr(node, "__dict__") else ():
+        items = value if isinstance(value, (list, tuple)) else [value]
+        for item in items:
+            if type(item).__module__.startswith("cssselect"):
+                yield from _walk_selector(item)
+
+
+def css_error(selector):
+    """
+    Why a browser would reject ``selector``, or None if it is valid.
+    """
+    from cssselect import parse, GenericTranslator, SelectorError
+    from cssselect.parser import Function, Pseudo
+
+    try:
+        parsed = parse(selector)
+    except SelectorError as e:
+        return f"invalid CSS {selector!r}: {e}"
+    for tree in parsed:
+        for node in _walk_selector(tree.parsed_tree):
+            name = getattr(node, "name", None) if isinstance(node, Function) else \
+                getattr(node, "ident", None) if isinstance(node, Pseudo) else None
+            if name and name.lower() in NON_STANDARD_PSEUDO:
+                return f"':{name}' in {selector!r} is jQuery-only; browsers reject it"
+    try:
+        GenericTranslator().css_to_xpath(selector)
+    except SelectorError as e:
+        if "pseudo" in str(e).lower():
+            return None  # a real pseudo-class lxml cannot emulate (e.g. :hover)
+        return f"unsupported CSS {selector!r}: {e}"
+    return None
+
+
+def xpath_error(expression):
+    from lxml import etree
+
+    try:
+        etree.XPath(expression)
+    except etree.XPathSyntaxError as e:
+        return f"invalid XPath {expression!r}: {e}"
+    return None
+
+
+def syntax_error(by, value):
+    """Syntax problem of one locator, or None."""
+    if by == "css selector":
+        return css_error(value)
+    if by == "xpath":
+        return xpath_error(value)
+    if by == "class name" and len(value.split()) != 1:
+        return f"By.CLASS_NAME takes one class, got {value!r}; use a CSS selector"
+    if by in ("id", "name", "tag name", "link text", "partial link text", "text") and not str(value).strip():
+        return f"empty {by} locator"
+    return None
+
+
+# --- Names ---
+
+def _bound_names(nodes):
+    """Names bound by a list of statements (assignments, imports, defs, loops, ...)."""
+    names = set()
+    for stmt in nodes:
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+                names.add(node.id)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names.add(node.name)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                names.update((a.asname or a.name).split(".")[0] for a in node.names)
+            elif isinstance(node, ast.ExceptHandler) and node.name:
+                names.add(node.name)
+            elif isinstance(node, ast.arg):
+                names.add(node.arg)
+            elif isinstance(node, (ast.Global, ast.Nonlocal)):
+                names.update(node.names)
+    return names
+
+
+def undefined_names(source, filename="<page>"):
+    """
+    Names loaded in ``source`` that nothing binds (module, enclosing
+    function or builtins), e.g. ``EC`` used without its import.
+    Returns:
+        list: (line, name) pairs
+    """
+    tree = ast.parse(source, filename=filename)
+    if any(isinstance(n, ast.ImportFrom) and any(a.name == "*" for a in n.names) for n in ast.walk(tree)):
+        return []  # star import: cannot tell
+    known = _bound_names(tree.body) | set(dir(builtins)) | {"__file__", "__name__", "__doc__"}
+    missing = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load) and node.id not in known:
+            missing.append((node.lineno, node.id))
+    return missing
+
+
+def _class_attributes(classes):
+    """Class name -> attributes defined on it or assigned as ``self.x``."""
+    table = {}
+    for cls in classes:
+        attrs = set()
+        for stmt in cls.body:
+            attrs |= _bound_names([stmt]) if not isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)) \
+                else {stmt.name}
+        for node in ast.walk(cls):
+            if isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Store) \
+                    and isinstance(node.value, ast.Name) and node.value.id == "self":
+                attrs.add(node.attr)
+        table[cls.name] = (attrs, [b.id for b in cls.bases if isinstance(b, ast.Name)])
+    return table
+
+
+def unknown_self_attributes(trees):
+    """
+    ``self.<attr>`` loads that no class in the page hierarchy defines.
+    Args:
+        trees (dict): rel path -> parsed module
+    Returns:
+        list: (rel path, line, class, attr)
+    """
+    classes = {rel: [n for n in tree.body if isinstance(n, ast.ClassDef)] for rel, tree in trees.items()}
+    table = _class_attributes([cls for found in classes.values() for cls in found])
+
+    def resolved(name, seen=()):
+        if name not in table or name in seen:
+            return None  # a base outside pages/ (e.g. object, a library class)
+        attrs, bases = table[name]
+        result = set(attrs)
+        for base in bases:
+            inherited = resolved(base, seen + (name,))
+            if inherited is None and base not in ("object",):
+                return None
+            result |= inherited or set()
+        return result
+
+    missing = []
+    for rel, found in classes.items():
+        for cls in found:
+            attrs = resolved(cls.name)
+            if attrs is None:
+                continue
+            for node in ast.walk(cls):
+                if isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Load) \
+                        and isinstance(node.value, ast.Name) and node.value.id == "self" \
+                        and node.attr not in attrs and not node.attr.startswith("__"):
+                    missing.append((rel, node.lineno, cls.name, node.attr))
+    return missing
+
+
+# --- DOM snapshots ---
+
+def render_snapshots():
+    """
+    Screens of the stub application for a user with a cart, an order and
+    a review, keyed by screen name.
+    Returns:
+        dict: screen -> HTML
+    """
+    from stub_app import views
+    from stub_app.store import StubStore
+
+    store = StubStore()
+    user = store.create_user("snapshot@shop.com", "Snapshot@123", "Snapshot User")
+    products = list(store.products.values())
+    store.add_to_cart(user["_id"], products[0]["_id"])
+    store.record_view(user["_id"], products[0]["_id"])
+    store.add_review(products[0]["_id"], 4, "Great fit", "Snapshot User")
+    store.add_address(user["_id"], {"street": "1 Main St", "city": "Pune", "state": "MH", "zip": "411001",
+                                    "country": "India"})
+    order_ids = store.create_orders(user["_id"], [{"country": "India", "productOrderedId": products[1]["_id"]}])
+
+    def page(body):
+        return f"<html><body>{body}</body></html>"
+
+    return {
+        "login": page(views.login_view()),
+        "register": page(views.register_view()),
+        "forgot_password": page(views.forgot_password_view()),
+        "dashboard": page(views.dashboard_view(store, user, products)),
+        "product_details": page(views.product_details_view(store, user, products[0])),
+        "cart": page(views.cart_view(store, user)),
+        "payment": page(views.payment_view(store, user)),
+        "thank_you": page(views.thank_you_view(store, user, order_ids)),
+        "orders": page(views.orders_view(store, user)),
+        "profile": page(views.profile_view(store, user)),
+    }
+
+
+def load_snapshots(snapshot_dir=SNAPSHOT_DIR):
+    """Rendered screens, replaced or extended by ``<screen>.html`` files in ``snapshot_dir``."""
+    snapshots = render_snapshots()
+    for path in sorted(Path(snapshot_dir).glob("*.html")):
+        snapshots[path.stem] = path.read_text(encoding="utf-8", errors="replace")
+    return snapshots
+
+
+class SnapshotMatcher:
+    """
+    Runs locators against parsed snapshots with lxml; CSS is translated to
+    XPath once per selector.
+    """
+
+    def __init__(self, snapshots):
+        import lxml.html
+
+        self.documents = {screen: lxml.html.document_fromstring(html) for screen, html in snapshots.items()}
+        self._compiled = {}
+
+    def _xpath(self, by, value):
+        key = (by, value if isinstance(value, str) else repr(sorted(value.items())))
+        if key not in self._compiled:
+            from cssselect import HTMLTranslator
+            from lxml import etree
+
+            kind, query = to_query(by, value)
+            if kind == "css":
+                query = HTMLTranslator().css_to_xpath(query)
+            elif query.startswith("./"):
+                query = "." + query[1:] if query.startswith(".//") else ".//" + query[2:]
+            self._compiled[key] = etree.XPath(query)
+        return self._compiled[key]
+
+    def matches(self, by, value, screen):
+        """Number of elements matching in ``screen``."""
+        try:
+            return len(self._xpath(by, value)(self.documents[screen]))
+        except Exception:
+            return 0
+
+
+# --- Check ---
+
+def check(pages_dir=PAGES_DIR, snapshot_dir=SNAPSHOT_DIR, root=PROJECT_DIR):
+    """
+    Validate all page-object locators offline.
+    Returns:
+        list: Finding objects, errors first
+    """
+    findings = []
+    trees, refs = {}, []
+    for path in sorted(Path(pages_dir).rglob("*.py")):
+        rel = path.resolve().relative_to(Path(root).resolve()).as_posix()
+        source = path.read_text(encoding="utf-8")
+        trees[rel] = ast.parse(source, filename=rel)
+        for line, name in undefined_names(source, rel):
+            findings.append(Finding("error", f"{rel}:{line}", f"name '{name}' is not defined (missing import?)"))
+        refs.extend(extract_locators(path, root))
+    for rel, line, owner, attr in unknown_self_attributes(trees):
+        findings.append(Finding("error", f"{rel}:{line} {owner}", f"self.{attr} is not defined on {owner} or its bases"))
+
+    valid = []
+    for ref in refs:
+        problem = syntax_error(ref.by, ref.value)
+        if problem:
+            findings.append(Finding("error", ref.where, problem))
+        else:
+            valid.append(ref)
+
+    matcher = SnapshotMatcher(load_snapshots(snapshot_dir))
+    groups = {}
+    for ref in valid:
+        groups.setdefault((ref.path, ref.owner, ref.name), []).append(ref)
+    for refs_of_locator in groups.values():
+        primary = refs_of_locator[0]
+        screens = [s for s in PAGE_SCREENS.get(primary.owner, ()) if s in matcher.documents]
+        if not screens or f"{primary.owner}.{primary.name}" in TRANSIENT:
+            continue
+        hits = [any(matcher.matches(r.by, r.value, s) for s in screens) for r in refs_of_locator]
+        if not any(hits):
+            findings.append(Finding("warning", primary.where,
+                                    f"{primary.by} {primary.value!r} matches nothing on {', '.join(screens)}"))
+        elif not hits[0] and primary.candidate == 0 and len(refs_of_locator) > 1:
+            winner = refs_of_locator[hits.index(True)]
+            findings.append(Finding("warning", primary.where,
+                                    f"primary misses on {', '.join(screens)}; would heal to "
+                                    f"{winner.by} {winner.value!r}"))
+    return sorted(findings, key=lambda f: (f.level != "error", f.where))
+
+
+def main(argv=None):
+    """Check page-object locators against DOM snapshots."""
+    parser = argparse.ArgumentParser(description="Offline page-object locator validation")
+    parser.add_argument("--strict", action="store_true", help="Treat snapshot misses as errors")
+    parser.add_argument("--snapshots", default=SNAPSHOT_DIR, help="Directory of <screen>.html overrides")
+    parser.add_argument("--write-snapshots", action="store_true",
+                        help="Write the rendered stub screens to the snapshot directory and exit")
+    args = parser.parse_args(argv)
+
+    if args.write_snapshots:
+        target = Path(args.snapshots)
+        target.mkdir(parents=True, exist_ok=True)
+        for screen, html in render_snapshots().items():
+            (target / f"{screen}.html").write_text(html, encoding="utf-8")
+        print(f"Wrote rendered screens to {target}")
+        return 0
+
+    findings = check(snapshot_dir=args.snapshots)
+    for finding in findings:
+        print(finding)
+    errors = sum(f.level == "error" or args.strict for f in findings)
+    print(f"{errors} error(s), {len(findings) - errors} warning(s)")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Cross-process locking for xdist workers.
+
+Workers are separate processes, so shared files (the account pool, caches)
+are guarded with OS-level file locks: ``fcntl.flock`` on POSIX and
+``msvcrt.locking`` on Windows. A lock is released automatically if its
+holder dies.
+"""
+import os
+import time
+from pathlib import Path
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+from utils.run_configs import ARTIFACTS_DIR
+
+LOCKS_DIR = ARTIFACTS_DIR / ".locks"
+
+
+class LockTimeout(TimeoutError):
+    """Raised when a lock is not acquired within its timeout."""
+
+
+class FileLock:
+    """
+    Exclusive inter-process lock backed by a file.
+    Args:
+        path (str|Path): Lock file (created if missing)
+        timeout (float): Seconds to wait; None waits forever
+        poll_interval (float): Seconds between attempts
+    """
+
+    def __init__(self, path, timeout=None, poll_interval=0.05):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    @property
+    def is_locked(self):
+        return self._fd is not None
+
+    def _try_lock(self, fd):
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self):
+        """
+        Block until the lock is held.
+        Raises:
+            LockTimeout: If ``timeout`` expires first
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while not self._try_lock(fd):
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                raise LockTimeout(f"Timed out after {self.timeout}s waiting for {self.path}")
+            time.sleep(self.poll_interval)
+        self._fd = fd
+        return self
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            if os.name == "nt":
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+class ResourceLocks:
+    """
+    Named locks for state shared between tests on different workers.
+    Locks are taken in sorted order so overlapping sets cannot deadlock.
+    Args:
+        names (iterable): Resource names, e.g. ``("cart", "reviews")``
+        timeout (float): Seconds to wait for each lock
+    """
+
+    def __init__(self, names, timeout=300):
+        self.names = sorted(set(names))
+        self.locks = [FileLock(LOCKS_DIR / f"resource_{name}.lock", timeout=timeout)
+                      for name in self.names]
+        self.waited = 0.0
+
+    def acquire(self):
+        start = time.monotonic()
+        acquired = []
+        try:
+            for lock in self.locks:
+                lock.acquire()
+                acquired.append(lock)
+        except LockTimeout:
+            for lock in reversed(acquired):
+                lock.release()
+            raise
+        self.waited = time.monotonic() - start
+        return self
+
+    def release(self):
+        for lock in reversed(self.locks):
+            lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def resource_names(item):
+    """
+    Resources declared by a test item's ``resource`` markers.
+    ``parallel_safe`` on the test function opts it out of locks inherited
+    from its class or module; its own ``resource`` markers still apply.
+    Returns:
+        list: Resource names (empty if the test needs no locks)
+    """
+    own = item.own_markers
+    if any(marker.name == "parallel_safe" for marker in own):
+        markers = [marker for marker in own if marker.name == "resource"]
+    else:
+        markers = item.iter_markers("resource")
+    return [name for marker in markers for name in marker.args]
@@ -33,6 +33,9 @@ firefox_only = pytest.mark.firefox_only
 
 # Custom Markers
 parallel_safe = pytest.mark.parallel_safe
+resource = pytest.mark.resource  # @resource("cart") - serialize across workers
+capability = pytest.mark.capability  # @capability("login") - failures count against login
+requires = pytest.mark.requires  # @requires("checkout") - skipped once checkout is down
 skip_in_ci = pytest.mark.skip_in_ci
 
 # Example usage in test files:
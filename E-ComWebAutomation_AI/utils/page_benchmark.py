@@ -0,0 +1,272 @@
+"""Framework overhead benchmark for page-object primitives.
+
+Each case drives one page-object method repeatedly against the local stub
+application (``stub_app``), so timings reflect the framework and WebDriver
+round trips rather than a remote server. Every WebDriver command is counted;
+a primitive that starts issuing more commands is reported even when the
+wall-clock change is still within tolerance.
+
+Usage:
+    python -m utils.page_benchmark                  # compare with baseline
+    python -m utils.page_benchmark --save-baseline  # record a new baseline
+    python -m utils.page_benchmark --case fill_input --iterations 50
+"""
+import argparse
+import sys
+import time
+
+from utils.benchmark import (summarize, load_baseline, save_baseline,
+                             append_history, compare_to_baseline)
+
+BENCHMARK_NAME = "page_objects"
+VALID_USER = {"email": "test.qa@shop.com", "password": "ValidPassword123!"}
+CART_PRODUCTS = ["6581ca399fd99c85e8ee7f45", "6581cade9fd99c85e8ee7ff5", "6581cb199fd99c85e8ee80d4"]
+
+
+class CommandCounter:
+    """
+    Counts WebDriver round trips by wrapping the driver's command executor.
+    Args:
+        driver (WebDriver): Driver to instrument
+    """
+
+    def __init__(self, driver):
+        self.count = 0
+        executor = driver.command_executor
+        original = executor.execute
+
+        def counting_execute(command, params):
+            self.count += 1
+            return original(command, params)
+
+        executor.execute = counting_execute
+
+    def reset(self):
+        self.count = 0
+
+
+def _open(driver, stub, route, nonce):
+    """Load a fresh copy of the SPA at ``route`` (query string forces a reload)."""
+    driver.get(f"{stub.url}/client/?n={nonce}#{route}")
+
+
+def _sign_in(driver, stub):
+    """Put a session token in localStorage without going through the login form."""
+    token, user = stub.store.login(VALID_USER["email"], VALID_USER["password"])
+    _open(driver, stub, "/auth/login", "signin")
+    driver.execute_script(
+        "localStorage.setItem('token', arguments[0]); localStorage.setItem('userId', arguments[1]);",
+        token, user["_id"])
+    return user
+
+
+# --- Cases: (setup, operation) pairs; setup is untimed and returns the operation's argument ---
+
+def _setup_fill_input(driver, stub, i):
+    from pages.login_page.login import LoginPage
+
+    page = LoginPage(driver)
+    if i == 0:
+        _open(driver, stub, "/auth/login", i)
+        page.wait_and_find_element(page.EMAIL_FIELD)
+    return page
+
+
+def _run_fill_input(page):
+    page.fill_input(page.EMAIL_FIELD, VALID_USER["email"])
+
+
+def _setup_perform_login(driver, stub, i):
+    from pages.login_page.login import LoginPage
+
+    page = LoginPage(driver)
+    _open(driver, stub, "/auth/login", i)
+    page.wait_and_find_element(page.LOGIN_BUTTON)
+    return page
+
+
+def _run_perform_login(page):
+    page.perform_login(VALID_USER["email"], VALID_USER["password"])
+    page.wait_and_find_element(page.DASHBOARD_HEADER)
+
+
+def _setup_product_details(driver, stub, i):
+    from pages.dashboard_page.dashboard_page import DashboardPage
+
+    page = DashboardPage(driver)
+    if i == 0:
+        _sign_in(driver, stub)
+        _open(driver, stub, "/dashboard/dash", i)
+        page.wait_and_find_element(page.PRODUCT_CARDS)
+    return page
+
+
+def _run_product_details(page):
+    page.get_product_details()
+
+
+def _setup_cart_items(driver, stub, i):
+    from pages.cart_page.cart_page import CartPage
+
+    page = CartPage(driver)
+    if i == 0:
+        user = _sign_in(driver, stub)
+        stub.store.clear_cart(user["_id"])
+        for product_id in CART_PRODUCTS:
+            stub.store.add_to_cart(user["_id"], product_id)
+        _open(driver, stub, "/dashboard/cart", i)
+        page.wait_and_find_element(page.CART_ITEMS)
+    return page
+
+
+def _run_cart_items(page):
+    page.get_cart_items()
+
+
+def _setup_profile_details(driver, stub, i):
+    from pages.profile_page.profile_page import ProfilePage
+
+    if i == 0:
+        _sign_in(driver, stub)
+        _open(driver, stub, "/dashboard/profile", i)
+        _setup_profile_details.page = ProfilePage(driver)
+        _setup_profile_details.page.wait_and_find_element(ProfilePage.PROFILE_NAME_INPUT)
+    return _setup_profile_details.page
+
+
+def _run_profile_details(page):
+    page.get_profile_details()
+
+
+def _setup_route_switch(driver, stub, i):
+    from pages.dashboard_page.dashboard_page import DashboardPage
+
+    if i == 0:
+        _sign_in(driver, stub)
+        _open(driver, stub, DashboardPage.ROUTE, i)
+    return DashboardPage(driver).navigate(DashboardPage)
+
+
+def _run_route_switch(page):
+    from pages.cart_page.cart_page import CartPage
+
+    page.navigate(CartPage)
+
+
+CASES = {
+    "fill_input": (_setup_fill_input, _run_fill_input),
+    "perform_login": (_setup_perform_login, _run_perform_login),
+    "get_product_details": (_setup_product_details, _run_product_details),
+    "get_cart_items": (_setup_cart_items, _run_cart_items),
+    "get_profile_details": (_setup_profile_details, _run_profile_details),
+    "route_switch": (_setup_route_switch, _run_route_switch),
+}
+
+
+def measure(driver, stub, case, iterations, warmup=2):
+    """
+    Time one case.
+    Args:
+        driver (WebDriver): Instrumented driver (see :class:`CommandCounter`)
+        stub (StubServer): Running stub application
+        case (str): Key of CASES
+        iterations (int): Timed repetitions
+        warmup (int): Untimed repetitions run first
+    Returns:
+        dict: Latency summary in milliseconds plus ``round_trips`` per call
+    """
+    setup, operation = CASES[case]
+    counter = driver.command_counter
+    timings, round_trips = [], []
+    for i in range(warmup + iterations):
+        target = setup(driver, stub, i)
+        counter.reset()
+        start = time.perf_counter()
+        operation(target)
+        elapsed = (time.perf_counter() - start) * 1000
+        if i >= warmup:
+            timings.append(elapsed)
+            round_trips.append(counter.count)
+    summary = summarize(timings)
+    # Waits poll, so the fewest commands seen is the primitive's intrinsic cost
+    summary["round_trips"] = min(round_trips)
+    return summary
+
+
+def _start_browser():
+    from utils.config import get_config
+    from utils.driver_factory import resolve_driver_path, create_driver
+
+    driver = create_driver(get_config().browser, resolve_driver_path())
+    driver.command_counter = CommandCounter(driver)
+    return driver
+
+
+def main(argv=None):
+    """Run the page-object benchmark and gate on regressions."""
+    from stub_app.server import StubServer, LatencyProfile
+
+    parser = argparse.ArgumentParser(description="Page-object overhead benchmark")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed repetitions per case")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed p50 slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--latency-ms", type=float, default=0,
+                        help="Stub server latency (0 isolates framework overhead)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store this run as the new baseline")
+    parser.add_argument("--case", action="append", choices=list(CASES),
+                        help="Case(s) to run (default: all)")
+    args = parser.parse_args(argv)
+
+    results, errors = {}, {}
+    with StubServer(latency=LatencyProfile(args.latency_ms)) as stub:
+        driver = _start_browser()
+        try:
+            for case in args.case or CASES:
+                try:
+                    results[case] = measure(driver, stub, case, args.iterations)
+                except Exception as e:
+                    errors[case] = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+                    print(f"❌ {case:22s} error - {errors[case]}")
+                    continue
+                s = results[case]
+                print(f"{case:22s} p50={s['p50']:.1f}ms p90={s['p90']:.1f}ms "
+                      f"p99={s['p99']:.1f}ms round_trips={s['round_trips']}")
+        finally:
+            driver.quit()
+    from utils.element_cache import cache_stats
+    for page, counts in sorted(cache_stats().items()):
+        print(f"element cache {page:20s} hit rate {counts['hit_rate']:.0%} "
+              f"({counts['hits']} hits, {counts['misses']} misses, {counts['stale']} stale)")
+    transport = sys.modules.get("utils.transport")
+    if transport is not None:
+        stats = transport.transport_stats()
+        print(f"webdriver transport floor {stats['floor_ms']} ms, "
+              f"{stats['connections']} connection(s), {stats['retries']} retries")
+        for name, counts in sorted(stats["commands"].items(), key=lambda item: -item[1]["count"])[:8]:
+            print(f"  {name:28s} n={counts['count']:<5d} p50 {counts['p50_ms']} ms  "
+                  f"p95 {counts['p95_ms']} ms  max {counts['max_ms']} ms")
+    append_history(BENCHMARK_NAME, results)
+
+    if args.save_baseline:
+        print(f"Baseline saved: {save_baseline(BENCHMARK_NAME, results)}")
+        return 1 if errors else 0
+
+    baseline = load_baseline(BENCHMARK_NAME)
+    if baseline is None:
+        print("No baseline found; run with --save-baseline to create one")
+        return 1 if errors else 0
+
+    slower = compare_to_baseline(results, baseline, args.tolerance)
+    chattier = compare_to_baseline(results, baseline, 0, metric="round_trips")
+    for case, before, after, ratio in slower:
+        print(f"❌ {case}: p50 {before:.1f}ms -> {after:.1f}ms ({ratio:.0%} of baseline)")
+    for case, before, after, _ in chattier:
+        print(f"❌ {case}: {before} -> {after} WebDriver round trips")
+    if not (slower or chattier or errors):
+        print("✓ Page-object primitives within tolerance of baseline")
+    return 1 if (slower or chattier or errors) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""Concurrent execution of several run configurations.
+
+Each configuration from ``utils.run_configs.CONFIGS`` runs as its own pytest
+process, all started together. They share one browser budget: every xdist
+worker drives one Chrome, so ``-n`` is rewritten per configuration to keep
+the total within the budget. When a gating configuration fails, the others
+are cancelled. A merged summary is built from each configuration's JUnit XML.
+"""
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from utils.run_configs import CONFIGS
+
+# xdist options that set the worker count; the browser budget decides it
+WORKER_OPTIONS = ("-n", "--numprocesses")
+# Each configuration gets its own process group, so cancelling it also stops
+# its xdist workers, browsers and drivers
+if os.name == "nt":
+    PROCESS_GROUP = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    PROCESS_GROUP = {"start_new_session": True}
+
+
+def _option_value(args, option):
+    """Return the value of ``option`` in a pytest argument list, or None."""
+    for i, arg in enumerate(args):
+        if arg == option and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith(option + "="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def worker_options(args):
+    """
+    Arguments that set the xdist worker count (``-n 4``, ``-n4``, ``-n=4``,
+    ``--numprocesses 4``), with their values.
+    Returns:
+        list: Offending arguments, empty if there are none
+    """
+    found, args = [], list(args or [])
+    for i, arg in enumerate(args):
+        if arg in WORKER_OPTIONS:
+            found.extend(args[i:i + 2])
+        elif arg.startswith("--numprocesses=") or (arg.startswith("-n") and not arg.startswith("--")):
+            found.append(arg)
+    return found
+
+
+def _replace_option(args, option, value):
+    """Return ``args`` with ``option`` set to ``value`` (appended if absent)."""
+    result, i, replaced = [], 0, False
+    while i < len(args):
+        arg = args[i]
+        if arg == option:
+            result.extend([option, value])
+            replaced = True
+            i += 2
+            continue
+        if arg.startswith(option + "="):
+            result.append(f"{option}={value}")
+            replaced = True
+        else:
+            result.append(arg)
+        i += 1
+    if not replaced:
+        result.extend([option, value])
+    return result
+
+
+def allocate_browsers(config_names, budget):
+    """
+    Split the browser budget between configurations.
+    pytest.ini adds ``-n auto`` to every run, so each configuration gets an
+    explicit worker count; debug-style configurations (``--pdb``) run in a
+    single process and the rest share what is left equally (at least one).
+    Args:
+        config_names (list): Configurations in the pipeline
+        budget (int): Maximum number of concurrent browsers
+    Returns:
+        dict: Configuration name -> number of browsers
+    """
+    serial = [n for n in config_names if "--pdb" in CONFIGS[n]["pytest_args"]]
+    parallel = [n for n in config_names if n not in serial]
+    allocation = {n: 1 for n in serial}
+    if parallel:
+        remaining = max(budget - len(serial), len(parallel))
+        share, extra = divmod(remaining, len(parallel))
+        for i, name in enumerate(parallel):
+            allocation[name] = share + (1 if i < extra else 0)
+    return allocation
+
+
+def build_commands(config_names, budget, run_dir, additional_args=None):
+    """
+    Build the pytest command for each configuration.
+    Tests selected by an earlier configuration's ``-m`` expression are
+    excluded from later ones, so e.g. regression does not re-run smoke tests.
+    Returns:
+        dict: Configuration name -> (command, env, junit_path)
+    Raises:
+        ValueError: If ``additional_args`` set the worker count, which would
+            override the budget's ``-n``
+    """
+    overrides = worker_options(additional_args)
+    if overrides:
+        raise ValueError(f"{' '.join(overrides)}: the browser budget sets each configuration's "
+                         "worker count; use --browsers instead")
+    allocation = allocate_browsers(config_names, budget)
+    commands = {}
+    earlier_markers = []
+    for name in config_names:
+        config = CONFIGS[name]
+        args = list(config["pytest_args"])
+        workers = allocation[name]
+        args = _replace_option(args, "-n", str(workers) if workers > 1 else "0")
+
+        marker = _option_value(args, "-m")
+        if earlier_markers:
+            exclusion = " and ".join(f"not ({m})" for m in earlier_markers)
+            args = _replace_option(args, "-m", f"({marker}) and {exclusion}" if marker else exclusion)
+        if marker:
+            earlier_markers.append(marker)
+
+        junit_path = _option_value(args, "--junitxml")
+        if not junit_path:
+            junit_path = str(run_dir / f"{name}_junit.xml")
+            args.append(f"--junitxml={junit_path}")
+
+        env = dict(os.environ)
+        env.update({key: str(value) for key, value in config["env_vars"].items()})
+        cmd = [sys.executable, "-m", "pytest", *args, *(additional_args or [])]
+        commands[name] = (cmd, env, junit_path)
+    return commands
+
+
+def parse_junit(junit_path):
+    """
+    Read totals from a JUnit XML report.
+    Returns:
+        dict: tests, failures, errors, skipped and time (zeros if missing)
+    """
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
+    if not os.path.exists(junit_path):
+        return totals
+    root = ET.parse(junit_path).getroot()
+    suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+    for suite in suites:
+        for key in ("tests", "failures", "errors", "skipped"):
+            totals[key] += int(suite.get(key, 0))
+        totals["time"] += float(suite.get("time", 0))
+    return totals
+
+
+def _signal_group(proc, sig):
+    try:
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass  # every process of the group has exited
+
+
+def _terminate(proc, grace_seconds=10):
+    """Stop ``proc`` and everything it started (xdist workers, browsers, drivers)."""
+    if os.name == "nt":
+        proc.send_signal(signal.CTRL_BREAK_EVENT)
+        try:
+            proc.wait(timeout=grace_seconds)
+        except subprocess.TimeoutExpired:
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True)
+        proc.wait()
+        return
+    _signal_group(proc, signal.SIGTERM)
+    try:
+        proc.wait(timeout=grace_seconds)
+    except subprocess.TimeoutExpired:
+        pass
+    # Also reaches children that outlived pytest itself
+    _signal_group(proc, signal.SIGKILL)
+    proc.wait()
+
+
+def run_pipeline(config_names, budget, gate, run_dir, additional_args=None, poll_interval=1.0):
+    """
+    Run configurations concurrently under a shared browser budget.
+    Args:
+        config_names (list): Configurations to run
+        budget (int): Maximum number of concurrent browsers
+        gate (list): Configurations whose failure cancels the rest
+        run_dir (Path): Directory for per-configuration logs and reports
+        additional_args (list): Extra pytest arguments for every configuration
+        poll_interval (float): Seconds between process status checks
+    Returns:
+        tuple: (exit code, summary dict)
+    """
+    run_dir = Path(run_dir)
+    commands = build_commands(config_names, budget, run_dir, additional_args)
+    allocation = allocate_browsers(config_names, budget)
+
+    processes, statuses, started = {}, {}, {}
+    for name, (cmd, env, _) in commands.items():
+        log_file = open(run_dir / f"{name}.log", "w")
+        print(f"▶ {name}: {allocation[name]} browser(s) - {' '.join(cmd)}")
+        started[name] = time.time()
+        processes[name] = (subprocess.Popen(cmd, env=env, stdout=log_file, stderr=subprocess.STDOUT,
+                                            **PROCESS_GROUP), log_file)
+
+    try:
+        while len(statuses) < len(processes):
+            time.sleep(poll_interval)
+            for name, (proc, log_file) in processes.items():
+                if name in statuses or proc.poll() is None:
+                    continue
+                log_file.close()
+                statuses[name] = "passed" if proc.returncode == 0 else f"failed ({proc.returncode})"
+                print(f"■ {name}: {statuses[name]} after {time.time() - started[name]:.0f}s")
+
+                if proc.returncode != 0 and name in gate:
+                    for other, (other_proc, other_log) in processes.items():
+                        if other not in statuses and other_proc.poll() is None:
+                            _terminate(other_proc)
+                            other_log.close()
+                            statuses[other] = f"cancelled (gate '{name}' failed)"
+                            print(f"✕ {other}: {statuses[other]}")
+    except KeyboardInterrupt:
+        for name, (proc, log_file) in processes.items():
+            if name not in statuses:
+                _terminate(proc)
+                log_file.close()
+                statuses[name] = "interrupted"
+        raise
+
+    summary = {"configs": {}, "totals": {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}}
+    for name in config_names:
+        totals = parse_junit(commands[name][2])
+        summary["configs"][name] = {"status": statuses[name], "browsers": allocation[name], **totals}
+        for key in summary["totals"]:
+            summary["totals"][key] += totals[key]
+    with open(run_dir / "pipeline_summary.json", "w") as f:
+        json.dump(summary, f, indent=2)
+
+    exit_code = 0
+    for name in config_names:
+        returncode = processes[name][0].returncode
+        if returncode:
+            exit_code = returncode
+            break
+    return exit_code, summary
+
+
+def print_summary(summary):
+    """Print the merged pipeline summary."""
+    print("\n=== Pipeline Summary ===")
+    print(f"{'Config':<14}{'Status':<34}{'Tests':>7}{'Fail':>6}{'Err':>6}{'Skip':>6}{'Time':>9}")
+    for name, result in summary["configs"].items():
+        print(f"{name:<14}{result['status']:<34}{result['tests']:>7}{result['failures']:>6}"
+              f"{result['errors']:>6}{result['skipped']:>6}{result['time']:>8.1f}s")
+    totals = summary["totals"]
+    print(f"{'TOTAL':<48}{totals['tests']:>7}{totals['failures']:>6}{totals['errors']:>6}{totals['skipped']:>6}")
+    print("========================\n")
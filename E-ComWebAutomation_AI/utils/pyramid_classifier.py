@@ -0,0 +1,376 @@
+"""Offline test-pyramid classifier (Unit / Integration / E2E).
+
+Test-case records are turned into TF-IDF vectors with NumPy and classified
+by a small softmax (multinomial logistic regression) model trained on the
+hand-labelled ``classifyTestCaseAccordingToTestPyramid.xlsx``. Every record of
+an input workbook is vectorised and classified in one batched matrix pass;
+the predicted layer is streamed into a write-only output workbook next to the
+original columns.
+
+The trained model and feature matrices are cached in
+``test_logs/.cache/pyramid/``, keyed by content hashes, so unchanged inputs
+are neither re-trained nor re-vectorised.
+
+Usage:
+    python -m utils.pyramid_classifier                          # classify the functional catalog
+    python -m utils.pyramid_classifier cases.xlsx -o out.xlsx
+    python -m utils.pyramid_classifier --evaluate               # cross-validated accuracy vs. majority class
+"""
+import argparse
+import hashlib
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from utils.run_configs import ARTIFACTS_DIR
+from utils.testcase_generator import COLUMNS, WORKBOOK_FILE, _clean
+from utils.tc_registry import PROJECT_DIR, TC_ID_PATTERN
+
+TRAINING_FILE = PROJECT_DIR.parent / "classifyTestCaseAccordingToTestPyramid.xlsx"
+CACHE_DIR = ARTIFACTS_DIR / ".cache" / "pyramid"
+OUTPUT_FILE = ARTIFACTS_DIR / "pyramid_predictions.xlsx"
+MODEL_VERSION = 2
+# Rows vectorised per block, bounding the (rows x vocabulary) count buffer
+TRANSFORM_CHUNK_ROWS = 1024
+# Cap on a class's loss weight; plain inverse frequency lets a handful of
+# rare rows dominate the fit
+MAX_CLASS_WEIGHT = 2.0
+
+FIELDS = {**COLUMNS, "module": "module", "pyramid layer": "layer"}
+# Steps and data describe UI actions for every layer; the title and the
+# expected result say what is checked (API response, page, calculation)
+TEXT_FIELDS = ("title", "expected")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Section rows in the labelled workbook use "---" as the layer
+PLACEHOLDER_LABELS = {"", "-", "---"}
+
+
+# --- Records ---
+
+def iter_records(path):
+    """
+    Stream records from the first sheet of a workbook (read-only mode).
+    Yields:
+        tuple: (original row values, record dict with TEXT_FIELDS and ``layer``)
+    """
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [_clean(c).lower() for c in next(rows, ())]
+        for cells in rows:
+            if not any(c is not None for c in cells):
+                continue
+            record = {}
+            for name, value in zip(header, cells):
+                field = FIELDS.get(name)
+                if field and field not in record:
+                    record[field] = _clean(value)
+            yield cells, record
+    finally:
+        workbook.close()
+
+
+def read_header(path):
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    try:
+        return [c for c in next(workbook.worksheets[0].iter_rows(values_only=True), ())]
+    finally:
+        workbook.close()
+
+
+def record_text(record):
+    return " ".join(record.get(field, "") for field in TEXT_FIELDS)
+
+
+def tokenize(text):
+    """Lower-case word unigrams plus bigrams."""
+    words = TOKEN_PATTERN.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def _digest(*parts):
+    sha = hashlib.sha1()
+    for part in parts:
+        sha.update(part.encode("utf-8") if isinstance(part, str) else part)
+        sha.update(b"\0")
+    return sha.hexdigest()[:16]
+
+
+# --- Features ---
+
+class TfidfVectorizer:
+    """
+    TF-IDF with a fixed vocabulary, producing dense L2-normalised rows.
+    Args:
+        vocabulary (list): Terms, in column order
+        idf (ndarray): Inverse document frequency per term
+    """
+
+    def __init__(self, vocabulary, idf):
+        self.vocabulary = list(vocabulary)
+        self.index = {term: i for i, term in enumerate(self.vocabulary)}
+        self.idf = np.asarray(idf, dtype=np.float32)
+
+    @classmethod
+    def fit(cls, texts, min_df=1, max_features=5000):
+        """
+        Learn the vocabulary and smoothed IDF from training texts.
+        Returns:
+            TfidfVectorizer: Fitted vectorizer
+        """
+        df = {}
+        for text in texts:
+            for term in set(tokenize(text)):
+                df[term] = df.get(term, 0) + 1
+        terms = sorted((t for t, n in df.items() if n >= min_df), key=lambda t: (-df[t], t))[:max_features]
+        terms.sort()
+        counts = np.array([df[t] for t in terms], dtype=np.float32)
+        idf = np.log((1 + len(texts)) / (1 + counts)) + 1
+        return cls(terms, idf)
+
+    def transform(self, texts):
+        """
+        Vectorise a batch of texts, ``TRANSFORM_CHUNK_ROWS`` rows at a time
+        straight into the float32 result.
+        Returns:
+            ndarray: (len(texts), len(vocabulary)) float32 matrix
+        """
+        width = len(self.vocabulary)
+        matrix = np.zeros((len(texts), width), dtype=np.float32)
+        for start in range(0, len(texts), TRANSFORM_CHUNK_ROWS):
+            chunk = texts[start:start + TRANSFORM_CHUNK_ROWS]
+            rows, cols = [], []
+            for row, text in enumerate(chunk):
+                ids = [self.index[t] for t in tokenize(text) if t in self.index]
+                rows.extend([row] * len(ids))
+                cols.extend(ids)
+            flat = np.asarray(rows, dtype=np.int64) * width + np.asarray(cols, dtype=np.int64)
+            block = matrix[start:start + len(chunk)]
+            block[:] = np.bincount(flat, minlength=len(chunk) * width).reshape(len(chunk), width)
+            np.log1p(block, out=block)
+            block *= self.idf
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            block /= np.where(norms == 0, 1, norms)
+        return matrix
+
+
+# --- Model ---
+
+class PyramidClassifier:
+    """
+    Softmax regression over TF-IDF features.
+    Args:
+        vectorizer (TfidfVectorizer): Feature extractor
+        classes (list): Layer names, in output order
+        weights (ndarray): (features, classes) weight matrix
+        bias (ndarray): (classes,) bias vector
+    """
+
+    def __init__(self, vectorizer, classes, weights, bias):
+        self.vectorizer = vectorizer
+        self.classes = list(classes)
+        self.weights = weights
+        self.bias = bias
+        self.key = _digest(str(MODEL_VERSION), *vectorizer.vocabulary, *self.classes,
+                           weights.tobytes(), bias.tobytes())
+
+    @classmethod
+    def train(cls, texts, labels, epochs=300, learning_rate=0.5, l2=1e-2):
+        """
+        Fit the model with full-batch gradient descent.
+        Args:
+            texts (list): Training documents
+            labels (list): Layer per document
+            epochs (int): Gradient steps
+            learning_rate (float): Step size
+            l2 (float): Weight decay
+        Returns:
+            PyramidClassifier: Trained model
+        """
+        vectorizer = TfidfVectorizer.fit(texts)
+        features = vectorizer.transform(texts)
+        classes = sorted(set(labels))
+        targets = np.zeros((len(labels), len(classes)), dtype=np.float32)
+        targets[np.arange(len(labels)), [classes.index(label) for label in labels]] = 1
+
+        # Smoothed (square root) inverse-frequency weights, capped, so the rare
+        # "Unit" rows count without outweighing everything else
+        class_weight = np.minimum(np.sqrt(len(labels) / (len(classes) * targets.sum(axis=0))), MAX_CLASS_WEIGHT)
+        sample_weight = (targets @ class_weight)[:, None]
+
+        weights = np.zeros((features.shape[1], len(classes)), dtype=np.float32)
+        bias = np.zeros(len(classes), dtype=np.float32)
+        for _ in range(epochs):
+            error = (_softmax(features @ weights + bias) - targets) * sample_weight / len(labels)
+            weights -= learning_rate * (features.T @ error + l2 * weights)
+            bias -= learning_rate * error.sum(axis=0)
+        return cls(vectorizer, classes, weights, bias)
+
+    def predict_proba(self, features):
+        return _softmax(features @ self.weights + self.bias)
+
+    def predict(self, features):
+        """
+        Returns:
+            tuple: (list of layer names, ndarray of confidences)
+        """
+        probabilities = self.predict_proba(features)
+        best = probabilities.argmax(axis=1)
+        return [self.classes[i] for i in best], probabilities[np.arange(len(best)), best]
+
+    def save(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(f, vocabulary=np.array(self.vectorizer.vocabulary, dtype=object),
+                     idf=self.vectorizer.idf, classes=np.array(self.classes),
+                     weights=self.weights, bias=self.bias)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path, allow_pickle=True)
+        vectorizer = TfidfVectorizer(data["vocabulary"].tolist(), data["idf"])
+        return cls(vectorizer, data["classes"].tolist(), data["weights"], data["bias"])
+
+
+def _softmax(logits):
+    shifted = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return shifted / shifted.sum(axis=1, keepdims=True)
+
+
+def labelled_records(path=TRAINING_FILE):
+    """
+    Returns:
+        tuple: (texts, labels) for rows with a real layer
+    """
+    texts, labels = [], []
+    for _, record in iter_records(path):
+        layer = record.get("layer", "")
+        if layer not in PLACEHOLDER_LABELS:
+            texts.append(record_text(record))
+            labels.append(layer)
+    return texts, labels
+
+
+def load_model(training_file=TRAINING_FILE, cache_dir=CACHE_DIR):
+    """
+    Train on the labelled workbook, or reuse the cached model for it.
+    Returns:
+        PyramidClassifier: Trained model
+    """
+    texts, labels = labelled_records(training_file)
+    if not texts:
+        raise ValueError(f"No labelled rows in {training_file}")
+    path = Path(cache_dir) / f"model-{_digest(str(MODEL_VERSION), *texts, *labels)}.npz"
+    if path.exists():
+        return PyramidClassifier.load(path)
+    model = PyramidClassifier.train(texts, labels)
+    model.save(path)
+    return model
+
+
+def cached_features(model, texts, cache_dir=CACHE_DIR):
+    """
+    Feature matrix for ``texts``, reused from disk when the model and texts
+    are unchanged.
+    Returns:
+        ndarray: TF-IDF matrix
+    """
+    path = Path(cache_dir) / f"features-{_digest(model.key, *texts)}.npy"
+    if path.exists():
+        return np.load(path)
+    features = model.vectorizer.transform(texts)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        np.save(f, features)
+    return features
+
+
+def classify_workbook(model, input_file, output_file, cache_dir=CACHE_DIR):
+    """
+    Classify every row of ``input_file`` and stream the result to ``output_file``.
+    Returns:
+        dict: Layer -> number of rows predicted
+    """
+    import openpyxl
+
+    # Rows without a TC ID (section headings) are copied through unclassified
+    texts = [record_text(record) for _, record in iter_records(input_file)
+             if TC_ID_PATTERN.fullmatch(record.get("id", ""))]
+    layers, confidence = model.predict(cached_features(model, texts, cache_dir))
+
+    output = openpyxl.Workbook(write_only=True)
+    sheet = output.create_sheet("Predictions")
+    sheet.append(read_header(input_file) + ["Predicted Layer", "Confidence"])
+    predictions = zip(layers, confidence)
+    for cells, record in iter_records(input_file):
+        if TC_ID_PATTERN.fullmatch(record.get("id", "")):
+            layer, score = next(predictions)
+            sheet.append(list(cells) + [layer, round(float(score), 3)])
+        else:
+            sheet.append(list(cells))
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    output.save(output_file)
+
+    counts = {}
+    for layer in layers:
+        counts[layer] = counts.get(layer, 0) + 1
+    return counts
+
+
+def cross_validate(training_file=TRAINING_FILE, folds=5, repeats=10, seed=0):
+    """
+    Repeated k-fold accuracy of the classifier on the labelled workbook, next
+    to the accuracy of always predicting the fold's most common training
+    layer. With a few dozen rows a single split is too noisy to compare.
+    Returns:
+        tuple: (model accuracy, majority-class accuracy), means over all folds
+    """
+    texts, labels = labelled_records(training_file)
+    rng = np.random.default_rng(seed)
+    scores, baseline = [], []
+    for _ in range(repeats):
+        order = rng.permutation(len(texts))
+        for fold in np.array_split(order, min(folds, len(texts))):
+            held_out = set(fold.tolist())
+            train = [i for i in order if i not in held_out]
+            train_labels = [labels[i] for i in train]
+            model = PyramidClassifier.train([texts[i] for i in train], train_labels)
+            predicted, _ = model.predict(model.vectorizer.transform([texts[i] for i in fold]))
+            majority = max(sorted(set(train_labels)), key=train_labels.count)
+            scores.append(np.mean([p == labels[i] for p, i in zip(predicted, fold)]))
+            baseline.append(np.mean([labels[i] == majority for i in fold]))
+    return float(np.mean(scores)), float(np.mean(baseline))
+
+
+def main(argv=None):
+    """Classify test cases into pyramid layers."""
+    parser = argparse.ArgumentParser(description="Offline test-pyramid classifier")
+    parser.add_argument("input", nargs="?", default=WORKBOOK_FILE, help="Workbook of test cases")
+    parser.add_argument("-o", "--output", default=OUTPUT_FILE, help="Workbook to write predictions to")
+    parser.add_argument("--training", default=TRAINING_FILE, help="Labelled workbook")
+    parser.add_argument("--evaluate", action="store_true", help="Print cross-validated accuracy and exit")
+    args = parser.parse_args(argv)
+
+    if args.evaluate:
+        accuracy, majority = cross_validate(args.training)
+        print(f"Cross-validated accuracy: {accuracy:.1%} (majority-class baseline {majority:.1%})")
+        if accuracy <= majority:
+            print("The model does not beat always predicting the most common layer; "
+                  "label more rows before relying on its predictions")
+        return 0
+
+    model = load_model(args.training)
+    counts = classify_workbook(model, args.input, args.output)
+    summary = ", ".join(f"{layer}: {n}" for layer, n in sorted(counts.items()))
+    print(f"Classified {sum(counts.values())} test case(s) -> {args.output} ({summary})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -60,6 +60,23 @@ def create_excel_report(results, run_dir, timestamp):
     wb.save(report_path)
     return report_path
 
+def worker_artifact_path(config, name, ext="json"):
+    """
+    Path of this process's file in the run's artifacts directory (created).
+    xdist workers share the run directory, so their worker id is appended.
+    Args:
+        config: pytest config carrying ``_run_dir``
+        name (str): File name without suffix, e.g. "element_cache"
+        ext (str): File extension
+    Returns:
+        str: ``<run_dir>/artifacts/<name>[_<workerid>].<ext>``
+    """
+    workerinput = getattr(config, "workerinput", None)
+    suffix = f"_{workerinput['workerid']}" if workerinput else ""
+    artifacts_dir = os.path.join(config._run_dir, "artifacts")
+    os.makedirs(artifacts_dir, exist_ok=True)
+    return os.path.join(artifacts_dir, f"{name}{suffix}.{ext}")
+
 def cleanup_old_reports(reports_dir, max_age_days=7):
     """
     Clean up old test reports to manage disk space.
@@ -24,7 +24,7 @@ CONFIGS = {
         "pytest_args": [
             "-v",
             "-n", "auto",
-            "--dist=loadfile",
+            "--dist=load",
             "-m", "not slow",
             "--html=test_logs/regression_test_report.html",
         ],
@@ -38,7 +38,7 @@ CONFIGS = {
         "pytest_args": [
             "-v",
             "-n", "auto",
-            "--dist=loadfile",
+            "--dist=load",
             "--html=test_logs/parallel_test_report.html",
         ],
         "env_vars": {
@@ -60,12 +60,28 @@ CONFIGS = {
             "TEST_BROWSER": "chrome"
         }
     },
+    "offline": {
+        "description": "Full suite against the local stub application",
+        "pytest_args": [
+            "-v",
+            "-n", "auto",
+            "--dist=load",
+            "--html=test_logs/offline_test_report.html",
+        ],
+        "env_vars": {
+            "TEST_ENV": "qa",
+            "TEST_HEADLESS": "true",
+            "TEST_STUB_SERVER": "true",
+            "TEST_STUB_LATENCY_MS": "20",
+            "TEST_STUB_JITTER_MS": "10"
+        }
+    },
     "ci": {
         "description": "CI pipeline test execution",
         "pytest_args": [
             "-v",
             "-n", "auto",
-            "--dist=loadfile",
+            "--dist=load",
             "--html=test_logs/ci_test_report.html",
             "--junitxml=test_logs/junit_report.xml",
         ],
@@ -75,4 +91,14 @@ CONFIGS = {
             "TEST_RERUNS": "2"
         }
     }
-}
\ No newline at end of file
+}
+
+# Pipelines run several configurations concurrently (run_tests.py pipeline).
+# "gate" configs cancel the rest of the pipeline when they fail.
+PIPELINES = {
+    "ci": {
+        "description": "Smoke gate with regression started alongside it",
+        "configs": ["smoke", "regression"],
+        "gate": ["smoke"]
+    }
+}
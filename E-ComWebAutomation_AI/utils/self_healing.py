@@ -0,0 +1,231 @@
+"""Self-healing locators for page objects.
+
+A ``Locator`` is a Selenium ``(by, value)`` tuple for its primary candidate,
+so it works anywhere a plain locator does, and carries ranked fallbacks:
+
+    CVV_INPUT = Locator(
+        (By.XPATH, "//div[@class='title'][contains(., 'CVV')]/following-sibling::input"),
+        (By.CSS_SELECTOR, ".form__cc .row:nth-child(2) .field:last-child input"),
+        ("text", "CVV Code"),                            # exact visible text
+        ("attributes", {"name": "cvv"}),                 # attribute match
+    )
+
+``BasePage`` resolves a ``Locator`` with one script per poll that evaluates
+every candidate in the browser and returns the first that matches, so a
+broken primary costs nothing beyond the poll that finds the fallback. The
+candidate that won is remembered per page-object attribute in
+``test_logs/.cache/locators.json``; later runs try it first. Resolutions by a
+fallback are reported as healed (Excel report, ``healed_locators`` user
+property, run log).
+"""
+import hashlib
+import json
+import os
+
+from utils.locks import FileLock, LOCKS_DIR
+from utils.run_configs import ARTIFACTS_DIR
+
+CACHE_FILE = ARTIFACTS_DIR / ".cache" / "locators.json"
+
+# Selenium ``By`` values, kept as strings so this module does not import selenium
+CSS, XPATH = "css selector", "xpath"
+
+# Evaluate candidates in order; return the index of the first one that matches
+# and its elements. Candidates the browser cannot parse are skipped.
+RESOLVE_SCRIPT = """/* read-only */
+var candidates = arguments[0], root = arguments[1] || document;
+for (var i = 0; i < candidates.length; i++) {
+  var kind = candidates[i][0], query = candidates[i][1], found = [];
+  try {
+    if (kind === 'css') {
+      found = Array.prototype.slice.call(root.querySelectorAll(query));
+    } else {
+      var result = document.evaluate(query, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      for (var j = 0; j < result.snapshotLength; j++) { found.push(result.snapshotItem(j)); }
+    }
+  } catch (e) {
+    continue;
+  }
+  if (found.length) { return [i, found]; }
+}
+return [-1, []];
+"""
+
+
+def _xpath_literal(text):
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in text.split("'")) + ")"
+
+
+def _css_string(text):
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def to_query(by, value):
+    """
+    Browser-side form of one candidate.
+    Args:
+        by (str): Selenium ``By`` value, ``"text"`` or ``"attributes"``
+        value (str|dict): Selector, visible text, or attribute -> value map
+    Returns:
+        tuple: ("css" | "xpath", query)
+    """
+    if by == CSS:
+        return "css", value
+    if by == XPATH:
+        return "xpath", value
+    if by == "id":
+        return "css", f"[id={_css_string(value)}]"
+    if by == "name":
+        return "css", f"[name={_css_string(value)}]"
+    if by == "class name":
+        return "css", "." + ".".join(value.split())
+    if by == "tag name":
+        return "css", value
+    if by == "link text":
+        return "xpath", f"//a[normalize-space()={_xpath_literal(value)}]"
+    if by == "partial link text":
+        return "xpath", f"//a[contains(., {_xpath_literal(value)})]"
+    if by == "text":
+        # Innermost element whose own text is exactly ``value``
+        return "xpath", f"//*[text()[normalize-space()={_xpath_literal(value)}]]"
+    if by == "attributes":
+        return "css", "".join(f"[{name}={_css_string(str(val))}]" for name, val in value.items())
+    raise ValueError(f"Unknown locator strategy {by!r}")
+
+
+def describe(candidate):
+    by, value = candidate
+    if isinstance(value, dict):
+        value = ", ".join(f"{k}={v}" for k, v in value.items())
+    return f"{by}: {value}"
+
+
+class Locator(tuple):
+    """
+    Primary ``(by, value)`` plus ranked fallback candidates.
+    The name is taken from the page-object attribute it is assigned to
+    (``CartPage.ITEM_PRICE``) and keys the persisted winner.
+    Args:
+        *candidates: ``(by, value)`` pairs, best first
+    """
+
+    def __new__(cls, *candidates):
+        if not candidates:
+            raise ValueError("Locator needs at least one candidate")
+        candidates = tuple((by, value) for by, value in candidates)
+        self = super().__new__(cls, candidates[0])
+        self.candidates = candidates
+        self.queries = tuple(to_query(by, value) for by, value in candidates)
+        self.key = describe(candidates[0])
+        return self
+
+    def __set_name__(self, owner, name):
+        self.key = f"{owner.__name__}.{name}"
+
+    def __reduce__(self):
+        return (type(self), self.candidates)
+
+    @property
+    def fingerprint(self):
+        """Changes whenever the candidate list does, invalidating the stored winner."""
+        return hashlib.sha1(json.dumps(self.queries).encode("utf-8")).hexdigest()[:12]
+
+    def scoped(self):
+        """Queries for a search below an element (XPath made relative)."""
+        return tuple((kind, "." + query if kind == "xpath" and query.startswith("/") else query)
+                     for kind, query in self.queries)
+
+
+class HealingCache:
+    """
+    Winning candidate per locator, shared by workers and later runs.
+    Read once per process; written (under a file lock, merged with what
+    other workers wrote) only when a winner changes.
+    Args:
+        path (Path): JSON file
+    """
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.lock = FileLock(LOCKS_DIR / "locators.lock", timeout=30)
+        self._winners = None
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def winner(self, locator):
+        """
+        Index of the candidate that last matched, or 0.
+        """
+        if self._winners is None:
+            self._winners = self._read()
+        entry = self._winners.get(locator.key)
+        if entry and entry.get("fingerprint") == locator.fingerprint:
+            return entry["index"]
+        return 0
+
+    def remember(self, locator, index):
+        if self.winner(locator) == index:
+            return
+        entry = {"fingerprint": locator.fingerprint, "index": index,
+                 "candidate": describe(locator.candidates[index])}
+        with self.lock:
+            winners = self._read()
+            if index:
+                winners[locator.key] = entry
+            else:
+                winners.pop(locator.key, None)  # primary works again
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(winners, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+        self._winners = winners
+
+
+_cache = HealingCache()
+_healed = []
+
+
+def resolve(driver, locator, root=None):
+    """
+    One browser round trip: the elements of the first matching candidate,
+    trying the stored winner first.
+    Args:
+        driver (WebDriver): Browser to query
+        locator (Locator): Candidates
+        root (WebElement): Search below this element instead of the document
+    Returns:
+        list: Matching elements (empty if no candidate matches)
+    """
+    queries = locator.scoped() if root is not None else locator.queries
+    first = _cache.winner(locator)
+    order = [first] + [i for i in range(len(queries)) if i != first]
+    position, elements = driver.execute_script(RESOLVE_SCRIPT, [list(queries[i]) for i in order], root)
+    if position < 0:
+        return []
+    index = order[position]
+    _cache.remember(locator, index)
+    if index:
+        _healed.append({"locator": locator.key, "candidate": describe(locator.candidates[index]),
+                        "primary": describe(locator.candidates[0])})
+    return elements
+
+
+def drain_healed():
+    """
+    Healing events since the last call, one per locator.
+    Returns:
+        list: dicts with ``locator``, ``candidate`` and ``primary``
+    """
+    events = {event["locator"]: event for event in _healed}
+    _healed.clear()
+    return list(events.values())
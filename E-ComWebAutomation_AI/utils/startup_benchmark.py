@@ -0,0 +1,97 @@
+"""Startup/collection time benchmark for the test framework.
+
+Runs pytest collection in fresh interpreters and compares the timings with a
+stored baseline, so regressions in import time or pytest_configure work are
+caught before they slow down every worker.
+
+Usage:
+    python -m utils.startup_benchmark                  # compare with baseline
+    python -m utils.startup_benchmark --save-baseline  # record a new baseline
+"""
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from utils.benchmark import (summarize, load_baseline, save_baseline,
+                             append_history, compare_to_baseline)
+
+PROJECT_DIR = Path(__file__).parent.parent
+BENCHMARK_NAME = "startup"
+
+# Scenario name -> extra pytest arguments
+SCENARIOS = {
+    "collect_only": ["--collect-only", "-q", "-n", "0"],
+    "collect_only_xdist": ["--collect-only", "-q", "-n", "2"],
+    "import_conftest": None,  # bare interpreter importing conftest.py
+}
+
+
+def _command(scenario):
+    extra = SCENARIOS[scenario]
+    if extra is None:
+        return [sys.executable, "-c", "import conftest"]
+    return [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", *extra]
+
+
+def measure(scenario, runs):
+    """
+    Time a scenario in fresh subprocesses.
+    Args:
+        scenario (str): Key of SCENARIOS
+        runs (int): Number of repetitions
+    Returns:
+        list: Wall-clock seconds per run
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(_command(scenario), cwd=PROJECT_DIR,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        elapsed = time.perf_counter() - start
+        # pytest exits 5 when nothing is collected; anything else is an error
+        if result.returncode not in (0, 5):
+            raise RuntimeError(f"{scenario} failed:\n{result.stderr}")
+        timings.append(elapsed)
+    return timings
+
+
+def main(argv=None):
+    """Run the startup benchmark and gate on regressions."""
+    parser = argparse.ArgumentParser(description="Startup/collection benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Repetitions per scenario")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store this run as the new baseline")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS),
+                        help="Scenario(s) to run (default: all)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for scenario in args.scenario or SCENARIOS:
+        results[scenario] = summarize(measure(scenario, args.runs))
+        s = results[scenario]
+        print(f"{scenario:22s} p50={s['p50']:.3f}s p90={s['p90']:.3f}s max={s['max']:.3f}s")
+    append_history(BENCHMARK_NAME, results)
+
+    if args.save_baseline:
+        print(f"Baseline saved: {save_baseline(BENCHMARK_NAME, results)}")
+        return 0
+
+    baseline = load_baseline(BENCHMARK_NAME)
+    if baseline is None:
+        print("No baseline found; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    for case, before, after, ratio in regressions:
+        print(f"❌ {case}: {before:.3f}s -> {after:.3f}s ({ratio:.0%} of baseline)")
+    if not regressions:
+        print("✓ Startup time within tolerance of baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
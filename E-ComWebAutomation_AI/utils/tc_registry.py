@@ -0,0 +1,243 @@
+"""Registry of test-case IDs (UA_03, PY_01, ...) and the tests covering them.
+
+IDs are read statically (``ast``, no imports) from test docstrings
+(``TC: UA_04`` or ``TC: UA_03, UA_04``), ``@test_case('UA_03')`` decorators and test name suffixes
+(``test_..._ua03``), plus the catalog in ``GenerateAIBasedTestCase.md``. The
+result is cached in ``test_logs/.cache/tc_registry.json``; a file is only
+re-parsed when its size/mtime and then its content hash change.
+
+Usage:
+    pytest --tc PY_*,UA_03                 # run tests covering these IDs
+    python -m utils.tc_registry            # coverage report
+    python -m utils.tc_registry UA_03      # tests for an ID
+"""
+import ast
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from utils.run_configs import ARTIFACTS_DIR
+
+PROJECT_DIR = Path(__file__).parent.parent
+TESTS_DIR = PROJECT_DIR / "Tests"
+SPEC_FILE = PROJECT_DIR.parent / "GenerateAIBasedTestCase.md"
+CACHE_FILE = ARTIFACTS_DIR / ".cache" / "tc_registry.json"
+CACHE_VERSION = 2
+
+# Compiled once: "UA_03", "PY_10", "CO_100"
+TC_ID_PATTERN = re.compile(r"\b([A-Z]{2,3}_\d{2,})\b")
+TC_REFERENCE_PATTERN = re.compile(
+    r"(?:TC:|test case(?: IDs)?:?)\s*([A-Z]{2,3}_\d{2,}(?:\s*,\s*[A-Z]{2,3}_\d{2,})*)", re.I)
+NAME_SUFFIX_PATTERN = re.compile(r"_([a-z]{2,3})(\d{2,})$")
+SPEC_ROW_PATTERN = re.compile(r"^\|\s*([A-Z]{2,3}_\d{2,})\s*\|\s*([^|]*?)\s*\|.*\|\s*(\w+)\s*\|\s*$")
+
+
+def _file_digest(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def _decorator_ids(func):
+    ids = []
+    for decorator in func.decorator_list:
+        if isinstance(decorator, ast.Call):
+            target = decorator.func
+            name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", "")
+            if name == "test_case":
+                ids.extend(arg.value for arg in decorator.args
+                           if isinstance(arg, ast.Constant) and isinstance(arg.value, str))
+    return ids
+
+
+def _test_ids(func):
+    """TC IDs referenced by one test function, in order of appearance."""
+    ids = _decorator_ids(func)
+    for reference in TC_REFERENCE_PATTERN.findall(ast.get_docstring(func) or ""):
+        ids.extend(re.split(r"\s*,\s*", reference))
+    suffix = NAME_SUFFIX_PATTERN.search(func.name)
+    if suffix:
+        ids.append(f"{suffix.group(1).upper()}_{suffix.group(2)}")
+    return list(dict.fromkeys(i.upper() for i in ids))
+
+
+def scan_test_file(source, rel_path):
+    """
+    Extract TC IDs from a test module without importing it.
+    Args:
+        source (bytes): Module source
+        rel_path (str): Path relative to the project root ('/' separated)
+    Returns:
+        dict: Test nodeid -> list of TC IDs (tests without IDs are omitted)
+    """
+    tree = ast.parse(source, filename=rel_path)
+    tests = {}
+
+    def visit(func, prefix):
+        if isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)) and func.name.startswith("test"):
+            ids = _test_ids(func)
+            if ids:
+                tests[f"{prefix}::{func.name}"] = ids
+
+    for node in tree.body:
+        visit(node, rel_path)
+        if isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            for child in node.body:
+                visit(child, f"{rel_path}::{node.name}")
+    return tests
+
+
+def parse_spec(text):
+    """
+    Read the TC catalog from GenerateAIBasedTestCase.md.
+    Returns:
+        dict: TC ID -> {"title", "priority"}
+    """
+    cases = {}
+    for line in text.splitlines():
+        match = SPEC_ROW_PATTERN.match(line.strip())
+        if match:
+            cases[match.group(1)] = {"title": match.group(2), "priority": match.group(3)}
+    return cases
+
+
+class TCRegistry:
+    """
+    Bidirectional TC ID <-> test nodeid index.
+    Args:
+        tests (dict): nodeid -> list of TC IDs
+        spec (dict): TC ID -> catalog entry
+    """
+
+    def __init__(self, tests, spec=None):
+        self.tests = tests
+        self.spec = spec or {}
+        self.by_id = {}
+        for nodeid, ids in tests.items():
+            for tc_id in ids:
+                self.by_id.setdefault(tc_id, []).append(nodeid)
+
+    def nodeids_for(self, tc_id):
+        return list(self.by_id.get(tc_id.upper(), []))
+
+    def ids_for(self, nodeid):
+        """TC IDs of a test (parametrize suffixes like ``[chrome]`` are ignored)."""
+        return list(self.tests.get(nodeid.split("[", 1)[0], []))
+
+    def select(self, patterns):
+        """
+        Resolve ``PY_*,UA_03``-style patterns.
+        Args:
+            patterns (str|list): Comma-separated string or list of glob patterns
+        Returns:
+            set: Matching test nodeids
+        """
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        patterns = [p.strip().upper() for group in patterns for p in group.split(",") if p.strip()]
+        selected = set()
+        for tc_id, nodeids in self.by_id.items():
+            if any(fnmatch.fnmatchcase(tc_id, pattern) for pattern in patterns):
+                selected.update(nodeids)
+        return selected
+
+    def uncovered(self):
+        """Catalog IDs with no test."""
+        return sorted(set(self.spec) - set(self.by_id))
+
+    def unknown(self):
+        """IDs referenced by tests but missing from the catalog."""
+        return sorted(set(self.by_id) - set(self.spec)) if self.spec else []
+
+    @classmethod
+    def load(cls, tests_dir=TESTS_DIR, spec_file=SPEC_FILE, cache_file=CACHE_FILE):
+        """
+        Build the registry, re-parsing only files that changed since the cache.
+        Returns:
+            TCRegistry: Current registry
+        """
+        cache_file = Path(cache_file)
+        cache = {}
+        if cache_file.exists():
+            try:
+                with open(cache_file) as f:
+                    cache = json.load(f)
+            except ValueError:
+                cache = {}
+        if cache.get("version") != CACHE_VERSION:
+            cache = {"version": CACHE_VERSION, "files": {}, "spec": {}}
+
+        changed = False
+        files = {}
+        for path in sorted(Path(tests_dir).rglob("test_*.py")):
+            try:
+                rel = path.relative_to(PROJECT_DIR).as_posix()
+            except ValueError:
+                rel = path.as_posix()
+            entry, dirty = cls._refresh(path, cache["files"].get(rel), lambda data: scan_test_file(data, rel))
+            files[rel] = entry
+            changed |= dirty
+        changed |= set(files) != set(cache["files"])
+        cache["files"] = files
+
+        spec_file = Path(spec_file)
+        if spec_file.exists():
+            entry, dirty = cls._refresh(spec_file, cache.get("spec"),
+                                        lambda data: parse_spec(data.decode("utf-8", "replace")))
+            cache["spec"] = entry
+            changed |= dirty
+
+        if changed:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w") as f:
+                json.dump(cache, f, indent=1)
+            os.replace(tmp, cache_file)
+
+        tests = {}
+        for entry in files.values():
+            tests.update(entry["data"])
+        return cls(tests, (cache.get("spec") or {}).get("data", {}))
+
+    @staticmethod
+    def _refresh(path, cached, parse):
+        """
+        Reuse ``cached`` when size/mtime match, or when the content hash still
+        matches; otherwise parse again.
+        Returns:
+            tuple: (cache entry, whether the cache changed)
+        """
+        stat = path.stat()
+        if cached and cached.get("size") == stat.st_size and cached.get("mtime_ns") == stat.st_mtime_ns:
+            return cached, False
+        data = path.read_bytes()
+        digest = _file_digest(data)
+        if cached and cached.get("sha1") == digest:
+            return dict(cached, size=stat.st_size, mtime_ns=stat.st_mtime_ns), True
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": digest, "data": parse(data)}, True
+
+
+def main(argv=None):
+    """Print TC coverage, or the tests for the given IDs/patterns."""
+    argv = sys.argv[1:] if argv is None else argv
+    registry = TCRegistry.load()
+    if argv:
+        for nodeid in sorted(registry.select(argv)):
+            print(f"{nodeid}  [{', '.join(registry.ids_for(nodeid))}]")
+        return 0
+
+    print(f"{len(registry.by_id)} TC IDs covered by {len(registry.tests)} tests")
+    for tc_id in sorted(registry.by_id):
+        title = registry.spec.get(tc_id, {}).get("title", "(not in catalog)")
+        print(f"{tc_id:8s} {len(registry.by_id[tc_id]):2d} test(s)  {title}")
+    if registry.uncovered():
+        print(f"\nNo tests for: {', '.join(registry.uncovered())}")
+    if registry.unknown():
+        print(f"Not in catalog: {', '.join(registry.unknown())}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@
 import os
 import pytest
 from functools import wraps
+from utils.config import get_config
 from utils.markers import *
 
 def test_case(*test_ids, **kwargs):
@@ -64,6 +65,9 @@ def test_case(*test_ids, **kwargs):
         return wrapper
     return decorator
 
+# Imported into test modules; keep pytest from collecting it as a test
+test_case.__test__ = False
+
 def skip_if_env(env_name):
     """Skip test if running in specified environment."""
     current_env = os.getenv('TEST_ENV', 'qa')
@@ -84,9 +88,7 @@ def requires_feature_flag(flag_name):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            from utils.config import TestConfig
-            config = TestConfig()
-            if not config.is_feature_enabled(flag_name):
+            if not get_config().is_feature_enabled(flag_name):
                 pytest.skip(f"Feature {flag_name} is not enabled")
             return func(*args, **kwargs)
         return wrapper
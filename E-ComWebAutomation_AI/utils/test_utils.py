@@ -5,6 +5,7 @@ from datetime import datetime
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from utils.tc_registry import TC_REFERENCE_PATTERN
 
 def take_screenshot(driver, name, screenshots_dir):
     """
@@ -102,6 +103,5 @@ def parse_test_id(test_name):
     Returns:
         str: Test case ID or None if not found
     """
-    import re
-    match = re.search(r'(?:TC:|test case)\s*([A-Z]{2}_\d{2})', test_name, re.I)
-    return match.group(1) if match else None
\ No newline at end of file
+    match = TC_REFERENCE_PATTERN.search(test_name)
+    return match.group(1).upper() if match else None
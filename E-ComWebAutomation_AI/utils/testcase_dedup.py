@@ -0,0 +1,314 @@
+"""Near-duplicate test-case detection with MinHash and LSH.
+
+Every test case is reduced to a set of character shingles of its title and
+steps: catalog rows (``GenerateAIBasedTestCase.md`` and the Excel workbooks,
+merged by TC ID) and test functions (name plus docstring, generated stubs
+included). A NumPy MinHash signature approximates each set; locality-sensitive
+hashing buckets signature bands so only cases sharing a bucket are compared,
+which keeps the run sub-quadratic. Candidate pairs whose signatures agree
+closely enough are confirmed with their exact Jaccard similarity and joined
+into clusters.
+
+Each cluster lists the pytest nodeids that would stop running if only one of
+its test cases were kept (TC IDs are mapped to tests via the TC registry).
+
+Usage:
+    python -m utils.testcase_dedup                  # clusters at similarity >= 0.6
+    python -m utils.testcase_dedup --threshold 0.5 --json test_logs/duplicates.json
+"""
+import argparse
+import ast
+import json
+import re
+import sys
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from utils.tc_registry import PROJECT_DIR, SPEC_FILE, TESTS_DIR, TCRegistry
+from utils.testcase_generator import OUTPUT_DIR, WORKBOOK_FILE, read_markdown_cases, read_workbook_cases
+
+PYRAMID_FILE = PROJECT_DIR.parent / "classifyTestCaseAccordingToTestPyramid.xlsx"
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+# Prime for the universal hash family; a * x stays below 2**63 for 32-bit x
+PRIME = (1 << 31) - 1
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+# Words every test case shares; they only inflate similarity
+STOP_WORDS = {"verify", "test", "the", "a", "an", "of", "to", "and", "is", "on", "in", "with", "for"}
+
+
+@dataclass
+class Case:
+    """One test case as seen by the deduplicator."""
+    key: str
+    kind: str  # "catalog" or "test"
+    text: str
+    tc_ids: list = field(default_factory=list)
+    nodeids: list = field(default_factory=list)
+
+    @property
+    def identity(self):
+        """Cases with the same identity are one test case, not duplicates."""
+        return self.tc_ids[0] if self.tc_ids else self.key
+
+
+# --- Sources ---
+
+def catalog_cases(sources=(SPEC_FILE, WORKBOOK_FILE, PYRAMID_FILE)):
+    """
+    Catalog rows from markdown tables and workbooks, merged by TC ID.
+    Rows of one ID from different files contribute their titles and steps once.
+    """
+    texts = {}
+    for path in sources:
+        path = Path(path)
+        if not path.exists():
+            continue
+        rows = read_markdown_cases(path) if path.suffix == ".md" else read_workbook_cases(path)
+        for record in rows:
+            steps = record.get("steps", "")
+            steps = " ".join(steps) if isinstance(steps, list) else steps
+            parts = texts.setdefault(record["id"], {})
+            for part in (record.get("title", ""), steps):
+                # "1. Open cart 2. Remove" and "Open cart Remove" are the same steps
+                part = re.sub(r"\b\d+\.\s+", "", part).strip()
+                parts.setdefault(" ".join(WORD_PATTERN.findall(part.lower())), part)
+    return [Case(tc_id, "catalog", " ".join(parts.values()), [tc_id]) for tc_id, parts in texts.items()]
+
+
+def test_cases(registry, tests_dir=TESTS_DIR):
+    """Test functions (nodeid, name and docstring), read with ``ast``."""
+    cases = []
+    for path in sorted(Path(tests_dir).rglob("test_*.py")):
+        rel = path.relative_to(PROJECT_DIR).as_posix()
+        tree = ast.parse(path.read_bytes(), filename=rel)
+        functions = [(rel, node) for node in tree.body]
+        functions += [(f"{rel}::{node.name}", child) for node in tree.body
+                      if isinstance(node, ast.ClassDef) and node.name.startswith("Test") for child in node.body]
+        for prefix, func in functions:
+            if isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)) and func.name.startswith("test"):
+                nodeid = f"{prefix}::{func.name}"
+                doc = ast.get_docstring(func) or ""
+                text = " ".join([func.name.replace("_", " "), doc])
+                cases.append(Case(nodeid, "test", text, registry.ids_for(nodeid), [nodeid]))
+    return cases
+
+
+# --- MinHash / LSH ---
+
+def shingle_hashes(text, size=SHINGLE_SIZE):
+    """
+    Hashed character shingles of the normalised text.
+    Returns:
+        ndarray: Unique uint64 hashes (may be empty)
+    """
+    words = [w for w in WORD_PATTERN.findall(text.lower()) if w not in STOP_WORDS]
+    normalised = " ".join(words)
+    grams = {normalised[i:i + size] for i in range(max(1, len(normalised) - size + 1))} if normalised else set()
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+class MinHasher:
+    """
+    MinHash signatures from ``num_perm`` universal hash functions.
+    Args:
+        num_perm (int): Signature length
+        seed (int): Seed for the hash family (fixed so signatures are comparable)
+    """
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, PRIME, num_perm, dtype=np.uint64)[:, None]
+        self.b = rng.integers(0, PRIME, num_perm, dtype=np.uint64)[:, None]
+        self.num_perm = num_perm
+
+    def signatures(self, hash_sets, batch=1000):
+        """
+        Sign many sets at once: each batch's hashes are concatenated, permuted
+        together and reduced per set with ``np.minimum.reduceat``.
+        Returns:
+            ndarray: (len(hash_sets), num_perm) uint64 signature matrix
+        """
+        out = np.full((len(hash_sets), self.num_perm), PRIME, dtype=np.uint64)
+        filled = [i for i, hashes in enumerate(hash_sets) if hashes.size]
+        for start in range(0, len(filled), batch):
+            rows = filled[start:start + batch]
+            sizes = np.array([hash_sets[i].size for i in rows])
+            values = np.concatenate([hash_sets[i] for i in rows]) % PRIME
+            permuted = (self.a * values + self.b) % PRIME
+            offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+            out[rows] = np.minimum.reduceat(permuted, offsets, axis=1).T
+        return out
+
+
+def lsh_shape(threshold, num_perm=NUM_PERM):
+    """
+    Bands x rows whose S-curve midpoint ``(1/b) ** (1/r)`` is closest to the
+    threshold from below, so recall is favoured and exact checks filter.
+    Returns:
+        tuple: (bands, rows)
+    """
+    shapes = [(num_perm // r, r) for r in range(1, num_perm + 1) if num_perm % r == 0]
+    below = [s for s in shapes if (1 / s[0]) ** (1 / s[1]) <= threshold] or shapes[:1]
+    return max(below, key=lambda s: (1 / s[0]) ** (1 / s[1]))
+
+
+def candidate_pairs(signatures, bands, rows, max_bucket=500):
+    """
+    Pairs of rows sharing at least one identical band.
+    Returns:
+        ndarray: (pairs, 2) unique index pairs with i < j
+    """
+    pairs = []
+    mix = np.random.default_rng(0).integers(1, 1 << 62, rows, dtype=np.uint64)
+    for band in range(bands):
+        keys = (signatures[:, band * rows:(band + 1) * rows] * mix).sum(axis=1)
+        order = np.argsort(keys, kind="stable")
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(keys[order])) + 1))
+        sizes = np.diff(np.append(starts, len(order)))
+        # Singletons are the common case; buckets of empty or boilerplate
+        # texts would add quadratic noise
+        for start, size in zip(starts[(sizes > 1) & (sizes <= max_bucket)].tolist(),
+                               sizes[(sizes > 1) & (sizes <= max_bucket)].tolist()):
+            members = order[start:start + size]
+            i, j = np.triu_indices(size, 1)
+            pairs.append(np.stack([members[i], members[j]], axis=1))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.sort(np.concatenate(pairs), axis=1)
+    return np.unique(pairs, axis=0)
+
+
+def _jaccard(a, b):
+    if not a.size or not b.size:
+        return 0.0
+    inter = np.intersect1d(a, b, assume_unique=True).size
+    return inter / (a.size + b.size - inter)
+
+
+def find_clusters(cases, threshold=0.6, num_perm=NUM_PERM):
+    """
+    Group near-duplicate cases.
+    Args:
+        cases (list): Case objects
+        threshold (float): Minimum Jaccard similarity of shingle sets
+        num_perm (int): MinHash signature length
+    Returns:
+        list: (list of Case, minimum linked similarity) per cluster, largest first
+    """
+    hashes = [shingle_hashes(case.text) for case in cases]
+    signatures = MinHasher(num_perm).signatures(hashes)
+    bands, rows = lsh_shape(threshold, num_perm)
+
+    parent = list(range(len(cases)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    pairs = candidate_pairs(signatures, bands, rows)
+    # The share of equal signature slots estimates Jaccard similarity; only
+    # pairs near the threshold pay for an exact comparison
+    estimates = np.concatenate([
+        (signatures[chunk[:, 0]] == signatures[chunk[:, 1]]).mean(axis=1)
+        for chunk in np.array_split(pairs, max(1, len(pairs) // 10000))]) if len(pairs) else np.empty(0)
+    slack = 2 / np.sqrt(num_perm)
+
+    similarity = {}
+    for (i, j), estimate in zip(pairs.tolist(), estimates.tolist()):
+        if cases[i].identity == cases[j].identity:
+            score = 1.0
+        elif estimate < threshold - slack:
+            continue
+        else:
+            score = _jaccard(hashes[i], hashes[j])
+            if score < threshold:
+                continue
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[root_j] = root_i
+        similarity[(i, j)] = score
+
+    groups, scores = {}, {}
+    for i in range(len(cases)):
+        groups.setdefault(find(i), []).append(i)
+    for (i, _), score in similarity.items():
+        root = find(i)
+        scores[root] = min(score, scores.get(root, 1.0))
+    clusters = [([cases[i] for i in members], scores[root]) for root, members in groups.items()
+                if len({cases[i].identity for i in members}) > 1]
+    clusters.sort(key=lambda c: (-len(c[0]), c[1]))
+    return clusters
+
+
+def removable_nodeids(cluster):
+    """
+    Tests that would no longer run if the cluster kept only its first test
+    case (lowest TC ID, or the first test without one).
+    Returns:
+        tuple: (identity kept, sorted list of nodeids to drop)
+    """
+    by_identity = {}
+    for case in cluster:
+        by_identity.setdefault(case.identity, set()).update(case.nodeids)
+    executed = {identity: ids for identity, ids in by_identity.items() if ids}
+    if not executed:
+        return None, []
+    keep = min(executed)
+    drop = set().union(*executed.values()) - executed[keep]
+    return keep, sorted(drop)
+
+
+def load_cases(registry=None):
+    """Catalog rows (with their covering tests) plus every test function."""
+    registry = registry or TCRegistry.load()
+    cases = catalog_cases()
+    for case in cases:
+        case.nodeids = registry.nodeids_for(case.key)
+    return cases + test_cases(registry)
+
+
+def main(argv=None):
+    """Report clusters of near-duplicate test cases."""
+    parser = argparse.ArgumentParser(description="Near-duplicate test-case detection")
+    parser.add_argument("--threshold", type=float, default=0.6, help="Minimum Jaccard similarity (0-1)")
+    parser.add_argument("--num-perm", type=int, default=NUM_PERM, help="MinHash signature length")
+    parser.add_argument("--json", metavar="PATH", help="Also write the clusters as JSON")
+    args = parser.parse_args(argv)
+
+    cases = load_cases()
+    clusters = find_clusters(cases, args.threshold, args.num_perm)
+    generated = OUTPUT_DIR.relative_to(PROJECT_DIR).as_posix() + "/"
+    report = []
+    for number, (members, score) in enumerate(clusters, 1):
+        keep, drop = removable_nodeids(members)
+        print(f"\nCluster {number}: {len(members)} cases, similarity >= {score:.2f}")
+        for case in members:
+            label = ", ".join(case.tc_ids) or "-"
+            text = case.text if case.kind == "catalog" else case.key
+            print(f"  {case.kind:7s} {label:14s} {text[:100]}")
+        for nodeid in drop:
+            print(f"  would remove: {nodeid}{'  (generated stub)' if nodeid.startswith(generated) else ''}")
+        report.append({
+            "similarity": round(score, 3),
+            "cases": [{"key": c.key, "kind": c.kind, "tc_ids": c.tc_ids, "text": c.text} for c in members],
+            "keep": keep,
+            "remove": drop,
+        })
+
+    removed = {nodeid for entry in report for nodeid in entry["remove"]}
+    print(f"\n{len(cases)} cases, {len(clusters)} cluster(s); {len(removed)} test(s) could be removed")
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
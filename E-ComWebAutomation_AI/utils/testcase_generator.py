@@ -0,0 +1,387 @@
+"""Generate pytest stubs from the functional test-case catalog.
+
+Rows come from ``GenerateAIBasedTestCase.md`` (title, steps, expected result)
+and ``StyleHaven_Functional_TestCases.xlsx`` (test data), merged by TC ID.
+Each row becomes a skipped test under ``Tests/generated/`` that already opens
+the right page objects, carries ``@test_case`` and the steps in its docstring.
+
+Every stub is delimited by ``# <generated ID row=HASH>`` markers, and
+``Tests/generated/manifest.json`` records the row hash and the stub's own
+hash. A re-run rewrites only stubs whose row changed; a stub edited by hand is
+never overwritten. The workbook is read in streaming (read-only) mode.
+
+Usage:
+    python -m utils.testcase_generator              # stubs for IDs without tests
+    python -m utils.testcase_generator --all        # stubs for every row
+    python -m utils.testcase_generator --check      # exit 1 if stubs are stale
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from utils.tc_registry import PROJECT_DIR, SPEC_FILE, TC_ID_PATTERN, TESTS_DIR, TCRegistry
+
+WORKBOOK_FILE = PROJECT_DIR.parent / "StyleHaven_Functional_TestCases.xlsx"
+OUTPUT_DIR = TESTS_DIR / "generated"
+MANIFEST_FILE = OUTPUT_DIR / "manifest.json"
+# Bump when the stub template changes so every untouched stub is re-rendered
+TEMPLATE_VERSION = 1
+
+# Header cell (lower-case) -> field name, for both sources
+COLUMNS = {
+    "tc id": "id", "test case id": "id",
+    "test case title": "title", "title": "title",
+    "steps": "steps",
+    "test data": "data", "test data (input)": "data",
+    "expected result": "expected",
+    "priority": "priority",
+}
+FIELDS = ("title", "steps", "data", "expected", "priority")
+
+BLOCK_PATTERN = re.compile(
+    r"^    # <generated (?P<id>[A-Z]{2,3}_\d{2,}) row=(?P<row>\w+)>\n.*?^    # </generated (?P=id)>\n",
+    re.M | re.S)
+
+_CART_SETUP = (
+    'seeded = api_seeder.seed(user=test_account, cart=[TestData.PRODUCTS["zara_coat"]["title"]])',
+    'api_seeder.open_session(driver_for_test, seeded.user, route="/dashboard/cart")',
+    "cart = CartPage(driver_for_test)",
+)
+
+
+@dataclass(frozen=True)
+class ModuleSpec:
+    """How stubs for one TC prefix are wired."""
+    name: str
+    title: str
+    feature: str
+    imports: tuple
+    fixtures: tuple
+    setup: tuple
+
+
+MODULES = {
+    "UA": ModuleSpec(
+        "user_account", "User Account", "login",
+        ("from pages.login_page.login import LoginPage",),
+        ("driver_for_test",),
+        ("page = LoginPage(driver_for_test)",)),
+    "PC": ModuleSpec(
+        "product_catalog", "Product Catalog", "",
+        ("from pages.dashboard_page.dashboard_page import DashboardPage",
+         "from pages.product_page.product_details_page import ProductDetailsPage"),
+        ("driver_for_test", "api_seeder", "test_account"),
+        ("seeded = api_seeder.seed(user=test_account)",
+         'api_seeder.open_session(driver_for_test, seeded.user, route="/dashboard/dash")',
+         "dashboard = DashboardPage(driver_for_test)")),
+    "SC": ModuleSpec(
+        "shopping_cart", "Shopping Cart", "cart",
+        ("from pages.cart_page.cart_page import CartPage",
+         "from Tests.test_data import TestData"),
+        ("driver_for_test", "api_seeder", "test_account"),
+        _CART_SETUP),
+    "CO": ModuleSpec(
+        "checkout", "Checkout", "cart",
+        ("from pages.cart_page.cart_page import CartPage",
+         "from pages.payment_page.payment_page import PaymentPage",
+         "from Tests.test_data import TestData"),
+        ("driver_for_test", "api_seeder", "test_account"),
+        _CART_SETUP),
+    "PY": ModuleSpec(
+        "payment", "Payment", "payment",
+        ("from pages.cart_page.cart_page import CartPage",
+         "from pages.payment_page.payment_page import PaymentPage",
+         "from Tests.test_data import TestData"),
+        ("driver_for_test", "api_seeder", "test_account"),
+        _CART_SETUP + ("cart.proceed_to_checkout()", "payment = PaymentPage(driver_for_test)")),
+}
+
+
+# --- Sources ---
+
+def _clean(value):
+    return re.sub(r"\s+", " ", str(value)).strip() if value is not None else ""
+
+
+def _record(header, cells):
+    record = {}
+    for name, value in zip(header, cells):
+        field = COLUMNS.get(name)
+        if field and field not in record:
+            record[field] = value
+    return record
+
+
+def read_markdown_cases(path=SPEC_FILE):
+    """
+    Stream TC rows out of the markdown tables.
+    Yields:
+        dict: ``id`` plus the FIELDS present in the table
+    """
+    header = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line.startswith("|"):
+                header = None
+                continue
+            cells = [c.strip() for c in line.strip("|").split("|")]
+            if header is None:
+                header = [c.lower() for c in cells]
+                continue
+            record = _record(header, cells)
+            if TC_ID_PATTERN.fullmatch(record.get("id", "")):
+                if "steps" in record:
+                    record["steps"] = [re.sub(r"^\d+\.\s*", "", _clean(step))
+                                       for step in re.split(r"<br\s*/?>", record["steps"]) if step.strip()]
+                yield record
+
+
+def read_workbook_cases(path=WORKBOOK_FILE):
+    """
+    Stream TC rows out of the first sheet of a workbook (read-only mode, so
+    rows are parsed lazily instead of loading the whole sheet).
+    Yields:
+        dict: ``id`` plus the FIELDS present in the sheet
+    """
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [_clean(c).lower() for c in next(rows, ())]
+        for cells in rows:
+            record = _record(header, [_clean(c) for c in cells])
+            if TC_ID_PATTERN.fullmatch(record.get("id", "")):
+                yield record
+    finally:
+        workbook.close()
+
+
+def load_cases(spec_file=SPEC_FILE, workbook_file=WORKBOOK_FILE):
+    """
+    Merge both sources by TC ID; the first source to provide a field wins.
+    Returns:
+        dict: TC ID -> record, in catalog order
+    """
+    cases = {}
+    sources = []
+    if Path(spec_file).exists():
+        sources.append(read_markdown_cases(spec_file))
+    if Path(workbook_file).exists():
+        sources.append(read_workbook_cases(workbook_file))
+    for source in sources:
+        for record in source:
+            case = cases.setdefault(record["id"], {"id": record["id"]})
+            for field in FIELDS:
+                if record.get(field) and not case.get(field):
+                    case[field] = record[field]
+    return cases
+
+
+def row_hash(case):
+    payload = json.dumps([TEMPLATE_VERSION, case], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def _block_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+# --- Rendering ---
+
+def _test_name(case):
+    words = re.sub(r"\(.*?\)", "", case.get("title", "")).lower()
+    words = re.sub(r"[^a-z0-9]+", " ", words).split()
+    if words[:1] == ["verify"]:
+        words = words[1:]
+    name = "_".join(words)[:60].rstrip("_") or "case"
+    return f"test_{name}_{case['id'].replace('_', '').lower()}"
+
+
+def _doc(text):
+    return text.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+
+
+def render_stub(case, spec):
+    """Source of one stub, markers included (class-level indentation)."""
+    tc_id = case["id"]
+    kwargs = [f"feature='{spec.feature}'"] if spec.feature else []
+    if case.get("priority"):
+        kwargs.append(f"priority='{case['priority'].lower()}'")
+    doc = [f"TC: {tc_id} - {_doc(case.get('title', ''))}"]
+    if case.get("steps"):
+        doc += ["", "Steps:"] + [f"    {i}. {_doc(step)}" for i, step in enumerate(case["steps"], 1)]
+    if case.get("data"):
+        doc += ["", f"Test data: {_doc(case['data'])}"]
+    if case.get("expected"):
+        doc += [f"Expected: {_doc(case['expected'])}"]
+
+    lines = [
+        f"# <generated {tc_id} row={row_hash(case)}>",
+        f'@pytest.mark.skip(reason="Generated stub: {tc_id} is not automated yet")',
+        f"@test_case('{tc_id}'{''.join(', ' + k for k in kwargs)})",
+        f"def {_test_name(case)}(self, {', '.join(spec.fixtures)}):",
+        '    """',
+        *[f"    {line}" if line else "" for line in doc],
+        '    """',
+        *[f"    {line}" for line in spec.setup],
+        "",
+        f'    raise NotImplementedError("{tc_id}")',
+        f"# </generated {tc_id}>",
+    ]
+    return "".join(f"    {line}\n" if line else "\n" for line in lines)
+
+
+def render_header(spec):
+    imports = "\n".join(sorted(spec.imports, key=lambda i: i.startswith("from Tests")))
+    return (
+        f'"""\nGenerated stubs for the {spec.title} module.\n'
+        f"Regenerate with: python -m utils.testcase_generator\n"
+        f'Implement a stub by removing its skip marker; edited stubs are never overwritten.\n"""\n'
+        f"import pytest\n{imports}\nfrom utils.test_helpers import test_case\n\n\n"
+        f"class TestGenerated{spec.title.replace(' ', '')}:\n"
+        f'    """Catalog rows for {spec.title} without an automated test."""\n\n'
+    )
+
+
+# --- Incremental update ---
+
+class StubGenerator:
+    """
+    Writes and updates generated stub modules.
+    Args:
+        cases (dict): TC ID -> record (see :func:`load_cases`)
+        covered (set): TC IDs already automated outside ``output_dir``
+        output_dir (Path): Where stub modules and the manifest live
+    """
+
+    def __init__(self, cases, covered=(), output_dir=OUTPUT_DIR):
+        self.cases = cases
+        self.covered = set(covered)
+        self.output_dir = Path(output_dir)
+        self.manifest_file = self.output_dir / MANIFEST_FILE.name
+        self.manifest = {}
+        if self.manifest_file.exists():
+            with open(self.manifest_file) as f:
+                self.manifest = json.load(f)
+
+    def plan(self):
+        """
+        Work out the new content of every stub module.
+        Returns:
+            tuple: ({path: new text}, {action: [TC IDs]}, new manifest)
+        """
+        actions = {"created": [], "updated": [], "unchanged": [], "edited": [], "removed": []}
+        manifest, files = {}, {}
+        wanted = {}
+        for tc_id, case in self.cases.items():
+            prefix = tc_id.split("_", 1)[0]
+            if prefix in MODULES and tc_id not in self.covered:
+                wanted.setdefault(prefix, []).append(case)
+
+        for prefix, spec in MODULES.items():
+            path = self.output_dir / f"test_{spec.name}.py"
+            text = path.read_text(encoding="utf-8") if path.exists() else ""
+            existing = {m.group("id"): m for m in BLOCK_PATTERN.finditer(text)}
+            blocks = []
+            for case in wanted.get(prefix, []):
+                tc_id = case["id"]
+                block = existing.pop(tc_id, None)
+                if block is None:
+                    new, action = render_stub(case, MODULES[prefix]), "created"
+                elif self._edited(tc_id, block.group(0)):
+                    new, action = block.group(0), "edited"
+                elif block.group("row") == row_hash(case):
+                    new, action = block.group(0), "unchanged"
+                else:
+                    new, action = render_stub(case, MODULES[prefix]), "updated"
+                actions[action].append(tc_id)
+                blocks.append(new)
+                manifest[tc_id] = self.manifest.get(tc_id) if action == "edited" else {
+                    "row": row_hash(case), "stub": _block_hash(new), "file": path.name}
+            # Rows gone from the catalog (or now automated) disappear unless edited
+            for tc_id, block in existing.items():
+                if self._edited(tc_id, block.group(0)):
+                    actions["edited"].append(tc_id)
+                    blocks.append(block.group(0))
+                    manifest[tc_id] = self.manifest.get(tc_id)
+                else:
+                    actions["removed"].append(tc_id)
+
+            if not blocks:
+                if text:
+                    files[path] = None
+                continue
+            # Hand-written text before the first and after the last stub is kept
+            matches = list(BLOCK_PATTERN.finditer(text))
+            if matches:
+                head, tail = text[:matches[0].start()], text[matches[-1].end():]
+            else:
+                head, tail = text or render_header(spec), ""
+            new_text = head + "\n".join(blocks) + tail
+            if new_text != text:
+                files[path] = new_text
+        return files, actions, manifest
+
+    def _edited(self, tc_id, block):
+        entry = self.manifest.get(tc_id)
+        return bool(entry) and entry.get("stub") != _block_hash(block)
+
+    def write(self, files, manifest):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        init = self.output_dir / "__init__.py"
+        if not init.exists():
+            init.write_text("")
+        for path, text in files.items():
+            if text is None:
+                path.unlink()
+            else:
+                tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(text, encoding="utf-8")
+                os.replace(tmp, path)
+        with open(self.manifest_file, "w") as f:
+            json.dump(dict(sorted(manifest.items())), f, indent=1)
+            f.write("\n")
+
+
+def main(argv=None):
+    """Generate or check test stubs for catalog rows."""
+    parser = argparse.ArgumentParser(description="Generate pytest stubs from the TC catalog")
+    parser.add_argument("--all", action="store_true",
+                        help="Also generate stubs for IDs that already have tests")
+    parser.add_argument("--check", action="store_true",
+                        help="Only report; exit 1 if any stub would change")
+    parser.add_argument("--spec", default=SPEC_FILE, help="Markdown catalog")
+    parser.add_argument("--workbook", default=WORKBOOK_FILE, help="Excel catalog")
+    args = parser.parse_args(argv)
+
+    cases = load_cases(args.spec, args.workbook)
+    covered = set()
+    if not args.all:
+        generated = OUTPUT_DIR.relative_to(PROJECT_DIR).as_posix() + "/"
+        registry = TCRegistry.load()
+        covered = {tc_id for tc_id, nodeids in registry.by_id.items()
+                   if any(not n.startswith(generated) for n in nodeids)}
+
+    generator = StubGenerator(cases, covered)
+    files, actions, manifest = generator.plan()
+    for action, ids in actions.items():
+        if ids:
+            print(f"{action:10s} {len(ids):3d}  {', '.join(ids)}")
+    if args.check:
+        return 1 if files else 0
+    if files or manifest != generator.manifest:
+        generator.write(files, manifest)
+    for path, text in files.items():
+        print(f"{'deleted' if text is None else 'wrote'} {path.relative_to(PROJECT_DIR)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
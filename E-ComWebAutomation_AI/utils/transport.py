@@ -0,0 +1,195 @@
+"""Tuned, pooled and instrumented HTTP transport to ChromeDriver.
+
+Every page-object action is an HTTP request to the local ChromeDriver
+server. ``PooledConnection`` replaces Selenium's default connection for the
+whole session (including the new-session request):
+
+- one keep-alive pool per driver (``webdriver.pool_size`` connections, not
+  blocking), so a worker never pays a TCP handshake per command;
+- explicit connect/read timeouts instead of the socket default;
+- retries with backoff when a connection cannot be opened or is reset.
+  Commands that may change the page are only retried when the request never
+  reached the server, so a click is never sent twice.
+
+Each command's round trip (``wire``: request sent to response read) is put
+into a latency histogram per command. ``GET /status`` is answered by
+ChromeDriver without touching the browser; the session's ``/status`` probes
+are the transport floor, so browser time is roughly ``wire - floor``.
+``transport_stats()`` returns everything for this process.
+"""
+import time
+from collections import Counter
+
+import urllib3
+from urllib3.util.retry import Retry
+from selenium import webdriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+from utils.element_cache import is_read_only
+
+# Upper bucket edges in milliseconds; the last bucket is open-ended
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+STATUS_PROBES = 5
+STATUS = "status"  # GET /status, not a command Selenium defines
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "DELETE"})
+
+_latency = {}
+_events = Counter()
+
+
+def _observe(name, elapsed_ms):
+    entry = _latency.get(name)
+    if entry is None:
+        entry = _latency[name] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                  "buckets": [0] * (len(BUCKETS_MS) + 1)}
+    entry["count"] += 1
+    entry["total_ms"] += elapsed_ms
+    entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+    index = next((i for i, edge in enumerate(BUCKETS_MS) if elapsed_ms <= edge), len(BUCKETS_MS))
+    entry["buckets"][index] += 1
+
+
+class _CountingRetry(Retry):
+    """urllib3 retry policy that counts the retries it grants."""
+
+    def increment(self, *args, **kwargs):
+        retry = super().increment(*args, **kwargs)  # raises when exhausted
+        _events["retries"] += 1
+        return retry
+
+
+class _Pool(urllib3.PoolManager):
+    """Pool that applies the retry policy of the command being sent and times it."""
+
+    def __init__(self, connection, **kwargs):
+        super().__init__(**kwargs)
+        self.connection = connection
+
+    def urlopen(self, method, url, redirect=True, **kwargs):
+        kwargs.setdefault("retries", self.connection.retry_policy())
+        start = time.perf_counter()
+        try:
+            return super().urlopen(method, url, redirect=redirect, **kwargs)
+        finally:
+            self.connection.wire_ms = (time.perf_counter() - start) * 1000
+
+
+class PooledConnection(ChromiumRemoteConnection):
+    """
+    ChromeDriver connection with a tuned keep-alive pool (see module docstring).
+    Args:
+        remote_server_addr (str): ChromeDriver service URL
+        vendor_prefix (str): Vendor prefix for Chromium-specific commands
+        browser_name (str): Browser name for Chromium-specific commands
+        settings (Mapping): The ``webdriver`` configuration section
+    """
+
+    def __init__(self, remote_server_addr, vendor_prefix, browser_name, settings):
+        self.settings = settings
+        self.wire_ms = 0.0
+        self._idempotent = True
+        super().__init__(remote_server_addr, vendor_prefix, browser_name, keep_alive=True, ignore_proxy=True)
+        self._commands[STATUS] = ("GET", "/status")
+
+    def _get_connection_manager(self):
+        return _Pool(self, num_pools=1, maxsize=max(1, self.settings["pool_size"]), block=False,
+                     timeout=urllib3.Timeout(connect=self.settings["connect_timeout"],
+                                             read=self.settings["read_timeout"]))
+
+    def retry_policy(self):
+        """
+        Retries for the request being sent: connection failures always, resets
+        and broken responses only for commands that are safe to repeat.
+        """
+        retries = self.settings["retries"]
+        return _CountingRetry(total=retries, connect=retries, read=retries if self._idempotent else 0,
+                              status=0, other=0, redirect=False, allowed_methods=None,
+                              backoff_factor=self.settings["backoff_ms"] / 1000, raise_on_status=False)
+
+    def execute(self, command, params):
+        method = self._commands.get(command, ("POST",))[0]
+        self._idempotent = method in IDEMPOTENT_METHODS or is_read_only(command, params)
+        self.wire_ms = 0.0
+        try:
+            return super().execute(command, params)
+        finally:
+            _observe(command, self.wire_ms)
+
+    def probe(self, count=STATUS_PROBES):
+        """Time ``count`` ``GET /status`` round trips (the transport floor)."""
+        for _ in range(count):
+            try:
+                self.execute(STATUS, {})
+            except Exception:
+                return
+
+    def close(self):
+        if hasattr(self, "_conn"):
+            self.probe()
+            for key in list(self._conn.pools.keys()):
+                pool = self._conn.pools.get(key)
+                if pool is not None:
+                    _events["connections"] += pool.num_connections
+        super().close()
+
+
+class TunedChrome(webdriver.Chrome):
+    """
+    ``webdriver.Chrome`` that talks to ChromeDriver through ``PooledConnection``.
+    Args:
+        settings (Mapping): The ``webdriver`` configuration section
+        **kwargs: ``webdriver.Chrome`` arguments (``service``, ``options``)
+    """
+
+    def __init__(self, settings, **kwargs):
+        self._transport_settings = settings
+        super().__init__(**kwargs)
+
+    def start_session(self, capabilities):
+        # Called by WebDriver.__init__ before the first command is sent
+        default = self.command_executor
+        self.command_executor = PooledConnection(default._url, self.vendor_prefix, default.browser_name,
+                                                 self._transport_settings)
+        default.close()
+        super().start_session(capabilities)
+
+
+def _percentile(entry, fraction):
+    """
+    Upper bucket edge below which ``fraction`` of the observations fall,
+    never more than the slowest observation.
+    """
+    target = fraction * entry["count"]
+    slowest = round(entry["max_ms"], 1)
+    seen = 0
+    for edge, count in zip(BUCKETS_MS + (None,), entry["buckets"]):
+        seen += count
+        if seen >= target:
+            return min(edge, slowest) if edge is not None else slowest
+    return slowest
+
+
+def transport_stats():
+    """
+    Latency histograms per command and connection counters for this process.
+    Returns:
+        dict: ``commands`` (command -> count, mean/p50/p95/max ms, buckets),
+        ``floor_ms`` (mean ``/status`` round trip), ``connections``, ``retries``
+    """
+    commands = {}
+    for name, entry in _latency.items():
+        commands[name] = {
+            "count": entry["count"],
+            "mean_ms": round(entry["total_ms"] / entry["count"], 2),
+            "p50_ms": _percentile(entry, 0.5),
+            "p95_ms": _percentile(entry, 0.95),
+            "max_ms": round(entry["max_ms"], 2),
+            "buckets": dict(zip([f"<={edge}" for edge in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"], entry["buckets"])),
+        }
+    status = commands.get(STATUS)
+    return {
+        "commands": commands,
+        "floor_ms": status["mean_ms"] if status else None,
+        "connections": _events["connections"],
+        "retries": _events["retries"],
+    }
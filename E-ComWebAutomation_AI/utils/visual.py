@@ -0,0 +1,381 @@
+"""Visual checkpoints for page objects.
+
+``BasePage.visual_checkpoint`` takes an element-level screenshot and hands it
+to a background thread pool; the test continues while it is compared with
+the baseline. Mismatches are reported in the terminal summary; with
+``visual.fail_on_mismatch`` they also fail the test when its call phase ends.
+
+A comparison works on a grey-level copy scaled down to at most
+``visual.max_size`` pixels, with NumPy on whole arrays:
+
+- perceptual hash: DCT of a 32x32 copy, 63 low-frequency bits above the
+  median. More than ``phash_distance`` differing bits is a structural change
+  (layout, wrong image);
+- block diff: mean absolute difference per ``block_size`` block. A block
+  above ``tolerance`` grey levels is a local change (text, colour, icon).
+
+Parts of the element that legitimately change (prices, dates) are passed as
+``ignore`` locators; the blocks they cover form the tolerance mask and are
+left out of both checks. Baselines are compressed ``.npz`` files of the
+scaled copy, mask and hash (a few KB each) in ``baselines/visual``, which
+is committed with the page objects. A missing baseline is recorded on first
+use; ``pytest --visual-baseline`` records all of them again. For a mismatch, the
+current rendering with the changed blocks in red goes to the run's
+``screenshots`` directory.
+"""
+import functools
+import glob
+import io
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from utils.benchmark import summarize
+from utils.config import get_config
+
+BASELINE_DIR = Path(__file__).parent.parent / "baselines" / "visual"
+HASH_SIZE = 32
+HASH_LOW_FREQUENCIES = 8
+STABLE_TIMEOUT_SECONDS = 2
+
+# Images inside the element have loaded and no finite animation is running
+STABLE_SCRIPT = """/* read-only */
+var el = arguments[0];
+var images = el.tagName === 'IMG' ? [el] : Array.prototype.slice.call(el.querySelectorAll('img'));
+if (images.some(function (img) { return !img.complete; })) { return false; }
+return !(el.getAnimations ? el.getAnimations({subtree: true}) : []).some(function (a) {
+  return a.playState === 'running' && isFinite(a.effect.getComputedTiming().endTime);
+});
+"""
+
+# Element size and the rectangles of ``arguments[1]`` relative to it (CSS pixels)
+RECTS_SCRIPT = """/* read-only */
+var base = arguments[0].getBoundingClientRect();
+return [[base.width, base.height]].concat(arguments[1].map(function (e) {
+  var r = e.getBoundingClientRect();
+  return [r.left - base.left, r.top - base.top, r.width, r.height];
+}));
+"""
+
+_pool = None
+_pending = []
+_results = []
+_state = {"update": False, "diff_dir": None}
+
+
+def enabled():
+    return get_config().visual["enabled"]
+
+
+def configure(update=False, diff_dir=None):
+    """
+    Args:
+        update (bool): Record every checkpoint as the new baseline
+        diff_dir (str): Where diff images of mismatches are written
+    """
+    _state.update(update=update, diff_dir=diff_dir)
+
+
+def baseline_file(name):
+    return BASELINE_DIR / (re.sub(r"[^\w.-]+", "_", name) + ".npz")
+
+
+@functools.lru_cache(maxsize=None)
+def _dct_matrix(n=HASH_SIZE):
+    import numpy as np
+
+    k, i = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    matrix = np.sqrt(2 / n) * np.cos(np.pi * (2 * i + 1) * k / (2 * n))
+    matrix[0] /= np.sqrt(2)
+    return matrix.astype(np.float32)
+
+
+def phash(pixels):
+    """
+    Perceptual hash of a grey-level image.
+    Args:
+        pixels (ndarray): 2-D uint8 array
+    Returns:
+        int: 63-bit hash; similar images differ in few bits
+    """
+    import numpy as np
+    from PIL import Image
+
+    small = np.asarray(Image.fromarray(pixels).resize((HASH_SIZE, HASH_SIZE), Image.BILINEAR), dtype=np.float32)
+    dct = _dct_matrix()
+    coefficients = (dct @ small @ dct.T)[:HASH_LOW_FREQUENCIES, :HASH_LOW_FREQUENCIES].ravel()[1:]
+    bits = coefficients > np.median(coefficients)
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hash_distance(a, b):
+    return bin(a ^ b).count("1")
+
+
+def block_diff(a, b, block):
+    """
+    Mean absolute difference per block (edge blocks averaged over their pixels).
+    Args:
+        a, b (ndarray): 2-D uint8 arrays of the same shape
+        block (int): Block side in pixels
+    Returns:
+        ndarray: float32, one value per block
+    """
+    import numpy as np
+
+    h, w = a.shape
+    rows, cols = -(-h // block), -(-w // block)
+    pad = ((0, rows * block - h), (0, cols * block - w))
+    diff = np.pad(np.abs(a.astype(np.int16) - b.astype(np.int16)).astype(np.float32), pad)
+    counts = np.pad(np.ones((h, w), np.float32), pad)
+    blocks = (rows, block, cols, block)
+    return diff.reshape(blocks).sum(axis=(1, 3)) / counts.reshape(blocks).sum(axis=(1, 3))
+
+
+def block_mask(shape, rects, block):
+    """
+    Blocks touched by any rectangle.
+    Args:
+        shape (tuple): Image (height, width) in pixels
+        rects (list): (x, y, width, height) in the same pixels
+        block (int): Block side in pixels
+    Returns:
+        ndarray: bool, True for ignored blocks
+    """
+    import numpy as np
+
+    rows, cols = -(-shape[0] // block), -(-shape[1] // block)
+    mask = np.zeros((rows, cols), bool)
+    for x, y, width, height in rects:
+        if width <= 0 or height <= 0:
+            continue
+        top, left = max(0, int(y // block)), max(0, int(x // block))
+        bottom, right = int(-(-(y + height) // block)), int(-(-(x + width) // block))
+        mask[top:bottom, left:right] = True
+    return mask
+
+
+def _pixel_mask(mask, block, shape):
+    import numpy as np
+
+    return np.repeat(np.repeat(mask, block, axis=0), block, axis=1)[:shape[0], :shape[1]]
+
+
+def _decode(png, max_size, shape=None):
+    """Grey-level copy of a PNG scaled to ``shape`` (rows, cols) or to fit ``max_size``."""
+    import numpy as np
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(png)).convert("L")
+    if shape is None:
+        scale = min(1.0, max_size / max(image.size))
+        shape = (max(1, round(image.height * scale)), max(1, round(image.width * scale)))
+    return np.asarray(image.resize((shape[1], shape[0]), Image.BOX)), image.size
+
+
+def _save_baseline(path, pixels, mask, size, block):
+    import numpy as np
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp.npz")
+    np.savez_compressed(tmp, pixels=pixels, mask=mask, size=np.array(size), block=np.array(block),
+                        phash=np.array(phash(pixels), dtype=np.uint64))
+    os.replace(tmp, path)
+
+
+def _write_diff(name, pixels, changed, block):
+    import numpy as np
+    from PIL import Image
+
+    if not _state["diff_dir"]:
+        return None
+    rgb = np.repeat(pixels[:, :, None], 3, axis=2)
+    red = _pixel_mask(changed, block, pixels.shape)
+    rgb[red] = (rgb[red] // 2 + np.array([127, 0, 0], np.uint8))
+    os.makedirs(_state["diff_dir"], exist_ok=True)
+    path = os.path.join(_state["diff_dir"], f"visual_{baseline_file(name).stem}.png")
+    Image.fromarray(rgb).save(path)
+    return path
+
+
+def compare(name, png, rects, settings, tolerance=None, update=False):
+    """
+    Compare one screenshot with its baseline, recording the baseline if
+    there is none (or ``update`` is set).
+    Args:
+        name (str): Checkpoint name (``PageClass.checkpoint``)
+        png (bytes): Element screenshot
+        rects (list): Ignored (x, y, width, height) in screenshot pixels
+        settings (Mapping): The ``visual`` configuration section
+        tolerance (int): Grey-level tolerance per block (default from settings)
+        update (bool): Overwrite the baseline
+    Returns:
+        dict: name, status ("match", "mismatch", "new", "updated"), hash
+        distance, worst block difference, changed blocks, compare_ms
+    """
+    import numpy as np
+
+    start = time.perf_counter()
+    tolerance = settings["tolerance"] if tolerance is None else tolerance
+    path = baseline_file(name)
+    result = {"name": name, "status": "match", "phash_distance": 0, "max_block_diff": 0.0, "changed_blocks": 0}
+    baseline = None
+    if not update and path.exists():
+        with np.load(path) as stored:
+            baseline = {key: stored[key] for key in stored.files}
+    if baseline is None:
+        block = settings["block_size"]
+        pixels, size = _decode(png, settings["max_size"])
+        scale = pixels.shape[1] / size[0]
+        mask = block_mask(pixels.shape, [[v * scale for v in rect] for rect in rects], block)
+        _save_baseline(path, pixels, mask, size, block)
+        result["status"] = "updated" if update else "new"
+    else:
+        block = int(baseline["block"])
+        reference = baseline["pixels"]
+        pixels, size = _decode(png, settings["max_size"], reference.shape)
+        scale = reference.shape[1] / size[0]
+        mask = baseline["mask"] | block_mask(reference.shape, [[v * scale for v in rect] for rect in rects], block)
+        # Ignored regions take the baseline's pixels so they cannot move the hash
+        composite = np.where(_pixel_mask(mask, block, reference.shape), reference, pixels)
+        diffs = np.where(mask, 0, block_diff(composite, reference, block))
+        changed = diffs > tolerance
+        result.update(phash_distance=hash_distance(phash(composite), int(baseline["phash"])),
+                      max_block_diff=round(float(diffs.max()), 1), changed_blocks=int(changed.sum()))
+        if tuple(size) != tuple(int(v) for v in baseline["size"]):
+            result["size"] = f"{baseline['size'][0]}x{baseline['size'][1]} -> {size[0]}x{size[1]}"
+        if "size" in result or changed.any() or result["phash_distance"] > settings["phash_distance"]:
+            result["status"] = "mismatch"
+            result["diff"] = _write_diff(name, composite, changed, block)
+    result["compare_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    return result
+
+
+def _executor():
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=max(1, get_config().visual["workers"]), thread_name_prefix="visual")
+    return _pool
+
+
+def _compare_safely(name, png, rects, settings, tolerance, update, test):
+    try:
+        result = compare(name, png, rects, settings, tolerance, update)
+    except Exception as e:
+        result = {"name": name, "status": "error", "error": f"{type(e).__name__}: {e}"}
+    result["test"] = test
+    return result
+
+
+def checkpoint(driver, element, name, ignore=(), tolerance=None):
+    """
+    Screenshot ``element`` once it is stable and queue its comparison.
+    Args:
+        driver (WebDriver): Browser showing the element
+        element (WebElement): Element to capture
+        name (str): Checkpoint name
+        ignore (list): Elements inside ``element`` to mask
+        tolerance (int): Grey-level tolerance per block
+    Returns:
+        Future: Resolves to the :func:`compare` result
+    """
+    deadline = time.monotonic() + STABLE_TIMEOUT_SECONDS
+    while not driver.execute_script(STABLE_SCRIPT, element) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    (css_width, _), *rects = driver.execute_script(RECTS_SCRIPT, element, list(ignore))
+    png = element.screenshot_as_png
+    if rects:
+        from PIL import Image
+
+        ratio = Image.open(io.BytesIO(png)).width / css_width if css_width else 1.0
+        rects = [[v * ratio for v in rect] for rect in rects]
+    test = os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0] or None
+    future = _executor().submit(_compare_safely, name, png, rects, get_config().visual, tolerance,
+                                _state["update"], test)
+    _pending.append(future)
+    return future
+
+
+def drain():
+    """
+    Wait for the queued comparisons.
+    Returns:
+        list: Their results, in submission order
+    """
+    results = [future.result() for future in _pending]
+    _pending.clear()
+    _results.extend(results)
+    return results
+
+
+def describe(result):
+    if result["status"] == "error":
+        return f"{result['name']}: {result['error']}"
+    details = [f"{result['changed_blocks']} block(s) changed (worst {result['max_block_diff']})",
+               f"hash distance {result['phash_distance']}"]
+    if "size" in result:
+        details.insert(0, f"size {result['size']}")
+    if result.get("diff"):
+        details.append(f"diff: {result['diff']}")
+    return f"{result['name']}: " + ", ".join(details)
+
+
+class VisualReporter:
+    """
+    pytest plugin: fails a test whose checkpoints do not match, stores this
+    process's results and, on the controller, prints the run's summary.
+    Args:
+        config: pytest config; ``_run_dir`` is the run directory
+        settings (Mapping): The ``visual`` configuration section
+    """
+
+    def __init__(self, config, settings):
+        self.config = config
+        self.settings = settings
+        self.results = []
+        configure(update=config.getoption("visual_baseline"),
+                  diff_dir=os.path.join(config._run_dir, "screenshots"))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        outcome = yield
+        failed = [r for r in drain() if r["status"] in ("mismatch", "error")]
+        if failed and self.settings["fail_on_mismatch"] and outcome.excinfo is None:
+            message = "Visual checkpoint mismatch:\n" + "\n".join(describe(r) for r in failed)
+            outcome.force_exception(pytest.fail.Exception(message, pytrace=False))
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        drain()
+        if _pool is not None:
+            _pool.shutdown()
+        if _results:
+            from utils.report_helper import worker_artifact_path
+
+            with open(worker_artifact_path(self.config, "visual"), "w", encoding="utf-8") as f:
+                json.dump(_results, f, indent=2)
+        if hasattr(self.config, "workerinput"):
+            return
+        # Workers have finished (and written their results) by now
+        for path in sorted(glob.glob(os.path.join(self.config._run_dir, "artifacts", "visual*.json"))):
+            with open(path, encoding="utf-8") as f:
+                self.results.extend(json.load(f))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results:
+            return
+        counts = {}
+        for result in self.results:
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        timings = summarize([r["compare_ms"] for r in self.results if "compare_ms" in r])
+        terminalreporter.section("visual checkpoints")
+        terminalreporter.line(", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+                              + f"; compare p50 {timings['p50']:.1f}ms, max {timings['max']:.1f}ms (background)")
+        for result in self.results:
+            if result["status"] in ("mismatch", "error"):
+                terminalreporter.line(f"MISMATCH {describe(result)}", red=True)
@@ -0,0 +1,261 @@
+"""Front-end performance telemetry collected during functional runs.
+
+Page-object transitions (``BasePage.navigate``/``wait_for_route``,
+``api_seeder.open_session``) and the end of every browser session take one
+sample of the browser's own timings with a single script:
+
+- per document: TTFB, DOMContentLoaded, load, first paint, first
+  contentful paint and largest contentful paint (Navigation and Paint
+  Timing, a ``PerformanceObserver`` for LCP);
+- per transition: route switch time (hash change until the DOM stopped
+  changing), resources fetched since the previous sample, their bytes and
+  the slowest one (Resource Timing).
+
+The observers are installed in every new document when the driver is
+created (``install``), so paints and route switches are seen from the start.
+Samples are tagged with the screen (hash route, ids replaced by ``:id``) and
+the test, written per worker to ``artifacts/web_perf*.jsonl``, summarized per
+screen with percentiles, appended to ``test_logs/baselines/web_perf_history.jsonl``
+and compared with the stored baseline (``web_perf`` configuration section).
+
+Usage:
+    TEST_WEB_PERF_FAIL_ON_REGRESSION=true pytest   # fail the run on a slower screen
+    pytest --web-perf-baseline                      # store this run as the baseline
+    python -m utils.web_perf test_logs/<run>        # summarize a past run
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+import pytest
+
+from utils.benchmark import summarize, load_baseline, save_baseline, append_history, compare_to_baseline
+from utils.config import ConfigError, get_config
+
+BENCHMARK_NAME = "web_perf"
+METRICS = ("route_ms", "ttfb_ms", "dcl_ms", "load_ms", "fp_ms", "fcp_ms", "lcp_ms",
+           "resources", "transfer_kb", "slowest_resource_ms")
+GATE_METRICS = ("p50", "p90", "p99")
+ID_SEGMENT = re.compile(r"/(?:[0-9a-f]{8,}|\d+)(?=/|$)", re.I)
+
+# Idempotent: LCP observer, hash-change start time, last DOM mutation time
+OBSERVE_JS = """(function () {
+  if (window.__webPerf) { return; }
+  var perf = window.__webPerf = {lcp: null, lastMutation: 0, routeStart: null, resources: 0};
+  try {
+    new PerformanceObserver(function (list) {
+      var entries = list.getEntries(); perf.lcp = entries[entries.length - 1].startTime;
+    }).observe({type: 'largest-contentful-paint', buffered: true});
+  } catch (e) {}
+  window.addEventListener('hashchange', function () { perf.routeStart = performance.now(); });
+  new MutationObserver(function () { perf.lastMutation = performance.now(); })
+    .observe(document, {childList: true, subtree: true});
+})();
+"""
+
+SAMPLE_SCRIPT = "/* read-only */\n" + OBSERVE_JS + """
+var perf = window.__webPerf, nav = performance.getEntriesByType('navigation')[0] || {}, paint = {};
+performance.getEntriesByType('paint').forEach(function (p) { paint[p.name] = p.startTime; });
+var resources = performance.getEntriesByType('resource'), fresh = resources.slice(perf.resources);
+var bytes = 0, slowest = 0;
+fresh.forEach(function (r) { bytes += r.transferSize || 0; slowest = Math.max(slowest, r.duration); });
+var route = perf.routeStart === null ? null : Math.max(perf.lastMutation, perf.routeStart) - perf.routeStart;
+perf.resources = resources.length;
+perf.routeStart = null;
+return {document: performance.timeOrigin, screen: location.hash || location.pathname,
+        ttfb: nav.responseStart, dcl: nav.domContentLoadedEventEnd, load: nav.loadEventEnd,
+        fp: paint['first-paint'], fcp: paint['first-contentful-paint'], lcp: perf.lcp,
+        route: route, resources: fresh.length, transfer: bytes, slowest: slowest};
+"""
+
+_samples = []
+_documents = set()  # documents whose load metrics were already recorded
+
+
+def enabled():
+    return get_config().web_perf["enabled"]
+
+
+def install(driver):
+    """Install the observers in every document the driver opens (Chrome DevTools)."""
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVE_JS})
+    except Exception:
+        pass  # observers are then installed by the first sample of each document
+
+
+def screen_name(location):
+    """``#/dashboard/product-details/6581ca39...?x=1`` -> ``/dashboard/product-details/:id``."""
+    route = location.lstrip("#").split("?")[0] or "/"
+    return ID_SEGMENT.sub("/:id", route)
+
+
+def _current_test():
+    return os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0] or None
+
+
+def _ms(value):
+    return round(value, 1) if value else None
+
+
+def sample(driver):
+    """
+    Record one sample of the browser's timings for the current screen.
+    Costs one script round trip; does nothing when telemetry is disabled.
+    """
+    if not enabled():
+        return
+    try:
+        data = driver.execute_script(SAMPLE_SCRIPT)
+    except Exception:
+        return  # browser gone or not on a page
+    entry = {"screen": screen_name(data["screen"]), "test": _current_test(), "at": round(time.time(), 3),
+             "route_ms": _ms(data["route"]), "resources": data["resources"],
+             "transfer_kb": round(data["transfer"] / 1024, 1), "slowest_resource_ms": _ms(data["slowest"])}
+    if data["document"] not in _documents and data["load"]:
+        _documents.add(data["document"])
+        entry.update(ttfb_ms=_ms(data["ttfb"]), dcl_ms=_ms(data["dcl"]), load_ms=_ms(data["load"]),
+                     fp_ms=_ms(data["fp"]), fcp_ms=_ms(data["fcp"]), lcp_ms=_ms(data["lcp"]))
+    _samples.append(entry)
+
+
+def summarize_samples(samples):
+    """
+    Percentiles per screen and metric.
+    Returns:
+        dict: screen -> metric -> ``summarize`` result (metrics without samples omitted)
+    """
+    values = {}
+    for entry in samples:
+        for metric in METRICS:
+            if entry.get(metric) is not None:
+                values.setdefault(entry["screen"], {}).setdefault(metric, []).append(entry[metric])
+    return {screen: {metric: summarize(series) for metric, series in sorted(metrics.items())}
+            for screen, metrics in sorted(values.items())}
+
+
+def find_regressions(summary, baseline, settings):
+    """
+    Screens slower than the baseline.
+    Args:
+        summary (dict): This run, from :func:`summarize_samples`
+        baseline (dict): Stored baseline in the same shape
+        settings (Mapping): The ``web_perf`` configuration section
+    Returns:
+        list: (screen, metric, baseline value, current value, ratio)
+    """
+    def flat(results):
+        return {(screen, metric): values for screen, metrics in (results or {}).items()
+                for metric, values in metrics.items()
+                if metric.endswith("_ms") and values["count"] >= settings["min_samples"]}
+
+    current, reference = flat(summary), flat(baseline)
+    slower = compare_to_baseline({f"{s}|{m}": v for (s, m), v in current.items()},
+                                 {f"{s}|{m}": v for (s, m), v in reference.items()},
+                                 settings["tolerance_pct"] / 100, settings["metric"])
+    return [tuple(key.split("|", 1)) + (old, new, ratio) for key, old, new, ratio in slower]
+
+
+def load_run_samples(run_dir):
+    """All samples written by the processes of one run."""
+    samples = []
+    for path in sorted(glob.glob(os.path.join(run_dir, "artifacts", "web_perf*.jsonl"))):
+        with open(path, encoding="utf-8") as f:
+            samples.extend(json.loads(line) for line in f if line.strip())
+    return samples
+
+
+class WebPerfReporter:
+    """
+    pytest plugin: stores this process's samples and, on the controller,
+    summarizes the run, records history and applies the regression gate.
+    Args:
+        config: pytest config; ``_run_dir`` is the run directory
+        settings (Mapping): The ``web_perf`` configuration section
+    """
+
+    def __init__(self, config, settings):
+        if settings["metric"] not in GATE_METRICS:
+            raise ConfigError(f"web_perf.metric must be one of {', '.join(GATE_METRICS)}, "
+                              f"not {settings['metric']!r}")
+        self.config = config
+        self.settings = settings
+        self.summary = {}
+        self.regressions = []
+
+    def _write_samples(self):
+        if not _samples:
+            return
+        from utils.report_helper import worker_artifact_path
+
+        with open(worker_artifact_path(self.config, "web_perf", "jsonl"), "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in _samples)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        self._write_samples()
+        if hasattr(self.config, "workerinput"):
+            return
+        # Workers have finished (and written their samples) by now
+        self.summary = summarize_samples(load_run_samples(self.config._run_dir))
+        if not self.summary:
+            return
+        with open(os.path.join(self.config._run_dir, "artifacts", "web_perf_summary.json"), "w") as f:
+            json.dump(self.summary, f, indent=2)
+        append_history(BENCHMARK_NAME, self.summary)
+        if self.config.getoption("web_perf_baseline"):
+            save_baseline(BENCHMARK_NAME, self.summary)
+            return
+        self.regressions = find_regressions(self.summary, load_baseline(BENCHMARK_NAME), self.settings)
+        if self.regressions and self.settings["fail_on_regression"] and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.summary:
+            return
+        metric = self.settings["metric"]
+        terminalreporter.section("web performance")
+        for screen, metrics in self.summary.items():
+            parts = [f"{name[:-3]} {metrics[name][metric]:.0f}ms" for name in ("route_ms", "fcp_ms", "lcp_ms", "load_ms")
+                     if name in metrics]
+            samples = max(values["count"] for values in metrics.values())
+            terminalreporter.line(f"{screen:40s} n={samples:<4d} {metric}: " + (", ".join(parts) or "-"))
+        if self.config.getoption("web_perf_baseline"):
+            terminalreporter.line("baseline saved")
+        for screen, name, old, new, ratio in self.regressions:
+            terminalreporter.line(f"SLOWER {screen} {name} {metric} {old:.0f}ms -> {new:.0f}ms ({ratio:.2f}x)",
+                                  red=True)
+
+
+def main(argv=None):
+    """Summarize a finished run and compare it with the baseline."""
+    parser = argparse.ArgumentParser(description="Per-screen front-end performance of a test run")
+    parser.add_argument("run_dir", help="Run directory, e.g. test_logs/20250101_120000")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    args = parser.parse_args(argv)
+
+    settings = get_config().web_perf
+    summary = summarize_samples(load_run_samples(args.run_dir))
+    if not summary:
+        print(f"No web performance samples in {args.run_dir}")
+        return 1
+    for screen, metrics in summary.items():
+        print(screen)
+        for name, values in metrics.items():
+            print(f"  {name:22s} n={values['count']:<4d} p50={values['p50']:.1f} "
+                  f"p90={values['p90']:.1f} p99={values['p99']:.1f}")
+    if args.save_baseline:
+        print(f"Baseline saved: {save_baseline(BENCHMARK_NAME, summary)}")
+        return 0
+    regressions = find_regressions(summary, load_baseline(BENCHMARK_NAME), settings)
+    for screen, name, old, new, ratio in regressions:
+        print(f"SLOWER {screen} {name} {settings['metric']} {old:.1f}ms -> {new:.1f}ms ({ratio:.2f}x)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())